@@ -3,14 +3,28 @@ Production OpenClaw Bridge Implementation
 
 Implements IOpenClawBridge with robust error handling, retry logic, and monitoring.
 
+Send pipeline:
+- Concurrent sends are multiplexed over the single gateway WebSocket; the
+  base bridge correlates responses by request ID, so callers pipeline freely.
+  Every retry attempt sends a fresh request frame ID; the ID of the attempt
+  that succeeded is returned to the caller as request_id
+- Each session has a bounded in-flight window (max_in_flight_per_session)
+- Conversation persistence runs in an ordered write-behind queue: conversation
+  lookup/creation and message writes execute one at a time in submission
+  order, off the send critical path
+- session_key -> conversation is resolved through the shared
+  ConversationMetadataCache (TTL-bounded, invalidated on archive)
+
 Refs #1094
 """
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, Callable
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Callable, Awaitable, Tuple
 from datetime import datetime, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
 import random
 import sys
 import os
@@ -31,17 +45,31 @@ from backend.agents.orchestration.openclaw_bridge_protocol import (
 try:
     from sqlalchemy.ext.asyncio import AsyncSession
     from backend.services.conversation_service import ConversationService
+    from backend.services.conversation_cache import (
+        ConversationMetadata,
+        get_conversation_metadata_cache,
+    )
     from backend.integrations.zerodb_client import ZeroDBClient
     PERSISTENCE_AVAILABLE = True
 except ImportError:
     PERSISTENCE_AVAILABLE = False
     AsyncSession = None
     ConversationService = None
+    ConversationMetadata = None
+    get_conversation_metadata_cache = None
     ZeroDBClient = None
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _SessionWindow:
+    """In-flight window for one session key."""
+    semaphore: asyncio.Semaphore
+    in_flight: Dict[str, float] = field(default_factory=dict)
+    users: int = 0
+
+
 class ProductionOpenClawBridge:
     """
     Production implementation of OpenClaw bridge with robust error handling
@@ -52,6 +80,8 @@ class ProductionOpenClawBridge:
     - Session key validation
     - Detailed logging and error handling
     - Message metadata support
+    - Pipelined sends with per-session in-flight windows
+    - Ordered write-behind conversation persistence
     """
 
     def __init__(
@@ -62,7 +92,9 @@ class ProductionOpenClawBridge:
         zerodb_client: Optional['ZeroDBClient'] = None,
         max_retries: int = 3,
         initial_delay: float = 1.0,
-        max_delay: float = 30.0
+        max_delay: float = 30.0,
+        max_in_flight_per_session: int = 8,
+        persistence_queue_size: int = 10000
     ):
         """
         Initialize production bridge
@@ -75,6 +107,8 @@ class ProductionOpenClawBridge:
             max_retries: Maximum retry attempts
             initial_delay: Initial retry delay in seconds
             max_delay: Maximum retry delay in seconds
+            max_in_flight_per_session: Maximum concurrent sends per session key
+            persistence_queue_size: Maximum pending write-behind operations
         """
         self._base_bridge = BaseOpenClawBridge(url=url, token=token)
         self._connection_state = BridgeConnectionState.DISCONNECTED
@@ -86,14 +120,40 @@ class ProductionOpenClawBridge:
         self._db = db
         self._zerodb = zerodb_client
         self._conversation_service = None
+        self._conversation_cache = (
+            get_conversation_metadata_cache() if PERSISTENCE_AVAILABLE else None
+        )
 
         # Initialize ConversationService if both dependencies provided
         if PERSISTENCE_AVAILABLE and db is not None and zerodb_client is not None:
-            self._conversation_service = ConversationService(db=db, zerodb_client=zerodb_client)
+            self._conversation_service = ConversationService(
+                db=db,
+                zerodb_client=zerodb_client,
+                metadata_cache=self._conversation_cache
+            )
             logger.info("ProductionOpenClawBridge initialized with conversation persistence enabled")
         else:
             logger.info("ProductionOpenClawBridge initialized without conversation persistence")
 
+        # Pipelining: per-session in-flight windows
+        self._max_in_flight_per_session = max_in_flight_per_session
+        self._session_windows: Dict[str, _SessionWindow] = {}
+
+        # Write-behind persistence: single ordered worker
+        self._persistence_queue: Optional[asyncio.Queue] = None
+        self._persistence_queue_size = persistence_queue_size
+        self._persistence_worker: Optional[asyncio.Task] = None
+        self._conversation_futures: Dict[str, asyncio.Future] = {}
+
+        self._stats = {
+            "sent": 0,
+            "failed": 0,
+            "gateway_latency_ms_total": 0.0,
+            "max_in_flight": 0,
+            "writes_completed": 0,
+            "writes_failed": 0,
+        }
+
         logger.info(
             "ProductionOpenClawBridge initialized",
             extra={
@@ -161,6 +221,9 @@ class ProductionOpenClawBridge:
         Send message to agent with retry and validation
 
         Optionally persists conversation to ZeroDB when agent_id, user_id, and workspace_id are provided.
+        Persistence is queued write-behind and does not delay the gateway send
+        or the response; conversation_id is included only when the session's
+        conversation is already resolved. Call flush() to wait for pending writes.
 
         Args:
             session_key: Target session identifier
@@ -171,48 +234,14 @@ class ProductionOpenClawBridge:
             metadata: Optional metadata for routing/tracking
 
         Returns:
-            Response dictionary with status and message details
+            Response dictionary with status and message details; request_id
+            is the ID of the gateway request frame that was delivered
 
         Raises:
             ConnectionError: If bridge is not connected
             SessionError: If session key is invalid
             SendError: If message delivery fails after retries
         """
-        # Step 1: Get or create conversation (if IDs provided)
-        conversation = None
-        if self._conversation_service and agent_id and user_id and workspace_id:
-            try:
-                conversation = await self._conversation_service.get_conversation_by_session_key(session_key)
-                if not conversation:
-                    conversation = await self._conversation_service.create_conversation(
-                        workspace_id=workspace_id,
-                        agent_id=agent_id,
-                        user_id=user_id,
-                        openclaw_session_key=session_key
-                    )
-                    logger.info(f"Created new conversation {conversation.id} for session {session_key}")
-            except Exception as e:
-                # Graceful degradation - log error but continue
-                logger.warning(
-                    f"Failed to create/retrieve conversation: {e}",
-                    extra={"session_key": session_key, "error": str(e)}
-                )
-
-        # Step 2: Store user message in ZeroDB (if conversation exists)
-        if conversation:
-            try:
-                await self._conversation_service.add_message(
-                    conversation_id=conversation.id,
-                    role="user",
-                    content=message
-                )
-                logger.debug(f"Stored user message in conversation {conversation.id}")
-            except Exception as e:
-                # Graceful degradation - log error but continue
-                logger.warning(
-                    f"Failed to store user message: {e}",
-                    extra={"conversation_id": str(conversation.id), "error": str(e)}
-                )
         # Validate connection
         if not self.is_connected:
             raise ConnectionError("Bridge is not connected. Call connect() first.")
@@ -221,70 +250,138 @@ class ProductionOpenClawBridge:
         if not self._validate_session_key(session_key):
             raise SessionError(f"Invalid session key format: {session_key}")
 
-        # Retry loop with exponential backoff
+        # Queue conversation resolution and user message (write-behind)
+        conversation_future = None
+        if self._conversation_service and agent_id and user_id and workspace_id:
+            conversation_future = self._resolve_conversation(
+                session_key, workspace_id, agent_id, user_id
+            )
+            self._enqueue_write(
+                lambda: self._store_message(conversation_future, "user", message)
+            )
+
+        result, request_id, latency_ms, attempts = await self._send_pipelined(
+            session_key, message
+        )
+
+        # Enrich response with metadata
+        response = {
+            "status": "sent",
+            "message_id": result.get("id", f"msg_{datetime.now(timezone.utc).timestamp()}"),
+            "request_id": request_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "session_key": session_key,
+            "metadata": metadata or {},
+            "result": result  # Include full result for assistant response extraction
+        }
+
+        if conversation_future is not None:
+            # Resolved from cache or while the gateway responded; a lookup
+            # still queued behind other writes never holds the response
+            if conversation_future.done() and conversation_future.result():
+                response["conversation_id"] = str(conversation_future.result().id)
+
+            # Queue assistant response (if it has content)
+            if result.get("result") and result["result"].get("response"):
+                assistant_metadata = {}
+                if result["result"].get("model"):
+                    assistant_metadata["model"] = result["result"]["model"]
+                if result["result"].get("tokens_used"):
+                    assistant_metadata["tokens_used"] = result["result"]["tokens_used"]
+
+                content = result["result"]["response"]
+                self._enqueue_write(
+                    lambda: self._store_message(
+                        conversation_future,
+                        "assistant",
+                        content,
+                        assistant_metadata if assistant_metadata else None
+                    )
+                )
+
+        logger.info(
+            "Message sent successfully",
+            extra={
+                "session_key": session_key,
+                "message_id": response["message_id"],
+                "request_id": request_id,
+                "latency_ms": latency_ms,
+                "attempt": attempts,
+                "message_length": len(message)
+            }
+        )
+
+        return response
+
+    async def _send_pipelined(
+        self,
+        session_key: str,
+        message: str
+    ) -> Tuple[Dict[str, Any], str, float, int]:
+        """
+        Send through the session's in-flight window with retry
+
+        Args:
+            session_key: Target session identifier
+            message: Message content to send
+
+        Returns:
+            Tuple of (gateway result, delivered request frame ID,
+            latency in ms, attempts used)
+
+        Raises:
+            SendError: If message delivery fails after retries
+        """
+        window = self._session_windows.get(session_key)
+        if window is None:
+            window = _SessionWindow(asyncio.Semaphore(self._max_in_flight_per_session))
+            self._session_windows[session_key] = window
+        window.users += 1
+        send_id = str(uuid4())
+
+        try:
+            async with window.semaphore:
+                window.in_flight[send_id] = time.monotonic()
+                self._stats["max_in_flight"] = max(
+                    self._stats["max_in_flight"], len(window.in_flight)
+                )
+                try:
+                    return await self._send_with_retry(session_key, message)
+                finally:
+                    window.in_flight.pop(send_id, None)
+        finally:
+            window.users -= 1
+            if window.users == 0:
+                self._session_windows.pop(session_key, None)
+
+    async def _send_with_retry(
+        self,
+        session_key: str,
+        message: str
+    ) -> Tuple[Dict[str, Any], str, float, int]:
+        """
+        Send via the base bridge with exponential backoff retry
+
+        Each attempt uses its own request frame ID so a late response to a
+        timed-out attempt cannot be matched to the retry.
+        """
         last_error = None
         for attempt in range(self._max_retries):
+            request_id = str(uuid4())
             try:
-                start_time = datetime.now(timezone.utc)
+                start_time = time.monotonic()
 
                 # Send message via base bridge
                 result = await self._base_bridge.send_to_agent(
                     session_key=session_key,
-                    message=message
+                    message=message,
+                    request_id=request_id
                 )
 
-                # Calculate latency
-                latency_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
-
-                # Enrich response with metadata
-                response = {
-                    "status": "sent",
-                    "message_id": result.get("id", f"msg_{datetime.now(timezone.utc).timestamp()}"),
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "session_key": session_key,
-                    "metadata": metadata or {},
-                    "result": result  # Include full result for assistant response extraction
-                }
-
-                # Include conversation_id if conversation was tracked
-                if conversation:
-                    response["conversation_id"] = str(conversation.id)
-
-                # Step 4: Store assistant response in ZeroDB (if conversation exists and response has content)
-                if conversation and result.get("result") and result["result"].get("response"):
-                    try:
-                        assistant_metadata = {}
-                        if result["result"].get("model"):
-                            assistant_metadata["model"] = result["result"]["model"]
-                        if result["result"].get("tokens_used"):
-                            assistant_metadata["tokens_used"] = result["result"]["tokens_used"]
-
-                        await self._conversation_service.add_message(
-                            conversation_id=conversation.id,
-                            role="assistant",
-                            content=result["result"]["response"],
-                            metadata=assistant_metadata if assistant_metadata else None
-                        )
-                        logger.debug(f"Stored assistant response in conversation {conversation.id}")
-                    except Exception as e:
-                        # Graceful degradation - log error but continue
-                        logger.warning(
-                            f"Failed to store assistant response: {e}",
-                            extra={"conversation_id": str(conversation.id), "error": str(e)}
-                        )
-
-                logger.info(
-                    "Message sent successfully",
-                    extra={
-                        "session_key": session_key,
-                        "message_id": response["message_id"],
-                        "latency_ms": latency_ms,
-                        "attempt": attempt + 1,
-                        "message_length": len(message)
-                    }
-                )
-
-                return response
+                latency_ms = (time.monotonic() - start_time) * 1000
+                self._stats["sent"] += 1
+                self._stats["gateway_latency_ms_total"] += latency_ms
+                return result, request_id, latency_ms, attempt + 1
 
             except Exception as e:
                 last_error = e
@@ -305,6 +402,7 @@ class ProductionOpenClawBridge:
                     await asyncio.sleep(delay)
 
         # All retries exhausted
+        self._stats["failed"] += 1
         error_msg = (
             f"Failed to send message after {self._max_retries} retries. "
             f"Last error: {last_error}"
@@ -319,8 +417,171 @@ class ProductionOpenClawBridge:
         )
         raise SendError(error_msg)
 
+    def _resolve_conversation(
+        self,
+        session_key: str,
+        workspace_id: UUID,
+        agent_id: UUID,
+        user_id: UUID
+    ) -> asyncio.Future:
+        """
+        Get a future for the session's conversation
+
+        Resolves from the shared conversation metadata cache, joins an
+        in-progress lookup, or queues a get-or-create on the write-behind
+        worker. The future resolves to None if the conversation cannot be
+        retrieved or created.
+        """
+        loop = asyncio.get_running_loop()
+
+        cached = self._conversation_cache.get_by_session_key(session_key)
+        if cached is not None:
+            future = loop.create_future()
+            future.set_result(cached)
+            return future
+
+        pending = self._conversation_futures.get(session_key)
+        if pending is not None:
+            return pending
+
+        future = loop.create_future()
+        self._conversation_futures[session_key] = future
+
+        async def get_or_create() -> None:
+            conversation = None
+            try:
+                conversation = await self._conversation_service.get_conversation_by_session_key(session_key)
+                if not conversation:
+                    conversation = await self._conversation_service.create_conversation(
+                        workspace_id=workspace_id,
+                        agent_id=agent_id,
+                        user_id=user_id,
+                        openclaw_session_key=session_key
+                    )
+                    logger.info(f"Created new conversation {conversation.id} for session {session_key}")
+                if self._conversation_cache.get(conversation.id) is None:
+                    self._conversation_cache.put(ConversationMetadata.from_conversation(conversation))
+            except Exception as e:
+                # Graceful degradation - log error but continue
+                logger.warning(
+                    f"Failed to create/retrieve conversation: {e}",
+                    extra={"session_key": session_key, "error": str(e)}
+                )
+            finally:
+                self._conversation_futures.pop(session_key, None)
+                if not future.done():
+                    future.set_result(conversation)
+
+        if not self._enqueue_write(get_or_create):
+            # Dropped lookup would leave every waiter on this future blocked
+            self._conversation_futures.pop(session_key, None)
+            future.set_result(None)
+        return future
+
+    async def _store_message(
+        self,
+        conversation_future: asyncio.Future,
+        role: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Persist one message once its conversation is known (worker only)"""
+        conversation = await conversation_future
+        if not conversation:
+            return
+
+        message_kwargs = {
+            "conversation_id": conversation.id,
+            "role": role,
+            "content": content
+        }
+        if role == "assistant":
+            message_kwargs["metadata"] = metadata
+
+        try:
+            await self._conversation_service.add_message(**message_kwargs)
+            logger.debug(f"Stored {role} message in conversation {conversation.id}")
+        except Exception as e:
+            # Graceful degradation - log error but continue
+            self._stats["writes_failed"] += 1
+            logger.warning(
+                f"Failed to store {role} message: {e}",
+                extra={"conversation_id": str(conversation.id), "error": str(e)}
+            )
+
+    def _enqueue_write(self, operation: Callable[[], Awaitable[None]]) -> bool:
+        """
+        Queue a persistence operation, starting the worker if needed
+
+        Returns:
+            False if the queue was full and the operation was dropped
+        """
+        if self._persistence_queue is None:
+            self._persistence_queue = asyncio.Queue(maxsize=self._persistence_queue_size)
+        if self._persistence_worker is None or self._persistence_worker.done():
+            self._persistence_worker = asyncio.create_task(self._run_persistence_worker())
+
+        try:
+            self._persistence_queue.put_nowait(operation)
+        except asyncio.QueueFull:
+            self._stats["writes_failed"] += 1
+            logger.error("Persistence queue full - dropping conversation write")
+            return False
+        return True
+
+    async def _run_persistence_worker(self) -> None:
+        """Execute queued persistence operations one at a time, in order"""
+        queue = self._persistence_queue
+        while True:
+            operation = await queue.get()
+            try:
+                await operation()
+                self._stats["writes_completed"] += 1
+            except Exception as e:
+                self._stats["writes_failed"] += 1
+                logger.warning(f"Write-behind operation failed: {e}")
+            finally:
+                queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until all queued conversation writes have completed"""
+        if self._persistence_queue is not None:
+            await self._persistence_queue.join()
+
+    def get_pipeline_stats(self) -> Dict[str, Any]:
+        """
+        Get send pipeline and write-behind statistics
+
+        Returns:
+            Dictionary with in-flight, latency, and persistence queue metrics
+        """
+        sent = self._stats["sent"]
+        return {
+            "sent": sent,
+            "failed": self._stats["failed"],
+            "avg_gateway_latency_ms": (
+                self._stats["gateway_latency_ms_total"] / sent if sent else 0.0
+            ),
+            "in_flight": sum(len(w.in_flight) for w in self._session_windows.values()),
+            "active_sessions": len(self._session_windows),
+            "max_in_flight_observed": self._stats["max_in_flight"],
+            "persistence_queue_depth": (
+                self._persistence_queue.qsize() if self._persistence_queue else 0
+            ),
+            "writes_completed": self._stats["writes_completed"],
+            "writes_failed": self._stats["writes_failed"],
+        }
+
     async def close(self) -> None:
-        """Close connection gracefully"""
+        """Close connection gracefully, draining pending conversation writes"""
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"Error draining persistence queue: {e}")
+        if self._persistence_worker is not None:
+            self._persistence_worker.cancel()
+            self._persistence_worker = None
+
         try:
             await self._base_bridge.close()
             self._connection_state = BridgeConnectionState.DISCONNECTED
@@ -18,7 +18,7 @@ from sqlalchemy.orm import Session
 
 from backend.security.auth_dependencies import get_current_active_user
 from backend.security.authorization_service import verify_agent_access, AuthorizationService
-from backend.models.user import User
+from backend.security.principal_cache import UserSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -102,7 +102,7 @@ def list_agents(
     agent_status: Optional[str] = Query(None, alias="status"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ) -> AgentListResponse:
     _check_available()
@@ -140,7 +140,7 @@ def list_agents(
 )
 def get_agent(
     agent_id: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ) -> AgentResponse:
     _check_available()
@@ -175,7 +175,7 @@ def get_agent(
 )
 async def create_agent(
     request: CreateAgentRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ) -> AgentResponse:
     _check_available()
@@ -206,7 +206,7 @@ async def create_agent(
 )
 async def provision_agent(
     agent_id: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ) -> AgentResponse:
     _check_available()
@@ -249,7 +249,7 @@ async def provision_agent(
 )
 def pause_agent(
     agent_id: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ) -> AgentResponse:
     _check_available()
@@ -285,7 +285,7 @@ def pause_agent(
 )
 def resume_agent(
     agent_id: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ) -> AgentResponse:
     _check_available()
@@ -322,7 +322,7 @@ def resume_agent(
 def update_agent_settings(
     agent_id: str,
     request: UpdateAgentSettingsRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ) -> AgentResponse:
     _check_available()
@@ -352,7 +352,7 @@ def update_agent_settings(
 )
 def delete_agent(
     agent_id: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ) -> None:
     _check_available()
@@ -382,7 +382,7 @@ def delete_agent(
 )
 def execute_heartbeat(
     agent_id: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ) -> HeartbeatExecutionResponse:
     _check_available()
@@ -429,7 +429,7 @@ class SendMessageResponse(BaseModel):
 async def send_message(
     agent_id: str,
     request: SendMessageRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ) -> SendMessageResponse:
     _check_available()
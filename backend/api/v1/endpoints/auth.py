@@ -25,6 +25,7 @@ from backend.security.auth_service import (
     verify_refresh_token
 )
 from backend.models.user import User
+from backend.security.principal_cache import UserSnapshot
 from backend.db.base import get_async_db
 
 
@@ -197,7 +198,7 @@ async def refresh_token(
 
 @router.post("/auth/logout")
 async def logout(
-    current_user: User = Depends(get_current_user)
+    current_user: UserSnapshot = Depends(get_current_user)
 ):
     """
     Logout current user
@@ -284,7 +285,7 @@ async def register(
 @router.post("/auth/change-password")
 async def change_password(
     request: ChangePasswordRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db)
 ):
     """
@@ -301,21 +302,29 @@ async def change_password(
     Raises:
         HTTPException: 400 if current password is incorrect
     """
+    # current_user is a cached snapshot; load the row to read and update the hash
+    user = await db.get(User, current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
     # Verify current password
-    if not current_user.password_hash:
+    if not user.password_hash:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User does not have a password set"
         )
 
-    if not AuthService.verify_password(request.current_password, current_user.password_hash):
+    if not AuthService.verify_password(request.current_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
         )
 
     # Hash and update new password
-    current_user.password_hash = AuthService.hash_password(request.new_password)
+    user.password_hash = AuthService.hash_password(request.new_password)
 
     await db.commit()
 
@@ -327,7 +336,7 @@ async def change_password(
 
 @router.get("/auth/me", response_model=UserInfoResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    current_user: UserSnapshot = Depends(get_current_user)
 ):
     """
     Get current authenticated user information
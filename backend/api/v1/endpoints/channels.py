@@ -11,7 +11,7 @@ from typing import Dict, Any
 from fastapi import APIRouter, HTTPException, status
 
 from backend.security.auth_dependencies import get_current_active_user
-from backend.models.user import User
+from backend.security.principal_cache import UserSnapshot
 
 from backend.schemas.channel_schemas import (
     ChannelListResponse,
@@ -53,7 +53,7 @@ router = APIRouter()
 
 @router.get("/channels", response_model=ChannelListResponse, status_code=status.HTTP_200_OK)
 async def list_channels(
-    current_user: User = Depends(get_current_active_user)):
+    current_user: UserSnapshot = Depends(get_current_active_user)):
     """
     List all available channels with their current status.
 
@@ -102,7 +102,7 @@ async def list_channels(
     status_code=status.HTTP_201_CREATED
 )
 async def enable_channel(channel_id: str, request: ChannelConfigRequest,
-    current_user: User = Depends(get_current_active_user)):
+    current_user: UserSnapshot = Depends(get_current_active_user)):
     """
     Enable a channel globally with provided configuration.
 
@@ -166,7 +166,7 @@ async def enable_channel(channel_id: str, request: ChannelConfigRequest,
     status_code=status.HTTP_200_OK
 )
 async def disable_channel(channel_id: str,
-    current_user: User = Depends(get_current_active_user)):
+    current_user: UserSnapshot = Depends(get_current_active_user)):
     """
     Disable a channel globally (preserves configuration).
 
@@ -216,7 +216,7 @@ async def disable_channel(channel_id: str,
     status_code=status.HTTP_200_OK
 )
 async def get_channel_status(channel_id: str,
-    current_user: User = Depends(get_current_active_user)):
+    current_user: UserSnapshot = Depends(get_current_active_user)):
     """
     Get real-time channel status from OpenClaw Gateway.
 
@@ -261,7 +261,7 @@ async def get_channel_status(channel_id: str,
     status_code=status.HTTP_200_OK
 )
 async def update_channel_config(channel_id: str, request: ChannelConfigRequest,
-    current_user: User = Depends(get_current_active_user)):
+    current_user: UserSnapshot = Depends(get_current_active_user)):
     """
     Update channel configuration (supports partial updates).
 
@@ -442,7 +442,7 @@ async def disconnect_channel(channel_id: str):
     status_code=status.HTTP_200_OK
 )
 async def test_channel_connection(channel_id: str,
-    current_user: User = Depends(get_current_active_user)):
+    current_user: UserSnapshot = Depends(get_current_active_user)):
     """
     Test channel connection (Issue #98).
 
@@ -8,10 +8,12 @@ Endpoints:
     GET    /conversations                           - List conversations with filters
     GET    /conversations/{conversation_id}         - Retrieve single conversation
     GET    /conversations/{conversation_id}/messages - Retrieve conversation messages
+    GET    /conversations/{conversation_id}/messages/export - Stream full transcript (NDJSON)
     POST   /conversations/{conversation_id}/search   - Semantic search in conversation
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import Optional
@@ -21,7 +23,7 @@ import os
 from backend.db.base import get_async_db
 from backend.security.auth_dependencies import get_current_active_user
 from backend.security.authorization_service import verify_conversation_access, AuthorizationService
-from backend.models.user import User
+from backend.security.principal_cache import UserSnapshot
 from backend.schemas.conversation import (
     ConversationListResponse,
     ConversationResponse,
@@ -74,7 +76,7 @@ async def list_conversations(
     status: Optional[str] = Query(None, description="Filter by conversation status"),
     limit: int = Query(50, ge=1, le=200, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     service = Depends(get_conversation_service)
 ):
     """
@@ -127,7 +129,7 @@ async def list_conversations(
 @router.get("/{conversation_id}", response_model=ConversationResponse)
 async def get_conversation(
     conversation_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     service = Depends(get_conversation_service)
 ):
     """
@@ -164,30 +166,36 @@ async def get_conversation(
 async def get_conversation_messages(
     conversation_id: UUID,
     limit: int = Query(50, ge=1, le=200, description="Maximum number of messages"),
-    offset: int = Query(0, ge=0, description="Number of messages to skip"),
-    current_user: User = Depends(get_current_active_user),
+    offset: int = Query(0, ge=0, description="Number of messages to skip (prefer cursor)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     service = Depends(get_conversation_service)
 ):
     """
     Retrieve messages from a conversation with pagination.
 
-    Messages are retrieved from ZeroDB and returned in chronological order.
+    Messages are returned in chronological order.
 
     Pagination:
     - limit: Number of messages per page (1-200, default 50)
-    - offset: Number of messages to skip (default 0)
+    - cursor: Keyset cursor from the previous page's next_cursor; every page
+      costs the same regardless of depth
+    - offset: Number of messages to skip (default 0); retained for existing
+      clients, deep offsets get slower linearly
 
     Args:
         conversation_id: UUID of the conversation
         limit: Messages per page
         offset: Messages to skip
+        cursor: Keyset cursor
         service: ConversationService dependency
 
     Returns:
-        MessageListResponse with messages and total count
+        MessageListResponse with messages, total count and next_cursor
 
     Example:
-        GET /conversations/123e4567-e89b-12d3-a456-426614174000/messages?limit=20&offset=0
+        GET /conversations/123e4567-e89b-12d3-a456-426614174000/messages?limit=20
+        GET /conversations/123e4567-e89b-12d3-a456-426614174000/messages?limit=20&cursor=MjAyNC0...
     """
     # Verify conversation access before retrieving messages (Issue #130)
     conversation = await service.get_conversation(conversation_id)
@@ -198,18 +206,77 @@ async def get_conversation_messages(
         )
     verify_conversation_access(conversation, current_user, require_ownership=True)
 
-    messages = await service.get_messages(
-        conversation_id=conversation_id,
-        limit=limit,
-        offset=offset
-    )
+    next_cursor = None
+    if offset and not cursor:
+        messages = await service.get_messages(
+            conversation_id=conversation_id,
+            limit=limit,
+            offset=offset
+        )
+    else:
+        try:
+            messages, next_cursor = await service.get_messages_page(
+                conversation_id=conversation_id,
+                limit=limit,
+                cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
 
     # Get total message count (message_count field removed in Issue #103 migration)
     total = await service.get_message_count(conversation_id)
 
     return MessageListResponse(
         messages=messages,
-        total=total
+        total=total,
+        next_cursor=next_cursor
+    )
+
+
+@router.get("/{conversation_id}/messages/export")
+async def export_conversation_messages(
+    conversation_id: UUID,
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    service = Depends(get_conversation_service)
+):
+    """
+    Stream a full conversation transcript as NDJSON.
+
+    Each line is one MessageResponse JSON object, in chronological order.
+    Messages are read in keyset batches while the response is written, so
+    the transcript is never loaded into memory as a whole.
+
+    Args:
+        conversation_id: UUID of the conversation
+        service: ConversationService dependency
+
+    Returns:
+        StreamingResponse with media type application/x-ndjson
+
+    Example:
+        GET /conversations/123e4567-e89b-12d3-a456-426614174000/messages/export
+    """
+    conversation = await service.get_conversation(conversation_id)
+    if not conversation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Conversation with ID '{conversation_id}' not found"
+        )
+    verify_conversation_access(conversation, current_user, require_ownership=True)
+
+    async def ndjson_lines():
+        async for message in service.iter_messages(conversation_id):
+            yield message.model_dump_json() + "\n"
+
+    return StreamingResponse(
+        ndjson_lines(),
+        media_type="application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="conversation-{conversation_id}.ndjson"'
+        }
     )
 
 
@@ -217,7 +284,7 @@ async def get_conversation_messages(
 async def search_conversation(
     conversation_id: UUID,
     request: SearchRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     service = Depends(get_conversation_service)
 ):
     """
@@ -227,7 +294,7 @@ async def search_conversation(
 
     Args:
         conversation_id: UUID of the conversation
-        request: SearchRequest with query and optional limit
+        request: SearchRequest with query and optional limit/offset
         service: ConversationService dependency
 
     Returns:
@@ -237,7 +304,8 @@ async def search_conversation(
         POST /conversations/123e4567-e89b-12d3-a456-426614174000/search
         {
             "query": "machine learning concepts",
-            "limit": 5
+            "limit": 5,
+            "offset": 5
         }
     """
     # Verify conversation access before searching (Issue #130)
@@ -252,7 +320,8 @@ async def search_conversation(
     result = await service.search_conversation_semantic(
         conversation_id=conversation_id,
         query=request.query,
-        limit=request.limit or 5
+        limit=request.limit or 5,
+        offset=request.offset
     )
 
     return SearchResultsResponse(results=result)
@@ -261,7 +330,7 @@ async def search_conversation(
 @router.post("", response_model=ConversationResponse, status_code=status.HTTP_201_CREATED)
 async def create_conversation(
     request: CreateConversationRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     service = Depends(get_conversation_service)
 ):
     """
@@ -300,7 +369,7 @@ async def create_conversation(
 async def add_message(
     conversation_id: UUID,
     request: AddMessageRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     service = Depends(get_conversation_service)
 ):
     """
@@ -353,7 +422,7 @@ async def add_message(
 @router.post("/{conversation_id}/archive", response_model=ConversationResponse)
 async def archive_conversation(
     conversation_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     service = Depends(get_conversation_service)
 ):
     """
@@ -394,7 +463,7 @@ async def archive_conversation(
 async def get_conversation_context(
     conversation_id: UUID,
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of messages to include"),
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     service = Depends(get_conversation_service)
 ):
     """
@@ -444,7 +513,7 @@ async def get_conversation_context(
 async def attach_agent_to_conversation(
     conversation_id: UUID,
     request: AttachAgentRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     service = Depends(get_conversation_service)
 ):
     """
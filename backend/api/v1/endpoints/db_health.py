@@ -15,7 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.db.base import get_async_db, async_engine, engine
 from backend.security.auth_service import get_current_user
-from backend.models.user import User
+from backend.security.principal_cache import UserSnapshot
 
 
 router = APIRouter(tags=["Database Health"])
@@ -123,7 +123,7 @@ def _derive_health_status(
 )
 async def get_database_health(
     db: AsyncSession = Depends(get_async_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserSnapshot = Depends(get_current_user)
 ) -> DatabaseHealthResponse:
     """
     Check database health and connection pool statistics
@@ -194,7 +194,7 @@ async def get_database_health(
     description="Get raw connection pool statistics for async and sync pools"
 )
 async def get_pool_statistics(
-    current_user: User = Depends(get_current_user)
+    current_user: UserSnapshot = Depends(get_current_user)
 ) -> Dict[str, PoolStats]:
     """
     Get raw database connection pool statistics
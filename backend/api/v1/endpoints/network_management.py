@@ -40,6 +40,7 @@ except ImportError:
     logging.warning("qrcode library not available - QR generation will fail")
 
 from backend.services.wireguard_provisioning_service import WireGuardProvisioningService
+from backend.api.v1.endpoints.wireguard_provisioning import get_provisioning_service
 
 logger = logging.getLogger(__name__)
 
@@ -149,35 +150,10 @@ class NetworkTopology(BaseModel):
 # Dependency Injection
 # ============================================================================
 
-# Singleton instance of provisioning service (reuse from wireguard_provisioning.py)
-_provisioning_service: Optional[WireGuardProvisioningService] = None
-
-
-def get_provisioning_service() -> WireGuardProvisioningService:
-    """
-    Get or create provisioning service instance
-
-    Returns:
-        WireGuardProvisioningService instance
-    """
-    import os
-    global _provisioning_service
-
-    if _provisioning_service is None:
-        config_path = os.getenv(
-            "WIREGUARD_CONFIG_PATH",
-            "/Users/aideveloper/openclaw-backend/.wireguard/wg0.conf"
-        )
-        _provisioning_service = WireGuardProvisioningService(
-            ip_pool_network=os.getenv("WIREGUARD_IP_POOL", "10.8.0.0/24"),
-            hub_public_key=os.getenv("WIREGUARD_HUB_PUBLIC_KEY", "hub_wireguard_public_key_placeholder=="),
-            hub_endpoint=os.getenv("WIREGUARD_HUB_ENDPOINT", "localhost:51820"),
-            hub_ip=os.getenv("WIREGUARD_HUB_IP", "10.8.0.1"),
-            config_path=config_path,
-            enable_dbos=False
-        )
-
-    return _provisioning_service
+# get_provisioning_service is imported from wireguard_provisioning so both
+# routers share one provisioning service and one persisted IP pool (default
+# 10.8.0.0/24, hub 10.8.0.1); separate instances over the same state
+# directory would hand out the same addresses.
 
 
 # ============================================================================
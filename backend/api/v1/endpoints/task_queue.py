@@ -24,7 +24,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_, desc
 
 from backend.db.base import get_db
-from backend.models.task_queue import Task, TaskLease, TaskStatus, TaskPriority
+from backend.models.task_lease import Task, TaskLease, TaskStatus, TaskPriority
 from backend.services.task_timeline_service import get_timeline_service
 
 logger = logging.getLogger(__name__)
@@ -58,6 +58,100 @@ def _ensure_timezone(dt: datetime) -> datetime:
     return dt
 
 
+# Time series bucket configuration: (bucket count, bucket width, truncation unit)
+TIME_SERIES_BUCKETS = {
+    "hourly": (24, timedelta(hours=1), "hour"),
+    "daily": (30, timedelta(days=1), "day"),
+}
+
+
+def _truncate(dt: datetime, unit: str) -> datetime:
+    """Truncate a datetime to the start of its hour or day."""
+    if unit == "day":
+        return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def _bucket_expression(db: Session, column, unit: str):
+    """
+    Build a SQL expression truncating a timestamp column to a UTC bucket.
+
+    Uses date_trunc on PostgreSQL; strftime keeps the endpoint usable on
+    SQLite test databases.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return func.date_trunc(unit, func.timezone("UTC", column))
+
+    pattern = "%Y-%m-%d 00:00:00" if unit == "day" else "%Y-%m-%d %H:00:00"
+    return func.strftime(pattern, column)
+
+
+def _bucket_start(value: Any) -> datetime:
+    """Normalize a bucket value returned by the database to an aware UTC datetime."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return _ensure_timezone(value)
+
+
+def _get_time_series(db: Session, interval: str, since: Optional[datetime]) -> List[Dict[str, Any]]:
+    """
+    Compute created/completed/failed counts per time bucket with GROUP BY.
+
+    Buckets are aligned to UTC hour (last 24) or day (last 30) boundaries.
+
+    Args:
+        db: Database session
+        interval: "hourly" or "daily"
+        since: Optional filter for tasks created after this time
+
+    Returns:
+        Buckets ordered oldest first
+    """
+    bucket_count, bucket_width, unit = TIME_SERIES_BUCKETS[interval]
+    window_start = _truncate(datetime.now(timezone.utc), unit) - bucket_width * (bucket_count - 1)
+
+    created_bucket = _bucket_expression(db, Task.created_at, unit)
+    created_query = (
+        db.query(created_bucket, func.count(Task.id))
+        .filter(Task.created_at >= window_start)
+    )
+    if since:
+        created_query = created_query.filter(Task.created_at >= since)
+
+    finished_bucket = _bucket_expression(db, Task.completed_at, unit)
+    finished_query = (
+        db.query(finished_bucket, Task.status, func.count(Task.id))
+        .filter(
+            and_(
+                Task.status.in_([TaskStatus.COMPLETED, TaskStatus.FAILED]),
+                Task.completed_at >= window_start,
+            )
+        )
+    )
+    if since:
+        finished_query = finished_query.filter(Task.created_at >= since)
+
+    created_counts = {
+        _bucket_start(bucket): count
+        for bucket, count in created_query.group_by(created_bucket).all()
+    }
+    finished_counts: Dict[tuple, int] = {}
+    for bucket, status, count in finished_query.group_by(finished_bucket, Task.status).all():
+        finished_counts[(_bucket_start(bucket), TaskStatus(status))] = count
+
+    buckets = []
+    for i in range(bucket_count):
+        bucket_start = window_start + bucket_width * i
+        buckets.append({
+            "timestamp": bucket_start.isoformat(),
+            "created": created_counts.get(bucket_start, 0),
+            "completed": finished_counts.get((bucket_start, TaskStatus.COMPLETED), 0),
+            "failed": finished_counts.get((bucket_start, TaskStatus.FAILED), 0),
+        })
+
+    return buckets
+
+
 # IMPORTANT: Define specific routes BEFORE parameterized routes
 # to avoid path conflicts. E.g., /active-leases must come before /{task_id}
 
@@ -252,6 +346,9 @@ async def get_queue_stats(
     """
     Get queue statistics.
 
+    All aggregation runs in the database (GROUP BY / date_trunc), so the
+    cost does not grow with the number of task rows loaded into Python.
+
     Args:
         interval: Time series bucket interval (hourly or daily)
         since: Optional filter for tasks created after this time
@@ -260,21 +357,39 @@ async def get_queue_stats(
     Returns:
         Statistics including summary counts, time series, and breakdowns
     """
-    # Build base query
-    query = db.query(Task)
+    # Status / priority / type breakdown in a single GROUP BY pass
+    breakdown_query = db.query(
+        Task.status,
+        Task.priority,
+        Task.task_type,
+        func.count(Task.id),
+        func.sum(Task.duration_seconds),
+        func.count(Task.duration_seconds),
+    )
     if since:
-        query = query.filter(Task.created_at >= since)
-
-    tasks = query.all()
-
-    # Calculate summary statistics
-    status_counts = {}
-    for status in TaskStatus:
-        status_counts[status.value] = sum(1 for t in tasks if t.status == status)
+        breakdown_query = breakdown_query.filter(Task.created_at >= since)
+    breakdown_rows = breakdown_query.group_by(Task.status, Task.priority, Task.task_type).all()
+
+    status_counts = {status.value: 0 for status in TaskStatus}
+    by_priority = {priority.value: 0 for priority in TaskPriority}
+    by_type: Dict[str, int] = {}
+    total_count = 0
+    completed_duration_sum = 0.0
+    completed_duration_count = 0
+
+    for status, priority, task_type, count, duration_sum, duration_count in breakdown_rows:
+        status = TaskStatus(status)
+        status_counts[status.value] += count
+        by_priority[TaskPriority(priority).value] += count
+        by_type[task_type] = by_type.get(task_type, 0) + count
+        total_count += count
+        if status == TaskStatus.COMPLETED and duration_count:
+            completed_duration_sum += duration_sum
+            completed_duration_count += duration_count
 
     # Count active leases
     active_leases_count = (
-        db.query(TaskLease)
+        db.query(func.count(TaskLease.id))
         .filter(
             and_(
                 TaskLease.is_expired == 0,
@@ -282,17 +397,16 @@ async def get_queue_stats(
                 TaskLease.expires_at > datetime.now(timezone.utc),
             )
         )
-        .count()
+        .scalar()
     )
 
-    # Calculate average execution time for completed tasks
-    completed_tasks = [t for t in tasks if t.status == TaskStatus.COMPLETED and t.duration_seconds is not None]
+    # Average execution time for completed tasks
     avg_execution_time = None
-    if completed_tasks:
-        avg_execution_time = sum(t.duration_seconds for t in completed_tasks) / len(completed_tasks)
+    if completed_duration_count:
+        avg_execution_time = completed_duration_sum / completed_duration_count
 
     summary = {
-        "total_count": len(tasks),
+        "total_count": total_count,
         "queued_count": status_counts.get("queued", 0),
         "leased_count": status_counts.get("leased", 0),
         "running_count": status_counts.get("running", 0),
@@ -304,82 +418,8 @@ async def get_queue_stats(
         "avg_execution_time_seconds": avg_execution_time,
     }
 
-    # Generate time series data
-    now = datetime.now(timezone.utc)
-    time_series = {}
-
-    if interval == "hourly":
-        # Last 24 hours, hourly buckets
-        buckets = []
-        for i in range(24):
-            bucket_start = now - timedelta(hours=23-i)
-            bucket_end = bucket_start + timedelta(hours=1)
-
-            created = sum(
-                1 for t in tasks
-                if t.created_at and bucket_start <= _ensure_timezone(t.created_at) < bucket_end
-            )
-            completed = sum(
-                1 for t in tasks
-                if t.completed_at and bucket_start <= _ensure_timezone(t.completed_at) < bucket_end
-                and t.status == TaskStatus.COMPLETED
-            )
-            failed = sum(
-                1 for t in tasks
-                if t.completed_at and bucket_start <= _ensure_timezone(t.completed_at) < bucket_end
-                and t.status == TaskStatus.FAILED
-            )
-
-            buckets.append({
-                "timestamp": bucket_start.isoformat(),
-                "created": created,
-                "completed": completed,
-                "failed": failed,
-            })
-
-        time_series["hourly"] = buckets
-
-    elif interval == "daily":
-        # Last 30 days, daily buckets
-        buckets = []
-        for i in range(30):
-            bucket_start = (now - timedelta(days=29-i)).replace(hour=0, minute=0, second=0, microsecond=0)
-            bucket_end = bucket_start + timedelta(days=1)
-
-            created = sum(
-                1 for t in tasks
-                if t.created_at and bucket_start <= _ensure_timezone(t.created_at) < bucket_end
-            )
-            completed = sum(
-                1 for t in tasks
-                if t.completed_at and bucket_start <= _ensure_timezone(t.completed_at) < bucket_end
-                and t.status == TaskStatus.COMPLETED
-            )
-            failed = sum(
-                1 for t in tasks
-                if t.completed_at and bucket_start <= _ensure_timezone(t.completed_at) < bucket_end
-                and t.status == TaskStatus.FAILED
-            )
-
-            buckets.append({
-                "timestamp": bucket_start.isoformat(),
-                "created": created,
-                "completed": completed,
-                "failed": failed,
-            })
-
-        time_series["daily"] = buckets
-
-    # Breakdown by priority
-    by_priority = {}
-    for priority in TaskPriority:
-        by_priority[priority.value] = sum(1 for t in tasks if t.priority == priority)
-
-    # Breakdown by task type
-    by_type = {}
-    for task in tasks:
-        task_type = task.task_type
-        by_type[task_type] = by_type.get(task_type, 0) + 1
+    # Generate time series data (bucketed in the database)
+    time_series = {interval: _get_time_series(db, interval, since)}
 
     return {
         "summary": summary,
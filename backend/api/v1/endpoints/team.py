@@ -16,7 +16,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from backend.security.auth_dependencies import get_current_active_user
-from backend.models.user import User
+from backend.security.principal_cache import UserSnapshot
 from sqlalchemy.orm import Session
 
 from backend.db.base import get_db
@@ -58,7 +58,7 @@ def _serialize_member(member) -> dict:
     description="Get a list of all team members with their roles and status"
 )
 async def list_team_members(
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ) -> TeamMembersListResponse:
     """
@@ -91,7 +91,7 @@ async def list_team_members(
 )
 async def invite_member(
     request: InviteMemberRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ) -> InviteMemberResponse:
     """
@@ -154,7 +154,7 @@ async def invite_member(
 )
 async def remove_member(
     member_id: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ) -> RemoveMemberResponse:
     """
@@ -223,7 +223,7 @@ async def remove_member(
 async def update_member_role(
     member_id: str,
     request: UpdateRoleRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ) -> TeamMemberResponse:
     """
@@ -52,6 +52,10 @@ def get_provisioning_service() -> WireGuardProvisioningService:
     """
     Get or create provisioning service instance
 
+    Shared with the network management router. Without WIREGUARD_IP_POOL and
+    WIREGUARD_HUB_IP, peers are allocated from 10.8.0.0/24 behind a hub at
+    10.8.0.1.
+
     Returns:
         WireGuardProvisioningService instance
     """
@@ -60,13 +64,18 @@ def get_provisioning_service() -> WireGuardProvisioningService:
     if _provisioning_service is None:
         # Initialize service with default configuration
         # In production, these values would come from environment variables
+        config_path = os.getenv("WIREGUARD_CONFIG_PATH", os.path.expanduser("~/.wireguard/wg0.conf"))
         _provisioning_service = WireGuardProvisioningService(
-            ip_pool_network=os.getenv("WIREGUARD_IP_POOL", "10.0.0.0/24"),
+            ip_pool_network=os.getenv("WIREGUARD_IP_POOL", "10.8.0.0/24"),
             hub_public_key=os.getenv("WIREGUARD_HUB_PUBLIC_KEY", ""),
             hub_endpoint=os.getenv("WIREGUARD_HUB_ENDPOINT", "localhost:51820"),
-            hub_ip=os.getenv("WIREGUARD_HUB_IP", "10.0.0.1"),
-            config_path=os.getenv("WIREGUARD_CONFIG_PATH", os.path.expanduser("~/.wireguard/wg0.conf")),
-            enable_dbos=False  # Will enable when E4-S1 is ready
+            hub_ip=os.getenv("WIREGUARD_HUB_IP", "10.8.0.1"),
+            config_path=config_path,
+            enable_dbos=False,  # Will enable when E4-S1 is ready
+            ip_pool_state_dir=os.getenv(
+                "WIREGUARD_IP_POOL_STATE_DIR",
+                os.path.join(os.path.dirname(config_path), "ip_pool")
+            )
         )
 
     return _provisioning_service
@@ -4,9 +4,13 @@ ZeroDBClient - Enhanced async HTTP client wrapper for ZeroDB API.
 This module provides a high-level interface to interact with ZeroDB's
 NoSQL database and memory storage APIs with advanced features:
 - Retry logic with exponential backoff
-- Connection pooling and reuse
+- Connection pooling and reuse (one lazily created, shared
+  httpx.AsyncClient per ZeroDBClient and event loop with keep-alive,
+  optional HTTP/2 multiplexing and bounded in-flight requests)
 - Query builder helpers
 - Transaction support
+- Write coalescing: concurrent single-row writes to the same table are
+  auto-batched into one insert_rows/bulk_upsert request
 - Circuit breaker pattern
 - Caching layer
 - Workspace and Conversation-specific helpers for Epic E9
@@ -14,6 +18,7 @@ NoSQL database and memory storage APIs with advanced features:
 Environment Variables:
     ZERODB_API_KEY: API key for authentication
     ZERODB_API_URL: Base URL for ZeroDB API (default: https://api.ainative.studio)
+    ZERODB_HTTP2: Enable HTTP/2 when the h2 package is installed (default: true)
 
 Usage:
     async with ZeroDBClient(api_key="your-key") as client:
@@ -21,14 +26,29 @@ Usage:
         rows = await client.query_table(project_id="proj_123", table_name="users", limit=10, skip=0)
 """
 
-from typing import List, Dict, Any, Optional, AsyncContextManager
+from typing import List, Dict, Any, Optional, AsyncContextManager, AsyncIterator
 import httpx
 import os
 import asyncio
+import logging
 import random
 import time
+import weakref
 from contextlib import asynccontextmanager
 
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+# Every ZeroDBClient that has been constructed and not yet garbage collected;
+# used for aggregate pool metrics and graceful shutdown
+_live_clients: "weakref.WeakSet[ZeroDBClient]" = weakref.WeakSet()
+
 
 class ZeroDBConnectionError(Exception):
     """
@@ -140,6 +160,167 @@ class FilterBuilder:
         return self._filter
 
 
+class WriteCoalescer:
+    """
+    Auto-batching layer for single-row ZeroDB writes.
+
+    Writes to the same (operation, project, table) are collected for a short
+    window or until max_rows are queued, then sent as one insert_rows or
+    bulk_upsert request. Each caller awaits its own future, which resolves
+    with that caller's row result (or the batch's exception).
+    """
+
+    def __init__(self, client: "ZeroDBClient", window: float = 0.005, max_rows: int = 100):
+        """
+        Initialize write coalescer.
+
+        Args:
+            client: ZeroDBClient used to send the batches
+            window: Maximum time a write waits for companions (seconds)
+            max_rows: Batch size that triggers an immediate send
+        """
+        self._client = client
+        self.window = window
+        self.max_rows = max_rows
+        self._pending: Dict[tuple, Dict[str, Any]] = {}
+        self._sending: set = set()
+        self._stats = {
+            "writes": 0,
+            "batches": 0,
+            "max_batch_size": 0,
+            "failed_batches": 0,
+        }
+
+    async def submit(
+        self,
+        operation: str,
+        project_id: Optional[str],
+        table_name: str,
+        row: Dict[str, Any],
+        unique_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Queue a row write and wait for its batch to be sent.
+
+        Args:
+            operation: "insert" or "upsert"
+            project_id: Project ID (None = ZERODB_PROJECT_ID env var)
+            table_name: Target table
+            row: Row document
+            unique_key: Upsert match field (upsert only)
+
+        Returns:
+            Per-row result dict
+        """
+        loop = asyncio.get_running_loop()
+        key = (operation, project_id, table_name, unique_key)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = {"rows": [], "futures": [], "timer": None}
+            self._pending[key] = batch
+            batch["timer"] = loop.call_later(self.window, self._dispatch, key)
+
+        future = loop.create_future()
+        batch["rows"].append(row)
+        batch["futures"].append(future)
+        self._stats["writes"] += 1
+
+        if len(batch["rows"]) >= self.max_rows:
+            self._dispatch(key)
+
+        return await future
+
+    def _dispatch(self, key: tuple) -> None:
+        """Detach the pending batch for key and send it in the background."""
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch["timer"] is not None:
+            batch["timer"].cancel()
+
+        task = asyncio.ensure_future(self._send(key, batch["rows"], batch["futures"]))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(
+        self,
+        key: tuple,
+        rows: List[Dict[str, Any]],
+        futures: List[asyncio.Future]
+    ) -> None:
+        """Send one batch and resolve every caller's future."""
+        operation, project_id, table_name, unique_key = key
+        self._stats["batches"] += 1
+        self._stats["max_batch_size"] = max(self._stats["max_batch_size"], len(rows))
+
+        try:
+            if operation == "upsert":
+                # Last write wins for duplicate keys within one batch
+                latest = {row.get(unique_key): row for row in rows}
+                result = await self._client.bulk_upsert(
+                    table_name=table_name,
+                    rows=list(latest.values()),
+                    unique_key=unique_key,
+                    project_id=project_id
+                )
+                results = [
+                    {"project_id": project_id, "table_name": table_name, "data": row, "result": result}
+                    for row in rows
+                ]
+            else:
+                result = await self._client.insert_rows(
+                    table_name=table_name,
+                    rows=rows,
+                    project_id=project_id
+                )
+                ids = result.get("inserted_ids") or []
+                if not ids and len(rows) == 1 and "id" in result:
+                    ids = [result["id"]]
+                results = [
+                    {
+                        "id": ids[i] if i < len(ids) else None,
+                        "project_id": project_id,
+                        "table_name": table_name,
+                        "data": row,
+                    }
+                    for i, row in enumerate(rows)
+                ]
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            self._stats["failed_batches"] += 1
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, row_result in zip(futures, results):
+            if not future.done():
+                future.set_result(row_result)
+
+    async def flush(self) -> None:
+        """Send all pending batches now and wait for in-flight batches."""
+        for key in list(self._pending):
+            self._dispatch(key)
+        if self._sending:
+            await asyncio.gather(*list(self._sending), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dict with writes, batches, max batch size and requests saved
+        """
+        return {
+            **self._stats,
+            "pending": sum(len(batch["rows"]) for batch in self._pending.values()),
+            "requests_saved": self._stats["writes"] - self._stats["batches"],
+        }
+
+
 class Transaction:
     """
     Transaction context for batch operations.
@@ -193,7 +374,12 @@ class ZeroDBClient:
         pool_max_connections: int = 100,
         pool_max_keepalive_connections: int = 20,
         timeout: float = 30.0,
-        connect_timeout: float = 10.0
+        connect_timeout: float = 10.0,
+        http2: Optional[bool] = None,
+        keepalive_expiry: float = 30.0,
+        max_concurrent_requests: Optional[int] = None,
+        write_coalesce_window: float = 0.005,
+        write_coalesce_max_rows: int = 100
     ):
         """
         Initialize ZeroDBClient.
@@ -205,6 +391,13 @@ class ZeroDBClient:
             pool_max_keepalive_connections: Maximum keepalive connections
             timeout: Request timeout in seconds
             connect_timeout: Connection timeout in seconds
+            http2: Enable HTTP/2 multiplexing (defaults to ZERODB_HTTP2 env var;
+                ignored when the h2 package is not installed)
+            keepalive_expiry: Seconds an idle keep-alive connection is retained
+            max_concurrent_requests: Maximum in-flight requests sharing the pool
+                (default: pool_max_connections)
+            write_coalesce_window: Seconds batched writes wait for companions
+            write_coalesce_max_rows: Batched write count that triggers an immediate send
         """
         self.api_key = api_key or os.getenv("ZERODB_API_KEY")
         self.api_url = api_url or os.getenv("ZERODB_API_URL", "https://api.ainative.studio/v1")
@@ -217,9 +410,17 @@ class ZeroDBClient:
             "Content-Type": "application/json"
         }
 
-        # Connection pooling configuration
+        # Connection pooling configuration. The client only talks to api_url,
+        # so the pool limits are effectively per-host limits.
         self.pool_max_connections = pool_max_connections
         self.pool_max_keepalive_connections = pool_max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        if http2 is None:
+            http2 = os.getenv("ZERODB_HTTP2", "true").lower() in ("1", "true", "yes")
+        if http2 and not HTTP2_AVAILABLE:
+            logger.info("h2 package not installed; ZeroDB client falling back to HTTP/1.1")
+        self.http2 = bool(http2 and HTTP2_AVAILABLE)
+        self.max_concurrent_requests = max_concurrent_requests or pool_max_connections
 
         # Timeout configuration
         self.timeout = timeout
@@ -227,8 +428,23 @@ class ZeroDBClient:
 
         # Internal state
         self._client: Optional[httpx.AsyncClient] = None
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        # Event loop the HTTP client and request slots are bound to
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
         self._cache: Dict[str, Dict[str, Any]] = {}
 
+        # Pool metrics
+        self._in_flight = 0
+        self._requests_total = 0
+        self._clients_created = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+        # Auto-batching for single-row writes
+        self.write_coalesce_window = write_coalesce_window
+        self.write_coalesce_max_rows = write_coalesce_max_rows
+        self._coalescer: Optional[WriteCoalescer] = None
+
         # Circuit breaker state
         self._circuit_breaker_state = "closed"
         self._failure_count = 0
@@ -236,16 +452,18 @@ class ZeroDBClient:
         self._circuit_breaker_timeout = 60.0
         self._last_failure_time = 0.0
 
+        _live_clients.add(self)
+
     async def __aenter__(self):
         """
         Async context manager entry.
 
-        Creates and returns the client instance.
+        Creates the shared HTTP client and returns the client instance.
 
         Returns:
             Self instance
         """
-        self._client = httpx.AsyncClient()
+        self._get_http_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -259,8 +477,231 @@ class ZeroDBClient:
             exc_val: Exception value (if any)
             exc_tb: Exception traceback (if any)
         """
-        if self._client:
-            await self._client.aclose()
+        await self.aclose()
+
+    def _bind_to_running_loop(self) -> None:
+        """
+        Drop the HTTP client and request slots if they belong to another loop.
+
+        httpx connections and asyncio primitives are tied to the event loop
+        that created them, so an instance reused from a new loop (a second
+        asyncio.run, a per-test loop, a worker thread) gets fresh ones. The
+        stale client is closed on its own loop when that loop is still
+        running, and otherwise left to be garbage collected.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client_loop is loop:
+            return
+        if self._client_loop is None:
+            # First use: adopt the current loop
+            self._client_loop = loop
+            return
+
+        stale, stale_loop = self._client, self._client_loop
+        self._client = None
+        self._request_slots = None
+        self._client_loop = loop
+
+        if stale is not None and stale_loop is not None and stale_loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(stale.aclose(), stale_loop)
+            except RuntimeError:
+                pass
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        All API methods share this client so TCP/TLS handshakes are paid once
+        per pooled connection instead of once per call. The client is
+        recreated when used from a different event loop.
+
+        Returns:
+            Long-lived httpx.AsyncClient
+        """
+        self._bind_to_running_loop()
+        if self._client is None or getattr(self._client, "is_closed", False) is True:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.pool_max_connections,
+                    max_keepalive_connections=self.pool_max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+            )
+            self._clients_created += 1
+        return self._client
+
+    @asynccontextmanager
+    async def _pooled_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Borrow the shared HTTP client for a single request.
+
+        Bounds in-flight requests to max_concurrent_requests and records how
+        long callers waited for a slot.
+
+        Yields:
+            Shared httpx.AsyncClient
+        """
+        self._bind_to_running_loop()
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+
+        started = time.monotonic()
+        async with self._request_slots:
+            waited = time.monotonic() - started
+            self._wait_seconds_total += waited
+            self._wait_seconds_max = max(self._wait_seconds_max, waited)
+            self._requests_total += 1
+            self._in_flight += 1
+            try:
+                yield self._get_http_client()
+            finally:
+                self._in_flight -= 1
+
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP client and its pooled connections.
+
+        Safe to call multiple times; the client is recreated lazily if the
+        instance is used again afterwards.
+        """
+        if self._coalescer is not None:
+            await self._coalescer.flush()
+
+        client, self._client = self._client, None
+        client_loop, self._client_loop = self._client_loop, None
+        self._request_slots = None
+        if client is None:
+            return
+        if client_loop is None or client_loop is asyncio.get_running_loop():
+            await client.aclose()
+        elif client_loop.is_running():
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+            )
+
+    def _get_coalescer(self) -> WriteCoalescer:
+        """Get the write coalescer, creating it on first use."""
+        if self._coalescer is None:
+            self._coalescer = WriteCoalescer(
+                self,
+                window=self.write_coalesce_window,
+                max_rows=self.write_coalesce_max_rows
+            )
+        return self._coalescer
+
+    async def create_table_row_batched(
+        self,
+        project_id: str,
+        table_name: str,
+        row_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Create a table row, coalescing concurrent calls into one insert_rows.
+
+        Adds at most write_coalesce_window of latency, and bursts to the
+        same table are sent as a single request. Rows are written through
+        the public database API
+        (POST /v1/public/{project_id}/database/tables/{table_name}/rows),
+        the same tables query_rows reads; create_table_row and query_table
+        use the legacy /projects/{project_id}/tables routes instead.
+
+        Args:
+            project_id: ID of the project
+            table_name: Name of the table
+            row_data: Document data as key-value pairs
+
+        Returns:
+            Dict containing id, project_id, table_name and data for this row
+
+        Raises:
+            ZeroDBConnectionError: If connection to API fails
+            ZeroDBAPIError: If API returns error response
+        """
+        return await self._get_coalescer().submit(
+            "insert", project_id, table_name, row_data
+        )
+
+    async def upsert_row_batched(
+        self,
+        table_name: str,
+        row: Dict[str, Any],
+        unique_key: str,
+        project_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Upsert a single row, coalescing concurrent calls into one bulk_upsert.
+
+        Args:
+            table_name: Name of the table
+            row: Row document
+            unique_key: Field name to use for upsert matching
+            project_id: Project ID (defaults to ZERODB_PROJECT_ID env var)
+
+        Returns:
+            Dict containing project_id, table_name, data and the batch result
+
+        Raises:
+            ZeroDBConnectionError: If connection to API fails
+            ZeroDBAPIError: If API returns error response
+        """
+        return await self._get_coalescer().submit(
+            "upsert", project_id, table_name, row, unique_key=unique_key
+        )
+
+    async def flush_writes(self) -> None:
+        """Send all pending batched writes immediately."""
+        if self._coalescer is not None:
+            await self._coalescer.flush()
+
+    def get_write_stats(self) -> Dict[str, Any]:
+        """
+        Get write coalescing statistics.
+
+        Returns:
+            Dict with writes, batches, max batch size and requests saved
+        """
+        if self._coalescer is None:
+            return WriteCoalescer(self).get_stats()
+        return self._coalescer.get_stats()
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics.
+
+        Returns:
+            Dict with in-flight requests, open/idle connections and slot wait times
+        """
+        connections = self._pool_connections()
+        idle = 0
+        for connection in connections:
+            try:
+                idle += 1 if connection.is_idle() else 0
+            except Exception:
+                pass
+
+        return {
+            "in_use": self._in_flight,
+            "idle": idle,
+            "connections": len(connections),
+            "max_connections": self.pool_max_connections,
+            "max_keepalive_connections": self.pool_max_keepalive_connections,
+            "http2": self.http2,
+            "requests_total": self._requests_total,
+            "clients_created": self._clients_created,
+            "wait_seconds_total": self._wait_seconds_total,
+            "wait_seconds_max": self._wait_seconds_max,
+        }
+
+    def _pool_connections(self) -> List[Any]:
+        """Best-effort view of the httpcore connections behind the shared client."""
+        if self._client is None:
+            return []
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        return list(connections) if isinstance(connections, (list, tuple)) else []
 
     async def create_project(
         self,
@@ -302,7 +743,7 @@ class ZeroDBClient:
             else:
                 self._circuit_breaker_state = "half_open"
 
-        async with httpx.AsyncClient() as client:
+        async with self._pooled_client() as client:
             try:
                 response = await client.post(
                     f"{self.api_url}/projects",
@@ -365,7 +806,7 @@ class ZeroDBClient:
                 table_name="users"
             )
         """
-        async with httpx.AsyncClient() as client:
+        async with self._pooled_client() as client:
             try:
                 response = await client.post(
                     f"{self.api_url}/projects/{project_id}/tables",
@@ -415,7 +856,7 @@ class ZeroDBClient:
                 row_data={"name": "John", "email": "john@example.com"}
             )
         """
-        async with httpx.AsyncClient() as client:
+        async with self._pooled_client() as client:
             try:
                 response = await client.post(
                     f"{self.api_url}/projects/{project_id}/tables/{table_name}/rows",
@@ -474,7 +915,7 @@ class ZeroDBClient:
                 skip=10
             )
         """
-        async with httpx.AsyncClient() as client:
+        async with self._pooled_client() as client:
             try:
                 response = await client.get(
                     f"{self.api_url}/projects/{project_id}/tables/{table_name}/rows",
@@ -536,7 +977,7 @@ class ZeroDBClient:
                 metadata={"source": "user-input", "priority": "high"}
             )
         """
-        async with httpx.AsyncClient() as client:
+        async with self._pooled_client() as client:
             try:
                 response = await client.post(
                     f"{self.api_url}/memories",
@@ -563,17 +1004,25 @@ class ZeroDBClient:
         self,
         query: str,
         limit: int = 10,
-        type: Optional[str] = None
+        type: Optional[str] = None,
+        offset: int = 0,
+        tags: Optional[List[str]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Search memories using semantic similarity.
 
         Uses vector embeddings to find memories similar to the query text.
+        Filters are applied server-side before ranking, so a page of results
+        is never diluted by memories outside the filter.
 
         Args:
             query: Search query text
             limit: Maximum number of results to return (default: 10)
             type: Optional filter by memory type
+            offset: Number of ranked results to skip (default: 0)
+            tags: Optional filter - memories must carry all of these tags
+            metadata_filter: Optional filter - exact matches on memory metadata
 
         Returns:
             Dict containing search results:
@@ -603,8 +1052,17 @@ class ZeroDBClient:
                 limit=5,
                 type="note"
             )
+
+            # Second page of one conversation's messages
+            results = await client.search_memories(
+                query="deployment",
+                limit=5,
+                offset=5,
+                type="conversation",
+                metadata_filter={"conversation_id": str(conversation_id)}
+            )
         """
-        async with httpx.AsyncClient() as client:
+        async with self._pooled_client() as client:
             try:
                 payload = {
                     "query": query,
@@ -612,6 +1070,12 @@ class ZeroDBClient:
                 }
                 if type is not None:
                     payload["type"] = type
+                if offset:
+                    payload["offset"] = offset
+                if tags:
+                    payload["tags"] = tags
+                if metadata_filter:
+                    payload["metadata_filter"] = metadata_filter
 
                 response = await client.post(
                     f"{self.api_url}/memories/search",
@@ -634,7 +1098,8 @@ class ZeroDBClient:
         filter_query: Dict[str, Any],
         project_id: Optional[str] = None,
         limit: int = 100,
-        skip: int = 0
+        skip: int = 0,
+        sort: Optional[Dict[str, int]] = None
     ) -> Dict[str, Any]:
         """
         Query table rows using MongoDB-style filter queries.
@@ -647,10 +1112,14 @@ class ZeroDBClient:
             project_id: Project ID (defaults to ZERODB_PROJECT_ID env var)
             limit: Maximum number of rows to return (default: 100)
             skip: Number of rows to skip for pagination (default: 0)
+            sort: Optional MongoDB-style sort spec applied server-side before
+                skip/limit, e.g. {"timestamp": 1, "id": 1} (1 ascending, -1
+                descending; keys are applied in order)
 
         Returns:
             Dict containing:
-                - rows: List of matching rows
+                - data: List of matching rows; each item holds the stored
+                  document under "row_data"
                 - total: Total number of matching rows
                 - limit: Limit used
                 - skip: Skip offset used
@@ -687,16 +1156,20 @@ class ZeroDBClient:
         if not proj_id:
             raise ValueError("project_id must be provided or ZERODB_PROJECT_ID must be set in environment")
 
-        async with httpx.AsyncClient() as client:
+        body: Dict[str, Any] = {
+            "filter": filter_query,
+            "limit": limit,
+            "skip": skip
+        }
+        if sort:
+            body["sort"] = sort
+
+        async with self._pooled_client() as client:
             try:
                 response = await client.post(
                     f"{self.api_url}/v1/public/{proj_id}/database/tables/{table_name}/query",
                     headers=self.headers,
-                    json={
-                        "filter": filter_query,
-                        "limit": limit,
-                        "skip": skip
-                    }
+                    json=body
                 )
                 response.raise_for_status()
                 return response.json()
@@ -744,7 +1217,7 @@ class ZeroDBClient:
         if not proj_id:
             raise ValueError("project_id must be provided or ZERODB_PROJECT_ID must be set in environment")
 
-        async with httpx.AsyncClient() as client:
+        async with self._pooled_client() as client:
             try:
                 response = await client.post(
                     f"{self.api_url}/v1/public/{proj_id}/database/tables/{table_name}/rows",
@@ -797,7 +1270,7 @@ class ZeroDBClient:
         if not proj_id:
             raise ValueError("project_id must be provided or ZERODB_PROJECT_ID must be set in environment")
 
-        async with httpx.AsyncClient() as client:
+        async with self._pooled_client() as client:
             try:
                 response = await client.put(
                     f"{self.api_url}/v1/public/{proj_id}/database/tables/{table_name}/rows/bulk",
@@ -856,7 +1329,7 @@ class ZeroDBClient:
         if not proj_id:
             raise ValueError("project_id must be provided or ZERODB_PROJECT_ID must be set in environment")
 
-        async with httpx.AsyncClient() as client:
+        async with self._pooled_client() as client:
             try:
                 response = await client.request(
                     method="DELETE",
@@ -938,7 +1411,7 @@ class ZeroDBClient:
         last_exception = None
         for attempt in range(max_retries + 1):
             try:
-                async with httpx.AsyncClient() as client:
+                async with self._pooled_client() as client:
                     response = await client.post(
                         f"{self.api_url}/projects",
                         headers=self.headers,
@@ -1004,7 +1477,7 @@ class ZeroDBClient:
         if not proj_id:
             raise ValueError("project_id must be provided or ZERODB_PROJECT_ID must be set in environment")
 
-        async with httpx.AsyncClient() as client:
+        async with self._pooled_client() as client:
             try:
                 response = await client.post(
                     f"{self.api_url}/v1/public/{proj_id}/database/tables/{table_name}/upsert",
@@ -1242,3 +1715,44 @@ class ZeroDBClient:
             rows=[message_data],
             project_id=project_id
         )
+
+
+class ZeroDBPoolMonitor:
+    """
+    Aggregates connection pool statistics across all live ZeroDBClients.
+
+    Registered with PrometheusMetricsService as "zerodb_pool".
+    """
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics summed over every live client.
+
+        Returns:
+            Dict with clients, in_use, idle, connections and wait-time totals
+        """
+        totals: Dict[str, Any] = {
+            "clients": 0,
+            "in_use": 0,
+            "idle": 0,
+            "connections": 0,
+            "requests_total": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+        }
+        for client in list(_live_clients):
+            stats = client.get_pool_stats()
+            totals["clients"] += 1
+            for key in ("in_use", "idle", "connections", "requests_total", "wait_seconds_total"):
+                totals[key] += stats[key]
+            totals["wait_seconds_max"] = max(totals["wait_seconds_max"], stats["wait_seconds_max"])
+        return totals
+
+
+async def close_all_clients() -> None:
+    """Gracefully close the shared HTTP clients of all live ZeroDBClients."""
+    for client in list(_live_clients):
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Error closing ZeroDB HTTP client: {e}")
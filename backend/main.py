@@ -462,10 +462,47 @@ async def startup():
         # Note: IP pool service requires network configuration, so it's registered separately when needed
         monitoring_service.bootstrap(subsystems)
 
+        # ZeroDB connection pool metrics (metrics only, not a health subsystem)
+        try:
+            from backend.integrations.zerodb_client import ZeroDBPoolMonitor
+            metrics_service.register_service("zerodb_pool", ZeroDBPoolMonitor())
+        except Exception as e:
+            print(f"Warning: ZeroDB pool metrics not available: {e}")
+
         print(f"✅ Monitoring services initialized with {len(subsystems)}/7 subsystems")
     except Exception as e:
         print(f"Warning: monitoring services initialization failed: {e}")
 
+    # Flush buffered conversation message stats for idle conversations
+    try:
+        from backend.db.base import AsyncSessionLocal
+        from backend.services.conversation_cache import start_message_stats_flusher
+        start_message_stats_flusher(AsyncSessionLocal)
+    except Exception as e:
+        print(f"Warning: conversation message stats flusher not started: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Gracefully close pooled ZeroDB HTTP connections and flush buffered conversation stats"""
+    try:
+        from backend.integrations.zerodb_client import close_all_clients
+        await close_all_clients()
+    except Exception as e:
+        print(f"Warning: failed to close ZeroDB clients: {e}")
+
+    try:
+        from backend.db.base import AsyncSessionLocal
+        from backend.services.conversation_cache import (
+            flush_message_stats,
+            stop_message_stats_flusher,
+        )
+        await stop_message_stats_flusher()
+        async with AsyncSessionLocal() as db:
+            await flush_message_stats(db)
+    except Exception as e:
+        print(f"Warning: failed to flush conversation message stats: {e}")
+
 
 @app.get("/health")
 async def health():
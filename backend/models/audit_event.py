@@ -38,6 +38,7 @@ class AuditEventType(str, Enum):
     TOKEN_REVOKED = "TOKEN_REVOKED"
     SIGNATURE_VERIFIED = "SIGNATURE_VERIFIED"
     SIGNATURE_FAILED = "SIGNATURE_FAILED"
+    LEASE_REVOKED = "LEASE_REVOKED"
 
 
 class AuditEventResult(str, Enum):
@@ -12,6 +12,10 @@ from backend.networking.wireguard_config import (
     generate_wireguard_keypair,
     generate_node_config,
 )
+from backend.networking.ip_allocator import (
+    AddressPoolExhaustedError,
+    BitmapIPAllocator,
+)
 
 __all__ = [
     "WireGuardConfig",
@@ -20,4 +24,6 @@ __all__ = [
     "IPAddressAllocator",
     "generate_wireguard_keypair",
     "generate_node_config",
+    "BitmapIPAllocator",
+    "AddressPoolExhaustedError",
 ]
@@ -0,0 +1,539 @@
+"""
+Bitmap-backed IP Address Allocation Engine
+
+Shared allocation engine for WireGuard overlay addressing. Used by
+IPPoolManager (peer-keyed pool) and IPAddressAllocator (anonymous pool).
+
+Features:
+- Compact bitmap: one bit per address in the network (8 KiB for a /16)
+- O(1) amortized allocation: LIFO free-list of released addresses first,
+  then a next-fit cursor that skips fully allocated bytes
+- Reverse maps owner -> offset and offset -> owner for O(1) lookups
+- Bulk allocate (all-or-nothing) and bulk release
+- Optional persistence: periodic snapshot plus append-only journal, so a
+  restart restores state without rebuilding from provisioning records;
+  journal appends and snapshots hold an exclusive file lock (POSIX)
+
+Persistence layout (state_dir):
+- snapshot.json: network, cursor, zlib+base64 bitmap and owner map
+- journal.log: one JSON line per mutation since the last snapshot
+  ({"op": "a", "o": offset, "p": owner} / {"op": "r", "o": offset})
+- state.lock: flock target serializing journal and snapshot writes
+"""
+
+import base64
+import ipaddress
+import json
+import logging
+import os
+import threading
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+# Largest network the bitmap will track (2^24 addresses = 2 MiB bitmap)
+MAX_BITMAP_ADDRESSES = 1 << 24
+
+
+class AddressPoolExhaustedError(ValueError):
+    """Raised when the pool has fewer free addresses than requested."""
+
+    def __init__(self, message: str, requested: int = 1, available: int = 0):
+        super().__init__(message)
+        self.requested = requested
+        self.available = available
+
+
+class BitmapIPAllocator:
+    """
+    Thread-safe bitmap IP allocator with optional snapshot + journal persistence.
+
+    Addresses are tracked by offset from the network address. Reserved
+    addresses (network, broadcast and caller-specified) are marked in the
+    bitmap so the scan never has to consult a separate set.
+    """
+
+    SNAPSHOT_FILE = "snapshot.json"
+    JOURNAL_FILE = "journal.log"
+    LOCK_FILE = "state.lock"
+
+    def __init__(
+        self,
+        network: Union[str, IPNetwork],
+        reserved: Optional[Iterable[Union[str, IPAddress]]] = None,
+        state_dir: Optional[str] = None,
+        snapshot_every: int = 1000,
+    ):
+        """
+        Initialize allocator.
+
+        Args:
+            network: Network CIDR or network object
+            reserved: Addresses that must never be allocated
+            state_dir: Directory for snapshot/journal persistence (None = in-memory)
+            snapshot_every: Journal entries after which a new snapshot is written
+
+        Raises:
+            ValueError: If the network is invalid, too large, or a reserved
+                address lies outside it
+        """
+        self.network: IPNetwork = (
+            network if not isinstance(network, str)
+            else ipaddress.ip_network(network, strict=False)
+        )
+        self.size = self.network.num_addresses
+        if self.size > MAX_BITMAP_ADDRESSES:
+            raise ValueError(
+                f"Network {self.network} is too large for bitmap allocation "
+                f"({self.size} addresses, max {MAX_BITMAP_ADDRESSES})"
+            )
+
+        self._base = int(self.network.network_address)
+        self._bits = bytearray((self.size + 7) // 8)
+        self._reserved: Set[int] = set()
+        self._owner_by_offset: Dict[int, str] = {}
+        self._offset_by_owner: Dict[str, int] = {}
+        self._allocated = 0
+        self._free_list: List[int] = []
+        self._cursor = 0
+        self._lock = threading.RLock()
+
+        # Network and broadcast addresses are never usable (mirrors hosts())
+        for offset in self._excluded_offsets():
+            self._reserve_offset(offset)
+        for address in reserved or ():
+            self.reserve(address)
+
+        self.state_dir = Path(state_dir) if state_dir else None
+        self.snapshot_every = snapshot_every
+        self._journal_entries = 0
+        self._journal = None
+        self._state_lock = None
+        if self.state_dir is not None:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            self._state_lock = open(self.state_dir / self.LOCK_FILE, "a")
+            with self._locked_state():
+                self._load_state()
+            self._journal = open(self.state_dir / self.JOURNAL_FILE, "a", encoding="utf-8")
+
+    # ------------------------------------------------------------------
+    # Bit helpers
+    # ------------------------------------------------------------------
+
+    def _excluded_offsets(self) -> List[int]:
+        """Offsets excluded by ipaddress.hosts() semantics."""
+        if self.network.version == 4:
+            if self.network.prefixlen >= 31:
+                return []
+            return [0, self.size - 1]
+        # IPv6: the subnet-router anycast address is excluded
+        return [0] if self.network.prefixlen < 127 else []
+
+    def _test(self, offset: int) -> bool:
+        return bool(self._bits[offset >> 3] & (1 << (offset & 7)))
+
+    def _set(self, offset: int) -> None:
+        self._bits[offset >> 3] |= 1 << (offset & 7)
+
+    def _clear(self, offset: int) -> None:
+        self._bits[offset >> 3] &= ~(1 << (offset & 7)) & 0xFF
+
+    def _reserve_offset(self, offset: int) -> None:
+        if offset not in self._reserved:
+            self._reserved.add(offset)
+            self._set(offset)
+
+    def _offset(self, address: Union[str, IPAddress]) -> int:
+        """
+        Convert an address to its offset.
+
+        Raises:
+            ValueError: If the address is not in the network
+        """
+        ip = ipaddress.ip_address(address) if isinstance(address, str) else address
+        if ip not in self.network:
+            raise ValueError(f"IP {ip} not in network {self.network}")
+        return int(ip) - self._base
+
+    def _address(self, offset: int) -> IPAddress:
+        return ipaddress.ip_address(self._base + offset)
+
+    def _find_free(self) -> Optional[int]:
+        """Find a free offset: free-list first, then next-fit from the cursor."""
+        while self._free_list:
+            offset = self._free_list.pop()
+            if not self._test(offset):
+                return offset
+
+        nbytes = len(self._bits)
+        start_byte = self._cursor >> 3
+        for step in range(nbytes + 1):
+            index = (start_byte + step) % nbytes
+            byte = self._bits[index]
+            if byte == 0xFF:
+                continue
+            for bit in range(8):
+                offset = (index << 3) + bit
+                if offset >= self.size:
+                    break
+                if not byte & (1 << bit):
+                    return offset
+        return None
+
+    # ------------------------------------------------------------------
+    # Allocation API
+    # ------------------------------------------------------------------
+
+    @property
+    def capacity(self) -> int:
+        """Number of allocatable (non-reserved) addresses."""
+        return self.size - len(self._reserved)
+
+    @property
+    def allocated_count(self) -> int:
+        """Number of allocated addresses."""
+        return self._allocated
+
+    @property
+    def reserved_count(self) -> int:
+        """Number of reserved addresses (including network/broadcast)."""
+        return len(self._reserved)
+
+    def available_count(self) -> int:
+        """Number of free addresses."""
+        return self.capacity - self._allocated
+
+    def reserve(self, address: Union[str, IPAddress]) -> None:
+        """
+        Reserve an address so it is never allocated.
+
+        Raises:
+            ValueError: If the address is outside the network or already allocated
+        """
+        with self._lock:
+            offset = self._offset(address)
+            if offset in self._reserved:
+                return
+            if self._test(offset):
+                raise ValueError(f"IP {self._address(offset)} already allocated")
+            self._reserve_offset(offset)
+
+    def is_reserved(self, address: Union[str, IPAddress]) -> bool:
+        """Check whether an address is reserved."""
+        try:
+            return self._offset(address) in self._reserved
+        except ValueError:
+            return False
+
+    def is_allocated(self, address: Union[str, IPAddress]) -> bool:
+        """Check whether an address is allocated (reserved addresses excluded)."""
+        try:
+            offset = self._offset(address)
+        except ValueError:
+            return False
+        return offset not in self._reserved and self._test(offset)
+
+    def allocate(self, owner: Optional[str] = None) -> IPAddress:
+        """
+        Allocate the next free address.
+
+        Args:
+            owner: Optional owner identifier (must be unique)
+
+        Returns:
+            Allocated address
+
+        Raises:
+            ValueError: If owner already holds an address
+            AddressPoolExhaustedError: If no address is free
+        """
+        with self._lock:
+            if owner is not None and owner in self._offset_by_owner:
+                raise ValueError(
+                    f"Peer {owner} already has IP "
+                    f"{self._address(self._offset_by_owner[owner])} allocated"
+                )
+            offset = self._find_free()
+            if offset is None:
+                raise AddressPoolExhaustedError(
+                    f"No available IP addresses in network {self.network}. "
+                    f"Allocated: {self._allocated}, Available: 0",
+                    requested=1,
+                    available=0,
+                )
+            self._mark_allocated(offset, owner)
+            self._cursor = (offset + 1) % self.size
+            return self._address(offset)
+
+    def allocate_specific(
+        self, address: Union[str, IPAddress], owner: Optional[str] = None
+    ) -> IPAddress:
+        """
+        Allocate a specific address.
+
+        Raises:
+            ValueError: If the address is outside the network, reserved,
+                already allocated, or owner already holds an address
+        """
+        with self._lock:
+            offset = self._offset(address)
+            ip = self._address(offset)
+            if offset in self._reserved:
+                raise ValueError(f"IP {ip} is reserved")
+            if self._test(offset):
+                raise ValueError(f"IP {ip} already allocated")
+            if owner is not None and owner in self._offset_by_owner:
+                raise ValueError(f"Peer {owner} already has an IP allocated")
+            self._mark_allocated(offset, owner)
+            return ip
+
+    def allocate_bulk(self, owners: List[Optional[str]]) -> List[IPAddress]:
+        """
+        Allocate one address per owner, all or nothing.
+
+        Args:
+            owners: Owner identifiers (None entries allocate anonymously)
+
+        Returns:
+            Allocated addresses in the same order as owners
+
+        Raises:
+            ValueError: If an owner is duplicated or already holds an address
+            AddressPoolExhaustedError: If fewer addresses are free than requested
+        """
+        with self._lock:
+            named = [owner for owner in owners if owner is not None]
+            if len(set(named)) != len(named):
+                raise ValueError("Duplicate owners in bulk allocation")
+            for owner in named:
+                if owner in self._offset_by_owner:
+                    raise ValueError(f"Peer {owner} already has an IP allocated")
+            available = self.available_count()
+            if len(owners) > available:
+                raise AddressPoolExhaustedError(
+                    f"Requested {len(owners)} addresses but only {available} "
+                    f"available in network {self.network}",
+                    requested=len(owners),
+                    available=available,
+                )
+            return [self.allocate(owner) for owner in owners]
+
+    def release(self, address: Union[str, IPAddress]) -> Optional[str]:
+        """
+        Release an address (no-op if it is not allocated).
+
+        Returns:
+            Owner that held the address, if any
+        """
+        with self._lock:
+            try:
+                offset = self._offset(address)
+            except ValueError:
+                return None
+            if offset in self._reserved or not self._test(offset):
+                return None
+            return self._mark_released(offset)
+
+    def release_owner(self, owner: str) -> IPAddress:
+        """
+        Release the address held by owner.
+
+        Raises:
+            KeyError: If owner holds no address
+        """
+        with self._lock:
+            offset = self._offset_by_owner[owner]
+            self._mark_released(offset)
+            return self._address(offset)
+
+    def release_bulk(self, addresses: Iterable[Union[str, IPAddress]]) -> int:
+        """
+        Release many addresses.
+
+        Returns:
+            Number of addresses actually released
+        """
+        with self._lock:
+            released = 0
+            for address in addresses:
+                try:
+                    offset = self._offset(address)
+                except ValueError:
+                    continue
+                if offset not in self._reserved and self._test(offset):
+                    self._mark_released(offset)
+                    released += 1
+            return released
+
+    def address_of(self, owner: str) -> Optional[IPAddress]:
+        """Get the address held by owner, or None."""
+        offset = self._offset_by_owner.get(owner)
+        return None if offset is None else self._address(offset)
+
+    def owner_of(self, address: Union[str, IPAddress]) -> Optional[str]:
+        """Get the owner of an address, or None."""
+        try:
+            return self._owner_by_offset.get(self._offset(address))
+        except ValueError:
+            return None
+
+    def owners(self) -> Dict[str, IPAddress]:
+        """Snapshot of owner -> address for all owned allocations."""
+        with self._lock:
+            return {owner: self._address(offset) for owner, offset in self._offset_by_owner.items()}
+
+    def iter_allocated(self) -> Iterable[IPAddress]:
+        """Iterate allocated (non-reserved) addresses in address order."""
+        for index, byte in enumerate(bytes(self._bits)):
+            if not byte:
+                continue
+            for bit in range(8):
+                offset = (index << 3) + bit
+                if byte & (1 << bit) and offset < self.size and offset not in self._reserved:
+                    yield self._address(offset)
+
+    def _mark_allocated(self, offset: int, owner: Optional[str]) -> None:
+        self._set(offset)
+        self._allocated += 1
+        if owner is not None:
+            self._owner_by_offset[offset] = owner
+            self._offset_by_owner[owner] = offset
+        self._journal_append({"op": "a", "o": offset, "p": owner})
+
+    def _mark_released(self, offset: int) -> Optional[str]:
+        self._clear(offset)
+        self._allocated -= 1
+        owner = self._owner_by_offset.pop(offset, None)
+        if owner is not None:
+            self._offset_by_owner.pop(owner, None)
+        self._free_list.append(offset)
+        self._journal_append({"op": "r", "o": offset})
+        return owner
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[None]:
+        """Hold the exclusive state-directory file lock (no-op without fcntl)."""
+        if self._state_lock is None or not FCNTL_AVAILABLE:
+            yield
+            return
+        fcntl.flock(self._state_lock.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._state_lock.fileno(), fcntl.LOCK_UN)
+
+    def _journal_append(self, entry: Dict) -> None:
+        if self._journal is None:
+            return
+        with self._locked_state():
+            self._journal.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._journal.flush()
+        self._journal_entries += 1
+        if self._journal_entries >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        """Write a snapshot atomically and truncate the journal."""
+        if self.state_dir is None:
+            return
+        with self._lock, self._locked_state():
+            state = {
+                "network": str(self.network),
+                "cursor": self._cursor,
+                "reserved": sorted(self._reserved),
+                "bitmap": base64.b64encode(zlib.compress(bytes(self._bits))).decode("ascii"),
+                "owners": {str(offset): owner for offset, owner in self._owner_by_offset.items()},
+            }
+            target = self.state_dir / self.SNAPSHOT_FILE
+            tmp = target.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, target)
+
+            if self._journal is not None:
+                self._journal.close()
+            self._journal = open(self.state_dir / self.JOURNAL_FILE, "w", encoding="utf-8")
+            self._journal_entries = 0
+            logger.debug(f"Wrote IP allocator snapshot for {self.network} ({self._allocated} allocated)")
+
+    def _load_state(self) -> None:
+        """Restore state from snapshot and replay the journal."""
+        snapshot_path = self.state_dir / self.SNAPSHOT_FILE
+        journal_path = self.state_dir / self.JOURNAL_FILE
+
+        if snapshot_path.exists():
+            state = json.loads(snapshot_path.read_text(encoding="utf-8"))
+            if state.get("network") != str(self.network):
+                raise ValueError(
+                    f"Allocator state in {self.state_dir} is for network "
+                    f"{state.get('network')}, not {self.network}"
+                )
+            self._bits = bytearray(zlib.decompress(base64.b64decode(state["bitmap"])))
+            self._reserved |= set(state.get("reserved", []))
+            for offset in self._reserved:
+                self._set(offset)
+            self._cursor = state.get("cursor", 0)
+            for offset_str, owner in state.get("owners", {}).items():
+                offset = int(offset_str)
+                self._owner_by_offset[offset] = owner
+                self._offset_by_owner[owner] = offset
+
+        replayed = 0
+        if journal_path.exists():
+            with open(journal_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # torn final write
+                    offset = entry["o"]
+                    if entry["op"] == "a":
+                        self._set(offset)
+                        owner = entry.get("p")
+                        if owner is not None:
+                            self._owner_by_offset[offset] = owner
+                            self._offset_by_owner[owner] = offset
+                        self._cursor = (offset + 1) % self.size
+                    else:
+                        self._clear(offset)
+                        owner = self._owner_by_offset.pop(offset, None)
+                        if owner is not None:
+                            self._offset_by_owner.pop(owner, None)
+                    replayed += 1
+        self._journal_entries = replayed
+
+        self._allocated = sum(bin(byte).count("1") for byte in self._bits) - len(self._reserved)
+        if snapshot_path.exists() or replayed:
+            logger.info(
+                f"Restored IP allocator for {self.network}: {self._allocated} allocated "
+                f"({replayed} journal entries replayed)"
+            )
+
+    def close(self) -> None:
+        """Write a final snapshot and close the journal."""
+        if self.state_dir is not None:
+            self.snapshot()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if self._state_lock is not None:
+            self._state_lock.close()
+            self._state_lock = None
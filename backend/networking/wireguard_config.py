@@ -9,11 +9,14 @@ Supports hub-and-spoke topology with unique IP allocation.
 
 import base64
 import subprocess
-from typing import List, Optional, Set, Literal
+from collections.abc import Set as AbstractSet
+from typing import Iterator, List, Optional, Literal
 from ipaddress import IPv4Address, IPv4Network, AddressValueError
 from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 from pydantic.types import conint
 
+from backend.networking.ip_allocator import BitmapIPAllocator
+
 
 class WireGuardInterface(BaseModel):
     """
@@ -182,23 +185,41 @@ class WireGuardConfig(BaseModel):
     model_config = ConfigDict(frozen=False)
 
 
+class _AllocatedIPSet(AbstractSet):
+    """Read-only set view of addresses allocated by a BitmapIPAllocator."""
+
+    def __init__(self, allocator: BitmapIPAllocator):
+        self._allocator = allocator
+
+    def __contains__(self, ip: object) -> bool:
+        return isinstance(ip, (IPv4Address, str)) and self._allocator.is_allocated(ip)
+
+    def __iter__(self) -> Iterator[IPv4Address]:
+        return iter(self._allocator.iter_allocated())
+
+    def __len__(self) -> int:
+        return self._allocator.allocated_count
+
+
 class IPAddressAllocator:
     """
     IP Address Allocator for WireGuard Network
 
     Manages IP address allocation within a network range, ensuring no collisions.
     Reserves .0 (network), .1 (gateway), and .255 (broadcast) addresses.
+    Backed by the shared BitmapIPAllocator engine, so allocation and release
+    are O(1) amortized regardless of how full the network is.
     """
 
-    def __init__(self, network_cidr: str):
+    def __init__(self, network_cidr: str, state_dir: Optional[str] = None):
         """
         Initialize allocator with network range
 
         Args:
             network_cidr: Network in CIDR notation (e.g., "10.0.0.0/24")
+            state_dir: Optional directory for snapshot/journal persistence
         """
         self.network = IPv4Network(network_cidr)
-        self.allocated_ips: Set[IPv4Address] = set()
 
         # Reserve network, gateway, and broadcast addresses
         self.reserved_ips = {
@@ -207,6 +228,13 @@ class IPAddressAllocator:
             self.network.broadcast_address,  # .255
         }
 
+        self._allocator = BitmapIPAllocator(
+            self.network,
+            reserved=[ip for ip in self.reserved_ips if ip in self.network],
+            state_dir=state_dir,
+        )
+        self.allocated_ips: AbstractSet[IPv4Address] = _AllocatedIPSet(self._allocator)
+
     def allocate_ip(self) -> IPv4Address:
         """
         Allocate next available IP address
@@ -217,16 +245,7 @@ class IPAddressAllocator:
         Raises:
             ValueError: If no IP addresses are available
         """
-        for ip in self.network.hosts():
-            if ip not in self.allocated_ips and ip not in self.reserved_ips:
-                self.allocated_ips.add(ip)
-                return ip
-
-        raise ValueError(
-            f"No available IP addresses in network {self.network}. "
-            f"Allocated: {len(self.allocated_ips)}, "
-            f"Available: {self.get_available_count()}"
-        )
+        return self._allocator.allocate()
 
     def allocate_specific_ip(self, ip_address: str) -> IPv4Address:
         """
@@ -241,19 +260,7 @@ class IPAddressAllocator:
         Raises:
             ValueError: If IP is already allocated or not in network
         """
-        ip = IPv4Address(ip_address)
-
-        if ip not in self.network:
-            raise ValueError(f"IP {ip} not in network {self.network}")
-
-        if ip in self.reserved_ips:
-            raise ValueError(f"IP {ip} is reserved")
-
-        if ip in self.allocated_ips:
-            raise ValueError(f"IP {ip} already allocated")
-
-        self.allocated_ips.add(ip)
-        return ip
+        return self._allocator.allocate_specific(IPv4Address(ip_address))
 
     def release_ip(self, ip_address: IPv4Address) -> None:
         """
@@ -262,7 +269,7 @@ class IPAddressAllocator:
         Args:
             ip_address: IP address to release
         """
-        self.allocated_ips.discard(ip_address)
+        self._allocator.release(ip_address)
 
     def get_available_count(self) -> int:
         """
@@ -271,8 +278,7 @@ class IPAddressAllocator:
         Returns:
             Number of available IPs
         """
-        total_usable = sum(1 for ip in self.network.hosts() if ip not in self.reserved_ips)
-        return total_usable - len(self.allocated_ips)
+        return self._allocator.available_count()
 
 
 def generate_wireguard_keypair() -> tuple[str, str]:
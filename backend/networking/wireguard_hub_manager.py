@@ -6,7 +6,11 @@ Provides zero-downtime configuration reload using 'wg syncconf'.
 
 Features:
 - Add/remove peers without connection loss
-- Safe configuration reload mechanism
+- Batched incremental reconciliation: peer mutations are coalesced over a
+  debounce window, diffed against the live 'wg show <iface> dump' state
+  and applied as a single 'wg set' delta (falling back to 'wg syncconf'
+  only when the live state is unavailable or the delta fails)
+- Per-batch apply latency and peers/sec metrics
 - Peer connectivity verification
 - Configuration change logging
 
@@ -17,9 +21,11 @@ Coverage Target: >= 80%
 
 import asyncio
 import logging
-from dataclasses import dataclass
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +67,42 @@ class PeerConfig:
     persistent_keepalive: int = 25
 
 
+@dataclass
+class LivePeer:
+    """
+    Peer state as reported by 'wg show <interface> dump'.
+
+    Attributes:
+        public_key: Peer's WireGuard public key (base64)
+        allowed_ips: Allowed IPs currently installed on the interface
+        endpoint: Current endpoint, None if unknown
+        persistent_keepalive: Keepalive interval in seconds (0 = off)
+    """
+    public_key: str
+    allowed_ips: List[str]
+    endpoint: Optional[str] = None
+    persistent_keepalive: int = 0
+
+
+@dataclass
+class ReconcileBatchStats:
+    """
+    Metrics for one applied reconciliation batch.
+
+    Attributes:
+        mutations: Peer mutations coalesced into the batch
+        peers_changed: Peers added, updated or removed on the interface
+        method: "wg_set", "syncconf" or "noop"
+        latency_ms: Wall time to write config, diff and apply
+        peers_per_second: peers_changed / apply time
+    """
+    mutations: int
+    peers_changed: int
+    method: str
+    latency_ms: float
+    peers_per_second: float
+
+
 class WireGuardHubManager:
     """
     Manages WireGuard hub configuration with zero-downtime updates.
@@ -79,6 +121,8 @@ class WireGuardHubManager:
         listen_port: int,
         private_key: str,
         address: str,
+        debounce_seconds: float = 0.05,
+        max_peers_per_command: int = 200,
     ):
         """
         Initialize WireGuard hub manager.
@@ -89,6 +133,9 @@ class WireGuardHubManager:
             listen_port: UDP port to listen on
             private_key: Hub's WireGuard private key (base64)
             address: Hub's IP address and subnet (e.g., "10.0.0.1/24")
+            debounce_seconds: Window over which peer mutations are coalesced
+            max_peers_per_command: Peer changes per 'wg set' invocation
+                (keeps argument lists well below ARG_MAX)
         """
         self.interface_name = interface_name
         self.config_path = config_path
@@ -102,6 +149,24 @@ class WireGuardHubManager:
         # Lock for thread-safe configuration updates
         self._config_lock = asyncio.Lock()
 
+        # Reconciliation engine state
+        self.debounce_seconds = debounce_seconds
+        self.max_peers_per_command = max_peers_per_command
+        self._pending_mutations = 0
+        self._waiters: List[asyncio.Future] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: set = set()
+        self._batch_history: Deque[ReconcileBatchStats] = deque(maxlen=100)
+        self._totals = {
+            "batches": 0,
+            "mutations": 0,
+            "peers_changed": 0,
+            "wg_set_batches": 0,
+            "syncconf_fallbacks": 0,
+            "failed_batches": 0,
+            "apply_seconds": 0.0,
+        }
+
         logger.info(
             f"Initialized WireGuard hub manager for interface {interface_name} "
             f"at {address}"
@@ -111,7 +176,9 @@ class WireGuardHubManager:
         """
         Add peer to WireGuard hub configuration.
 
-        Updates configuration file and reloads WireGuard without connection loss.
+        The mutation is coalesced with other changes made within the debounce
+        window and applied to the interface as one incremental batch; the
+        call returns once that batch has been applied.
 
         Args:
             peer_id: Unique identifier for the peer
@@ -123,32 +190,29 @@ class WireGuardHubManager:
         Raises:
             ConfigReloadError: If configuration reload fails
         """
+        # Update desired state; the change is applied with the next batch
         async with self._config_lock:
-            # Update in-memory registry
             self.peers[peer_id] = peer_config
 
-            logger.info(
-                f"Adding peer {peer_id} with public key {peer_config.public_key[:16]}..."
-            )
-
-            # Write updated configuration to file
-            await self._write_config_file()
+        logger.info(
+            f"Adding peer {peer_id} with public key {peer_config.public_key[:16]}..."
+        )
 
-            # Reload WireGuard configuration without downtime
-            await self._reload_config()
+        await self._enqueue_mutation()
 
-            logger.info(
-                f"Added peer {peer_id} to hub configuration. "
-                f"Total peers: {len(self.peers)}"
-            )
+        logger.info(
+            f"Added peer {peer_id} to hub configuration. "
+            f"Total peers: {len(self.peers)}"
+        )
 
-            return True
+        return True
 
     async def remove_peer(self, peer_id: str) -> bool:
         """
         Remove peer from WireGuard hub configuration.
 
-        Updates configuration file and reloads to drop connections.
+        Applied with the next reconciliation batch, which drops the peer's
+        connections.
 
         Args:
             peer_id: Unique identifier for the peer
@@ -165,25 +229,21 @@ class WireGuardHubManager:
             if peer_id not in self.peers:
                 raise PeerNotFoundError(f"Peer {peer_id} not found in configuration")
 
-            # Remove from in-memory registry
+            # Remove from desired state; applied with the next batch
             peer_config = self.peers.pop(peer_id)
 
-            logger.info(
-                f"Removing peer {peer_id} with public key {peer_config.public_key[:16]}..."
-            )
-
-            # Write updated configuration to file
-            await self._write_config_file()
+        logger.info(
+            f"Removing peer {peer_id} with public key {peer_config.public_key[:16]}..."
+        )
 
-            # Reload WireGuard configuration
-            await self._reload_config()
+        await self._enqueue_mutation()
 
-            logger.info(
-                f"Removed peer {peer_id} from hub configuration. "
-                f"Remaining peers: {len(self.peers)}"
-            )
+        logger.info(
+            f"Removed peer {peer_id} from hub configuration. "
+            f"Remaining peers: {len(self.peers)}"
+        )
 
-            return True
+        return True
 
     async def verify_peer_connectivity(
         self, peer_id: str, timeout: int = 5
@@ -246,6 +306,294 @@ class WireGuardHubManager:
         """
         return list(self.peers.keys())
 
+    # ------------------------------------------------------------------
+    # Reconciliation engine
+    # ------------------------------------------------------------------
+
+    async def _enqueue_mutation(self) -> None:
+        """
+        Register a desired-state change and wait for its batch to be applied.
+
+        Raises:
+            ConfigReloadError: If the batch containing this change fails
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        self._pending_mutations += 1
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.debounce_seconds, self._start_flush
+            )
+
+        await waiter
+
+    def _start_flush(self) -> None:
+        """Debounce timer callback: apply the pending batch in the background."""
+        self._flush_handle = None
+        task = asyncio.ensure_future(self._flush_pending())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_pending(self) -> None:
+        """Apply all pending mutations as one batch and resolve their waiters."""
+        waiters, self._waiters = self._waiters, []
+        mutations, self._pending_mutations = self._pending_mutations, 0
+        if not waiters:
+            return
+
+        try:
+            await self.reconcile(mutations=mutations)
+        except Exception as e:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+            return
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def flush(self) -> None:
+        """Apply pending peer mutations immediately and wait for in-flight batches."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            await self._flush_pending()
+        if self._flush_tasks:
+            await asyncio.gather(*list(self._flush_tasks), return_exceptions=True)
+
+    async def reconcile(self, mutations: int = 0) -> ReconcileBatchStats:
+        """
+        Bring the interface in line with the desired peer set.
+
+        Writes the configuration file once, diffs the desired peers against
+        the live interface state and applies only the delta with 'wg set'.
+        Falls back to 'wg syncconf' when the live state cannot be read or the
+        delta could not be applied.
+
+        Args:
+            mutations: Number of coalesced peer mutations (for metrics)
+
+        Returns:
+            ReconcileBatchStats for the applied batch
+
+        Raises:
+            ConfigReloadError: If neither 'wg set' nor 'wg syncconf' succeeds
+        """
+        async with self._config_lock:
+            started = time.perf_counter()
+            try:
+                # Persist desired state so restarts and syncconf see it
+                await self._write_config_file()
+
+                live = await self._read_live_peers()
+                if live is None:
+                    await self._reload_config()
+                    method, changed = "syncconf", len(self.peers)
+                else:
+                    upserts, removals = self._diff_peers(live)
+                    changed = len(upserts) + len(removals)
+                    method = "noop"
+                    if changed:
+                        try:
+                            await self._apply_delta(upserts, removals)
+                            method = "wg_set"
+                        except ConfigReloadError as e:
+                            logger.warning(f"Incremental apply failed, falling back to syncconf: {e}")
+                            await self._reload_config()
+                            method = "syncconf"
+            except Exception:
+                self._totals["failed_batches"] += 1
+                raise
+
+            elapsed = time.perf_counter() - started
+            stats = ReconcileBatchStats(
+                mutations=mutations,
+                peers_changed=changed,
+                method=method,
+                latency_ms=elapsed * 1000,
+                peers_per_second=(changed / elapsed) if elapsed > 0 else 0.0,
+            )
+            self._record_batch(stats)
+
+            logger.info(
+                f"Reconciled {self.interface_name}: {mutations} mutations, "
+                f"{changed} peers changed via {method} in {stats.latency_ms:.1f}ms"
+            )
+            return stats
+
+    def _record_batch(self, stats: ReconcileBatchStats) -> None:
+        """Accumulate metrics for an applied batch."""
+        self._batch_history.append(stats)
+        self._totals["batches"] += 1
+        self._totals["mutations"] += stats.mutations
+        self._totals["peers_changed"] += stats.peers_changed
+        self._totals["apply_seconds"] += stats.latency_ms / 1000
+        if stats.method == "wg_set":
+            self._totals["wg_set_batches"] += 1
+        elif stats.method == "syncconf":
+            self._totals["syncconf_fallbacks"] += 1
+
+    def get_reconcile_stats(self) -> Dict[str, Any]:
+        """
+        Get reconciliation metrics.
+
+        Returns:
+            Dict with totals, last batch and recent per-batch latency/throughput
+        """
+        recent = list(self._batch_history)
+        apply_seconds = self._totals["apply_seconds"]
+        return {
+            **self._totals,
+            "pending_mutations": self._pending_mutations,
+            "peers_per_second": (
+                self._totals["peers_changed"] / apply_seconds if apply_seconds > 0 else 0.0
+            ),
+            "avg_batch_latency_ms": (
+                sum(b.latency_ms for b in recent) / len(recent) if recent else 0.0
+            ),
+            "max_batch_latency_ms": max((b.latency_ms for b in recent), default=0.0),
+            "last_batch": asdict(recent[-1]) if recent else None,
+            "recent_batches": [asdict(b) for b in recent],
+        }
+
+    async def _read_live_peers(self) -> Optional[Dict[str, LivePeer]]:
+        """
+        Read the peers currently installed on the interface.
+
+        Returns:
+            Dict of public key -> LivePeer, or None if the dump is unavailable
+        """
+        returncode, stdout, stderr = await self._execute_wg_command(
+            "show", self.interface_name, "dump"
+        )
+        if returncode != 0 or not stdout:
+            logger.debug(f"Live state unavailable for {self.interface_name}: {stderr}")
+            return None
+        return self._parse_dump(stdout)
+
+    @staticmethod
+    def _parse_dump(output: str) -> Optional[Dict[str, LivePeer]]:
+        """
+        Parse 'wg show <interface> dump' output.
+
+        The first line describes the interface; each following line is a peer:
+        public-key, preshared-key, endpoint, allowed-ips, latest-handshake,
+        transfer-rx, transfer-tx, persistent-keepalive (tab separated).
+
+        Args:
+            output: Raw dump output
+
+        Returns:
+            Dict of public key -> LivePeer, or None if the output is malformed
+        """
+        lines = output.splitlines()
+        if not lines or len(lines[0].split("\t")) < 3:
+            return None
+
+        peers: Dict[str, LivePeer] = {}
+        for line in lines[1:]:
+            fields = line.split("\t")
+            if len(fields) < 8:
+                return None
+            public_key, _psk, endpoint, allowed_ips, *_rest, keepalive = fields[:8]
+            peers[public_key] = LivePeer(
+                public_key=public_key,
+                allowed_ips=[] if allowed_ips == "(none)" else allowed_ips.split(","),
+                endpoint=None if endpoint == "(none)" else endpoint,
+                persistent_keepalive=WireGuardHubManager._parse_keepalive(keepalive),
+            )
+        return peers
+
+    @staticmethod
+    def _parse_keepalive(value: str) -> int:
+        """
+        Parse the persistent-keepalive field of a dump line.
+
+        Unrecognized values are treated as off rather than failing the whole
+        dump; the next diff then simply re-applies the desired keepalive.
+
+        Args:
+            value: Raw field ("off" or seconds)
+
+        Returns:
+            Keepalive interval in seconds (0 = off)
+        """
+        try:
+            return int(value)
+        except ValueError:
+            if value != "off":
+                logger.debug(f"Ignoring unexpected persistent-keepalive value {value!r}")
+            return 0
+
+    def _diff_peers(
+        self, live: Dict[str, LivePeer]
+    ) -> Tuple[List[PeerConfig], List[str]]:
+        """
+        Compute the delta between desired and live peers.
+
+        Endpoints are only compared when the desired config pins one, since
+        roaming peers legitimately change their endpoint at runtime.
+
+        Args:
+            live: Live peers keyed by public key
+
+        Returns:
+            Tuple of (peers to add or update, public keys to remove)
+        """
+        desired = {config.public_key: config for config in self.peers.values()}
+
+        upserts: List[PeerConfig] = []
+        for public_key, config in desired.items():
+            current = live.get(public_key)
+            if (
+                current is None
+                or set(current.allowed_ips) != set(config.allowed_ips)
+                or current.persistent_keepalive != (config.persistent_keepalive or 0)
+                or (config.endpoint and current.endpoint != config.endpoint)
+            ):
+                upserts.append(config)
+
+        removals = [public_key for public_key in live if public_key not in desired]
+        return upserts, removals
+
+    async def _apply_delta(
+        self, upserts: List[PeerConfig], removals: List[str]
+    ) -> None:
+        """
+        Apply a peer delta with 'wg set', chunked by max_peers_per_command.
+
+        Args:
+            upserts: Peers to add or update
+            removals: Public keys to remove
+
+        Raises:
+            ConfigReloadError: If any 'wg set' invocation fails
+        """
+        peer_args: List[List[str]] = [
+            ["peer", public_key, "remove"] for public_key in removals
+        ]
+        for config in upserts:
+            args = ["peer", config.public_key, "allowed-ips", ",".join(config.allowed_ips)]
+            if config.endpoint:
+                args += ["endpoint", str(config.endpoint)]
+            args += ["persistent-keepalive", str(config.persistent_keepalive or 0)]
+            peer_args.append(args)
+
+        for start in range(0, len(peer_args), self.max_peers_per_command):
+            chunk = peer_args[start:start + self.max_peers_per_command]
+            command = ["set", self.interface_name]
+            for args in chunk:
+                command.extend(args)
+
+            returncode, _stdout, stderr = await self._execute_wg_command(*command)
+            if returncode != 0:
+                raise ConfigReloadError(
+                    f"Failed to apply peer delta: {stderr}\nReturn code: {returncode}"
+                )
+
     async def _write_config_file(self) -> None:
         """
         Write current configuration to WireGuard config file.
@@ -386,4 +734,9 @@ class WireGuardHubManager:
         Cleanup resources on shutdown.
         """
         logger.info(f"Shutting down WireGuard hub manager for {self.interface_name}")
-        # Any cleanup operations can be added here
+
+        # Apply any peer changes still waiting in the debounce window
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"Failed to apply pending peer changes on shutdown: {e}")
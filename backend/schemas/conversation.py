@@ -133,13 +133,18 @@ class MessageListResponse(BaseModel):
                         "metadata": {}
                     }
                 ],
-                "total": 2
+                "total": 2,
+                "next_cursor": None
             }
         }
     )
 
     messages: List[MessageResponse]
     total: int
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page (pass as ?cursor=); null on the last page"
+    )
 
 
 class SearchRequest(BaseModel):
@@ -158,7 +163,8 @@ class SearchRequest(BaseModel):
         json_schema_extra={
             "example": {
                 "query": "machine learning concepts",
-                "limit": 5
+                "limit": 5,
+                "offset": 0
             }
         }
     )
@@ -175,6 +181,11 @@ class SearchRequest(BaseModel):
         le=50,
         description="Maximum number of results"
     )
+    offset: int = Field(
+        0,
+        ge=0,
+        description="Number of ranked results to skip"
+    )
 
     @field_validator('query')
     @classmethod
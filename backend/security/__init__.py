@@ -6,6 +6,8 @@ from backend.security.token_service import (
     TokenService,
     TokenExpiredError,
     InvalidTokenError,
+    TokenRevokedError,
+    VerifiedClaims,
 )
 
 __all__ = [
@@ -14,4 +16,6 @@ __all__ = [
     "TokenService",
     "TokenExpiredError",
     "InvalidTokenError",
+    "TokenRevokedError",
+    "VerifiedClaims",
 ]
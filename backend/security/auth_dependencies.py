@@ -9,21 +9,31 @@ Provides:
 - get_current_active_user: Extract authenticated user and verify active status
 - optional_current_user: Optional authentication (returns None if not authenticated)
 
+Verified tokens are cached with a snapshot of their user (see
+backend/security/principal_cache.py), so repeat requests with the same
+token skip JWT decoding and the users query. Misses use the async engine.
+
 Issue #130: IDOR Prevention
 """
 
 import logging
 import os
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime, timedelta, timezone
 
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.db.base import get_db
+from backend.db.base import get_async_db
 from backend.models.user import User
+from backend.security.principal_cache import (
+    AuthenticatedPrincipal,
+    UserSnapshot,
+    get_principal_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -89,52 +99,107 @@ def create_access_token(
     return encoded_jwt
 
 
-def decode_access_token(token: str) -> TokenData:
+def _decode_claims(token: str) -> Dict[str, Any]:
     """
-    Decode and validate JWT access token.
+    Decode and validate a JWT, returning its raw claims.
 
     Args:
         token: JWT token string
 
     Returns:
-        TokenData: Extracted token payload
+        Decoded claims with sub and email present
 
     Raises:
         AuthenticationError: If token is invalid or expired
     """
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        email: str = payload.get("email")
-        workspace_id: str = payload.get("workspace_id")
-
-        if user_id is None or email is None:
-            raise AuthenticationError("Invalid token payload")
-
-        return TokenData(user_id=user_id, email=email, workspace_id=workspace_id)
-
     except jwt.ExpiredSignatureError:
         raise AuthenticationError("Token has expired")
     except jwt.InvalidTokenError as e:
         logger.warning(f"Invalid JWT token: {e}")
         raise AuthenticationError("Invalid token")
 
+    if payload.get("sub") is None or payload.get("email") is None:
+        raise AuthenticationError("Invalid token payload")
+
+    return payload
+
+
+def decode_access_token(token: str) -> TokenData:
+    """
+    Decode and validate JWT access token.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        TokenData: Extracted token payload
+
+    Raises:
+        AuthenticationError: If token is invalid or expired
+    """
+    payload = _decode_claims(token)
+    return TokenData(
+        user_id=payload.get("sub"),
+        email=payload.get("email"),
+        workspace_id=payload.get("workspace_id")
+    )
+
+
+async def resolve_principal(token: str, db: AsyncSession) -> AuthenticatedPrincipal:
+    """
+    Resolve a bearer token to its principal, using the principal cache.
+
+    Args:
+        token: JWT token string
+        db: Async database session (used only on a cache miss)
+
+    Returns:
+        AuthenticatedPrincipal with claims and user snapshot
+
+    Raises:
+        AuthenticationError: If token is invalid, expired or revoked
+        HTTPException 404: If user not found in database
+    """
+    cache = get_principal_cache("auth_dependencies")
+    principal = cache.get(token)
+    if principal is not None:
+        return principal
+
+    claims = _decode_claims(token)
+    if cache.is_revoked(token, claims):
+        raise AuthenticationError("Token has been revoked")
+
+    result = await db.execute(select(User).where(User.id == claims["sub"]))
+    user = result.scalars().first()
+
+    if user is None:
+        logger.warning(f"User {claims['sub']} not found in database")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    return cache.put(token, claims, UserSnapshot.from_user(user))
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_async_db)
+) -> UserSnapshot:
     """
     FastAPI dependency: Extract and validate current authenticated user.
 
-    Validates JWT token from Authorization header and returns User object.
+    Validates JWT token from Authorization header and returns a snapshot of
+    the user (same attributes as User; load the row to modify it).
 
     Args:
         credentials: HTTP Bearer credentials from Authorization header
-        db: Database session
+        db: Async database session (used only on a principal cache miss)
 
     Returns:
-        User: Authenticated user object
+        UserSnapshot: Authenticated user
 
     Raises:
         HTTPException 401: If authentication fails
@@ -142,43 +207,31 @@ async def get_current_user(
 
     Usage:
         @router.get("/protected")
-        def protected_route(current_user: User = Depends(get_current_user)):
+        def protected_route(current_user: UserSnapshot = Depends(get_current_user)):
             return {"user_id": current_user.id}
     """
-    token = credentials.credentials
-    token_data = decode_access_token(token)
-
-    # Query user from database
-    user = db.query(User).filter(User.id == token_data.user_id).first()
-
-    if user is None:
-        logger.warning(f"User {token_data.user_id} not found in database")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-
-    return user
+    principal = await resolve_principal(credentials.credentials, db)
+    return principal.user
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: UserSnapshot = Depends(get_current_user)
+) -> UserSnapshot:
     """
     FastAPI dependency: Get current user and verify active status.
 
     Args:
-        current_user: User from get_current_user dependency
+        current_user: UserSnapshot from get_current_user dependency
 
     Returns:
-        User: Active authenticated user
+        UserSnapshot: Active authenticated user
 
     Raises:
         HTTPException 403: If user account is inactive
 
     Usage:
         @router.get("/active-only")
-        def active_route(current_user: User = Depends(get_current_active_user)):
+        def active_route(current_user: UserSnapshot = Depends(get_current_active_user)):
             return {"user_id": current_user.id}
     """
     if not current_user.is_active:
@@ -195,24 +248,24 @@ async def optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(
         HTTPBearer(auto_error=False)
     ),
-    db: Session = Depends(get_db)
-) -> Optional[User]:
+    db: AsyncSession = Depends(get_async_db)
+) -> Optional[UserSnapshot]:
     """
     FastAPI dependency: Optional authentication.
 
-    Returns User if valid token provided, None otherwise.
+    Returns the user snapshot if valid token provided, None otherwise.
     Does not raise exception if no token provided.
 
     Args:
         credentials: Optional HTTP Bearer credentials
-        db: Database session
+        db: Async database session (used only on a principal cache miss)
 
     Returns:
-        Optional[User]: User if authenticated, None otherwise
+        Optional[UserSnapshot]: User if authenticated, None otherwise
 
     Usage:
         @router.get("/optional-auth")
-        def optional_route(user: Optional[User] = Depends(optional_current_user)):
+        def optional_route(user: Optional[UserSnapshot] = Depends(optional_current_user)):
             if user:
                 return {"authenticated": True, "user_id": user.id}
             return {"authenticated": False}
@@ -221,11 +274,8 @@ async def optional_current_user(
         return None
 
     try:
-        token = credentials.credentials
-        token_data = decode_access_token(token)
-
-        user = db.query(User).filter(User.id == token_data.user_id).first()
-        return user
+        principal = await resolve_principal(credentials.credentials, db)
+        return principal.user
 
     except (AuthenticationError, HTTPException):
         # Invalid token - return None instead of raising
@@ -10,6 +10,7 @@ Security Features:
 - Token expiration and validation
 - Automatic token refresh mechanism
 - User authentication and authorization
+- Verified access tokens cached with a user snapshot (principal cache)
 """
 
 from datetime import datetime, timedelta, timezone
@@ -26,6 +27,7 @@ import httpx
 
 from backend.models.user import User
 from backend.db.base import get_db, get_async_db
+from backend.security.principal_cache import UserSnapshot, get_principal_cache
 
 
 # Password hashing context using bcrypt
@@ -303,25 +305,40 @@ class AuthService:
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_async_db)
-) -> User:
+) -> UserSnapshot:
     """
     Dependency to get the current authenticated user from JWT token
 
+    Tokens seen before are served from the principal cache without
+    decoding or a database round-trip.
+
     Args:
         credentials: HTTP Bearer token credentials
-        db: Async database session
+        db: Async database session (used only on a principal cache miss)
 
     Returns:
-        Current authenticated User object
+        Snapshot of the current authenticated user (load the User row to modify it)
 
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If token is invalid, revoked or user not found
     """
     token = credentials.credentials
+    cache = get_principal_cache("auth_service")
+
+    principal = cache.get(token)
+    if principal is not None and principal.user.is_active:
+        return principal.user
 
     # Verify and decode token
     payload = AuthService.verify_token(token)
 
+    if cache.is_revoked(token, payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     # Extract user ID from token
     user_id: str = payload.get("sub")
     if user_id is None:
@@ -356,13 +373,13 @@ async def get_current_user(
             detail="Inactive user"
         )
 
-    return user
+    return cache.put(token, payload, UserSnapshot.from_user(user)).user
 
 
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: AsyncSession = Depends(get_async_db)
-) -> Optional[User]:
+) -> Optional[UserSnapshot]:
     """
     Dependency to optionally get the current authenticated user
 
@@ -374,7 +391,7 @@ async def get_current_user_optional(
         db: Async database session
 
     Returns:
-        Current authenticated User object or None
+        Snapshot of the current authenticated user or None
     """
     if credentials is None:
         return None
@@ -2,13 +2,19 @@
 Message Signing Service (E7-S2)
 
 Implements Ed25519 message signing for authenticated P2P messaging.
+Also provides the batch primitives used by the verification pipeline:
+- verify_ed25519_batch(): picklable batch verifier for thread/process pools
+- CanonicalHashCache: canonical payload hashes keyed by payload identity
 """
 
 import hashlib
 import json
 import time
 import base64
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.exceptions import InvalidSignature
@@ -17,6 +23,118 @@ from backend.p2p.libp2p_identity import LibP2PIdentity
 from backend.models.message_envelope import MessageEnvelope
 
 
+def compute_canonical_hash(payload: Dict[str, Any]) -> str:
+    """
+    Compute SHA-256 hash of a payload's canonical JSON form.
+
+    Canonical form: keys sorted, no whitespace, UTF-8 encoded.
+
+    Args:
+        payload: Message payload
+
+    Returns:
+        Hash string in format "sha256:<hex_digest>"
+    """
+    # sort_keys ensures consistent ordering across implementations
+    # separators removes whitespace for canonical form
+    canonical_json = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False
+    )
+
+    hash_bytes = hashlib.sha256(canonical_json.encode('utf-8')).digest()
+
+    return f"sha256:{hash_bytes.hex()}"
+
+
+@lru_cache(maxsize=4096)
+def _load_public_key(public_key_bytes: bytes) -> ed25519.Ed25519PublicKey:
+    """Load (and memoize per process) a raw Ed25519 public key."""
+    return ed25519.Ed25519PublicKey.from_public_bytes(public_key_bytes)
+
+
+def verify_ed25519_batch(items: Sequence[Tuple[bytes, bytes, bytes]]) -> List[bool]:
+    """
+    Verify a batch of Ed25519 signatures.
+
+    Takes only raw bytes so it can be shipped to a process pool.
+
+    Args:
+        items: (raw public key, signature, signed data) per message
+
+    Returns:
+        True/False per item, in order
+    """
+    results = []
+    for public_key_bytes, signature, data in items:
+        try:
+            _load_public_key(public_key_bytes).verify(signature, data)
+            results.append(True)
+        except InvalidSignature:
+            results.append(False)
+        except Exception:
+            # Malformed key or signature
+            results.append(False)
+    return results
+
+
+class CanonicalHashCache:
+    """
+    Bounded LRU cache of canonical payload hashes keyed by payload identity.
+
+    Avoids re-serializing a payload object that is hashed repeatedly (e.g.
+    one payload verified against many envelopes). Entries keep a reference
+    to the payload so its id() cannot be reused while cached; payloads
+    must therefore not be mutated after they have been hashed.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize hash cache.
+
+        Args:
+            max_size: Maximum number of cached payloads
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, Tuple[Any, str]]" = OrderedDict()
+
+    def get_or_compute(self, payload: Dict[str, Any]) -> str:
+        """
+        Get a payload's canonical hash, computing it on a miss.
+
+        Args:
+            payload: Message payload
+
+        Returns:
+            Hash string in format "sha256:<hex_digest>"
+        """
+        key = id(payload)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is payload:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        payload_hash = compute_canonical_hash(payload)
+        self._entries[key] = (payload, payload_hash)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return payload_hash
+
+    def clear(self) -> None:
+        """Drop all cached hashes."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class MessageSigningService:
     """
     Service for signing and verifying P2P messages using Ed25519 signatures.
@@ -39,12 +157,15 @@ class MessageSigningService:
         is_valid = service.verify_signature(envelope, original_payload)
     """
 
-    def __init__(self, identity: LibP2PIdentity):
+    def __init__(self, identity: LibP2PIdentity, hash_cache_size: int = 0):
         """
         Initialize message signing service with peer identity.
 
         Args:
             identity: LibP2PIdentity instance with Ed25519 keypair
+            hash_cache_size: Payloads whose canonical hash is cached by
+                identity (0 disables caching; enable only if payloads are
+                never mutated after signing/verification)
         """
         if identity.private_key is None:
             raise ValueError(
@@ -52,6 +173,9 @@ class MessageSigningService:
             )
 
         self._identity = identity
+        self._hash_cache: Optional[CanonicalHashCache] = (
+            CanonicalHashCache(hash_cache_size) if hash_cache_size > 0 else None
+        )
 
     def sign_message(
         self,
@@ -193,6 +317,78 @@ class MessageSigningService:
         except Exception:
             return False
 
+    def verify_signatures_batch(
+        self,
+        items: Sequence[Tuple[MessageEnvelope, Dict[str, Any], ed25519.Ed25519PublicKey]],
+        executor: Optional[Executor] = None,
+        chunk_size: int = 256
+    ) -> List[bool]:
+        """
+        Verify many envelopes at once.
+
+        Each payload object is hashed once per batch however many envelopes
+        reference it. Signature checks run in chunks on the executor when
+        one is given (a process pool spreads them across cores), inline
+        otherwise.
+
+        Args:
+            items: (envelope, payload, sender public key) per message
+            executor: Optional thread/process pool for signature checks
+            chunk_size: Signatures per executor task
+
+        Returns:
+            True/False per item, in order (same result as
+            verify_signature_with_public_key for each item)
+        """
+        results = [False] * len(items)
+        batch_hashes: Dict[int, str] = {}
+        raw_keys: Dict[int, bytes] = {}
+        pending: List[int] = []
+        raw_items: List[Tuple[bytes, bytes, bytes]] = []
+
+        for index, (envelope, payload, public_key) in enumerate(items):
+            try:
+                # items keeps every payload alive, so id() is stable here
+                computed_hash = batch_hashes.get(id(payload))
+                if computed_hash is None:
+                    computed_hash = self._compute_payload_hash(payload)
+                    batch_hashes[id(payload)] = computed_hash
+
+                # Verify hash matches
+                if computed_hash != envelope.payload_hash:
+                    continue
+
+                public_key_bytes = raw_keys.get(id(public_key))
+                if public_key_bytes is None:
+                    public_key_bytes = public_key.public_bytes_raw()
+                    raw_keys[id(public_key)] = public_key_bytes
+
+                signing_data = f"{envelope.payload_hash}:{envelope.timestamp}".encode('utf-8')
+                signature_bytes = base64.b64decode(envelope.signature)
+            except Exception:
+                continue
+
+            pending.append(index)
+            raw_items.append((public_key_bytes, signature_bytes, signing_data))
+
+        chunks = [
+            raw_items[start:start + chunk_size]
+            for start in range(0, len(raw_items), chunk_size)
+        ]
+        if executor is None:
+            verified = [ok for chunk in chunks for ok in verify_ed25519_batch(chunk)]
+        else:
+            verified = [
+                ok
+                for chunk_result in executor.map(verify_ed25519_batch, chunks)
+                for ok in chunk_result
+            ]
+
+        for index, ok in zip(pending, verified):
+            results[index] = ok
+
+        return results
+
     def _compute_payload_hash(self, payload: Dict[str, Any]) -> str:
         """
         Compute SHA-256 hash of message payload.
@@ -202,27 +398,32 @@ class MessageSigningService:
         - No whitespace
         - UTF-8 encoding
 
+        Served from the identity-keyed hash cache when enabled.
+
         Args:
             payload: Message payload
 
         Returns:
             Hash string in format "sha256:<hex_digest>"
         """
-        # Serialize to canonical JSON
-        # sort_keys ensures consistent ordering across implementations
-        # separators removes whitespace for canonical form
-        canonical_json = json.dumps(
-            payload,
-            sort_keys=True,
-            separators=(',', ':'),
-            ensure_ascii=False
-        )
+        if self._hash_cache is not None:
+            return self._hash_cache.get_or_compute(payload)
+        return compute_canonical_hash(payload)
 
-        # Compute SHA-256 hash
-        hash_bytes = hashlib.sha256(canonical_json.encode('utf-8')).digest()
+    def get_hash_cache_stats(self) -> Dict[str, int]:
+        """
+        Get canonical hash cache statistics.
 
-        # Convert to hex and add prefix
-        return f"sha256:{hash_bytes.hex()}"
+        Returns:
+            Dictionary with cache size, hits and misses
+        """
+        if self._hash_cache is None:
+            return {"cache_size": 0, "cache_hits": 0, "cache_misses": 0}
+        return {
+            "cache_size": len(self._hash_cache),
+            "cache_hits": self._hash_cache.hits,
+            "cache_misses": self._hash_cache.misses
+        }
 
     @property
     def peer_id(self) -> str:
@@ -3,20 +3,116 @@ Message Verification Service (E7-S3)
 
 Verifies Ed25519 signatures on received messages to ensure authenticity.
 Implements constant-time comparison, timestamp validation, and rate limiting.
+
+Batch pipeline:
+- verify_messages() verifies a list of messages in chunks on a thread or
+  process pool (synchronous API)
+- verify_message_async() collects concurrent calls into micro-batches
+  (flushed at max_batch_size or after max_batch_delay seconds)
+- get_pipeline_stats() reports throughput and latency histograms
 """
 
-from typing import Dict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.exceptions import InvalidSignature
+import asyncio
+import bisect
 import logging
 import hmac
+import time
 
+from backend.security.message_signing_service import verify_ed25519_batch
 from backend.security.peer_key_store import PeerKeyStore
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class VerificationRequest:
+    """A received message awaiting signature verification."""
+    sender_peer_id: str
+    payload: bytes
+    signature: bytes
+    timestamp: int
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (milliseconds).
+
+    Bucket bounds follow the Prometheus convention: a bucket counts
+    observations less than or equal to its upper bound.
+    """
+
+    BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0)
+
+    def __init__(self):
+        self._counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, seconds: float, count: int = 1) -> None:
+        """
+        Record one or more observations of the same latency.
+
+        Args:
+            seconds: Observed latency in seconds
+            count: Number of observations
+        """
+        latency_ms = seconds * 1000
+        self._counts[bisect.bisect_left(self.BUCKETS_MS, latency_ms)] += count
+        self.count += count
+        self.total_ms += latency_ms * count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile as the upper bound of the bucket containing it.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Upper bound in milliseconds (inf for the overflow bucket), or
+            None without observations
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return self.BUCKETS_MS[index] if index < len(self.BUCKETS_MS) else float("inf")
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Get histogram contents.
+
+        Returns:
+            Cumulative bucket counts keyed by upper bound, plus count, mean,
+            p50, p95 and p99 in milliseconds
+        """
+        buckets = {}
+        cumulative = 0
+        for bound, bucket_count in zip(self.BUCKETS_MS, self._counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+
+        return {
+            "buckets_ms": buckets,
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 4) if self.count else None,
+            "p50_ms": self.quantile(0.50),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99)
+        }
+
+
 class MessageVerificationService:
     """
     Verifies message signatures using Ed25519 cryptography.
@@ -27,6 +123,7 @@ class MessageVerificationService:
     - Timestamp validation (reject messages >5 minutes old)
     - Rate limiting tracking for failed verifications
     - Constant-time signature comparison (via cryptography library)
+    - Micro-batched verification on a thread/process pool
 
     Security:
     - Messages older than 5 minutes are rejected
@@ -41,17 +138,53 @@ class MessageVerificationService:
     # Maximum clock skew tolerance in seconds (30 seconds)
     MAX_CLOCK_SKEW_SECONDS = 30
 
-    def __init__(self, peer_key_store: PeerKeyStore):
+    def __init__(
+        self,
+        peer_key_store: PeerKeyStore,
+        max_batch_size: int = 64,
+        max_batch_delay: float = 0.002,
+        pool_workers: Optional[int] = None,
+        use_process_pool: bool = False,
+        executor: Optional[Executor] = None
+    ):
         """
         Initialize message verification service.
 
         Args:
             peer_key_store: Storage for peer public keys
+            max_batch_size: Messages per verification batch
+            max_batch_delay: Longest time a message waits for its micro-batch
+                to fill (seconds)
+            pool_workers: Worker count of the verification pool
+            use_process_pool: Verify on a process pool to use several cores
+                (a thread pool only keeps the event loop free)
+            executor: Externally managed pool (overrides the two above)
         """
         self._peer_key_store = peer_key_store
         self._key_cache: Dict[str, ed25519.Ed25519PublicKey] = {}
+        self._raw_key_cache: Dict[str, bytes] = {}
         self._key_cache_hits = 0
         self._failure_counts: Dict[str, int] = {}
+
+        # Batch pipeline
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_batch_delay = max_batch_delay
+        self._pool_workers = pool_workers
+        self._use_process_pool = use_process_pool
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._queue: List[Tuple[str, bytes, bytes, bytes, float, asyncio.Future]] = []
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+        # Pipeline statistics
+        self._messages_processed = 0
+        self._messages_verified = 0
+        self._batches = 0
+        self._busy_seconds = 0.0
+        self._latency = LatencyHistogram()
+        self._batch_latency = LatencyHistogram()
+
         logger.info("MessageVerificationService initialized")
 
     def verify_message(
@@ -101,6 +234,245 @@ class MessageVerificationService:
             self._track_verification_failure(sender_peer_id)
             return False
 
+    def verify_messages(self, requests: Sequence[VerificationRequest]) -> List[bool]:
+        """
+        Verify a batch of message signatures.
+
+        Synchronous counterpart of verify_message for many messages:
+        signature checks run in chunks of max_batch_size on the
+        verification pool. Unlike verify_message, an unknown sender or an
+        invalid timestamp yields False for that message instead of raising.
+
+        Args:
+            requests: Messages to verify
+
+        Returns:
+            True/False per message, in order
+        """
+        started = time.perf_counter()
+        results = [False] * len(requests)
+        pending: List[int] = []
+        raw_items: List[Tuple[bytes, bytes, bytes]] = []
+
+        for index, request in enumerate(requests):
+            raw_key = self._prepare(request.sender_peer_id, request.timestamp, strict=False)
+            if raw_key is None:
+                continue
+            pending.append(index)
+            raw_items.append((raw_key, request.signature, request.payload))
+
+        chunks = [
+            raw_items[start:start + self.max_batch_size]
+            for start in range(0, len(raw_items), self.max_batch_size)
+        ]
+        verified = [
+            ok
+            for chunk_result in self._get_executor().map(verify_ed25519_batch, chunks)
+            for ok in chunk_result
+        ]
+
+        for index, ok in zip(pending, verified):
+            results[index] = ok
+            self._record_result(requests[index].sender_peer_id, ok)
+
+        elapsed = time.perf_counter() - started
+        self._record_batch(
+            len(requests), sum(results), elapsed, [started] * len(requests), started + elapsed
+        )
+        return results
+
+    async def verify_message_async(
+        self,
+        sender_peer_id: str,
+        payload: bytes,
+        signature: bytes,
+        timestamp: int
+    ) -> bool:
+        """
+        Verify a message signature as part of a micro-batch.
+
+        Concurrent calls are grouped into batches of up to max_batch_size
+        (or whatever arrived within max_batch_delay) and verified on the
+        verification pool, keeping the event loop free.
+
+        Args:
+            sender_peer_id: Peer ID of the sender
+            payload: Message payload bytes
+            signature: Ed25519 signature bytes (64 bytes)
+            timestamp: Unix timestamp when message was signed
+
+        Returns:
+            True if signature is valid, False otherwise
+
+        Raises:
+            ValueError: If sender is unknown or timestamp is invalid
+        """
+        raw_key = self._prepare(sender_peer_id, timestamp, strict=True)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((sender_peer_id, raw_key, signature, payload, time.perf_counter(), future))
+
+        if len(self._queue) >= self.max_batch_size:
+            self._dispatch_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = loop.call_later(self.max_batch_delay, self._dispatch_batch)
+
+        return await future
+
+    def _dispatch_batch(self) -> None:
+        """Hand the queued messages to the pool as one batch."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        if not self._queue:
+            return
+
+        batch = self._queue[:self.max_batch_size]
+        del self._queue[:len(batch)]
+        if self._queue:
+            # Remaining messages start a new batch window
+            self._batch_timer = asyncio.get_running_loop().call_later(
+                self.max_batch_delay, self._dispatch_batch
+            )
+
+        # Keep a strong reference so the batch task is not garbage collected
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, bytes, bytes, bytes, float, asyncio.Future]]) -> None:
+        """Verify one micro-batch on the pool and resolve its futures."""
+        started = time.perf_counter()
+        raw_items = [(raw_key, signature, payload) for _, raw_key, signature, payload, _, _ in batch]
+
+        try:
+            verified = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), verify_ed25519_batch, raw_items
+            )
+        except Exception as e:
+            logger.error(f"Batch signature verification error: {e}")
+            verified = [False] * len(batch)
+
+        finished = time.perf_counter()
+        for (peer_id, _, _, _, _, future), ok in zip(batch, verified):
+            self._record_result(peer_id, ok)
+            if not future.done():
+                future.set_result(ok)
+
+        self._record_batch(
+            len(batch), sum(verified), finished - started, [item[4] for item in batch], finished
+        )
+
+    def _prepare(self, sender_peer_id: str, timestamp: int, strict: bool) -> Optional[bytes]:
+        """
+        Validate timestamp and resolve the sender's raw public key.
+
+        Args:
+            sender_peer_id: Peer ID of the sender
+            timestamp: Unix timestamp when message was signed
+            strict: Raise ValueError like verify_message instead of
+                returning None
+
+        Returns:
+            Raw public key bytes, or None if the message is rejected
+        """
+        try:
+            self._validate_timestamp(timestamp)
+        except ValueError as e:
+            if strict:
+                raise
+            logger.warning(f"Rejected message from peer {sender_peer_id}: {e}")
+            return None
+
+        raw_key = self._raw_key_cache.get(sender_peer_id)
+        if raw_key is not None:
+            self._key_cache_hits += 1
+            return raw_key
+
+        public_key = self._get_peer_public_key(sender_peer_id)
+        if public_key is None:
+            logger.warning(f"Unknown peer: {sender_peer_id}")
+            if strict:
+                raise ValueError(f"Unknown peer: {sender_peer_id}")
+            return None
+
+        raw_key = public_key.public_bytes_raw()
+        self._raw_key_cache[sender_peer_id] = raw_key
+        return raw_key
+
+    def _record_result(self, peer_id: str, ok: bool) -> None:
+        """Update failure tracking for one verification result."""
+        if ok:
+            self._failure_counts[peer_id] = 0
+        else:
+            logger.warning(f"Invalid signature from peer {peer_id}")
+            self._track_verification_failure(peer_id)
+
+    def _record_batch(
+        self,
+        size: int,
+        verified: int,
+        busy_seconds: float,
+        enqueued_at: List[float],
+        finished_at: float
+    ) -> None:
+        """Update throughput and latency statistics for one batch."""
+        self._batches += 1
+        self._messages_processed += size
+        self._messages_verified += verified
+        self._busy_seconds += busy_seconds
+        self._batch_latency.observe(busy_seconds)
+        for enqueued in enqueued_at:
+            self._latency.observe(finished_at - enqueued)
+
+    def _get_executor(self) -> Executor:
+        """Get the verification pool, creating it on first use."""
+        if self._executor is None:
+            if self._use_process_pool:
+                self._executor = ProcessPoolExecutor(max_workers=self._pool_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._pool_workers,
+                    thread_name_prefix="msg-verify"
+                )
+        return self._executor
+
+    def get_pipeline_stats(self) -> Dict[str, object]:
+        """
+        Get batch pipeline statistics.
+
+        Returns:
+            Dictionary with processed/successfully verified message counts,
+            batch count, throughput (messages processed per second of pool
+            time), per-message latency histogram (enqueue to
+            result) and per-batch latency histogram
+        """
+        throughput = (
+            self._messages_processed / self._busy_seconds if self._busy_seconds > 0 else 0.0
+        )
+        return {
+            "messages_processed": self._messages_processed,
+            "messages_verified": self._messages_verified,
+            "batches": self._batches,
+            "average_batch_size": (
+                round(self._messages_processed / self._batches, 2) if self._batches else 0.0
+            ),
+            "throughput_per_second": round(throughput, 2),
+            "queued": len(self._queue),
+            "message_latency": self._latency.snapshot(),
+            "batch_latency": self._batch_latency.snapshot()
+        }
+
+    def close(self) -> None:
+        """Shut down the verification pool if this service created it."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def _get_peer_public_key(self, peer_id: str) -> ed25519.Ed25519PublicKey:
         """
         Get peer's public key with caching.
@@ -198,6 +570,7 @@ class MessageVerificationService:
         """Clear the public key cache."""
         cache_size = len(self._key_cache)
         self._key_cache.clear()
+        self._raw_key_cache.clear()
         self._key_cache_hits = 0
         logger.debug(f"Cleared public key cache ({cache_size} entries)")
 
@@ -0,0 +1,347 @@
+"""
+Authenticated Principal Cache
+
+Process-wide cache of verified access tokens and the users they resolve
+to, so authenticated requests skip JWT decoding and the users lookup.
+
+Features:
+- Keyed by SHA-256 of the raw token (tokens are never stored); the token's
+  jti, when present, is indexed for revocation
+- Each entry holds the decoded claims and a compact, session-independent
+  user snapshot
+- Entries expire at the earlier of the token's exp and a short max TTL,
+  which bounds staleness for changes made by other processes
+- Invalidation on user deactivation/deletion (ORM events on User) and on
+  token revocation; revoked tokens are remembered until they expire
+
+Architecture:
+- auth_dependencies.get_current_user and auth_service.get_current_user
+  consult the cache first and fall back to decode + async users lookup
+- Callers receive a UserSnapshot, which exposes the same attributes
+  endpoints read from User; load the User row explicitly before mutating it
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import event
+
+from backend.models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Immutable copy of the User fields read by authenticated endpoints"""
+    id: UUID
+    email: str
+    workspace_id: Optional[UUID]
+    is_active: bool
+    full_name: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        """
+        Build a snapshot from a loaded User.
+
+        Args:
+            user: User instance
+
+        Returns:
+            UserSnapshot
+        """
+        return cls(
+            id=user.id,
+            email=user.email,
+            workspace_id=user.workspace_id,
+            is_active=bool(user.is_active),
+            full_name=user.full_name,
+            created_at=user.created_at,
+        )
+
+
+@dataclass(frozen=True)
+class AuthenticatedPrincipal:
+    """A verified token together with the user it identifies"""
+    claims: Mapping[str, Any]
+    user: UserSnapshot
+    expires_at: float
+
+
+def hash_token(token: str) -> str:
+    """
+    Compute the cache key for a raw token.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class PrincipalCache:
+    """
+    Bounded cache of authenticated principals.
+
+    Thread-safe; lookups are O(1), user invalidation is O(tokens for the user).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_ttl_seconds: float = 60.0,
+        revocation_ttl_seconds: float = 7 * 24 * 3600
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum cached tokens (LRU eviction)
+            max_ttl_seconds: Upper bound on entry lifetime regardless of token exp
+            revocation_ttl_seconds: How long to remember a revocation when the
+                token's exp is not supplied (longest token lifetime)
+        """
+        self.max_entries = max_entries
+        self.max_ttl_seconds = max_ttl_seconds
+        self.revocation_ttl_seconds = revocation_ttl_seconds
+        self._entries: "OrderedDict[str, AuthenticatedPrincipal]" = OrderedDict()
+        self._by_user: Dict[str, Set[str]] = {}
+        self._by_jti: Dict[str, str] = {}
+        # Revoked token hashes / jtis -> wall-clock expiry
+        self._revoked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, token: str) -> Optional[AuthenticatedPrincipal]:
+        """
+        Get the principal for a token.
+
+        Args:
+            token: Encoded JWT
+
+        Returns:
+            Cached principal, or None on miss/expiry
+        """
+        key = hash_token(token)
+        with self._lock:
+            principal = self._entries.get(key)
+            if principal is None:
+                self._misses += 1
+                return None
+            if time.time() >= principal.expires_at:
+                self._remove(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return principal
+
+    def put(self, token: str, claims: Mapping[str, Any], user: UserSnapshot) -> AuthenticatedPrincipal:
+        """
+        Cache a verified token.
+
+        Args:
+            token: Encoded JWT (already verified by the caller)
+            claims: Decoded claims
+            user: Snapshot of the resolved user
+
+        Returns:
+            The cached principal
+        """
+        expires_at = time.time() + self.max_ttl_seconds
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+        principal = AuthenticatedPrincipal(
+            claims=MappingProxyType(dict(claims)),
+            user=user,
+            expires_at=expires_at,
+        )
+
+        key = hash_token(token)
+        jti = claims.get("jti")
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = principal
+            self._by_user.setdefault(str(user.id), set()).add(key)
+            if jti:
+                self._by_jti[jti] = key
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+        return principal
+
+    def invalidate_user(self, user_id: Any) -> int:
+        """
+        Drop every cached token for a user (e.g., after deactivation).
+
+        Args:
+            user_id: User UUID (or its string form)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = list(self._by_user.get(str(user_id), ()))
+            for key in keys:
+                self._remove(key)
+        if keys:
+            logger.info(f"Invalidated {len(keys)} cached principals for user {user_id}")
+        return len(keys)
+
+    def revoke(
+        self,
+        token: Optional[str] = None,
+        jti: Optional[str] = None,
+        expires_at: Optional[float] = None
+    ) -> None:
+        """
+        Revoke a token by value or jti.
+
+        The token is dropped from the cache and rejected by is_revoked()
+        until expires_at (or revocation_ttl_seconds when unknown), after
+        which its own exp rejects it.
+
+        Args:
+            token: Encoded JWT
+            jti: Token ID claim
+            expires_at: Token exp as a Unix timestamp
+        """
+        until = expires_at if expires_at is not None else time.time() + self.revocation_ttl_seconds
+        with self._lock:
+            if token is not None:
+                key = hash_token(token)
+                self._revoked[key] = until
+                self._remove(key)
+            if jti is not None:
+                self._revoked[jti] = until
+                key = self._by_jti.get(jti)
+                if key is not None:
+                    self._remove(key)
+            self._prune_revoked()
+
+    def is_revoked(self, token: str, claims: Optional[Mapping[str, Any]] = None) -> bool:
+        """
+        Check whether a token has been revoked.
+
+        Args:
+            token: Encoded JWT
+            claims: Decoded claims (to check jti)
+
+        Returns:
+            True if the token or its jti was revoked
+        """
+        with self._lock:
+            if not self._revoked:
+                return False
+            now = time.time()
+            candidates = [hash_token(token)]
+            if claims is not None and claims.get("jti"):
+                candidates.append(claims["jti"])
+            return any(self._revoked.get(c, 0) > now for c in candidates)
+
+    def clear(self) -> None:
+        """Drop all entries and revocations"""
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+            self._by_jti.clear()
+            self._revoked.clear()
+
+    def _remove(self, key: str) -> None:
+        principal = self._entries.pop(key, None)
+        if principal is None:
+            return
+        user_key = str(principal.user.id)
+        keys = self._by_user.get(user_key)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[user_key]
+        jti = principal.claims.get("jti")
+        if jti and self._by_jti.get(jti) == key:
+            del self._by_jti[jti]
+
+    def _prune_revoked(self) -> None:
+        now = time.time()
+        expired = [k for k, until in self._revoked.items() if until <= now]
+        for k in expired:
+            del self._revoked[k]
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, revoked count, hits, misses, and hit_rate
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "revoked": len(self._revoked),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+# One cache per token verifier: a token verified with one signing key must
+# never be accepted by a verifier using another
+_principal_caches: Dict[str, PrincipalCache] = {}
+_principal_caches_lock = threading.Lock()
+
+
+def get_principal_cache(realm: str = "default") -> PrincipalCache:
+    """
+    Get the process-wide principal cache for a token verifier.
+
+    Args:
+        realm: Verifier name (e.g., "auth_dependencies", "auth_service")
+
+    Returns:
+        PrincipalCache for the realm
+    """
+    cache = _principal_caches.get(realm)
+    if cache is None:
+        with _principal_caches_lock:
+            cache = _principal_caches.setdefault(realm, PrincipalCache())
+    return cache
+
+
+def invalidate_user_principals(user_id: Any) -> int:
+    """
+    Drop cached principals for a user in every realm.
+
+    Args:
+        user_id: User UUID
+
+    Returns:
+        Number of entries removed
+    """
+    return sum(cache.invalidate_user(user_id) for cache in list(_principal_caches.values()))
+
+
+@event.listens_for(User.is_active, "set")
+def _on_user_active_changed(target: User, value: Any, oldvalue: Any, initiator: Any) -> None:
+    """Drop cached principals as soon as a user's active flag changes in this process"""
+    if target.id is not None and value != oldvalue:
+        invalidate_user_principals(target.id)
+
+
+@event.listens_for(User, "after_delete")
+def _on_user_deleted(mapper: Any, connection: Any, target: User) -> None:
+    """Drop cached principals for deleted users"""
+    invalidate_user_principals(target.id)
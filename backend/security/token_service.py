@@ -4,11 +4,22 @@ Token Service (E7-S1)
 JWT encoding/decoding service for capability tokens.
 Supports both HS256 (symmetric) and RS256 (asymmetric) algorithms.
 
+Verified tokens are cached by SHA-256 digest as immutable VerifiedClaims
+(capabilities and data scope as frozensets), so repeated capability and
+data-access checks skip signature verification and model construction.
+Cached entries still honor token expiry and the revocation list.
+
 Refs: OpenCLAW P2P Swarm PRD Section on Security, Backlog E7-S1
 """
 
+import hashlib
+import threading
+import time
 import jwt
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
 from datetime import datetime
 
 from backend.models.capability_token import CapabilityToken, TokenLimits
@@ -24,6 +35,95 @@ class InvalidTokenError(Exception):
     pass
 
 
+class TokenRevokedError(InvalidTokenError):
+    """Raised when token has been revoked"""
+    pass
+
+
+@dataclass(frozen=True)
+class VerifiedClaims:
+    """
+    Immutable view of a verified capability token
+
+    Attributes:
+        jti: JWT ID
+        peer_id: libp2p peer ID
+        capabilities: Allowed capabilities
+        data_scope: Allowed project IDs (empty means all projects)
+        limits: Resource limits
+        expires_at: Unix timestamp when token expires
+        parent_jti: Parent token ID (for rotation)
+        payload: Raw JWT payload
+    """
+    jti: Optional[str]
+    peer_id: str
+    capabilities: FrozenSet[str]
+    data_scope: FrozenSet[str]
+    limits: Mapping[str, int]
+    expires_at: int
+    parent_jti: Optional[str]
+    payload: Mapping[str, Any]
+
+    @classmethod
+    def from_model(cls, token_model: CapabilityToken, payload: Mapping[str, Any]) -> "VerifiedClaims":
+        """
+        Build claims from a decoded token model
+
+        Args:
+            token_model: Decoded CapabilityToken
+            payload: Raw JWT payload
+
+        Returns:
+            VerifiedClaims instance
+        """
+        return cls(
+            jti=token_model.jti,
+            peer_id=token_model.peer_id,
+            capabilities=frozenset(token_model.capabilities),
+            data_scope=frozenset(token_model.data_scope),
+            limits=MappingProxyType(token_model.limits.model_dump()),
+            expires_at=token_model.expires_at,
+            parent_jti=token_model.parent_jti,
+            payload=MappingProxyType(dict(payload)),
+        )
+
+    def has_capability(self, capability: str) -> bool:
+        """
+        Check if token has a specific capability
+
+        Args:
+            capability: Capability string to check
+
+        Returns:
+            True if token has the capability, False otherwise
+        """
+        return capability in self.capabilities
+
+    def has_data_access(self, project_id: str) -> bool:
+        """
+        Check if token has access to a specific project
+
+        Args:
+            project_id: Project ID to check access for
+
+        Returns:
+            True if token has access (empty data_scope means all projects)
+        """
+        return not self.data_scope or project_id in self.data_scope
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """
+        Check if token is expired
+
+        Args:
+            now: Unix timestamp to compare against (default: current time)
+
+        Returns:
+            True if token is expired, False otherwise
+        """
+        return (time.time() if now is None else now) >= self.expires_at
+
+
 class TokenService:
     """
     JWT token encoding and decoding service
@@ -35,13 +135,17 @@ class TokenService:
         secret_key: Secret key or private key for signing
         algorithm: JWT algorithm (HS256 or RS256)
         public_key: Public key for RS256 verification (optional)
+        cache_size: Maximum number of verified tokens kept in memory
+        revocation_checker: Optional callable returning True for revoked jtis
     """
 
     def __init__(
         self,
         secret_key: str,
         algorithm: str = "HS256",
-        public_key: Optional[str] = None
+        public_key: Optional[str] = None,
+        cache_size: int = 1024,
+        revocation_checker: Optional[Callable[[str], bool]] = None
     ):
         """
         Initialize token service
@@ -50,10 +154,23 @@ class TokenService:
             secret_key: Secret key (HS256) or private key PEM (RS256)
             algorithm: JWT algorithm (default: HS256)
             public_key: Public key PEM for RS256 verification (optional)
+            cache_size: Maximum verified tokens to cache (0 disables caching)
+            revocation_checker: Optional callable consulted on every check with
+                the token jti; must be fast (e.g., backed by an in-memory set)
         """
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.public_key = public_key
+        self.cache_size = cache_size
+        self.revocation_checker = revocation_checker
+
+        # Verified tokens keyed by SHA-256 digest of the encoded JWT
+        self._verified: "OrderedDict[str, VerifiedClaims]" = OrderedDict()
+        # Locally revoked jti -> expiry timestamp
+        self._revoked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
 
         # Validate algorithm
         if algorithm not in ["HS256", "RS256"]:
@@ -113,6 +230,10 @@ class TokenService:
             TokenExpiredError: If token has expired
             InvalidTokenError: If token signature or format is invalid
         """
+        return self._verify_and_build(encoded_token)[1]
+
+    def _verify_and_build(self, encoded_token: str) -> Tuple[Dict[str, Any], CapabilityToken]:
+        """Verify the JWT signature and build the token model from its payload"""
         try:
             # For RS256, use public key for verification
             verify_key = self.public_key if self.algorithm == "RS256" else self.secret_key
@@ -138,7 +259,7 @@ class TokenService:
                 parent_jti=payload.get("parent_jti"),
             )
 
-            return token_model
+            return payload, token_model
 
         except jwt.ExpiredSignatureError as e:
             raise TokenExpiredError(f"Token has expired: {str(e)}")
@@ -152,6 +273,110 @@ class TokenService:
         except (KeyError, TypeError) as e:
             raise InvalidTokenError(f"Invalid token format: {str(e)}")
 
+    def verify(self, encoded_token: str) -> VerifiedClaims:
+        """
+        Verify token once and return its cached claims
+
+        The signature is verified and the token model built only on the
+        first call for a given token; later calls return the cached
+        immutable claims after checking expiry and revocation.
+
+        Args:
+            encoded_token: JWT string
+
+        Returns:
+            VerifiedClaims instance
+
+        Raises:
+            TokenExpiredError: If token has expired
+            TokenRevokedError: If token has been revoked
+            InvalidTokenError: If token is invalid
+        """
+        key = hashlib.sha256(encoded_token.encode("utf-8")).digest()
+        now = time.time()
+
+        with self._lock:
+            claims = self._verified.get(key)
+            if claims is not None:
+                if claims.is_expired(now):
+                    del self._verified[key]
+                    claims = None
+                else:
+                    self._verified.move_to_end(key)
+                    self._hits += 1
+            if claims is None:
+                self._misses += 1
+
+        if claims is None:
+            # Expired entries fall through here so decoding reports the expiry
+            payload, token_model = self._verify_and_build(encoded_token)
+            claims = VerifiedClaims.from_model(token_model, payload)
+            if self.cache_size > 0:
+                with self._lock:
+                    self._verified[key] = claims
+                    while len(self._verified) > self.cache_size:
+                        self._verified.popitem(last=False)
+
+        if self.is_revoked(claims.jti):
+            raise TokenRevokedError(f"Token {claims.jti} has been revoked")
+
+        return claims
+
+    def revoke(self, jti: str, expires_at: Optional[float] = None) -> None:
+        """
+        Revoke a token locally and drop it from the verified cache
+
+        Args:
+            jti: Token ID to revoke
+            expires_at: Token exp timestamp; the revocation is forgotten after
+                it since expiry rejects the token anyway (default: keep forever)
+        """
+        with self._lock:
+            self._revoked[jti] = expires_at if expires_at is not None else float("inf")
+            for key in [k for k, c in self._verified.items() if c.jti == jti]:
+                del self._verified[key]
+            now = time.time()
+            for expired_jti in [j for j, until in self._revoked.items() if until <= now]:
+                del self._revoked[expired_jti]
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        """
+        Check local revocations and the configured revocation checker
+
+        Args:
+            jti: Token ID
+
+        Returns:
+            True if token is revoked
+        """
+        if jti is None:
+            return False
+        if self._revoked.get(jti, 0) > time.time():
+            return True
+        return bool(self.revocation_checker and self.revocation_checker(jti))
+
+    def clear_cache(self) -> None:
+        """Drop all verified tokens (e.g., after key rotation)"""
+        with self._lock:
+            self._verified.clear()
+
+    def get_cache_stats(self) -> Dict[str, float]:
+        """
+        Get verified-token cache statistics
+
+        Returns:
+            Dictionary with size, revoked count, hits, misses, and hit_rate
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._verified),
+                "revoked": len(self._revoked),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
     def check_capability(self, encoded_token: str, capability: str) -> bool:
         """
         Check if token has a specific capability
@@ -165,15 +390,27 @@ class TokenService:
 
         Raises:
             TokenExpiredError: If token has expired
-            InvalidTokenError: If token is invalid
+            InvalidTokenError: If token is invalid or revoked
         """
-        try:
-            token_model = self.decode_token(encoded_token)
-            return token_model.has_capability(capability)
-        except TokenExpiredError:
-            raise
-        except InvalidTokenError:
-            raise
+        return self.verify(encoded_token).has_capability(capability)
+
+    def check_capabilities(self, encoded_token: str, capabilities: Iterable[str]) -> Dict[str, bool]:
+        """
+        Check many capabilities against one token with a single verification
+
+        Args:
+            encoded_token: JWT string
+            capabilities: Capabilities to check
+
+        Returns:
+            Mapping of capability to whether the token grants it
+
+        Raises:
+            TokenExpiredError: If token has expired
+            InvalidTokenError: If token is invalid or revoked
+        """
+        granted = self.verify(encoded_token).capabilities
+        return {capability: capability in granted for capability in capabilities}
 
     def check_data_access(self, encoded_token: str, project_id: str) -> bool:
         """
@@ -188,15 +425,9 @@ class TokenService:
 
         Raises:
             TokenExpiredError: If token has expired
-            InvalidTokenError: If token is invalid
+            InvalidTokenError: If token is invalid or revoked
         """
-        try:
-            token_model = self.decode_token(encoded_token)
-            return token_model.has_data_access(project_id)
-        except TokenExpiredError:
-            raise
-        except InvalidTokenError:
-            raise
+        return self.verify(encoded_token).has_data_access(project_id)
 
     def get_token_claims(self, encoded_token: str) -> dict:
         """
@@ -211,6 +442,12 @@ class TokenService:
         Returns:
             Token payload as dictionary
         """
+        key = hashlib.sha256(encoded_token.encode("utf-8")).digest()
+        with self._lock:
+            claims = self._verified.get(key)
+        if claims is not None:
+            return dict(claims.payload)
+
         try:
             # Decode without verification (for inspection only)
             payload = jwt.decode(
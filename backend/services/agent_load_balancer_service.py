@@ -9,6 +9,7 @@ Provides intelligent load balancing and task assignment for multi-agent swarms:
 - Capability matching for task-to-agent assignment
 - Performance tracking and adaptive optimization
 - Load rebalancing
+- Indexed candidate selection (inverted capability index + lazy min-heaps)
 
 Key Features:
 - Select best agent by load/health/capabilities
@@ -16,10 +17,12 @@ Key Features:
 - Health status filtering (exclude degraded/overloaded nodes)
 - Round-robin for equal load distribution
 - Adaptive strategy combining multiple approaches
+- Batch assignment solved as one capacity-constrained matching
 
 Architecture:
 - AgentMetrics: Tracks per-agent performance and health
 - SwarmLoadBalancer: Main service orchestrating task assignment
+- AgentCandidateIndex: Incrementally maintained index used by assign_task
 - LoadBalancingStrategy: Enum of available strategies
 - AgentHealthStatus: Health classification
 
@@ -29,8 +32,9 @@ Integration Points:
 - Task: Extracts requirements from task payload
 """
 
+import heapq
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, FrozenSet, List, Optional, Any, Tuple
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
@@ -72,6 +76,9 @@ class AgentMetrics:
     Tracks performance, resource utilization, and health indicators
     for intelligent task assignment decisions.
     """
+    # Concurrent task limit before an agent counts as overloaded
+    MAX_CURRENT_TASKS = 10
+
     agent_id: str
 
     # Performance metrics
@@ -162,7 +169,7 @@ class AgentMetrics:
         - Average response time > 30s
         """
         return (
-            self.current_tasks > 10 or
+            self.current_tasks > self.MAX_CURRENT_TASKS or
             self.queue_length > 20 or
             self.cpu_usage > 0.8 or
             self.memory_usage > 0.8 or
@@ -211,6 +218,369 @@ class TaskAssignment:
         return datetime.now(timezone.utc) > self.expected_completion
 
 
+class _Descending:
+    """Wrapper that inverts ordering so a min-heap yields the largest value first"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return self.value > other.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+
+class AgentCandidateIndex:
+    """
+    Persistent candidate index for SwarmLoadBalancer
+
+    Replaces per-task rescans of every available node with incrementally
+    maintained structures:
+    - Inverted capability index: capability key -> peer_ids advertising it
+    - Candidate cache: requirement set -> peer_ids satisfying all requirements
+    - Lazy min-heaps ordered by current tasks, average response time,
+      performance score and (descending) peer_id
+
+    Heap entries carry the node's position in the available_nodes list so
+    ties resolve exactly like the list-based strategies (first node wins).
+    Entries are versioned: refresh() pushes a new entry and older ones are
+    dropped when they surface. Heaps are compacted once they outgrow the
+    node count.
+
+    Health depends on heartbeat age, so it is checked lazily when an entry
+    is popped rather than baked into the index. Metric changes must go
+    through refresh() (SwarmLoadBalancer does this from assign_task,
+    update_agent_metrics, task_completed and rebalance_tasks).
+    """
+
+    CURRENT_TASKS = "current_tasks"
+    RESPONSE_TIME = "response_time"
+    PERFORMANCE = "performance"
+    PEER_ID = "peer_id"
+
+    HEAP_NAMES = (CURRENT_TASKS, RESPONSE_TIME, PERFORMANCE, PEER_ID)
+
+    # Candidate sets this many times smaller than the index are scanned
+    # directly instead of walking heaps full of non-matching agents
+    SPARSE_RATIO = 8
+
+    def __init__(
+        self,
+        metrics_provider: Callable[[str], AgentMetrics],
+        requirement_check: Callable[[Any, Any], bool]
+    ):
+        """
+        Initialize AgentCandidateIndex
+
+        Args:
+            metrics_provider: Returns (creating if needed) metrics for an agent
+            requirement_check: Predicate(required_value, actual_value)
+        """
+        self._metrics_provider = metrics_provider
+        self._requirement_check = requirement_check
+
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        self._orders: Dict[str, int] = {}
+        self._capabilities: Dict[str, Dict[str, Any]] = {}
+        self._versions: Dict[str, int] = {}
+        self._capability_index: Dict[str, set] = defaultdict(set)
+        self._candidate_cache: Dict[Tuple, FrozenSet[str]] = {}
+        self._heaps: Dict[str, List[Tuple]] = {name: [] for name in self.HEAP_NAMES}
+
+        # Last node list synced, used to skip re-syncing the same list
+        self._source: Optional[List[Dict[str, Any]]] = None
+        self._source_len = 0
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self._nodes
+
+    @property
+    def source(self) -> Optional[List[Dict[str, Any]]]:
+        """Node list the index was last synced from"""
+        return self._source
+
+    def get_node(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Get indexed node dictionary by peer_id"""
+        return self._nodes.get(agent_id)
+
+    def sync(self, available_nodes: List[Dict[str, Any]]):
+        """
+        Bring the index in line with the given node list
+
+        Returns immediately when called again with the same list object.
+        Otherwise only the difference is applied: added, removed, re-ordered
+        or re-advertised nodes. Call invalidate() after mutating the synced
+        list or its node dictionaries in place.
+
+        Args:
+            available_nodes: List of node dictionaries with peer_id and capabilities
+        """
+        if available_nodes is self._source and len(available_nodes) == self._source_len:
+            return
+
+        positions: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        for order, node in enumerate(available_nodes):
+            agent_id = node.get("peer_id")
+            if agent_id and agent_id not in positions:
+                positions[agent_id] = (order, node)
+
+        membership_changed = False
+
+        for agent_id in [a for a in self._nodes if a not in positions]:
+            self._remove(agent_id)
+            membership_changed = True
+
+        for agent_id, (order, node) in positions.items():
+            capabilities = node.get("capabilities") or {}
+
+            if agent_id not in self._nodes:
+                self._add(agent_id, order, node, capabilities)
+                membership_changed = True
+            elif self._capabilities[agent_id] != capabilities:
+                self._remove(agent_id)
+                self._add(agent_id, order, node, capabilities)
+                membership_changed = True
+            else:
+                self._nodes[agent_id] = node
+                if self._orders[agent_id] != order:
+                    self._orders[agent_id] = order
+                    self.refresh(agent_id)
+
+        if membership_changed:
+            self._candidate_cache.clear()
+
+        self._source = available_nodes
+        self._source_len = len(available_nodes)
+
+    def invalidate(self):
+        """Force the next sync() to diff the node list even if it is the same object"""
+        self._source = None
+
+    def refresh(self, agent_id: str):
+        """
+        Re-key an agent after its metrics changed
+
+        Args:
+            agent_id: Agent identifier (ignored if not indexed)
+        """
+        if agent_id not in self._nodes:
+            return
+
+        version = self._versions.get(agent_id, 0) + 1
+        self._versions[agent_id] = version
+
+        metrics = self._metrics_provider(agent_id)
+        order = self._orders[agent_id]
+        for name in self.HEAP_NAMES:
+            heapq.heappush(
+                self._heaps[name],
+                (self._heap_key(name, agent_id, metrics), order, version, agent_id)
+            )
+
+        if len(self._heaps[self.CURRENT_TASKS]) > 2 * len(self._nodes) + 64:
+            self._compact()
+
+    def candidates(self, requirements: Dict[str, Any]) -> Optional[FrozenSet[str]]:
+        """
+        Get agents whose capabilities satisfy every requirement
+
+        Only agents advertising the rarest required key are evaluated, and
+        results are cached per requirement set until membership changes.
+
+        Args:
+            requirements: Required capabilities
+
+        Returns:
+            Frozen set of peer_ids, or None when there are no requirements
+            (every indexed agent is a candidate)
+        """
+        if not requirements:
+            return None
+
+        signature = self._requirements_signature(requirements)
+        if signature is not None:
+            cached = self._candidate_cache.get(signature)
+            if cached is not None:
+                return cached
+
+        postings = [self._capability_index.get(key) for key in requirements]
+        if not all(postings):
+            result = frozenset()
+        else:
+            smallest = min(postings, key=len)
+            result = frozenset(
+                agent_id for agent_id in smallest
+                if all(
+                    key in self._capabilities[agent_id] and
+                    self._requirement_check(required_value, self._capabilities[agent_id][key])
+                    for key, required_value in requirements.items()
+                )
+            )
+
+        if signature is not None:
+            self._candidate_cache[signature] = result
+        return result
+
+    def select(self, heap_name: str, candidates: Optional[FrozenSet[str]]) -> Optional[str]:
+        """
+        Get the best healthy candidate according to one heap ordering
+
+        Args:
+            heap_name: One of HEAP_NAMES
+            candidates: Result of candidates() (None means all agents)
+
+        Returns:
+            Selected agent ID or None if no candidate is healthy
+        """
+        if candidates is not None and len(candidates) * self.SPARSE_RATIO < len(self._nodes):
+            return self._scan(heap_name, candidates)
+
+        heap = self._heaps[heap_name]
+        kept = []
+        rekeyed = []
+        selected = None
+
+        while heap:
+            entry = heapq.heappop(heap)
+            key, _, version, agent_id = entry
+            if self._versions.get(agent_id) != version:
+                continue
+
+            metrics = self._metrics_provider(agent_id)
+            if key != self._heap_key(heap_name, agent_id, metrics):
+                # Metrics were changed without refresh(); re-key below
+                rekeyed.append(agent_id)
+                continue
+
+            kept.append(entry)
+            if (candidates is None or agent_id in candidates) and metrics.is_healthy():
+                selected = agent_id
+                break
+
+        for entry in kept:
+            heapq.heappush(heap, entry)
+
+        for agent_id in rekeyed:
+            self.refresh(agent_id)
+            if (candidates is None or agent_id in candidates) and \
+                    self._metrics_provider(agent_id).is_healthy():
+                if selected is None or \
+                        self._rank(heap_name, agent_id) < self._rank(heap_name, selected):
+                    selected = agent_id
+
+        return selected
+
+    def eligible_agents(self, candidates: Optional[FrozenSet[str]]) -> List[str]:
+        """
+        Get healthy candidates in available_nodes order
+
+        Used by the round-robin strategies, which need positional selection.
+
+        Args:
+            candidates: Result of candidates() (None means all agents)
+
+        Returns:
+            List of agent IDs
+        """
+        pool = self._nodes if candidates is None else candidates
+        agents = [
+            agent_id for agent_id in pool
+            if agent_id in self._nodes and self._metrics_provider(agent_id).is_healthy()
+        ]
+        agents.sort(key=self._orders.__getitem__)
+        return agents
+
+    def _scan(self, heap_name: str, candidates: FrozenSet[str]) -> Optional[str]:
+        """Linear selection over a small candidate set"""
+        selected = None
+        selected_rank = None
+        for agent_id in candidates:
+            if agent_id not in self._nodes:
+                continue
+            if not self._metrics_provider(agent_id).is_healthy():
+                continue
+            rank = self._rank(heap_name, agent_id)
+            if selected_rank is None or rank < selected_rank:
+                selected, selected_rank = agent_id, rank
+        return selected
+
+    def _rank(self, heap_name: str, agent_id: str) -> Tuple:
+        """Current (key, order) rank of an agent within a heap ordering"""
+        metrics = self._metrics_provider(agent_id)
+        return (self._heap_key(heap_name, agent_id, metrics), self._orders[agent_id])
+
+    def _heap_key(self, heap_name: str, agent_id: str, metrics: AgentMetrics) -> Any:
+        """Ordering key for a heap (smaller is better)"""
+        if heap_name == self.CURRENT_TASKS:
+            return metrics.current_tasks
+        if heap_name == self.RESPONSE_TIME:
+            return metrics.average_response_time
+        if heap_name == self.PERFORMANCE:
+            return -metrics.get_performance_score()
+        return _Descending(agent_id)
+
+    def _add(self, agent_id: str, order: int, node: Dict[str, Any], capabilities: Dict[str, Any]):
+        """Index a node"""
+        self._nodes[agent_id] = node
+        self._orders[agent_id] = order
+        self._capabilities[agent_id] = dict(capabilities)
+        for key in capabilities:
+            self._capability_index[key].add(agent_id)
+        self.refresh(agent_id)
+
+    def _remove(self, agent_id: str):
+        """Drop a node; its heap entries become stale"""
+        self._nodes.pop(agent_id, None)
+        self._orders.pop(agent_id, None)
+        self._versions.pop(agent_id, None)
+        for key in self._capabilities.pop(agent_id, {}):
+            postings = self._capability_index.get(key)
+            if postings is not None:
+                postings.discard(agent_id)
+                if not postings:
+                    del self._capability_index[key]
+
+    def _compact(self):
+        """Rebuild heaps from live entries only"""
+        for name in self.HEAP_NAMES:
+            heap = []
+            for agent_id in self._nodes:
+                metrics = self._metrics_provider(agent_id)
+                heap.append((
+                    self._heap_key(name, agent_id, metrics),
+                    self._orders[agent_id],
+                    self._versions[agent_id],
+                    agent_id
+                ))
+            heapq.heapify(heap)
+            self._heaps[name] = heap
+
+    @staticmethod
+    def _requirements_signature(requirements: Dict[str, Any]) -> Optional[Tuple]:
+        """Hashable cache key for a requirement set (None if unhashable)"""
+        def freeze(value: Any) -> Any:
+            if isinstance(value, list):
+                return tuple(freeze(item) for item in value)
+            return value
+
+        # Type names keep True and 1 apart (equality vs threshold semantics)
+        signature = tuple(
+            (key, type(value).__name__, freeze(value))
+            for key, value in sorted(requirements.items(), key=lambda item: item[0])
+        )
+        try:
+            hash(signature)
+        except TypeError:
+            return None
+        return signature
+
+
 class SwarmLoadBalancer:
     """
     Intelligent Load Balancer for Multi-Agent Swarms
@@ -230,8 +600,23 @@ class SwarmLoadBalancer:
         - CAPABILITY_BASED: Match task requirements to capabilities
         - PERFORMANCE_BASED: Select highest performing agents
         - ADAPTIVE: Weighted combination of multiple strategies
+
+    assign_tasks_batch places a whole backlog in one matching pass instead
+    of calling assign_task per task.
+
+    assign_task selects through an AgentCandidateIndex kept in sync with
+    the node list and agent metrics, so selection cost grows with
+    log(nodes) rather than nodes x strategies.
     """
 
+    # Batch placement order (higher first)
+    PRIORITY_RANK = {
+        TaskPriority.CRITICAL: 3,
+        TaskPriority.HIGH: 2,
+        TaskPriority.NORMAL: 1,
+        TaskPriority.LOW: 0
+    }
+
     def __init__(
         self,
         db_session: Session,
@@ -271,6 +656,12 @@ class SwarmLoadBalancer:
             LoadBalancingStrategy.PERFORMANCE_BASED: 0.2
         }
 
+        # Candidate index used by assign_task
+        self.candidate_index = AgentCandidateIndex(
+            metrics_provider=self._ensure_agent_metrics,
+            requirement_check=self._requirement_satisfied
+        )
+
         logger.info(f"Initialized SwarmLoadBalancer with strategy: {strategy.value}")
 
     async def initialize_agent_metrics(self, available_nodes: List[Dict[str, Any]]):
@@ -288,6 +679,15 @@ class SwarmLoadBalancer:
 
         logger.info(f"Initialized metrics for {len(self.agent_metrics)} agents")
 
+    def _ensure_agent_metrics(self, agent_id: str) -> AgentMetrics:
+        """Get metrics for an agent, initializing them if not present"""
+        metrics = self.agent_metrics.get(agent_id)
+        if metrics is None:
+            metrics = AgentMetrics(agent_id=agent_id)
+            self.agent_metrics[agent_id] = metrics
+            self.agent_weights[agent_id] = 1.0
+        return metrics
+
     async def assign_task(
         self,
         task: Task,
@@ -305,22 +705,166 @@ class SwarmLoadBalancer:
         """
         start_time = datetime.now(timezone.utc)
 
-        # Get available agents
-        available_agents = await self._get_available_agents(task, available_nodes)
-
-        if not available_agents:
-            logger.warning(f"No available agents for task {task.id}")
-            return None
+        # Bring candidate index up to date (no-op for an unchanged node list)
+        self.candidate_index.sync(available_nodes)
 
         # Select best agent based on strategy
-        selected_agent = await self._select_agent(task, available_agents, available_nodes)
+        selected_agent = self._select_indexed_agent(task)
 
         if not selected_agent:
-            logger.warning(f"Failed to select agent for task {task.id}")
+            logger.warning(f"No available agents for task {task.id}")
             return None
 
+        assignment_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+        return self._record_assignment(task, selected_agent, assignment_time)
+
+    async def assign_tasks_batch(
+        self,
+        tasks: List[Task],
+        available_nodes: List[Dict[str, Any]]
+    ) -> List[Optional[TaskAssignmentResult]]:
+        """
+        Assign a batch of tasks with one global matching pass
+
+        Solves the batch as a capacity-constrained assignment instead of
+        making a greedy choice per task:
+        1. Each available agent is scored once into a base cost (response
+           time, performance) shared by every task in the batch
+        2. Tasks are grouped by requirement set; each group's feasible
+           agents come from the candidate index
+        3. Tasks are placed highest priority first, most constrained first
+           on ties, onto the feasible agent with the lowest marginal cost.
+           Marginal cost grows with load, so the batch spreads across agents
+           instead of piling onto the currently best one
+
+        Agent capacity is the headroom left before it becomes overloaded.
+
+        Args:
+            tasks: Tasks to assign
+            available_nodes: List of available nodes with capabilities
+
+        Returns:
+            Results aligned with tasks (None where no capable agent had capacity)
+        """
+        start_time = datetime.now(timezone.utc)
+        results: List[Optional[TaskAssignmentResult]] = [None] * len(tasks)
+        if not tasks:
+            return results
+
+        index = self.candidate_index
+        index.sync(available_nodes)
+
+        # Base cost vector over all eligible agents
+        load_weight = self.strategy_weights.get(LoadBalancingStrategy.LEAST_CONNECTIONS, 0.25)
+        response_weight = self.strategy_weights.get(LoadBalancingStrategy.LEAST_RESPONSE_TIME, 0.25)
+        performance_weight = self.strategy_weights.get(LoadBalancingStrategy.PERFORMANCE_BASED, 0.2)
+        slots_per_agent = AgentMetrics.MAX_CURRENT_TASKS + 1
+
+        eligible = index.eligible_agents(None)
+        order = {agent_id: position for position, agent_id in enumerate(eligible)}
+        base_cost: Dict[str, float] = {}
+        load: Dict[str, int] = {}
+        capacity: Dict[str, int] = {}
+        for agent_id in eligible:
+            metrics = self.agent_metrics[agent_id]
+            base_cost[agent_id] = (
+                response_weight * min(metrics.average_response_time / 30.0, 1.0) +
+                performance_weight * (1.0 - metrics.get_performance_score() / 100.0)
+            )
+            load[agent_id] = metrics.current_tasks
+            capacity[agent_id] = slots_per_agent - metrics.current_tasks
+
+        def marginal_cost(agent_id: str) -> float:
+            return base_cost[agent_id] + load_weight * load[agent_id] / slots_per_agent
+
+        # Group tasks by feasible agent set (candidate sets are cached per requirement set)
+        group_candidates: Dict[Any, Optional[FrozenSet[str]]] = {}
+        task_groups: List[Any] = []
+        for task in tasks:
+            candidates = index.candidates(task.required_capabilities or {})
+            group_key = None if candidates is None else id(candidates)
+            group_candidates[group_key] = candidates
+            task_groups.append(group_key)
+
+        def group_size(group_key: Any) -> int:
+            candidates = group_candidates[group_key]
+            return len(capacity) if candidates is None else len(candidates)
+
+        placement_order = sorted(
+            range(len(tasks)),
+            key=lambda i: (
+                -self.PRIORITY_RANK.get(tasks[i].priority, 1),
+                group_size(task_groups[i]),
+                i
+            )
+        )
+
+        # Per-group heaps of (marginal_cost, order, agent_id); entries are
+        # re-keyed lazily when another group has loaded the same agent
+        group_heaps: Dict[Any, List[Tuple[float, int, str]]] = {}
+        assignments: List[Tuple[int, str]] = []
+
+        for position in placement_order:
+            group_key = task_groups[position]
+            heap = group_heaps.get(group_key)
+            if heap is None:
+                candidates = group_candidates[group_key]
+                pool = capacity if candidates is None else [a for a in candidates if a in capacity]
+                heap = [(marginal_cost(a), order[a], a) for a in pool]
+                heapq.heapify(heap)
+                group_heaps[group_key] = heap
+
+            while heap:
+                cost, agent_order, agent_id = heapq.heappop(heap)
+                if capacity[agent_id] <= 0:
+                    continue
+                current_cost = marginal_cost(agent_id)
+                if cost != current_cost:
+                    heapq.heappush(heap, (current_cost, agent_order, agent_id))
+                    continue
+
+                load[agent_id] += 1
+                capacity[agent_id] -= 1
+                if capacity[agent_id] > 0:
+                    heapq.heappush(heap, (marginal_cost(agent_id), agent_order, agent_id))
+                assignments.append((position, agent_id))
+                break
+
+        # Amortize matching time across the batch for assignment stats
+        assignment_time = (datetime.now(timezone.utc) - start_time).total_seconds() / len(tasks)
+        for position, agent_id in assignments:
+            results[position] = self._record_assignment(tasks[position], agent_id, assignment_time)
+
+        unassigned = len(tasks) - len(assignments)
+        if unassigned:
+            logger.warning(f"No capable agent with capacity for {unassigned} of {len(tasks)} batched tasks")
+
+        logger.info(
+            f"Batch assigned {len(assignments)}/{len(tasks)} tasks across "
+            f"{len({agent_id for _, agent_id in assignments})} agents"
+        )
+
+        return results
+
+    def _record_assignment(
+        self,
+        task: Task,
+        selected_agent: str,
+        assignment_time: float
+    ) -> TaskAssignmentResult:
+        """
+        Record an assignment and update agent load and statistics
+
+        Args:
+            task: Assigned task
+            selected_agent: Selected agent ID
+            assignment_time: Time spent selecting the agent (seconds)
+
+        Returns:
+            TaskAssignmentResult for the assignment
+        """
         # Calculate scores
-        capability_match_score = self._calculate_capability_match(task, self._get_node_by_id(selected_agent, available_nodes))
+        capability_match_score = self._calculate_capability_match(task, self.candidate_index.get_node(selected_agent))
         performance_score = self.agent_metrics[selected_agent].get_performance_score()
 
         # Create assignment record
@@ -337,10 +881,10 @@ class SwarmLoadBalancer:
         # Update tracking
         self.task_assignments[str(task.id)] = assignment
         self.agent_metrics[selected_agent].current_tasks += 1
+        self.candidate_index.refresh(selected_agent)
         self.total_tasks_assigned += 1
 
         # Update assignment time
-        assignment_time = (datetime.now(timezone.utc) - start_time).total_seconds()
         self.average_assignment_time = (
             (self.average_assignment_time * (self.total_tasks_assigned - 1) + assignment_time) /
             self.total_tasks_assigned
@@ -363,6 +907,60 @@ class SwarmLoadBalancer:
             performance_score=performance_score
         )
 
+    def _select_indexed_agent(self, task: Task) -> Optional[str]:
+        """
+        Select the best agent through the candidate index
+
+        Equivalent to _get_available_agents followed by _select_agent, but
+        min/max strategies are answered from the index heaps instead of
+        rescanning available_nodes. Round-robin strategies need positional
+        selection and use the ordered candidate list.
+
+        Args:
+            task: Task to assign
+
+        Returns:
+            Selected agent ID or None if no agent is available
+        """
+        index = self.candidate_index
+        candidates = index.candidates(task.required_capabilities or {})
+
+        if self.strategy in (
+            LoadBalancingStrategy.ROUND_ROBIN,
+            LoadBalancingStrategy.WEIGHTED_ROUND_ROBIN
+        ):
+            available_agents = index.eligible_agents(candidates)
+            if not available_agents:
+                return None
+            if len(available_agents) == 1:
+                return available_agents[0]
+            if self.strategy == LoadBalancingStrategy.ROUND_ROBIN:
+                return self._round_robin_selection(available_agents)
+            return self._weighted_round_robin_selection(available_agents)
+
+        # Every candidate satisfies all requirements, so capability match
+        # scores tie at 1.0 and capability-based selection falls through to
+        # the highest peer_id (see _capability_based_selection)
+        heap_names = {
+            LoadBalancingStrategy.LEAST_CONNECTIONS: AgentCandidateIndex.CURRENT_TASKS,
+            LoadBalancingStrategy.LEAST_RESPONSE_TIME: AgentCandidateIndex.RESPONSE_TIME,
+            LoadBalancingStrategy.CAPABILITY_BASED: AgentCandidateIndex.PEER_ID,
+            LoadBalancingStrategy.PERFORMANCE_BASED: AgentCandidateIndex.PERFORMANCE
+        }
+
+        if self.strategy in heap_names:
+            return index.select(heap_names[self.strategy], candidates)
+
+        # Adaptive: one heap lookup per voting strategy
+        strategy_scores = {}
+        for strategy, heap_name in heap_names.items():
+            agent_id = index.select(heap_name, candidates)
+            if agent_id is None:
+                return None
+            strategy_scores[strategy] = agent_id
+
+        return self._tally_votes(strategy_scores)
+
     async def _get_available_agents(
         self,
         task: Task,
@@ -544,6 +1142,10 @@ class SwarmLoadBalancer:
         pb_agent = self._performance_based_selection(available_agents)
         strategy_scores[LoadBalancingStrategy.PERFORMANCE_BASED] = pb_agent
 
+        return self._tally_votes(strategy_scores)
+
+    def _tally_votes(self, strategy_scores: Dict[LoadBalancingStrategy, str]) -> str:
+        """Combine per-strategy selections using adaptive strategy weights"""
         # Weight the selections
         agent_votes = defaultdict(float)
         for strategy, agent_id in strategy_scores.items():
@@ -664,6 +1266,9 @@ class SwarmLoadBalancer:
 
     def _get_node_by_id(self, peer_id: str, available_nodes: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Get node dictionary by peer_id"""
+        if available_nodes is self.candidate_index.source and peer_id in self.candidate_index:
+            return self.candidate_index.get_node(peer_id)
+
         for node in available_nodes:
             if node.get("peer_id") == peer_id:
                 return node
@@ -699,6 +1304,8 @@ class SwarmLoadBalancer:
         performance_score = metrics.get_performance_score()
         self.agent_weights[agent_id] = max(performance_score / 100.0, 0.1)
 
+        self.candidate_index.refresh(agent_id)
+
     async def task_completed(self, task_id: str, success: bool, completion_time: float):
         """
         Handle task completion
@@ -717,6 +1324,7 @@ class SwarmLoadBalancer:
         metrics = self.agent_metrics[assignment.agent_id]
         metrics.update_performance(response_time, completion_time, success)
         metrics.current_tasks = max(0, metrics.current_tasks - 1)
+        self.candidate_index.refresh(assignment.agent_id)
 
         # Update global stats
         if success:
@@ -727,6 +1335,27 @@ class SwarmLoadBalancer:
 
         logger.info(f"Task {task_id} completed by agent {assignment.agent_id} (success: {success})")
 
+    def release_assignment(self, task_id: str):
+        """
+        Undo the reservation for a task that was matched but never started
+
+        Unlike task_completed, agent performance and completion statistics
+        are left untouched.
+
+        Args:
+            task_id: Task identifier
+        """
+        assignment = self.task_assignments.pop(task_id, None)
+        if not assignment:
+            return
+
+        metrics = self.agent_metrics.get(assignment.agent_id)
+        if metrics is not None:
+            metrics.current_tasks = max(0, metrics.current_tasks - 1)
+            self.candidate_index.refresh(assignment.agent_id)
+
+        logger.info(f"Released assignment of task {task_id} from agent {assignment.agent_id}")
+
     async def rebalance_tasks(self):
         """
         Rebalance tasks across agents
@@ -775,6 +1404,8 @@ class SwarmLoadBalancer:
                 # Update metrics
                 self.agent_metrics[overloaded_agent].current_tasks -= 1
                 self.agent_metrics[target_agent].current_tasks += 1
+                self.candidate_index.refresh(overloaded_agent)
+                self.candidate_index.refresh(target_agent)
 
                 logger.info(f"Reassigned task {assignment.task_id} from {overloaded_agent} to {target_agent}")
 
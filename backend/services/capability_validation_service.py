@@ -8,7 +8,7 @@ Refs #46 (E7-S4: Capability Validation on Task Assignment)
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, List, Optional
 
 from backend.models.task_requirements import (
     TaskRequirements,
@@ -59,6 +59,9 @@ class CapabilityValidationService:
     - Validate resource limits (GPU minutes, memory, concurrent tasks)
     - Check data scope permissions
     - Return comprehensive validation results
+
+    Token capabilities and data scopes are compiled to frozensets once per
+    call, so validate_batch checks many tasks against one token cheaply.
     """
 
     def validate(
@@ -83,14 +86,73 @@ class CapabilityValidationService:
         2. Resource limits - GPU minutes, memory, concurrent tasks
         3. Data scope - project/data access permissions
         """
-        missing_capabilities = []
-        resource_violations = []
-        scope_violations = []
+        return self._validate_compiled(
+            task_requirements=task_requirements,
+            capability_token=capability_token,
+            node_usage=node_usage,
+            granted_capabilities=frozenset(capability_token.capabilities),
+            authorized_scopes=frozenset(capability_token.data_scopes)
+        )
+
+    def validate_batch(
+        self,
+        task_requirements_list: List[TaskRequirements],
+        capability_token: CapabilityToken,
+        node_usage: Dict[str, Any]
+    ) -> List[ValidationResult]:
+        """
+        Validate many tasks against one node's capability token
+
+        The token's capability and data scope sets are built once and
+        shared by every task check.
+
+        Args:
+            task_requirements_list: Requirements of each candidate task
+            capability_token: Node's capability token with permissions
+            node_usage: Current node resource usage stats
+
+        Returns:
+            ValidationResult per task, in input order
+        """
+        granted_capabilities = frozenset(capability_token.capabilities)
+        authorized_scopes = frozenset(capability_token.data_scopes)
+        return [
+            self._validate_compiled(
+                task_requirements=task_requirements,
+                capability_token=capability_token,
+                node_usage=node_usage,
+                granted_capabilities=granted_capabilities,
+                authorized_scopes=authorized_scopes
+            )
+            for task_requirements in task_requirements_list
+        ]
+
+    def _validate_compiled(
+        self,
+        task_requirements: TaskRequirements,
+        capability_token: CapabilityToken,
+        node_usage: Dict[str, Any],
+        granted_capabilities: FrozenSet[str],
+        authorized_scopes: FrozenSet[str]
+    ) -> ValidationResult:
+        """
+        Validate one task using precompiled token capability/scope sets
+
+        Args:
+            task_requirements: Task capability and resource requirements
+            capability_token: Node's capability token with permissions
+            node_usage: Current node resource usage stats
+            granted_capabilities: frozenset of token capabilities
+            authorized_scopes: frozenset of token data scopes
 
+        Returns:
+            ValidationResult with detailed validation outcome
+        """
         # 1. Validate capability matching
         missing_capabilities = self._check_capabilities(
             task_requirements=task_requirements,
-            capability_token=capability_token
+            capability_token=capability_token,
+            granted_capabilities=granted_capabilities
         )
 
         # 2. Validate resource limits
@@ -103,7 +165,8 @@ class CapabilityValidationService:
         # 3. Validate data scope
         scope_violations = self._check_data_scope(
             task_requirements=task_requirements,
-            capability_token=capability_token
+            capability_token=capability_token,
+            authorized_scopes=authorized_scopes
         )
 
         # Determine overall validation result
@@ -164,7 +227,8 @@ class CapabilityValidationService:
     def _check_capabilities(
         self,
         task_requirements: TaskRequirements,
-        capability_token: CapabilityToken
+        capability_token: CapabilityToken,
+        granted_capabilities: Optional[FrozenSet[str]] = None
     ) -> list:
         """
         Check if all required capabilities are present in token
@@ -172,18 +236,21 @@ class CapabilityValidationService:
         Args:
             task_requirements: Task requirements
             capability_token: Node capability token
+            granted_capabilities: Precompiled token capabilities (optional)
 
         Returns:
             List of missing capability IDs (empty if all present)
         """
         missing = []
+        if granted_capabilities is None:
+            granted_capabilities = frozenset(capability_token.capabilities)
 
         # Get required capabilities from task
         required_capabilities = task_requirements.get_required_capabilities()
 
         # Check each required capability
         for required_cap in required_capabilities:
-            if required_cap not in capability_token.capabilities:
+            if required_cap not in granted_capabilities:
                 missing.append(required_cap)
                 logger.debug(
                     f"Missing capability: {required_cap}",
@@ -359,7 +426,8 @@ class CapabilityValidationService:
     def _check_data_scope(
         self,
         task_requirements: TaskRequirements,
-        capability_token: CapabilityToken
+        capability_token: CapabilityToken,
+        authorized_scopes: Optional[FrozenSet[str]] = None
     ) -> list:
         """
         Check data scope permissions
@@ -367,6 +435,7 @@ class CapabilityValidationService:
         Args:
             task_requirements: Task requirements with data scope
             capability_token: Node capability token with authorized scopes
+            authorized_scopes: Precompiled token data scopes (optional)
 
         Returns:
             List of scope violations (project IDs node cannot access)
@@ -380,7 +449,9 @@ class CapabilityValidationService:
         required_project = task_requirements.data_scope.project_id
 
         # Check if node has access to required project
-        if required_project not in capability_token.data_scopes:
+        if authorized_scopes is None:
+            authorized_scopes = frozenset(capability_token.data_scopes)
+        if required_project not in authorized_scopes:
             violations.append(required_project)
             logger.debug(
                 f"Data scope violation: task requires {required_project}, "
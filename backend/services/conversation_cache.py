@@ -0,0 +1,434 @@
+"""
+Conversation Metadata Cache
+
+Process-wide cache of conversation metadata for the chat hot path, plus a
+buffer that batches per-message conversation counter updates.
+
+Features:
+- Bounded LRU cache with TTL, keyed by conversation ID and by session key
+- Holds plain metadata (never session-bound ORM instances), so entries are
+  safe to share across request-scoped AsyncSessions
+- Explicit invalidation on archive / attach-agent
+- Message stats buffer: message_count / last_message_at increments are
+  accumulated in memory and flushed as one UPDATE per conversation,
+  periodically or when enough conversations are pending
+
+Architecture:
+- ConversationService / ConversationServicePG consult the cache before
+  issuing select(Conversation) and record message stats in the buffer
+- The buffer flushes on the caller's session when a write finds it due; a
+  background flusher started with the application also flushes idle
+  conversations every flush_interval, and flush_message_stats() is called
+  on application shutdown so pending increments are not lost
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.conversation import Conversation
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConversationMetadata:
+    """Immutable snapshot of the conversation fields used on the hot path"""
+    id: UUID
+    workspace_id: Optional[UUID]
+    status: Optional[str]
+    zerodb_project_id: Optional[str] = None
+    session_key: Optional[str] = None
+    agent_id: Optional[UUID] = None
+
+    @classmethod
+    def from_conversation(cls, conversation: Conversation) -> "ConversationMetadata":
+        """
+        Build metadata from a loaded Conversation.
+
+        Args:
+            conversation: Conversation instance (workspace relationship loaded
+                if the caller needs zerodb_project_id)
+
+        Returns:
+            ConversationMetadata snapshot
+        """
+        state = getattr(conversation, "__dict__", {})
+        if "_sa_instance_state" in state:
+            # ORM instance: only use an already-loaded relationship, never lazy load
+            workspace = state.get("workspace")
+        else:
+            workspace = getattr(conversation, "workspace", None)
+        status = getattr(conversation, "status", None)
+        return cls(
+            id=conversation.id,
+            workspace_id=getattr(conversation, "workspace_id", None),
+            status=getattr(status, "value", status),
+            zerodb_project_id=getattr(workspace, "zerodb_project_id", None),
+            session_key=getattr(conversation, "openclaw_session_key", None),
+            agent_id=getattr(
+                conversation, "agent_swarm_instance_id", getattr(conversation, "agent_id", None)
+            ),
+        )
+
+
+class ConversationMetadataCache:
+    """
+    Bounded TTL cache of ConversationMetadata.
+
+    Thread-safe; all operations are O(1).
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 300.0):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum cached conversations (LRU eviction)
+            ttl_seconds: Entry lifetime in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[UUID, Tuple[ConversationMetadata, float]]" = OrderedDict()
+        self._by_session_key: Dict[str, UUID] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, conversation_id: UUID) -> Optional[ConversationMetadata]:
+        """
+        Get metadata by conversation ID.
+
+        Args:
+            conversation_id: Conversation UUID
+
+        Returns:
+            Cached metadata, or None on miss/expiry
+        """
+        with self._lock:
+            entry = self._entries.get(conversation_id)
+            if entry is None:
+                self._misses += 1
+                return None
+            metadata, expires_at = entry
+            if time.monotonic() >= expires_at:
+                self._remove(conversation_id)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(conversation_id)
+            self._hits += 1
+            return metadata
+
+    def get_by_session_key(self, session_key: str) -> Optional[ConversationMetadata]:
+        """
+        Get metadata by OpenClaw session key.
+
+        Args:
+            session_key: OpenClaw session identifier
+
+        Returns:
+            Cached metadata, or None on miss/expiry
+        """
+        with self._lock:
+            conversation_id = self._by_session_key.get(session_key)
+        if conversation_id is None:
+            with self._lock:
+                self._misses += 1
+            return None
+        return self.get(conversation_id)
+
+    def put(self, metadata: ConversationMetadata) -> None:
+        """
+        Insert or refresh an entry.
+
+        Args:
+            metadata: Conversation metadata to cache
+        """
+        with self._lock:
+            self._remove(metadata.id)
+            self._entries[metadata.id] = (metadata, time.monotonic() + self.ttl_seconds)
+            if metadata.session_key:
+                self._by_session_key[metadata.session_key] = metadata.id
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def invalidate(self, conversation_id: UUID) -> None:
+        """
+        Drop an entry (e.g., after archive or attach-agent).
+
+        Args:
+            conversation_id: Conversation UUID
+        """
+        with self._lock:
+            self._remove(conversation_id)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._by_session_key.clear()
+
+    def _remove(self, conversation_id: UUID) -> None:
+        entry = self._entries.pop(conversation_id, None)
+        if entry is not None and entry[0].session_key:
+            if self._by_session_key.get(entry[0].session_key) == conversation_id:
+                del self._by_session_key[entry[0].session_key]
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses, and hit_rate
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+class MessageStatsBuffer:
+    """
+    Accumulates per-conversation message counters and flushes them in batches.
+
+    Each flush issues one UPDATE per pending conversation using relative
+    increments (message_count = message_count + n), so concurrent flushes
+    from different processes compose correctly.
+    """
+
+    def __init__(self, flush_interval: float = 5.0, max_pending: int = 100):
+        """
+        Initialize buffer.
+
+        Args:
+            flush_interval: Seconds between flushes
+            max_pending: Pending conversations that force an early flush
+        """
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[UUID, Tuple[int, datetime]] = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._flushes = 0
+        self._rows_updated = 0
+
+    def record(self, conversation_id: UUID, message_at: datetime) -> None:
+        """
+        Record one new message for a conversation.
+
+        Args:
+            conversation_id: Conversation UUID
+            message_at: Message timestamp
+        """
+        with self._lock:
+            count, last = self._pending.get(conversation_id, (0, message_at))
+            self._pending[conversation_id] = (count + 1, max(last, message_at))
+
+    def pending_count(self, conversation_id: UUID) -> int:
+        """Get the unflushed message count for a conversation"""
+        with self._lock:
+            return self._pending.get(conversation_id, (0, None))[0]
+
+    def should_flush(self) -> bool:
+        """Check whether a flush is due"""
+        with self._lock:
+            if not self._pending:
+                return False
+            return (
+                len(self._pending) >= self.max_pending
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+
+    async def flush(self, db: AsyncSession, commit: bool = True) -> int:
+        """
+        Write pending increments.
+
+        Args:
+            db: Async session to execute updates on
+            commit: Commit after the updates (False to join the caller's transaction)
+
+        Returns:
+            Number of conversations updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return 0
+
+        columns = Conversation.__table__.c
+        try:
+            for conversation_id, (count, last_message_at) in pending.items():
+                values = {}
+                if "message_count" in columns:
+                    values["message_count"] = columns.message_count + count
+                if "last_message_at" in columns:
+                    values["last_message_at"] = last_message_at
+                elif "updated_at" in columns:
+                    values["updated_at"] = last_message_at
+                if values:
+                    await db.execute(
+                        update(Conversation)
+                        .where(Conversation.id == conversation_id)
+                        .values(**values)
+                    )
+            if commit:
+                await db.commit()
+        except Exception:
+            self._restore(pending)
+            raise
+
+        self._flushes += 1
+        self._rows_updated += len(pending)
+        logger.debug(f"Flushed message stats for {len(pending)} conversations")
+        return len(pending)
+
+    async def maybe_flush(self, db: AsyncSession) -> None:
+        """
+        Flush if due, without failing the caller's write.
+
+        Failed flushes keep their increments pending and are retried on the
+        next due flush.
+
+        Args:
+            db: Async session to execute updates on
+        """
+        if not self.should_flush():
+            return
+        try:
+            await self.flush(db)
+        except Exception as e:
+            logger.warning(f"Deferred message stats flush failed: {e}")
+            try:
+                await db.rollback()
+            except Exception:
+                pass
+
+    def _restore(self, pending: Dict[UUID, Tuple[int, datetime]]) -> None:
+        """Merge drained increments back after a failed flush"""
+        with self._lock:
+            for conversation_id, (count, last) in pending.items():
+                current_count, current_last = self._pending.get(conversation_id, (0, last))
+                self._pending[conversation_id] = (current_count + count, max(last, current_last))
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get buffer statistics.
+
+        Returns:
+            Dictionary with pending conversations/messages and flush counts
+        """
+        with self._lock:
+            return {
+                "pending_conversations": len(self._pending),
+                "pending_messages": sum(count for count, _ in self._pending.values()),
+                "flushes": self._flushes,
+                "rows_updated": self._rows_updated,
+            }
+
+
+_conversation_metadata_cache: Optional[ConversationMetadataCache] = None
+_message_stats_buffer: Optional[MessageStatsBuffer] = None
+_message_stats_flusher: Optional[asyncio.Task] = None
+
+
+def get_conversation_metadata_cache() -> ConversationMetadataCache:
+    """Get the process-wide conversation metadata cache"""
+    global _conversation_metadata_cache
+    if _conversation_metadata_cache is None:
+        _conversation_metadata_cache = ConversationMetadataCache()
+    return _conversation_metadata_cache
+
+
+def get_message_stats_buffer() -> MessageStatsBuffer:
+    """Get the process-wide message stats buffer"""
+    global _message_stats_buffer
+    if _message_stats_buffer is None:
+        _message_stats_buffer = MessageStatsBuffer()
+    return _message_stats_buffer
+
+
+async def flush_message_stats(db: AsyncSession) -> int:
+    """
+    Flush pending message stats on the given session.
+
+    Args:
+        db: Async session
+
+    Returns:
+        Number of conversations updated
+    """
+    if _message_stats_buffer is None:
+        return 0
+    return await _message_stats_buffer.flush(db)
+
+
+async def _flush_message_stats_periodically(
+    session_factory: Callable[[], AsyncSession],
+    interval: float
+) -> None:
+    """Flush due message stats every interval seconds until cancelled"""
+    buffer = get_message_stats_buffer()
+    while True:
+        await asyncio.sleep(interval)
+        if not buffer.should_flush():
+            continue
+        try:
+            async with session_factory() as db:
+                await buffer.maybe_flush(db)
+        except Exception as e:
+            logger.warning(f"Periodic message stats flush failed: {e}")
+
+
+def start_message_stats_flusher(
+    session_factory: Callable[[], AsyncSession],
+    interval: Optional[float] = None
+) -> asyncio.Task:
+    """
+    Start the background task that flushes message stats for idle conversations.
+
+    Without it, increments are only written when a later add_message finds
+    the buffer due. Calling this again while the task runs returns it.
+
+    Args:
+        session_factory: Callable returning an async session context manager
+        interval: Seconds between flush checks (default: the buffer's flush_interval)
+
+    Returns:
+        Running flusher task
+    """
+    global _message_stats_flusher
+    if _message_stats_flusher is None or _message_stats_flusher.done():
+        interval = interval or get_message_stats_buffer().flush_interval
+        _message_stats_flusher = asyncio.create_task(
+            _flush_message_stats_periodically(session_factory, interval)
+        )
+        logger.info(f"Message stats flusher started (interval: {interval}s)")
+    return _message_stats_flusher
+
+
+async def stop_message_stats_flusher() -> None:
+    """Stop the background flusher; call flush_message_stats() afterwards to drain"""
+    global _message_stats_flusher
+    task, _message_stats_flusher = _message_stats_flusher, None
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
@@ -0,0 +1,363 @@
+"""
+Conversation Search Support
+
+Result caching and a local lexical fallback for per-conversation semantic
+search.
+
+Features:
+- Search result cache keyed by (conversation, normalized query, limit, offset)
+  with TTL and LRU bounds; all entries for a conversation are dropped when a
+  new message is added
+- Local BM25 index over the most recent messages of each conversation, used
+  when the ZeroDB Memory API is unreachable or erroring
+
+Architecture:
+- ConversationService.add_message feeds the local index and invalidates the
+  conversation's cached results
+- ConversationService.search_conversation_semantic consults the cache, then
+  ZeroDB (with the conversation filter pushed server-side), then the local
+  index on ZeroDB failure
+- Embeddings are computed by ZeroDB, so caching results also avoids
+  re-embedding repeated queries
+"""
+
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+SearchCacheKey = Tuple[UUID, str, int, int]
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a search query for cache keys.
+
+    Args:
+        query: Raw search query
+
+    Returns:
+        Lowercased query with whitespace collapsed
+    """
+    return " ".join(query.lower().split())
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchResultCache:
+    """
+    Bounded TTL cache of search results, invalidated per conversation.
+
+    Thread-safe; lookups and inserts are O(1), invalidation is O(entries for
+    the conversation).
+    """
+
+    def __init__(self, max_entries: int = 5000, ttl_seconds: float = 120.0):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum cached result sets (LRU eviction)
+            ttl_seconds: Entry lifetime in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[SearchCacheKey, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._by_conversation: Dict[UUID, Set[SearchCacheKey]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(conversation_id: UUID, query: str, limit: int, offset: int) -> SearchCacheKey:
+        """
+        Build a cache key.
+
+        Args:
+            conversation_id: Conversation UUID
+            query: Search query (normalized internally)
+            limit: Page size
+            offset: Page offset
+
+        Returns:
+            Cache key tuple
+        """
+        return (conversation_id, normalize_query(query), limit, offset)
+
+    def get(self, key: SearchCacheKey) -> Optional[Dict[str, Any]]:
+        """
+        Get cached results.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached result dict, or None on miss/expiry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            result, expires_at = entry
+            if time.monotonic() >= expires_at:
+                self._remove(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def put(self, key: SearchCacheKey, result: Dict[str, Any]) -> None:
+        """
+        Cache results.
+
+        Args:
+            key: Key from make_key()
+            result: Search result dict
+        """
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (result, time.monotonic() + self.ttl_seconds)
+            self._by_conversation.setdefault(key[0], set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_conversation(self, conversation_id: UUID) -> None:
+        """
+        Drop all cached results for a conversation (e.g., after a new message).
+
+        Args:
+            conversation_id: Conversation UUID
+        """
+        with self._lock:
+            for key in self._by_conversation.pop(conversation_id, ()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._by_conversation.clear()
+
+    def _remove(self, key: SearchCacheKey) -> None:
+        if self._entries.pop(key, None) is None:
+            return
+        keys = self._by_conversation.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_conversation[key[0]]
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses, and hit_rate
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+@dataclass
+class _IndexedMessage:
+    """Message held by the local index with precomputed term frequencies"""
+    id: Optional[str]
+    content: str
+    role: str
+    timestamp: str
+    terms: Counter
+    length: int
+
+
+class LocalMessageIndex:
+    """
+    BM25 index over the most recent messages of each conversation.
+
+    Only a bounded window of recent messages per conversation (and a bounded
+    number of conversations) is kept, so scoring a query is a linear scan of
+    at most max_messages_per_conversation documents.
+    """
+
+    def __init__(
+        self,
+        max_messages_per_conversation: int = 500,
+        max_conversations: int = 1000,
+        k1: float = 1.5,
+        b: float = 0.75
+    ):
+        """
+        Initialize index.
+
+        Args:
+            max_messages_per_conversation: Recent messages kept per conversation
+            max_conversations: Conversations kept (LRU eviction)
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+        """
+        self.max_messages_per_conversation = max_messages_per_conversation
+        self.max_conversations = max_conversations
+        self.k1 = k1
+        self.b = b
+        self._conversations: "OrderedDict[UUID, Deque[_IndexedMessage]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        conversation_id: UUID,
+        content: str,
+        role: str,
+        timestamp: str,
+        message_id: Optional[str] = None
+    ) -> None:
+        """
+        Index a message.
+
+        Args:
+            conversation_id: Conversation UUID
+            content: Message text
+            role: Message role
+            timestamp: ISO timestamp
+            message_id: Stored message ID, if known
+        """
+        tokens = tokenize(content)
+        message = _IndexedMessage(
+            id=message_id,
+            content=content,
+            role=role,
+            timestamp=timestamp,
+            terms=Counter(tokens),
+            length=len(tokens),
+        )
+        with self._lock:
+            messages = self._conversations.get(conversation_id)
+            if messages is None:
+                messages = deque(maxlen=self.max_messages_per_conversation)
+                self._conversations[conversation_id] = messages
+            else:
+                self._conversations.move_to_end(conversation_id)
+            messages.append(message)
+            while len(self._conversations) > self.max_conversations:
+                self._conversations.popitem(last=False)
+
+    def has_conversation(self, conversation_id: UUID) -> bool:
+        """Check whether any messages are indexed for a conversation"""
+        with self._lock:
+            return conversation_id in self._conversations
+
+    def search(
+        self,
+        conversation_id: UUID,
+        query: str,
+        limit: int = 5,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank a conversation's recent messages against a query.
+
+        Args:
+            conversation_id: Conversation UUID
+            query: Search query text
+            limit: Maximum results to return
+            offset: Results to skip
+
+        Returns:
+            Matching messages in the same shape as Memory API results
+            (id, content, score, metadata), best first
+        """
+        query_terms = set(tokenize(query))
+        with self._lock:
+            messages = list(self._conversations.get(conversation_id, ()))
+        if not messages or not query_terms:
+            return []
+
+        doc_count = len(messages)
+        avg_length = sum(m.length for m in messages) / doc_count or 1.0
+        document_frequency = {
+            term: sum(1 for m in messages if term in m.terms) for term in query_terms
+        }
+        idf = {
+            term: math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+            if df
+        }
+
+        scored = []
+        for position, message in enumerate(messages):
+            score = 0.0
+            norm = self.k1 * (1 - self.b + self.b * message.length / avg_length)
+            for term, weight in idf.items():
+                tf = message.terms.get(term, 0)
+                if tf:
+                    score += weight * tf * (self.k1 + 1) / (tf + norm)
+            if score > 0:
+                # Newer messages win ties
+                scored.append((score, position, message))
+
+        scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        conversation_id_str = str(conversation_id)
+        return [
+            {
+                "id": message.id,
+                "content": message.content,
+                "score": round(score, 4),
+                "metadata": {
+                    "conversation_id": conversation_id_str,
+                    "role": message.role,
+                    "timestamp": message.timestamp,
+                },
+            }
+            for score, _, message in scored[offset:offset + limit]
+        ]
+
+    def clear(self) -> None:
+        """Drop all indexed messages"""
+        with self._lock:
+            self._conversations.clear()
+
+
+_search_result_cache: Optional[SearchResultCache] = None
+_local_message_index: Optional[LocalMessageIndex] = None
+
+
+def get_search_result_cache() -> SearchResultCache:
+    """Get the process-wide conversation search result cache"""
+    global _search_result_cache
+    if _search_result_cache is None:
+        _search_result_cache = SearchResultCache()
+    return _search_result_cache
+
+
+def get_local_message_index() -> LocalMessageIndex:
+    """Get the process-wide local message index"""
+    global _local_message_index
+    if _local_message_index is None:
+        _local_message_index = LocalMessageIndex()
+    return _local_message_index
@@ -10,6 +10,14 @@ Key Features:
 - Message metadata tracking (count, timestamps)
 - Conversation archival and listing with filters
 - Graceful degradation on memory storage failures
+- Message rows written through ZeroDBClient's auto-batching layer to the
+  public database API; rows from the legacy table API are copied over by
+  backfill_legacy_messages (scripts/backfill_zerodb_messages.py) and read
+  from the legacy table until a conversation has rows in the new one
+- Conversation metadata served from a shared TTL cache (no per-message
+  select(Conversation)); message_count/last_message_at updates batched
+- Semantic search filtered and paginated server-side, with cached results
+  and a local BM25 fallback over recent messages when ZeroDB is unavailable
 
 Architecture:
 - PostgreSQL: Conversation metadata (workspace, agent, user, status, counts)
@@ -33,20 +41,79 @@ Usage:
             )
 """
 
+import copy
+import logging
 from typing import List, Dict, Any, Optional, Tuple
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from sqlalchemy.orm import joinedload
 
 from backend.models.conversation import Conversation
 from backend.models.workspace import Workspace
+from backend.services.conversation_cache import (
+    ConversationMetadata,
+    ConversationMetadataCache,
+    MessageStatsBuffer,
+    get_conversation_metadata_cache,
+    get_message_stats_buffer,
+)
+from backend.services.conversation_search import (
+    LocalMessageIndex,
+    SearchResultCache,
+    get_local_message_index,
+    get_search_result_cache,
+)
+from backend.services.message_cursor import decode_message_cursor, encode_message_cursor
 from backend.integrations.zerodb_client import (
     ZeroDBClient,
     ZeroDBConnectionError,
     ZeroDBAPIError
 )
 
+logger = logging.getLogger(__name__)
+
+# Keyset order for message pages; must match the cursor filter. "id" is the
+# message id add_message stores in each row's data, not the ZeroDB row ID.
+MESSAGE_PAGE_SORT = {"timestamp": 1, "id": 1}
+
+
+# Fields copied from legacy message rows by backfill_legacy_messages
+_LEGACY_MESSAGE_FIELDS = ("conversation_id", "role", "content", "timestamp", "metadata")
+
+
+def _row_documents(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract stored message documents from a query_rows response."""
+    return [item.get("row_data", {}) for item in result.get("data", [])]
+
+
+def _message_sort_key(document: Dict[str, Any]) -> Tuple[str, str]:
+    """(timestamp, id) keyset position of a message document."""
+    return (document.get("timestamp") or "", str(document.get("id")))
+
+
+def _legacy_message_document(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a legacy query_table message row into a message document.
+
+    Legacy rows hold the document either under "data" or flattened next to
+    the row ID. The legacy row ID becomes the message id, so re-running the
+    backfill upserts the same documents.
+
+    Returns:
+        Message document, or None if the row is not a conversation message
+    """
+    fields = row.get("data") if isinstance(row.get("data"), dict) else row
+    message_id = fields.get("id") or row.get("id")
+    if not message_id or not fields.get("conversation_id"):
+        return None
+
+    document = {key: fields[key] for key in _LEGACY_MESSAGE_FIELDS if key in fields}
+    document.setdefault("timestamp", row.get("created_at"))
+    document["id"] = str(message_id)
+    return document
+
 
 class ConversationService:
     """
@@ -56,16 +123,69 @@ class ConversationService:
     using both ZeroDB tables (for structured queries) and Memory API (for semantic search).
     """
 
-    def __init__(self, db: AsyncSession, zerodb_client: ZeroDBClient):
+    def __init__(
+        self,
+        db: AsyncSession,
+        zerodb_client: ZeroDBClient,
+        metadata_cache: Optional[ConversationMetadataCache] = None,
+        stats_buffer: Optional[MessageStatsBuffer] = None,
+        search_cache: Optional[SearchResultCache] = None,
+        local_index: Optional[LocalMessageIndex] = None
+    ):
         """
         Initialize ConversationService.
 
         Args:
             db: Async SQLAlchemy database session
             zerodb_client: ZeroDB API client for message storage
+            metadata_cache: Conversation metadata cache (defaults to the shared cache)
+            stats_buffer: Message stats buffer (defaults to the shared buffer)
+            search_cache: Semantic search result cache (defaults to the shared cache)
+            local_index: Local fallback search index (defaults to the shared index)
         """
         self.db = db
         self.zerodb = zerodb_client
+        self.metadata_cache = metadata_cache or get_conversation_metadata_cache()
+        self.stats_buffer = stats_buffer or get_message_stats_buffer()
+        self.search_cache = search_cache or get_search_result_cache()
+        self.local_index = local_index or get_local_message_index()
+
+    async def _get_metadata(self, conversation_id: UUID) -> Optional[ConversationMetadata]:
+        """
+        Get conversation metadata, loading and caching it on a miss.
+
+        Args:
+            conversation_id: Conversation UUID
+
+        Returns:
+            ConversationMetadata if the conversation exists, None otherwise
+        """
+        metadata = self.metadata_cache.get(conversation_id)
+        if metadata is not None:
+            return metadata
+
+        stmt = (
+            select(Conversation)
+            .options(joinedload(Conversation.workspace))
+            .where(Conversation.id == conversation_id)
+        )
+        result = await self.db.execute(stmt)
+        conversation = result.scalar_one_or_none()
+        if not conversation:
+            return None
+
+        metadata = ConversationMetadata.from_conversation(conversation)
+        self.metadata_cache.put(metadata)
+        return metadata
+
+    async def flush_message_stats(self) -> int:
+        """
+        Write buffered message_count/last_message_at increments.
+
+        Returns:
+            Number of conversations updated
+        """
+        return await self.stats_buffer.flush(self.db)
 
     async def create_conversation(
         self,
@@ -119,6 +239,15 @@ class ConversationService:
             await self.db.commit()
             await self.db.refresh(conversation)
 
+            self.metadata_cache.put(ConversationMetadata(
+                id=conversation.id,
+                workspace_id=workspace_id,
+                status="active",
+                zerodb_project_id=workspace.zerodb_project_id,
+                session_key=openclaw_session_key,
+                agent_id=agent_id
+            ))
+
             return conversation
 
         except Exception as e:
@@ -149,17 +278,32 @@ class ConversationService:
         """
         Retrieve conversation by OpenClaw session key.
 
+        A cached session key resolves through the session identity map /
+        primary key instead of a session-key scan.
+
         Args:
             session_key: OpenClaw session identifier
 
         Returns:
             Conversation if found, None otherwise
         """
-        stmt = select(Conversation).where(
-            Conversation.openclaw_session_key == session_key
+        metadata = self.metadata_cache.get_by_session_key(session_key)
+        if metadata is not None:
+            conversation = await self.db.get(Conversation, metadata.id)
+            if conversation is not None:
+                return conversation
+            self.metadata_cache.invalidate(metadata.id)
+
+        stmt = (
+            select(Conversation)
+            .options(joinedload(Conversation.workspace))
+            .where(Conversation.openclaw_session_key == session_key)
         )
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        conversation = result.scalar_one_or_none()
+        if conversation is not None:
+            self.metadata_cache.put(ConversationMetadata.from_conversation(conversation))
+        return conversation
 
     async def add_message(
         self,
@@ -175,7 +319,8 @@ class ConversationService:
         1. ZeroDB table row (for pagination/retrieval)
         2. ZeroDB Memory API (for semantic search)
 
-        Updates conversation metadata (message_count, last_message_at).
+        Conversation metadata (message_count, last_message_at) updates are
+        buffered and flushed in batches; see flush_message_stats().
 
         Args:
             conversation_id: Conversation UUID
@@ -185,7 +330,9 @@ class ConversationService:
 
         Returns:
             Dict with message details:
-                - id: Table row ID
+                - id: ZeroDB table row ID
+                - message_id: Message ID stored in the row (the keyset
+                  tiebreak and the "id" returned by get_messages)
                 - memory_id: Memory API ID (or None if memory storage failed)
                 - conversation_id: Conversation UUID
                 - role: Message role
@@ -197,17 +344,17 @@ class ConversationService:
             ZeroDBConnectionError: If ZeroDB connection fails
             ZeroDBAPIError: If table storage fails (memory failure is graceful)
         """
-        # Fetch conversation with workspace
-        stmt = select(Conversation).where(Conversation.id == conversation_id)
-        result = await self.db.execute(stmt)
-        conversation = result.scalar_one_or_none()
+        # Resolve conversation metadata (cached)
+        conversation = await self._get_metadata(conversation_id)
 
         if not conversation:
             raise ValueError(f"Conversation {conversation_id} not found")
 
         # Prepare message data
         timestamp = datetime.now(timezone.utc).isoformat()
+        message_id = str(uuid4())
         message_data = {
+            "id": message_id,
             "conversation_id": str(conversation_id),
             "role": role,
             "content": content,
@@ -217,9 +364,13 @@ class ConversationService:
         if metadata:
             message_data["metadata"] = metadata
 
-        # Storage 1: ZeroDB table row (required - fail if this fails)
-        table_row = await self.zerodb.create_table_row(
-            project_id=conversation.workspace.zerodb_project_id,
+        # Storage 1: ZeroDB table row (required - fail if this fails).
+        # Concurrent messages are coalesced into a single insert_rows request
+        # on the public database API, which get_messages reads via query_rows.
+        # Rows written by the legacy table API are copied over by
+        # backfill_legacy_messages().
+        table_row = await self.zerodb.create_table_row_batched(
+            project_id=conversation.zerodb_project_id,
             table_name="messages",
             row_data=message_data
         )
@@ -244,13 +395,23 @@ class ConversationService:
             # Graceful degradation - continue without semantic search capability
             pass
 
-        # Update conversation metadata
-        conversation.message_count += 1
-        conversation.last_message_at = datetime.now(timezone.utc)
-        await self.db.commit()
+        # Keep search consistent with the new message
+        self.local_index.add(
+            conversation_id,
+            content=content,
+            role=role,
+            timestamp=timestamp,
+            message_id=message_id
+        )
+        self.search_cache.invalidate_conversation(conversation_id)
+
+        # Buffer conversation metadata update; flush when due
+        self.stats_buffer.record(conversation_id, datetime.now(timezone.utc))
+        await self.stats_buffer.maybe_flush(self.db)
 
         return {
             "id": table_row.get("id"),
+            "message_id": message_id,
             "memory_id": memory_id,
             "conversation_id": str(conversation_id),
             "role": role,
@@ -267,7 +428,11 @@ class ConversationService:
         """
         Retrieve messages from conversation with pagination.
 
-        Queries ZeroDB table for message rows.
+        Queries ZeroDB table rows filtered to this conversation. Offset
+        pagination re-reads every skipped row; prefer get_messages_page()
+        for deep pages. Conversations with no rows in the table yet (history
+        not copied by backfill_legacy_messages()) are read from the legacy
+        table API instead.
 
         Args:
             conversation_id: Conversation UUID
@@ -287,79 +452,301 @@ class ConversationService:
             ZeroDBConnectionError: If ZeroDB connection fails
             ZeroDBAPIError: If query fails
         """
-        # Fetch conversation with workspace
-        stmt = select(Conversation).where(Conversation.id == conversation_id)
-        result = await self.db.execute(stmt)
-        conversation = result.scalar_one_or_none()
+        # Resolve conversation metadata (cached)
+        conversation = await self._get_metadata(conversation_id)
 
         if not conversation:
             raise ValueError(f"Conversation {conversation_id} not found")
 
-        # Query ZeroDB table
-        messages = await self.zerodb.query_table(
-            project_id=conversation.workspace.zerodb_project_id,
+        result = await self.zerodb.query_rows(
             table_name="messages",
+            filter_query={"conversation_id": {"$eq": str(conversation_id)}},
+            project_id=conversation.zerodb_project_id,
             limit=limit,
             skip=offset
         )
+        messages = _row_documents(result)
+
+        project_id = conversation.zerodb_project_id
+        if not messages and (
+            offset == 0 or not await self._has_message_rows(conversation_id, project_id)
+        ):
+            legacy = await self._get_legacy_messages(conversation_id, project_id)
+            return legacy[offset:offset + limit]
+        return messages
+
+    async def get_messages_page(
+        self,
+        conversation_id: UUID,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Retrieve a page of messages using (timestamp, id) keyset pagination.
+
+        The cursor position is pushed into the ZeroDB filter and rows are
+        sorted server-side by (timestamp, id) before the limit is applied, so
+        each page holds the next rows after the cursor and deep pages never
+        re-read earlier rows. Rows written by add_message carry uniformly
+        formatted UTC ISO timestamps, which order correctly as strings, and
+        a stored message id that breaks timestamp ties. Conversations with no
+        rows in the table yet are paged from the legacy table API instead,
+        using the same cursor order.
+
+        Args:
+            conversation_id: Conversation UUID
+            limit: Maximum messages to return (default: 50)
+            cursor: next_cursor from the previous page (None for the first page)
+
+        Returns:
+            Tuple of (messages, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If conversation not found or the cursor is malformed
+            ZeroDBConnectionError: If ZeroDB connection fails
+            ZeroDBAPIError: If query fails
+        """
+        conversation = await self._get_metadata(conversation_id)
+
+        if not conversation:
+            raise ValueError(f"Conversation {conversation_id} not found")
+
+        position = decode_message_cursor(cursor) if cursor else None
+
+        filter_query: Dict[str, Any] = {"conversation_id": {"$eq": str(conversation_id)}}
+        if position:
+            timestamp, message_id = position
+            filter_query = {
+                "$and": [
+                    filter_query,
+                    {"$or": [
+                        {"timestamp": {"$gt": timestamp}},
+                        {"$and": [
+                            {"timestamp": {"$eq": timestamp}},
+                            {"id": {"$gt": message_id}}
+                        ]}
+                    ]}
+                ]
+            }
+
+        result = await self.zerodb.query_rows(
+            table_name="messages",
+            filter_query=filter_query,
+            project_id=conversation.zerodb_project_id,
+            limit=limit,
+            sort=MESSAGE_PAGE_SORT
+        )
+        rows = sorted(_row_documents(result), key=_message_sort_key)
+
+        project_id = conversation.zerodb_project_id
+        if not rows and (
+            position is None or not await self._has_message_rows(conversation_id, project_id)
+        ):
+            rows = [
+                row for row in await self._get_legacy_messages(conversation_id, project_id)
+                if position is None or _message_sort_key(row) > position
+            ][:limit]
+
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = encode_message_cursor(rows[-1].get("timestamp"), rows[-1].get("id"))
+        return rows, next_cursor
+
+    async def _has_message_rows(self, conversation_id: UUID, project_id: str) -> bool:
+        """Check whether the public database table holds any rows for a conversation."""
+        result = await self.zerodb.query_rows(
+            table_name="messages",
+            filter_query={"conversation_id": {"$eq": str(conversation_id)}},
+            project_id=project_id,
+            limit=1
+        )
+        return bool(result.get("data"))
+
+    async def _iter_legacy_rows(self, project_id: str, batch_size: int = 100):
+        """Yield pages of rows from the legacy /projects/{project_id}/tables/messages table."""
+        skip = 0
+        while True:
+            rows = await self.zerodb.query_table(
+                project_id=project_id,
+                table_name="messages",
+                limit=batch_size,
+                skip=skip
+            )
+            yield rows
+            if len(rows) < batch_size:
+                return
+            skip += batch_size
+
+    async def _get_legacy_messages(
+        self,
+        conversation_id: UUID,
+        project_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Read a conversation's messages from the legacy table API.
 
+        The legacy API has no filters, so every row of the project's table is
+        paged through and matched here. Only used for conversations whose
+        history has not been copied by backfill_legacy_messages() yet.
+
+        Returns:
+            Message documents in (timestamp, id) order
+        """
+        messages = []
+        async for rows in self._iter_legacy_rows(project_id):
+            messages.extend(
+                document for document in map(_legacy_message_document, rows)
+                if document is not None and document["conversation_id"] == str(conversation_id)
+            )
+        messages.sort(key=_message_sort_key)
         return messages
 
+    async def backfill_legacy_messages(
+        self,
+        project_id: str,
+        batch_size: int = 100
+    ) -> Dict[str, int]:
+        """
+        Copy message rows written through the legacy table API.
+
+        Messages used to be stored with create_table_row under
+        /projects/{project_id}/tables/messages; they are now written and read
+        through the public database API. This pages through the legacy table
+        and upserts every message into the new one, keyed on the message id,
+        so it is safe to re-run. Until it has run, reads fall back to the
+        legacy table only for conversations with no rows in the new one, so
+        histories that gained new messages since the switch stay partial.
+
+        Args:
+            project_id: Workspace ZeroDB project ID
+            batch_size: Legacy rows read (and upserted) per request
+
+        Returns:
+            Dict with the number of legacy rows scanned and messages copied
+
+        Raises:
+            ZeroDBConnectionError: If ZeroDB connection fails
+            ZeroDBAPIError: If a legacy read or upsert fails
+        """
+        scanned = 0
+        copied = 0
+        async for rows in self._iter_legacy_rows(project_id, batch_size):
+            documents = [
+                document for document in map(_legacy_message_document, rows)
+                if document is not None
+            ]
+            if documents:
+                await self.zerodb.bulk_upsert(
+                    table_name="messages",
+                    rows=documents,
+                    unique_key="id",
+                    project_id=project_id
+                )
+            scanned += len(rows)
+            copied += len(documents)
+
+        logger.info(
+            f"Backfilled {copied} legacy messages ({scanned} rows scanned) "
+            f"for ZeroDB project {project_id}"
+        )
+        return {"scanned": scanned, "copied": copied}
+
     async def search_conversation_semantic(
         self,
         conversation_id: UUID,
         query: str,
-        limit: int = 5
+        limit: int = 5,
+        offset: int = 0
     ) -> Dict[str, Any]:
         """
         Search conversation messages using semantic similarity.
 
-        Uses ZeroDB Memory API for vector-based semantic search.
-        Filters results to only include messages from this conversation.
+        Uses ZeroDB Memory API for vector-based semantic search, with the
+        conversation filter applied server-side so each page holds up to
+        `limit` messages from this conversation. Results are cached per
+        (conversation, query, page) until the next message is added; callers
+        always receive their own copy of a cached page. If
+        ZeroDB is unreachable or erroring, recent messages seen by this
+        process are ranked locally with BM25 instead.
 
         Args:
             conversation_id: Conversation UUID
             query: Search query text
             limit: Maximum results to return (default: 5)
+            offset: Number of ranked results to skip (default: 0)
 
         Returns:
             Dict with search results:
                 - results: List of matching messages with scores
-                - total: Number of results after filtering
+                - total: Number of results in this page
                 - query: Original search query
+                - limit / offset: Page requested
+                - has_more: Whether a further page may exist
+                - source: "zerodb" or "local"
 
         Raises:
             ValueError: If conversation not found
-            ZeroDBConnectionError: If ZeroDB connection fails
-            ZeroDBAPIError: If search fails
+            ZeroDBConnectionError: If ZeroDB connection fails and no local fallback exists
+            ZeroDBAPIError: If search fails and no local fallback exists
         """
-        # Validate conversation exists
-        stmt = select(Conversation).where(Conversation.id == conversation_id)
-        result = await self.db.execute(stmt)
-        conversation = result.scalar_one_or_none()
+        # Validate conversation exists (cached)
+        conversation = await self._get_metadata(conversation_id)
 
         if not conversation:
             raise ValueError(f"Conversation {conversation_id} not found")
 
-        # Search memories
-        search_results = await self.zerodb.search_memories(
-            query=query,
-            limit=limit,
-            type="conversation"
-        )
+        cache_key = self.search_cache.make_key(conversation_id, query, limit, offset)
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
-        # Filter results to only this conversation
         conversation_id_str = str(conversation_id)
+        try:
+            search_results = await self.zerodb.search_memories(
+                query=query,
+                limit=limit,
+                type="conversation",
+                offset=offset,
+                metadata_filter={"conversation_id": conversation_id_str}
+            )
+        except (ZeroDBConnectionError, ZeroDBAPIError) as e:
+            if not self.local_index.has_conversation(conversation_id):
+                raise
+            logger.warning(
+                f"Semantic search unavailable for conversation {conversation_id}, "
+                f"using local index: {e}"
+            )
+            local_results = self.local_index.search(
+                conversation_id, query, limit=limit, offset=offset
+            )
+            return {
+                "results": local_results,
+                "total": len(local_results),
+                "query": query,
+                "limit": limit,
+                "offset": offset,
+                "has_more": len(local_results) == limit,
+                "source": "local"
+            }
+
+        # Guard against servers that ignore the filter
+        raw_results = search_results.get("results", [])
         filtered_results = [
-            result for result in search_results.get("results", [])
+            result for result in raw_results
             if result.get("metadata", {}).get("conversation_id") == conversation_id_str
         ]
 
-        return {
+        result = {
             "results": filtered_results,
             "total": len(filtered_results),
-            "query": query
+            "query": query,
+            "limit": limit,
+            "offset": offset,
+            "has_more": len(raw_results) >= limit,
+            "source": "zerodb"
         }
+        self.search_cache.put(cache_key, copy.deepcopy(result))
+        return result
 
     async def archive_conversation(
         self,
@@ -393,6 +780,7 @@ class ConversationService:
             conversation.archived_at = datetime.now(timezone.utc)
             await self.db.commit()
 
+        self.metadata_cache.invalidate(conversation_id)
         return conversation
 
     async def list_conversations(
@@ -3,17 +3,33 @@ ConversationServicePG - PostgreSQL-based conversation and message management
 
 Simple, immediate persistence using PostgreSQL only.
 No ZeroDB dependency - messages persist across page refreshes.
+
+Conversation existence checks on the message path are served from the shared
+conversation metadata cache, and updated_at bumps are batched through the
+message stats buffer (see backend/services/conversation_cache.py).
+
+Messages are paginated by (created_at, id) keyset cursors served from
+ix_messages_conversation_created, and full transcripts can be streamed in
+bounded batches for export.
 """
 
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, func, desc, or_
 
 from backend.models.conversation import Conversation, ConversationStatus
 from backend.models.message import Message
 from backend.schemas.conversation import MessageResponse
+from backend.services.conversation_cache import (
+    ConversationMetadata,
+    ConversationMetadataCache,
+    MessageStatsBuffer,
+    get_conversation_metadata_cache,
+    get_message_stats_buffer,
+)
+from backend.services.message_cursor import decode_message_cursor, encode_message_cursor
 
 
 class ConversationServicePG:
@@ -23,14 +39,23 @@ class ConversationServicePG:
     Provides immediate persistence without ZeroDB dependency.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        metadata_cache: Optional[ConversationMetadataCache] = None,
+        stats_buffer: Optional[MessageStatsBuffer] = None
+    ):
         """
         Initialize ConversationServicePG.
 
         Args:
             db: Async SQLAlchemy database session
+            metadata_cache: Conversation metadata cache (defaults to the shared cache)
+            stats_buffer: Message stats buffer (defaults to the shared buffer)
         """
         self.db = db
+        self.metadata_cache = metadata_cache or get_conversation_metadata_cache()
+        self.stats_buffer = stats_buffer or get_message_stats_buffer()
 
     async def create_conversation(
         self,
@@ -172,10 +197,12 @@ class ConversationServicePG:
         Raises:
             ValueError: If conversation not found
         """
-        # Verify conversation exists
-        conversation = await self.get_conversation(conversation_id)
-        if not conversation:
-            raise ValueError(f"Conversation {conversation_id} not found")
+        # Verify conversation exists (cached)
+        if self.metadata_cache.get(conversation_id) is None:
+            conversation = await self.get_conversation(conversation_id)
+            if not conversation:
+                raise ValueError(f"Conversation {conversation_id} not found")
+            self.metadata_cache.put(ConversationMetadata.from_conversation(conversation))
 
         try:
             # Create message
@@ -188,12 +215,14 @@ class ConversationServicePG:
 
             self.db.add(message)
 
-            # Update conversation metadata (message_count and last_message_at removed in Issue #103 migration)
-            conversation.updated_at = datetime.now(timezone.utc)
-
+            # Update conversation metadata (message_count and last_message_at removed in Issue #103 migration).
+            # updated_at bumps are buffered and flushed in batches once the message is committed.
             await self.db.commit()
             await self.db.refresh(message)
 
+            self.stats_buffer.record(conversation_id, datetime.now(timezone.utc))
+            await self.stats_buffer.maybe_flush(self.db)
+
             return message
 
         except Exception as e:
@@ -209,6 +238,9 @@ class ConversationServicePG:
         """
         Retrieve messages from a conversation.
 
+        Offset pagination scans every skipped row; prefer get_messages_page()
+        for deep pages.
+
         Args:
             conversation_id: Conversation UUID
             limit: Maximum messages to return
@@ -220,7 +252,7 @@ class ConversationServicePG:
         query = (
             select(Message)
             .where(Message.conversation_id == conversation_id)
-            .order_by(Message.created_at)
+            .order_by(Message.created_at, Message.id)
             .offset(offset)
             .limit(limit)
         )
@@ -238,6 +270,97 @@ class ConversationServicePG:
             for msg in messages
         ]
 
+    async def get_messages_page(
+        self,
+        conversation_id: UUID,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[MessageResponse], Optional[str]]:
+        """
+        Retrieve a page of messages using keyset pagination.
+
+        Each page costs the same regardless of depth: the query seeks to the
+        cursor position on ix_messages_conversation_created instead of
+        skipping rows.
+
+        Args:
+            conversation_id: Conversation UUID
+            limit: Maximum messages to return
+            cursor: next_cursor from the previous page (None for the first page)
+
+        Returns:
+            Tuple of (messages, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = (
+            select(
+                Message.id,
+                Message.role,
+                Message.content,
+                Message.created_at,
+                Message.message_metadata,
+            )
+            .where(Message.conversation_id == conversation_id)
+            .order_by(Message.created_at, Message.id)
+            .limit(limit)
+        )
+        if cursor:
+            created_at_str, message_id_str = decode_message_cursor(cursor)
+            created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
+            message_id = UUID(message_id_str)
+            # created_at >= bound keeps the seek on the index; the OR breaks ties by id
+            query = query.where(
+                Message.created_at >= created_at,
+                or_(Message.created_at > created_at, Message.id > message_id)
+            )
+
+        # Column rows are not tracked by the session identity map
+        rows = (await self.db.execute(query)).all()
+
+        messages = [
+            MessageResponse(
+                role=row.role,
+                content=row.content,
+                timestamp=row.created_at.isoformat(),
+                metadata=row.message_metadata or {}
+            )
+            for row in rows
+        ]
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = encode_message_cursor(rows[-1].created_at, rows[-1].id)
+        return messages, next_cursor
+
+    async def iter_messages(
+        self,
+        conversation_id: UUID,
+        batch_size: int = 500
+    ) -> AsyncIterator[MessageResponse]:
+        """
+        Stream every message of a conversation in chronological order.
+
+        Walks keyset pages of batch_size, so at most one batch is held in
+        memory regardless of transcript length.
+
+        Args:
+            conversation_id: Conversation UUID
+            batch_size: Messages fetched per query
+
+        Yields:
+            MessageResponse objects
+        """
+        cursor = None
+        while True:
+            messages, cursor = await self.get_messages_page(
+                conversation_id, limit=batch_size, cursor=cursor
+            )
+            for message in messages:
+                yield message
+            if cursor is None:
+                return
+
     async def get_message_count(
         self,
         conversation_id: UUID
@@ -333,6 +456,7 @@ class ConversationServicePG:
             conversation.archive()  # Uses model method to set status and archived_at
             await self.db.commit()
             await self.db.refresh(conversation)
+            self.metadata_cache.invalidate(conversation_id)
             return conversation
 
         except Exception as e:
@@ -403,6 +527,7 @@ class ConversationServicePG:
             conversation.updated_at = datetime.now(timezone.utc)
             await self.db.commit()
             await self.db.refresh(conversation)
+            self.metadata_cache.invalidate(conversation_id)
             return conversation
 
         except Exception as e:
@@ -15,12 +15,16 @@ Features:
 - Flush buffered results with lease token validation
 - Discard expired results to prevent duplicate work
 - Resume normal operation with full DBOS connectivity
+- Optional durable buffer (ResultSegmentLog) replayed on startup
+- Bulk lease validation and bounded-concurrency submission on flush,
+  checkpointed so a restart mid-flush resumes after the last checkpoint
 
 Refs E6-S5
 """
 
 import logging
 import asyncio
+import os
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, Any, List
 from enum import Enum
@@ -34,6 +38,7 @@ from backend.services.lease_validation_service import (
     LeaseNotFoundError,
     LeaseOwnershipError,
 )
+from backend.services.result_segment_log import ResultSegmentLog
 from backend.schemas.task_schemas import TaskResult, TaskStatus
 
 logger = logging.getLogger(__name__)
@@ -63,6 +68,10 @@ class BufferedResult(BaseModel):
     execution_metadata: Dict[str, Any] = Field(default_factory=dict)
     submitted_at: datetime
     buffered_at: datetime
+    sequence: Optional[int] = Field(
+        None,
+        description="Segment log sequence number (None when not persisted)"
+    )
 
     class Config:
         json_encoders = {
@@ -86,7 +95,7 @@ class DBOSReconciliationService:
 
     Workflow:
     1. Detect DBOS partition -> Enter DEGRADED mode
-    2. Buffer task results locally (SQLite or in-memory)
+    2. Buffer task results locally (segment log on disk, or in-memory)
     3. Periodic reconnection attempts
     4. On reconnection -> Enter RECONCILING mode
     5. Flush buffered results with token validation
@@ -100,6 +109,10 @@ class DBOSReconciliationService:
         lease_validator: LeaseValidationService,
         max_buffer_size: int = 1000,
         reconnection_check_interval: int = 10,
+        buffer_dir: Optional[str] = None,
+        max_concurrent_submissions: int = 16,
+        fsync_batch_size: int = 32,
+        checkpoint_interval: int = 64,
     ):
         """
         Initialize DBOS Reconciliation Service
@@ -109,11 +122,17 @@ class DBOSReconciliationService:
             lease_validator: Lease validation service for token checks
             max_buffer_size: Maximum buffered results (default 1000)
             reconnection_check_interval: Reconnection check interval in seconds
+            buffer_dir: Directory for the durable result log (None = in-memory only)
+            max_concurrent_submissions: Concurrent DBOS submissions during flush
+            fsync_batch_size: Buffered results appended between fsyncs
+            checkpoint_interval: Processed results between flush checkpoints
         """
         self.dbos_gateway_url = dbos_gateway_url.rstrip("/")
         self.lease_validator = lease_validator
         self.max_buffer_size = max_buffer_size
         self.reconnection_check_interval = reconnection_check_interval
+        self.max_concurrent_submissions = max(1, max_concurrent_submissions)
+        self.checkpoint_interval = max(1, checkpoint_interval)
 
         # State management
         self.state = ReconciliationState.NORMAL
@@ -121,8 +140,14 @@ class DBOSReconciliationService:
         self.degraded_since: Optional[datetime] = None
         self.last_reconnection_time: Optional[datetime] = None
 
-        # Result buffer (in-memory, production would use SQLite)
+        # Result buffer; mirrored to the segment log when buffer_dir is set
         self.result_buffer: List[BufferedResult] = []
+        self.segment_log: Optional[ResultSegmentLog] = None
+        if buffer_dir:
+            self.segment_log = ResultSegmentLog(
+                buffer_dir, fsync_batch_size=fsync_batch_size
+            )
+            self._restore_buffer()
 
         # HTTP client for DBOS communication
         self.client = httpx.AsyncClient(timeout=30.0)
@@ -135,6 +160,22 @@ class DBOSReconciliationService:
     async def close(self):
         """Close HTTP client and cleanup resources"""
         await self.client.aclose()
+        if self.segment_log is not None:
+            self.segment_log.close()
+
+    def _restore_buffer(self) -> None:
+        """Reload results buffered before a restart from the segment log"""
+        for sequence, record in self.segment_log.replay():
+            try:
+                self.result_buffer.append(BufferedResult(**record, sequence=sequence))
+            except Exception as e:
+                # Skipped records are covered by the next flush checkpoint
+                logger.error(f"Dropping unreadable buffered result #{sequence}: {e}")
+
+        if self.result_buffer:
+            logger.info(
+                f"Restored {len(self.result_buffer)} buffered results from segment log"
+            )
 
     async def enter_degraded_mode(self, reason: str):
         """
@@ -216,8 +257,7 @@ class DBOSReconciliationService:
         Behavior:
             - Checks buffer capacity
             - Converts TaskResult to BufferedResult
-            - Adds to in-memory buffer
-            - In production, would persist to SQLite
+            - Appends to the segment log (if configured) and in-memory buffer
         """
         if len(self.result_buffer) >= self.max_buffer_size:
             logger.error(
@@ -237,6 +277,15 @@ class DBOSReconciliationService:
             buffered_at=datetime.now(timezone.utc),
         )
 
+        if self.segment_log is not None:
+            try:
+                buffered.sequence = self.segment_log.append(
+                    buffered.model_dump(mode="json", exclude={"sequence"})
+                )
+            except OSError as e:
+                logger.error(f"Failed to persist buffered result for task {result.task_id}: {e}")
+                return False
+
         self.result_buffer.append(buffered)
 
         logger.info(
@@ -258,14 +307,16 @@ class DBOSReconciliationService:
                 - failed: Submission failures
 
         Logic:
-            1. Enter RECONCILING state
-            2. Iterate through buffered results
-            3. Validate lease token for each
-            4. Submit valid results to DBOS
-            5. Discard expired results
-            6. Track submission outcomes
-            7. Clear buffer
-            8. Return to NORMAL state
+            1. Validate all lease tokens in one bulk call
+            2. Discard expired/invalid results
+            3. Submit valid results with bounded concurrency
+            4. Checkpoint the segment log as results are submitted or discarded
+            5. Remove submitted and discarded results from the buffer
+
+        Failed submissions stay buffered and are never checkpointed, so the
+        next flush (or a restart) retries them. Delivery is at-least-once:
+        results submitted after the last checkpoint are submitted again if
+        the process restarts mid-flush.
         """
         if self.state != ReconciliationState.NORMAL:
             logger.warning(
@@ -275,66 +326,151 @@ class DBOSReconciliationService:
             # For testing, allow flushing in any state
             # In production, this would be stricter
 
-        logger.info(f"Flushing {len(self.result_buffer)} buffered results")
-
-        total_buffered = len(self.result_buffer)
-        submitted = 0
-        discarded = 0
-        failed = 0
-
-        # Process each buffered result
-        for result in self.result_buffer[:]:  # Copy to allow modification
-            try:
-                # Validate lease token
-                is_valid = await self._validate_buffered_result(result)
-
-                if not is_valid:
-                    logger.warning(
-                        f"Discarding result for task {result.task_id}: "
-                        "expired or invalid lease"
-                    )
-                    discarded += 1
-                    continue
-
-                # Submit to DBOS
-                submission_result = await self._submit_result_to_dbos(result)
-
-                if submission_result.get("success"):
-                    logger.info(
-                        f"Successfully submitted buffered result for task {result.task_id}"
-                    )
-                    submitted += 1
-                else:
+        # Results buffered while flushing are appended after this snapshot
+        batch = self.result_buffer[:]
+        total_buffered = len(batch)
+        logger.info(f"Flushing {total_buffered} buffered results")
+
+        if self.segment_log is not None:
+            self.segment_log.sync()
+
+        counts = {"submitted": 0, "discarded": 0, "failed": 0}
+        failed: List[BufferedResult] = []
+        mark_done = self._checkpoint_tracker(batch)
+
+        valid_flags = await self._validate_buffered_results(batch)
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_submissions)
+
+        async def submit(result: BufferedResult) -> None:
+            async with semaphore:
+                try:
+                    submission_result = await self._submit_result_to_dbos(result)
+
+                    if submission_result.get("success"):
+                        logger.info(
+                            f"Successfully submitted buffered result for task {result.task_id}"
+                        )
+                        counts["submitted"] += 1
+                        mark_done(result.sequence)
+                    else:
+                        logger.error(
+                            f"Failed to submit buffered result for task {result.task_id}: "
+                            f"{submission_result.get('error')}"
+                        )
+                        counts["failed"] += 1
+                        failed.append(result)
+
+                except Exception as e:
                     logger.error(
-                        f"Failed to submit buffered result for task {result.task_id}: "
-                        f"{submission_result.get('error')}"
+                        f"Error processing buffered result for task {result.task_id}: {e}"
                     )
-                    failed += 1
-
-            except Exception as e:
-                logger.error(
-                    f"Error processing buffered result for task {result.task_id}: {e}"
+                    counts["failed"] += 1
+                    failed.append(result)
+
+        to_submit = []
+        for result, is_valid in zip(batch, valid_flags):
+            if is_valid:
+                to_submit.append(result)
+            else:
+                logger.warning(
+                    f"Discarding result for task {result.task_id}: "
+                    "expired or invalid lease"
                 )
-                failed += 1
+                counts["discarded"] += 1
+                mark_done(result.sequence)
+
+        await asyncio.gather(*(submit(result) for result in to_submit))
 
-        # Clear buffer after processing
-        self.result_buffer.clear()
+        # Keep failed results (in buffer order) ahead of any buffered during the flush
+        failed_ids = {id(result) for result in failed}
+        self.result_buffer[:total_buffered] = [
+            result for result in batch if id(result) in failed_ids
+        ]
+        mark_done(None, final=True)
 
         flush_summary = {
             "total_buffered": total_buffered,
-            "submitted": submitted,
-            "discarded": discarded,
-            "failed": failed,
+            "submitted": counts["submitted"],
+            "discarded": counts["discarded"],
+            "failed": counts["failed"],
             "flushed_at": datetime.now(timezone.utc).isoformat(),
         }
 
         logger.info(
-            f"Flush complete: {submitted} submitted, "
-            f"{discarded} discarded, {failed} failed"
+            f"Flush complete: {counts['submitted']} submitted, "
+            f"{counts['discarded']} discarded, {counts['failed']} failed"
         )
 
         return flush_summary
 
+    def _checkpoint_tracker(self, batch: List[BufferedResult]):
+        """
+        Build a completion callback that checkpoints the segment log
+
+        Results complete out of order, so the checkpoint advances only to
+        the highest sequence below which every result in the batch is done.
+
+        Args:
+            batch: Results being flushed
+
+        Returns:
+            Callable mark_done(sequence, final=False)
+        """
+        sequences = sorted(r.sequence for r in batch if r.sequence is not None)
+        done: set = set()
+        state = {"index": 0, "since_checkpoint": 0}
+
+        def mark_done(sequence: Optional[int], final: bool = False) -> None:
+            if self.segment_log is None or not sequences:
+                return
+            if sequence is not None:
+                done.add(sequence)
+                state["since_checkpoint"] += 1
+            while state["index"] < len(sequences) and sequences[state["index"]] in done:
+                state["index"] += 1
+            if state["index"] and (final or state["since_checkpoint"] >= self.checkpoint_interval):
+                self.segment_log.checkpoint(sequences[state["index"] - 1])
+                state["since_checkpoint"] = 0
+
+        return mark_done
+
+    async def _validate_buffered_results(
+        self, results: List[BufferedResult]
+    ) -> List[bool]:
+        """
+        Validate buffered results' leases with one bulk lookup
+
+        Identical (token, task, peer) triples are validated once.
+
+        Args:
+            results: Buffered results to validate
+
+        Returns:
+            Validity flag per result, in input order
+        """
+        keys = [(r.lease_token, r.task_id, r.peer_id) for r in results]
+        unique_keys = list(dict.fromkeys(keys))
+
+        try:
+            errors = await self.lease_validator.validate_lease_tokens(unique_keys)
+        except Exception as e:
+            logger.error(f"Bulk lease validation failed, validating individually: {e}")
+            flags = await asyncio.gather(
+                *(self._validate_buffered_result(r) for r in results)
+            )
+            return list(flags)
+
+        validity = {}
+        for key, error in zip(unique_keys, errors):
+            validity[key] = error is None
+            if error is not None:
+                logger.warning(
+                    f"Lease validation failed for buffered result "
+                    f"(task={key[1]}): {type(error).__name__}"
+                )
+        return [validity[key] for key in keys]
+
     async def _validate_buffered_result(self, result: BufferedResult) -> bool:
         """
         Validate buffered result before submission
@@ -507,6 +643,7 @@ class DBOSReconciliationService:
             "state": self.state.value,
             "buffered_results_count": len(self.result_buffer),
             "buffer_capacity": self.max_buffer_size,
+            "durable_buffer": self.segment_log is not None,
             "buffer_utilization": (
                 len(self.result_buffer) / self.max_buffer_size * 100
                 if self.max_buffer_size > 0
@@ -564,6 +701,7 @@ _reconciliation_service: Optional[DBOSReconciliationService] = None
 def get_reconciliation_service(
     dbos_gateway_url: str = "http://localhost:8080",
     lease_validator: Optional[LeaseValidationService] = None,
+    buffer_dir: Optional[str] = None,
 ) -> DBOSReconciliationService:
     """
     Get global reconciliation service instance
@@ -571,6 +709,8 @@ def get_reconciliation_service(
     Args:
         dbos_gateway_url: Base URL for DBOS/OpenClaw Gateway
         lease_validator: Lease validation service (creates new if None)
+        buffer_dir: Durable buffer directory (default: DBOS_RESULT_BUFFER_DIR
+            env var, in-memory if unset)
 
     Returns:
         DBOSReconciliationService instance
@@ -582,7 +722,9 @@ def get_reconciliation_service(
             lease_validator = LeaseValidationService()
 
         _reconciliation_service = DBOSReconciliationService(
-            dbos_gateway_url=dbos_gateway_url, lease_validator=lease_validator
+            dbos_gateway_url=dbos_gateway_url,
+            lease_validator=lease_validator,
+            buffer_dir=buffer_dir or os.getenv("DBOS_RESULT_BUFFER_DIR"),
         )
 
     return _reconciliation_service
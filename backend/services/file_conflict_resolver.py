@@ -7,11 +7,20 @@ Provides:
 - Multiple resolution strategies
 - Merge conflict detection
 
+Lock manager architecture:
+- Per-path wait queues ordered by priority, then arrival (FIFO)
+- Waiters are futures woken on release/expiry; no polling
+- Lock expiry driven by a single timer over a deadline heap
+- task -> locks reverse index for O(locks held) release
+- Multi-path acquisitions granted atomically (all paths or none)
+
 Extracted from core/src/backend/app/agents/swarm/llm_agent_orchestrator.py
 for Issue #114
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 from typing import Dict, List, Set, Optional, Any, Tuple
 from dataclasses import dataclass, field
@@ -72,6 +81,18 @@ class FileLock:
         return datetime.now() > self.expires_at
 
 
+@dataclass
+class _LockWaiter:
+    """Pending acquisition of one or more paths, granted atomically."""
+    task_id: str
+    agent_id: str
+    file_paths: List[str]
+    lock_type: str
+    priority: int
+    seq: int
+    future: asyncio.Future
+
+
 @dataclass
 class FileConflict:
     """Represents a file conflict between tasks"""
@@ -141,9 +162,13 @@ class FileConflictResolver:
 
     Features:
     - Multiple conflict resolution strategies
-    - Lock-based access control
+    - Lock-based access control with priority/FIFO wait queues
+    - Timer-driven lock expiry
     - Merge conflict detection
     - Priority-based resolution
+
+    All lock state is mutated synchronously on the event loop, so each
+    check-and-grant step is atomic without a global mutex.
     """
 
     def __init__(
@@ -154,9 +179,17 @@ class FileConflictResolver:
         self.strategy = strategy
         self.max_lock_duration = max_lock_duration
 
-        # Active locks
+        # Active locks by path, and reverse index by holder task
         self._locks: Dict[str, List[FileLock]] = defaultdict(list)
-        self._lock_mutex = asyncio.Lock()
+        self._task_locks: Dict[str, List[FileLock]] = defaultdict(list)
+
+        # Per-path wait queues: heap of (-priority, seq, waiter)
+        self._waiters: Dict[str, List[Tuple[int, int, _LockWaiter]]] = defaultdict(list)
+        self._seq = itertools.count()
+
+        # Expiry deadlines: heap of (expires_at, seq, lock), lazily pruned
+        self._expiry_heap: List[Tuple[datetime, int, FileLock]] = []
+        self._expiry_timer: Optional[asyncio.TimerHandle] = None
 
         # Queued requests
         self._queued_requests: Dict[str, List[FileAccessRequest]] = defaultdict(list)
@@ -185,6 +218,9 @@ class FileConflictResolver:
         """
         Acquire a lock on a file.
 
+        The request waits in the path's queue (priority, then FIFO) and is
+        woken when a release or expiry makes it grantable.
+
         Args:
             request: File access request
             timeout: Timeout in seconds
@@ -195,93 +231,215 @@ class FileConflictResolver:
         Raises:
             LockAcquisitionError: If unable to acquire lock within timeout
         """
-        start_time = asyncio.get_event_loop().time()
-
-        while True:
-            async with self._lock_mutex:
-                # Check for existing locks
-                existing_locks = self._locks.get(request.file_path, [])
-
-                # Remove expired locks
-                existing_locks = [lock for lock in existing_locks if not lock.is_expired()]
-                self._locks[request.file_path] = existing_locks
-
-                # Determine if we can acquire lock
-                can_acquire = False
-
-                if len(existing_locks) == 0:
-                    can_acquire = True
-                elif request.access_type == "read":
-                    # Can acquire shared lock if all existing are shared
-                    can_acquire = all(lock.lock_type == "shared" for lock in existing_locks)
-                # else: write access with existing locks = cannot acquire
-
-                if can_acquire:
-                    # Create lock
-                    lock_type = "shared" if request.access_type == "read" else "exclusive"
-                    lock = FileLock(
-                        file_path=request.file_path,
-                        holder_task_id=request.task_id,
-                        holder_agent_id=request.agent_id,
-                        lock_type=lock_type,
-                        expires_at=datetime.now() + timedelta(seconds=self.max_lock_duration)
-                    )
-                    self._locks[request.file_path].append(lock)
-                    self._stats["active_locks"] += 1
-
-                    logger.info(
-                        f"Lock acquired: {request.file_path} by {request.task_id} "
-                        f"({lock_type})"
-                    )
-                    return lock
-
-            # Check timeout
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout:
-                self._stats["total_conflicts"] += 1
-                raise LockAcquisitionError(
-                    f"Unable to acquire lock on {request.file_path} within {timeout}s"
-                )
-
-            # Wait before retry
-            await asyncio.sleep(0.1)
+        lock_type = "shared" if request.access_type == "read" else "exclusive"
+        locks = await self._acquire(
+            task_id=request.task_id,
+            agent_id=request.agent_id,
+            file_paths=[request.file_path],
+            lock_type=lock_type,
+            priority=request.priority,
+            timeout=timeout
+        )
+        return locks[0]
+
+    async def _acquire(
+        self,
+        task_id: str,
+        agent_id: str,
+        file_paths: List[str],
+        lock_type: str,
+        priority: int,
+        timeout: float
+    ) -> List[FileLock]:
+        """Enqueue a waiter on every path and wait until all are granted."""
+        waiter = _LockWaiter(
+            task_id=task_id,
+            agent_id=agent_id,
+            file_paths=file_paths,
+            lock_type=lock_type,
+            priority=priority,
+            seq=next(self._seq),
+            future=asyncio.get_running_loop().create_future()
+        )
+        for file_path in file_paths:
+            heapq.heappush(self._waiters[file_path], (-priority, waiter.seq, waiter))
+        self._dispatch(file_paths)
+
+        if waiter.future.done():
+            return waiter.future.result()
+
+        try:
+            return await asyncio.wait_for(waiter.future, timeout=timeout)
+        except asyncio.TimeoutError:
+            # Cancelled waiter may have been blocking others at a queue head
+            self._dispatch(file_paths)
+            self._stats["total_conflicts"] += 1
+            raise LockAcquisitionError(
+                f"Unable to acquire lock on {', '.join(file_paths)} within {timeout}s"
+            )
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                for lock in waiter.future.result():
+                    self._drop_lock(lock)
+            self._dispatch(file_paths)
+            raise
+
+    def _head_waiter(self, file_path: str) -> Optional[_LockWaiter]:
+        """Return the first live waiter for a path, discarding finished ones."""
+        queue = self._waiters.get(file_path)
+        while queue and queue[0][2].future.done():
+            heapq.heappop(queue)
+        if not queue:
+            self._waiters.pop(file_path, None)
+            return None
+        return queue[0][2]
+
+    def _holders(self, file_path: str) -> List[FileLock]:
+        """Return unexpired locks on a path, expiring any that are overdue."""
+        locks = self._locks.get(file_path, [])
+        for lock in [lock for lock in locks if lock.is_expired()]:
+            self._drop_lock(lock)
+            self._stats["expired_locks"] += 1
+        return self._locks.get(file_path, [])
+
+    def _is_compatible(self, file_path: str, lock_type: str) -> bool:
+        """Check whether a lock of lock_type can be granted on a path now."""
+        holders = self._holders(file_path)
+        if not holders:
+            return True
+        return lock_type == "shared" and all(lock.lock_type == "shared" for lock in holders)
+
+    def _dispatch(self, file_paths: List[str]) -> None:
+        """
+        Grant queued waiters on the given paths while they are compatible.
+
+        A waiter is granted only when it heads the queue of every path it
+        requested; because queue order is global (priority, seq), multi-path
+        waiters cannot deadlock each other.
+        """
+        pending = list(file_paths)
+        while pending:
+            file_path = pending.pop()
+            while True:
+                waiter = self._head_waiter(file_path)
+                if waiter is None:
+                    break
+                if not all(
+                    self._head_waiter(path) is waiter
+                    and self._is_compatible(path, waiter.lock_type)
+                    for path in waiter.file_paths
+                ):
+                    break
+                locks = [self._grant(waiter, path) for path in waiter.file_paths]
+                waiter.future.set_result(locks)
+                pending.extend(path for path in waiter.file_paths if path != file_path)
+
+    def _grant(self, waiter: _LockWaiter, file_path: str) -> FileLock:
+        """Create and register a lock for a waiter on one path."""
+        lock = FileLock(
+            file_path=file_path,
+            holder_task_id=waiter.task_id,
+            holder_agent_id=waiter.agent_id,
+            lock_type=waiter.lock_type,
+            expires_at=datetime.now() + timedelta(seconds=self.max_lock_duration)
+        )
+        self._locks[file_path].append(lock)
+        self._task_locks[waiter.task_id].append(lock)
+        self._stats["active_locks"] += 1
+        self._schedule_expiry(lock)
+
+        logger.info(
+            f"Lock acquired: {file_path} by {waiter.task_id} ({waiter.lock_type})"
+        )
+        return lock
+
+    def _drop_lock(self, lock: FileLock) -> bool:
+        """Remove a lock from both indexes by identity; False if not held."""
+        locks = self._locks.get(lock.file_path, [])
+        for index, held in enumerate(locks):
+            if held is lock:
+                del locks[index]
+                break
+        else:
+            return False
+        if not locks:
+            del self._locks[lock.file_path]
+
+        task_locks = self._task_locks.get(lock.holder_task_id, [])
+        for index, held in enumerate(task_locks):
+            if held is lock:
+                del task_locks[index]
+                break
+        if not task_locks:
+            self._task_locks.pop(lock.holder_task_id, None)
+
+        self._stats["active_locks"] -= 1
+        return True
+
+    def _schedule_expiry(self, lock: FileLock) -> None:
+        """Track a lock deadline, re-arming the timer if it is the earliest."""
+        heapq.heappush(self._expiry_heap, (lock.expires_at, next(self._seq), lock))
+        if self._expiry_heap[0][2] is lock:
+            self._arm_expiry_timer()
+
+    def _arm_expiry_timer(self) -> None:
+        """Schedule the expiry callback for the earliest tracked deadline."""
+        if self._expiry_timer is not None:
+            self._expiry_timer.cancel()
+            self._expiry_timer = None
+        if not self._expiry_heap:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        delay = (self._expiry_heap[0][0] - datetime.now()).total_seconds()
+        self._expiry_timer = loop.call_later(max(0.0, delay), self._on_expiry_timer)
+
+    def _on_expiry_timer(self) -> None:
+        """Timer callback: expire due locks and re-arm for the next deadline."""
+        self._expiry_timer = None
+        self._expire_due_locks()
+        self._arm_expiry_timer()
+
+    def _expire_due_locks(self) -> int:
+        """Expire every lock whose deadline has passed and wake waiters."""
+        now = datetime.now()
+        count = 0
+        paths: Set[str] = set()
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            _, _, lock = heapq.heappop(self._expiry_heap)
+            # Released locks leave stale heap entries; skip them
+            if self._drop_lock(lock):
+                count += 1
+                paths.add(lock.file_path)
+                self._stats["expired_locks"] += 1
+
+        if paths:
+            self._dispatch(list(paths))
+        if count > 0:
+            logger.info(f"Expired {count} file locks")
+        return count
 
     async def release_lock(self, lock: FileLock) -> None:
         """Release a file lock"""
-        async with self._lock_mutex:
-            locks = self._locks.get(lock.file_path, [])
-            if lock in locks:
-                locks.remove(lock)
-                self._stats["active_locks"] -= 1
-                logger.info(f"Lock released: {lock.file_path} by {lock.holder_task_id}")
+        if self._drop_lock(lock):
+            logger.info(f"Lock released: {lock.file_path} by {lock.holder_task_id}")
+            self._dispatch([lock.file_path])
 
     async def release_locks_by_task(self, task_id: str) -> None:
         """Release all locks held by a task"""
-        async with self._lock_mutex:
-            for file_path, locks in self._locks.items():
-                locks_to_remove = [lock for lock in locks if lock.holder_task_id == task_id]
-                for lock in locks_to_remove:
-                    locks.remove(lock)
-                    self._stats["active_locks"] -= 1
-                    logger.info(f"Lock released: {file_path} by {task_id}")
+        locks = list(self._task_locks.get(task_id, []))
+        for lock in locks:
+            self._drop_lock(lock)
+            logger.info(f"Lock released: {lock.file_path} by {task_id}")
+        if locks:
+            self._dispatch(list({lock.file_path for lock in locks}))
 
     async def cleanup_expired_locks(self) -> int:
         """Clean up expired locks, return count cleaned"""
-        count = 0
-        async with self._lock_mutex:
-            for file_path, locks in list(self._locks.items()):
-                expired = [lock for lock in locks if lock.is_expired()]
-                for lock in expired:
-                    locks.remove(lock)
-                    count += 1
-                    self._stats["active_locks"] -= 1
-                    self._stats["expired_locks"] += 1
-
-                if len(locks) == 0:
-                    del self._locks[file_path]
-
-        if count > 0:
-            logger.info(f"Cleaned up {count} expired locks")
+        count = self._expire_due_locks()
+        self._arm_expiry_timer()
         return count
 
     def get_active_locks(self) -> List[FileLock]:
@@ -553,7 +711,13 @@ class FileConflictResolver:
         return {
             **self._stats,
             "pending_decisions": len(self._pending_decisions),
-            "queued_requests": sum(len(q) for q in self._queued_requests.values())
+            "queued_requests": sum(len(q) for q in self._queued_requests.values()),
+            "waiting_requests": len({
+                waiter.seq
+                for queue in self._waiters.values()
+                for _, _, waiter in queue
+                if not waiter.future.done()
+            })
         }
 
     def get_pending_decisions(self) -> List[Dict[str, Any]]:
@@ -591,7 +755,7 @@ class FileConflictResolver:
         # Apply decision based on type
         if "preempt" in decision:
             # Find task to preempt (extract from decision string)
-            for lock in self._locks.get(file_path, []):
+            for lock in list(self._locks.get(file_path, [])):
                 if lock.holder_task_id != winner_task_id:
                     await self.release_lock(lock)
 
@@ -616,10 +780,16 @@ class FileConflictResolver:
         agent_id: str,
         file_paths: List[str],
         access_type: str = "write",
-        priority: int = 5
+        priority: int = 5,
+        timeout: float = 30.0
     ) -> List[FileLock]:
         """
-        Acquire locks for multiple files.
+        Acquire locks for multiple files atomically.
+
+        Paths are deduplicated and sorted, and a single waiter is queued on
+        all of them; locks are granted together once every path is free, so
+        the task never holds a partial set and cannot deadlock with other
+        bulk acquisitions.
 
         Args:
             task_id: Task ID
@@ -627,20 +797,22 @@ class FileConflictResolver:
             file_paths: List of file paths
             access_type: Access type
             priority: Priority
+            timeout: Timeout in seconds
 
         Returns:
-            List of acquired locks
-        """
-        locks = []
-        for file_path in file_paths:
-            request = FileAccessRequest(
-                task_id=task_id,
-                agent_id=agent_id,
-                file_path=file_path,
-                access_type=access_type,
-                priority=priority
-            )
-            lock = await self.acquire_lock(request)
-            locks.append(lock)
+            List of acquired locks, in sorted path order
 
-        return locks
+        Raises:
+            LockAcquisitionError: If the locks cannot all be acquired within timeout
+        """
+        if not file_paths:
+            return []
+
+        return await self._acquire(
+            task_id=task_id,
+            agent_id=agent_id,
+            file_paths=sorted(set(file_paths)),
+            lock_type="shared" if access_type == "read" else "exclusive",
+            priority=priority,
+            timeout=timeout
+        )
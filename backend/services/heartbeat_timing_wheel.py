@@ -0,0 +1,222 @@
+"""
+Heartbeat Timing Wheel
+
+Hierarchical timing wheel tracking per-peer heartbeat deadlines, so crash
+sweeps touch only peers whose deadline has passed instead of every peer.
+
+Features:
+- O(1) arm/re-arm/cancel: each peer lives in exactly one slot
+- advance(now) visits only the slots between the previous and current
+  tick and returns peers whose deadline has passed
+- Levels of coarser slots cascade into finer ones as time advances;
+  deadlines beyond the top level wait in an overflow set
+- Deadlines are never reported early; they may be reported up to one
+  tick late
+
+Architecture:
+- Level 0 has wheel_size slots of tick_seconds each; level n slots span
+  tick_seconds * wheel_size**n
+- Slot index is derived from the absolute deadline tick, so re-arming
+  never scans
+
+Refs: OpenCLAW P2P Swarm PRD Section 5.2, Backlog E6-S1
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+
+class HeartbeatTimingWheel:
+    """
+    Hierarchical timing wheel keyed by peer_id
+
+    Not thread-safe; callers serialize access (e.g., under an asyncio lock).
+    """
+
+    def __init__(
+        self,
+        tick_seconds: float = 1.0,
+        wheel_size: int = 64,
+        levels: int = 3,
+        start_time: float = 0.0
+    ):
+        """
+        Initialize timing wheel.
+
+        Args:
+            tick_seconds: Resolution of the finest level
+            wheel_size: Slots per level
+            levels: Number of levels (range = tick_seconds * wheel_size**levels)
+            start_time: Time (seconds) the wheel starts at
+        """
+        if tick_seconds <= 0 or wheel_size < 2 or levels < 1:
+            raise ValueError("tick_seconds must be > 0, wheel_size >= 2, levels >= 1")
+
+        self.tick_seconds = tick_seconds
+        self.wheel_size = wheel_size
+        self.levels = levels
+
+        self._current_tick = math.floor(start_time / tick_seconds)
+        # slots[level][index] -> {peer_id: deadline_tick}
+        self._slots: List[List[Dict[str, int]]] = [
+            [{} for _ in range(wheel_size)] for _ in range(levels)
+        ]
+        self._overflow: Dict[str, int] = {}
+        # peer_id -> (level, index) or None for overflow
+        self._location: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._deadlines: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._location)
+
+    def __contains__(self, peer_id: str) -> bool:
+        return peer_id in self._location
+
+    def deadline(self, peer_id: str) -> Optional[float]:
+        """
+        Get a peer's armed deadline.
+
+        Args:
+            peer_id: Peer identifier
+
+        Returns:
+            Deadline in seconds, or None if not armed
+        """
+        return self._deadlines.get(peer_id)
+
+    def arm(self, peer_id: str, deadline: float) -> None:
+        """
+        Arm (or re-arm) a peer's deadline.
+
+        Args:
+            peer_id: Peer identifier
+            deadline: Time (seconds) at which the peer expires
+        """
+        self.cancel(peer_id)
+        self._deadlines[peer_id] = deadline
+        self._place(peer_id, math.ceil(deadline / self.tick_seconds))
+
+    def cancel(self, peer_id: str) -> bool:
+        """
+        Stop tracking a peer.
+
+        Args:
+            peer_id: Peer identifier
+
+        Returns:
+            True if the peer was armed
+        """
+        if peer_id not in self._location:
+            return False
+        location = self._location.pop(peer_id)
+        if location is None:
+            del self._overflow[peer_id]
+        else:
+            level, index = location
+            del self._slots[level][index][peer_id]
+        del self._deadlines[peer_id]
+        return True
+
+    def clear(self) -> None:
+        """Stop tracking every peer"""
+        for level_slots in self._slots:
+            for slot in level_slots:
+                slot.clear()
+        self._overflow.clear()
+        self._location.clear()
+        self._deadlines.clear()
+
+    def advance(self, now: float) -> List[str]:
+        """
+        Advance the wheel to `now` and collect expired peers.
+
+        Expired peers are removed from the wheel; re-arm them to keep
+        tracking.
+
+        Args:
+            now: Current time (seconds)
+
+        Returns:
+            Peer IDs whose deadline is <= now
+        """
+        target_tick = math.floor(now / self.tick_seconds)
+        expired: List[str] = []
+
+        # A gap longer than the whole range is cheaper to handle in one pass
+        if target_tick - self._current_tick >= self.wheel_size ** self.levels:
+            self._current_tick = target_tick
+            entries = list(self._deadlines.items())
+            self.clear()
+            for peer_id, deadline in entries:
+                if math.ceil(deadline / self.tick_seconds) <= target_tick:
+                    expired.append(peer_id)
+                else:
+                    self.arm(peer_id, deadline)
+            return expired
+
+        while self._current_tick < target_tick:
+            self._current_tick += 1
+            self._cascade()
+            expired.extend(self._collect(0, self._current_tick % self.wheel_size))
+
+        return expired
+
+    def _collect(self, level: int, index: int) -> List[str]:
+        """Pop a slot's due entries, re-placing any not yet due"""
+        slot = self._slots[level][index]
+        if not slot:
+            return []
+        self._slots[level][index] = {}
+        due = []
+        for peer_id, deadline_tick in slot.items():
+            del self._location[peer_id]
+            if deadline_tick <= self._current_tick:
+                del self._deadlines[peer_id]
+                due.append(peer_id)
+            else:
+                self._place(peer_id, deadline_tick)
+        return due
+
+    def _cascade(self) -> None:
+        """Move entries from coarser levels into finer ones when their slot comes up"""
+        tick = self._current_tick
+        span = 1
+        for level in range(1, self.levels):
+            span *= self.wheel_size
+            if tick % span:
+                break
+            self._redistribute(self._slots[level], (tick // span) % self.wheel_size)
+        else:
+            if tick % (span * self.wheel_size) == 0 and self._overflow:
+                overflow, self._overflow = self._overflow, {}
+                for peer_id, deadline_tick in overflow.items():
+                    del self._location[peer_id]
+                    self._place(peer_id, deadline_tick, earliest_tick=tick)
+
+    def _redistribute(self, slots: List[Dict[str, int]], index: int) -> None:
+        slot = slots[index]
+        if not slot:
+            return
+        slots[index] = {}
+        for peer_id, deadline_tick in slot.items():
+            del self._location[peer_id]
+            # Runs before the current level-0 slot is collected
+            self._place(peer_id, deadline_tick, earliest_tick=self._current_tick)
+
+    def _place(self, peer_id: str, deadline_tick: int, earliest_tick: Optional[int] = None) -> None:
+        """Insert a peer into the slot for its deadline tick"""
+        # Deadlines already due land in the next slot to be collected
+        if earliest_tick is None:
+            earliest_tick = self._current_tick + 1
+        deadline_tick = max(deadline_tick, earliest_tick)
+        delta = deadline_tick - self._current_tick
+        span = 1
+        for level in range(self.levels):
+            if delta < span * self.wheel_size:
+                index = (deadline_tick // span) % self.wheel_size
+                self._slots[level][index][peer_id] = deadline_tick
+                self._location[peer_id] = (level, index)
+                return
+            span *= self.wheel_size
+        self._overflow[peer_id] = deadline_tick
+        self._location[peer_id] = None
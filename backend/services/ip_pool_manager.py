@@ -6,6 +6,10 @@ Implements thread-safe IP allocation with exhaustion detection.
 
 Part of E1-S3: WireGuard Peer Provisioning Service
 
+Allocation is backed by the shared BitmapIPAllocator engine
+(backend/networking/ip_allocator.py): O(1) amortized allocate/release via a
+free-list and next-fit cursor, with an O(1) reverse IP -> peer map.
+
 Security considerations:
 - Thread-safe allocation to prevent race conditions
 - Reserved IPs protected from allocation
@@ -13,13 +17,34 @@ Security considerations:
 """
 
 import ipaddress
-import threading
-from typing import Set, Optional, List, Dict
+from collections.abc import Mapping
+from typing import Set, Optional, List, Dict, Iterator
 import logging
 
+from backend.networking.ip_allocator import AddressPoolExhaustedError, BitmapIPAllocator
+
 logger = logging.getLogger(__name__)
 
 
+class _AllocationView(Mapping):
+    """Read-only peer_id -> IP mapping over the allocator's owner index."""
+
+    def __init__(self, allocator: BitmapIPAllocator):
+        self._allocator = allocator
+
+    def __getitem__(self, peer_id: str) -> str:
+        ip = self._allocator.address_of(peer_id)
+        if ip is None:
+            raise KeyError(peer_id)
+        return str(ip)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._allocator.owners())
+
+    def __len__(self) -> int:
+        return self._allocator.allocated_count
+
+
 class IPPoolManager:
     """
     Thread-safe IP address pool manager for WireGuard peers
@@ -30,14 +55,15 @@ class IPPoolManager:
     Attributes:
         network: IPv4Network representing the address pool
         reserved_ips: Set of reserved IP addresses (e.g., hub IP)
-        allocated: Dict mapping peer_id to allocated IP address
-        _lock: Thread lock for concurrent access safety
+        allocated: Read-only mapping of peer_id to allocated IP address
+        _allocator: Bitmap allocation engine (owns locking and persistence)
     """
 
     def __init__(
         self,
         network: str,
-        reserved_ips: Optional[List[str]] = None
+        reserved_ips: Optional[List[str]] = None,
+        state_dir: Optional[str] = None
     ):
         """
         Initialize IP pool manager
@@ -45,6 +71,7 @@ class IPPoolManager:
         Args:
             network: Network CIDR (e.g., "10.0.0.0/24")
             reserved_ips: List of reserved IP addresses (e.g., ["10.0.0.1"])
+            state_dir: Optional directory for snapshot/journal persistence
 
         Raises:
             ValueError: If network CIDR is invalid
@@ -74,11 +101,12 @@ class IPPoolManager:
                 except ValueError as e:
                     raise ValueError(f"Invalid reserved IP {ip_str}: {e}")
 
-        # Track allocated IPs: peer_id -> IP address
-        self.allocated: Dict[str, str] = {}
-
-        # Thread lock for concurrent access
-        self._lock = threading.Lock()
+        self._allocator = BitmapIPAllocator(
+            self.network,
+            reserved=self.reserved_ips,
+            state_dir=state_dir
+        )
+        self.allocated: Mapping = _AllocationView(self._allocator)
 
         logger.info(
             f"Initialized IP pool: network={network}, "
@@ -95,7 +123,7 @@ class IPPoolManager:
         """
         total_hosts = self.network.num_addresses - 2  # Exclude network/broadcast
         reserved_count = len(self.reserved_ips) - 2  # Already excluded network/broadcast
-        allocated_count = len(self.allocated)
+        allocated_count = self._allocator.allocated_count
         return total_hosts - reserved_count - allocated_count
 
     def allocate_ip(self, peer_id: str) -> str:
@@ -114,34 +142,46 @@ class IPPoolManager:
             IPPoolExhaustedError: If no IPs available
             ValueError: If peer_id already has an IP allocated
         """
-        with self._lock:
-            # Check if peer already has an IP
-            if peer_id in self.allocated:
-                raise ValueError(
-                    f"Peer {peer_id} already has IP {self.allocated[peer_id]} allocated"
-                )
+        try:
+            ip_str = str(self._allocator.allocate(owner=peer_id))
+        except AddressPoolExhaustedError:
+            self._raise_exhausted()
 
-            # Find first available IP
-            allocated_set = set(self.allocated.values())
+        logger.info(f"Allocated IP {ip_str} to peer {peer_id}")
+        return ip_str
 
-            for ip in self.network.hosts():
-                ip_str = str(ip)
+    def allocate_bulk(self, peer_ids: List[str]) -> Dict[str, str]:
+        """
+        Allocate IP addresses to many peers atomically
 
-                # Skip reserved and allocated IPs
-                if ip_str in self.reserved_ips or ip_str in allocated_set:
-                    continue
+        Either every peer receives an address or none do.
 
-                # Allocate this IP
-                self.allocated[peer_id] = ip_str
-                logger.info(f"Allocated IP {ip_str} to peer {peer_id}")
-                return ip_str
+        Args:
+            peer_ids: Unique peer identifiers
 
-            # No IPs available
-            from backend.services.wireguard_provisioning_service import IPPoolExhaustedError
-            raise IPPoolExhaustedError(
-                pool_range=str(self.network),
-                allocated_count=len(self.allocated)
-            )
+        Returns:
+            Dictionary mapping peer_id to allocated IP address
+
+        Raises:
+            IPPoolExhaustedError: If fewer IPs are available than requested
+            ValueError: If a peer_id is duplicated or already has an IP
+        """
+        try:
+            ips = self._allocator.allocate_bulk(list(peer_ids))
+        except AddressPoolExhaustedError:
+            self._raise_exhausted()
+
+        allocations = {peer_id: str(ip) for peer_id, ip in zip(peer_ids, ips)}
+        logger.info(f"Allocated {len(allocations)} IPs in bulk from {self.network}")
+        return allocations
+
+    def _raise_exhausted(self) -> None:
+        """Raise the provisioning-level pool exhaustion error."""
+        from backend.services.wireguard_provisioning_service import IPPoolExhaustedError
+        raise IPPoolExhaustedError(
+            pool_range=str(self.network),
+            allocated_count=self._allocator.allocated_count
+        )
 
     def deallocate_ip(self, peer_id: str) -> None:
         """
@@ -153,12 +193,32 @@ class IPPoolManager:
         Raises:
             ValueError: If peer_id has no IP allocated
         """
-        with self._lock:
-            if peer_id not in self.allocated:
-                raise ValueError(f"Peer {peer_id} has no IP allocated")
+        try:
+            ip = self._allocator.release_owner(peer_id)
+        except KeyError:
+            raise ValueError(f"Peer {peer_id} has no IP allocated")
+
+        logger.info(f"Deallocated IP {ip} from peer {peer_id}")
+
+    def deallocate_bulk(self, peer_ids: List[str]) -> int:
+        """
+        Deallocate IP addresses from many peers
 
-            ip = self.allocated.pop(peer_id)
-            logger.info(f"Deallocated IP {ip} from peer {peer_id}")
+        Peers without an allocation are skipped.
+
+        Args:
+            peer_ids: Peer identifiers to deallocate
+
+        Returns:
+            Number of addresses released
+        """
+        addresses = [
+            ip for ip in (self._allocator.address_of(peer_id) for peer_id in peer_ids)
+            if ip is not None
+        ]
+        released = self._allocator.release_bulk(addresses)
+        logger.info(f"Deallocated {released} IPs in bulk from {self.network}")
+        return released
 
     def get_allocated_ip(self, peer_id: str) -> Optional[str]:
         """
@@ -170,7 +230,20 @@ class IPPoolManager:
         Returns:
             Allocated IP address or None if not allocated
         """
-        return self.allocated.get(peer_id)
+        ip = self._allocator.address_of(peer_id)
+        return str(ip) if ip is not None else None
+
+    def get_peer_for_ip(self, ip_address: str) -> Optional[str]:
+        """
+        Get the peer holding an IP address
+
+        Args:
+            ip_address: IP address to look up
+
+        Returns:
+            Peer identifier or None if the IP is not allocated to a peer
+        """
+        return self._allocator.owner_of(ip_address)
 
     def is_allocated(self, ip_address: str) -> bool:
         """
@@ -182,7 +255,7 @@ class IPPoolManager:
         Returns:
             True if IP is allocated to a peer
         """
-        return ip_address in self.allocated.values()
+        return self._allocator.is_allocated(ip_address)
 
     def get_pool_stats(self) -> Dict[str, int]:
         """
@@ -193,7 +266,7 @@ class IPPoolManager:
         """
         total = self.network.num_addresses - 2  # Exclude network/broadcast
         reserved = len(self.reserved_ips) - 2
-        allocated = len(self.allocated)
+        allocated = self._allocator.allocated_count
         available = total - reserved - allocated
 
         return {
@@ -203,3 +276,7 @@ class IPPoolManager:
             "available_addresses": available,
             "utilization_percent": int((allocated / total) * 100) if total > 0 else 0
         }
+
+    def snapshot(self) -> None:
+        """Persist a snapshot of the pool (no-op without state_dir)"""
+        self._allocator.snapshot()
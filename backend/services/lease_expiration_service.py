@@ -1,23 +1,36 @@
 """
 Lease Expiration Detection Service.
 
-Periodically scans for expired task leases and triggers recovery workflows.
-Part of E5-S6: Lease Expiration Detection.
+Tracks task lease deadlines and triggers recovery workflows as soon as a
+lease expires. Part of E5-S6: Lease Expiration Detection.
 
 The service:
-- Scans for expired leases every 10 seconds
+- Keeps an in-memory min-heap of lease deadlines, seeded from the database
+  on start and updated by TaskLeaseIssuanceService on issue/revoke
+- Sleeps until the earliest deadline (plus grace period) instead of polling
 - Implements a grace period (2-5s) to avoid race conditions
-- Marks expired leases and revokes their tokens
-- Triggers task requeue workflow for recoverable tasks
+- Marks due leases expired with a single bulk UPDATE and requeues their
+  tasks with a single bulk UPDATE in the same transaction
+- Runs a periodic reconciliation sweep to catch anything the heap missed
+  (leases written by other processes, restarts, clock skew)
 - Emits events for monitoring and observability
+
+Architecture:
+- Heap entries are (expires_at, lease_id) tuples; re-scheduling or
+  cancelling a lease only updates the _deadlines map and stale heap entries
+  are discarded lazily when popped
+- Only leases with is_expired = 0 and is_revoked = 0 are considered, which
+  keeps the reconciliation query on idx_lease_expiration_scan
 """
 
 import asyncio
+import heapq
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import update
 
 from backend.models.task_lease import TaskLease, Task, TaskStatus
 
@@ -25,14 +38,36 @@ from backend.models.task_lease import TaskLease, Task, TaskStatus
 logger = logging.getLogger(__name__)
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Normalize a timestamp to timezone-aware UTC (SQLite drops tzinfo)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _lease_pk(value: Any) -> Any:
+    """Convert a heap key back into a primary key value for the UUID column."""
+    if isinstance(value, str):
+        try:
+            return UUID(value)
+        except ValueError:
+            return value
+    return value
+
+
 class LeaseExpirationService:
     """
     Service for detecting and processing expired task leases.
 
-    This service runs as a background task, periodically scanning the database
-    for expired leases and initiating recovery workflows.
+    This service runs as a background task. Lease deadlines are kept in a
+    min-heap so expiry is detected within the grace period of the actual
+    deadline, while a slower reconciliation sweep against the database acts
+    as a safety net.
     """
 
+    # Number of lease ids per bulk UPDATE statement
+    BULK_CHUNK_SIZE = 500
+
     def __init__(
         self,
         db_session: Session,
@@ -46,7 +81,7 @@ class LeaseExpirationService:
 
         Args:
             db_session: SQLAlchemy database session
-            scan_interval: Seconds between scans (default: 10s)
+            scan_interval: Seconds between reconciliation sweeps (default: 10s)
             grace_period: Seconds of grace period to avoid race conditions (default: 2s)
             event_emitter: Optional event emitter for publishing events
             requeue_service: Optional service for requeueing tasks
@@ -59,53 +94,232 @@ class LeaseExpirationService:
         self._running = False
         self._task: Optional[asyncio.Task] = None
 
+        # Deadline heap with lazy deletion
+        self._heap: List[Tuple[datetime, str]] = []
+        self._deadlines: Dict[str, datetime] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._seeded = False
+        self._last_reconcile: Optional[datetime] = None
+
+        # Counters for stats
+        self._expired_total = 0
+        self._reconciled_total = 0
+
         logger.info(
             f"LeaseExpirationService initialized with scan_interval={scan_interval}s, "
             f"grace_period={grace_period}s"
         )
 
+    # ------------------------------------------------------------------
+    # Deadline heap
+    # ------------------------------------------------------------------
+
+    def schedule_lease(self, lease_id: Any, task_id: Any, expires_at: datetime) -> None:
+        """
+        Register (or re-register) a lease deadline.
+
+        Called by TaskLeaseIssuanceService after a lease is committed. If the
+        lease is already tracked its deadline is replaced.
+
+        Args:
+            lease_id: Lease identifier
+            task_id: Task the lease belongs to
+            expires_at: Lease expiration timestamp
+        """
+        key = str(lease_id)
+        deadline = _as_utc(expires_at)
+        previous_head = self._heap[0][0] if self._heap else None
+
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, key))
+
+        # Wake the scheduler only if this lease is now the earliest deadline
+        if previous_head is None or deadline < previous_head:
+            self._wake()
+
+        logger.debug(f"Scheduled lease {key} for task {task_id} at {deadline.isoformat()}")
+
+    def cancel_lease(self, lease_id: Any) -> None:
+        """
+        Stop tracking a lease (revoked, completed or released).
+
+        The heap entry is discarded lazily when it reaches the top.
+
+        Args:
+            lease_id: Lease identifier
+        """
+        key = str(lease_id)
+        self._deadlines.pop(key, None)
+
+    def next_deadline(self) -> Optional[datetime]:
+        """
+        Get the earliest tracked lease deadline.
+
+        Returns:
+            Earliest expires_at, or None if no leases are tracked
+        """
+        self._discard_stale_heads()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due_leases(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Pop all tracked leases whose deadline plus grace period has passed.
+
+        Args:
+            now: Reference time (default: current UTC time)
+
+        Returns:
+            List of due lease ids
+        """
+        now = _as_utc(now) if now else datetime.now(timezone.utc)
+        threshold = now - timedelta(seconds=self.grace_period)
+        due: List[str] = []
+
+        while self._heap and self._heap[0][0] <= threshold:
+            deadline, key = heapq.heappop(self._heap)
+            if self._deadlines.get(key) != deadline:
+                continue  # stale entry (rescheduled or cancelled)
+            del self._deadlines[key]
+            due.append(key)
+
+        return due
+
+    def seed_from_db(self) -> int:
+        """
+        Load all active leases into the deadline heap.
+
+        Returns:
+            Number of leases tracked after seeding
+        """
+        rows = (
+            self.db_session.query(TaskLease.id, TaskLease.expires_at)
+            .filter(TaskLease.is_expired == 0, TaskLease.is_revoked == 0)
+            .all()
+        )
+
+        self._heap = []
+        self._deadlines = {}
+        for lease_id, expires_at in rows:
+            key = str(lease_id)
+            deadline = _as_utc(expires_at)
+            self._deadlines[key] = deadline
+            self._heap.append((deadline, key))
+        heapq.heapify(self._heap)
+
+        self._seeded = True
+        logger.info(f"Seeded lease deadline heap with {len(self._deadlines)} active leases")
+        return len(self._deadlines)
+
+    def _discard_stale_heads(self) -> None:
+        """Drop cancelled or rescheduled entries from the top of the heap."""
+        while self._heap:
+            deadline, key = self._heap[0]
+            if self._deadlines.get(key) == deadline:
+                return
+            heapq.heappop(self._heap)
+
+    def _wake(self) -> None:
+        """Interrupt the scheduler sleep so it re-evaluates the next deadline."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    # ------------------------------------------------------------------
+    # Scheduler loop
+    # ------------------------------------------------------------------
+
     async def start(self) -> None:
         """
-        Start the periodic lease expiration scanner.
+        Start the deadline-driven lease expiration scheduler.
 
         This method runs continuously until stop() is called.
         """
         self._running = True
-        logger.info("Starting lease expiration scanner")
+        self._wakeup = asyncio.Event()
+        logger.info("Starting lease expiration scheduler")
+
+        try:
+            self.seed_from_db()
+        except Exception as e:
+            logger.error(f"Error seeding lease deadline heap: {e}", exc_info=True)
+        self._last_reconcile = datetime.now(timezone.utc)
 
         while self._running:
             try:
-                # Scan for expired leases
-                expired_leases = await self.scan_expired_leases()
+                due = self.pop_due_leases()
+                if due:
+                    logger.info(f"Found {len(due)} expired leases")
+                    await self.expire_leases(due)
 
-                if expired_leases:
-                    logger.info(f"Found {len(expired_leases)} expired leases")
-                    await self.process_expired_leases(expired_leases)
+                now = datetime.now(timezone.utc)
+                next_reconcile = self._last_reconcile + timedelta(seconds=self.scan_interval)
+                if now >= next_reconcile:
+                    await self.reconcile()
+                    continue
 
-                # Wait for next scan interval
-                await asyncio.sleep(self.scan_interval)
+                await self._sleep_until(next_reconcile)
 
             except asyncio.CancelledError:
-                logger.info("Lease expiration scanner cancelled")
+                logger.info("Lease expiration scheduler cancelled")
                 break
             except Exception as e:
-                logger.error(f"Error in lease expiration scanner: {e}", exc_info=True)
-                # Continue scanning despite errors
-                await asyncio.sleep(self.scan_interval)
+                logger.error(f"Error in lease expiration scheduler: {e}", exc_info=True)
+                # Continue scheduling despite errors
+                await asyncio.sleep(min(self.scan_interval, 1))
+
+        logger.info("Lease expiration scheduler stopped")
 
-        logger.info("Lease expiration scanner stopped")
+    async def _sleep_until(self, next_reconcile: datetime) -> None:
+        """
+        Sleep until the next lease becomes due or the next reconciliation.
+
+        Args:
+            next_reconcile: Time of the next reconciliation sweep
+        """
+        wake_at = next_reconcile
+        head = self.next_deadline()
+        if head is not None:
+            wake_at = min(wake_at, head + timedelta(seconds=self.grace_period))
+
+        timeout = max((wake_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
 
     def stop(self) -> None:
-        """Stop the periodic scanner gracefully."""
-        logger.info("Stopping lease expiration scanner")
+        """Stop the scheduler gracefully."""
+        logger.info("Stopping lease expiration scheduler")
         self._running = False
+        self._wake()
 
         if self._task and not self._task.done():
             self._task.cancel()
 
+    async def reconcile(self) -> int:
+        """
+        Reconciliation sweep: expire leases the heap did not know about.
+
+        Returns:
+            Number of leases expired by the sweep
+        """
+        self._last_reconcile = datetime.now(timezone.utc)
+        expired_leases = await self.scan_expired_leases()
+        if not expired_leases:
+            return 0
+
+        logger.info(f"Reconciliation found {len(expired_leases)} expired leases")
+        count = await self.expire_leases([lease.id for lease in expired_leases])
+        self._reconciled_total += count
+        return count
+
+    # ------------------------------------------------------------------
+    # Database operations
+    # ------------------------------------------------------------------
+
     async def scan_expired_leases(self) -> List[TaskLease]:
         """
-        Scan database for expired leases outside grace period.
+        Scan database for active leases expired outside the grace period.
 
         The grace period prevents immediate requeue of leases that just expired,
         which could cause race conditions if the worker is about to submit results.
@@ -115,13 +329,17 @@ class LeaseExpirationService:
         """
         try:
             # Calculate expiration threshold with grace period
-            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            now = datetime.now(timezone.utc)
             expiration_threshold = now - timedelta(seconds=self.grace_period)
 
             # Query for active leases that expired before the threshold
             expired_leases = (
                 self.db_session.query(TaskLease)
-                .filter(TaskLease.expires_at < expiration_threshold)
+                .filter(
+                    TaskLease.expires_at < expiration_threshold,
+                    TaskLease.is_expired == 0,
+                    TaskLease.is_revoked == 0,
+                )
                 .all()
             )
 
@@ -131,98 +349,152 @@ class LeaseExpirationService:
             logger.error(f"Error scanning for expired leases: {e}", exc_info=True)
             return []
 
-    async def process_expired_leases(self, expired_leases: List[TaskLease]) -> None:
+    async def expire_leases(self, lease_ids: Iterable[Any]) -> int:
         """
-        Process a batch of expired leases.
+        Expire a batch of leases and requeue their tasks.
+
+        Leases are flagged with one bulk UPDATE per chunk; only rows that are
+        still active and past their expires_at are touched, so concurrent
+        revocations, renewals and other scheduler instances are safe. Tasks of the leases that were actually
+        expired are requeued in the same transaction.
 
         Args:
-            expired_leases: List of expired TaskLease objects
-        """
-        for lease in expired_leases:
-            try:
-                await self.handle_expired_lease(lease)
-            except Exception as e:
-                logger.error(
-                    f"Error processing expired lease {lease.id} for task {lease.task_id}: {e}",
-                    exc_info=True
-                )
-                # Continue with remaining leases
+            lease_ids: Lease identifiers to expire
 
-    async def handle_expired_lease(self, lease: TaskLease) -> None:
+        Returns:
+            Number of leases transitioned to expired
         """
-        Handle a single expired lease.
+        ids = [_lease_pk(lease_id) for lease_id in lease_ids]
+        if not ids:
+            return 0
 
-        This method:
-        1. Marks the lease as expired
-        2. Revokes the lease token
-        3. Emits a lease_expired event
-        4. Triggers task requeue if applicable
+        for lease_id in ids:
+            self.cancel_lease(lease_id)
 
-        Args:
-            lease: The expired TaskLease object
-        """
-        logger.info(
-            f"Processing expired lease {lease.id} for task {lease.task_id} "
-            f"(owner: {lease.owner_peer_id})"
-        )
+        now = datetime.now(timezone.utc)
+        expired: List[Tuple[Any, Any, str, datetime]] = []
+        try:
+            for start in range(0, len(ids), self.BULK_CHUNK_SIZE):
+                chunk = ids[start:start + self.BULK_CHUNK_SIZE]
+                result = self.db_session.execute(
+                    update(TaskLease)
+                    .where(
+                        TaskLease.id.in_(chunk),
+                        TaskLease.is_expired == 0,
+                        TaskLease.is_revoked == 0,
+                        TaskLease.expires_at <= now,
+                    )
+                    .values(is_expired=1)
+                    .returning(
+                        TaskLease.id,
+                        TaskLease.task_id,
+                        TaskLease.peer_id,
+                        TaskLease.expires_at,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                expired.extend(tuple(row) for row in result.all())
 
-        # Mark lease as expired (delete from active leases)
-        await self.mark_lease_expired(lease.id)
+            task_ids = [row[1] for row in expired]
+            if task_ids and not self.requeue_service:
+                self._requeue_tasks_bulk(task_ids)
 
-        # Emit lease expired event
-        if self.event_emitter:
-            try:
-                await self.event_emitter.emit(
-                    "lease_expired",
-                    lease_id=lease.id,
-                    task_id=lease.task_id,
-                    owner_peer_id=lease.owner_peer_id,
-                    expired_at=lease.expires_at,
-                    detected_at=datetime.now(timezone.utc)
-                )
-            except Exception as e:
-                logger.error(f"Error emitting lease_expired event: {e}")
+            self.db_session.commit()
 
-        # Check if task should be requeued
-        task = self.db_session.query(Task).filter(Task.task_id == lease.task_id).first()
+        except Exception as e:
+            logger.error(f"Error expiring {len(ids)} leases: {e}", exc_info=True)
+            self.db_session.rollback()
+            raise
 
-        if task:
-            # Always attempt to requeue - let the requeue service handle retry logic
-            logger.info(f"Requeueing task {task.task_id}")
+        self._expired_total += len(expired)
+        if expired:
+            logger.info(f"Expired {len(expired)} leases and requeued their tasks")
 
+        detected_at = datetime.now(timezone.utc)
+        for lease_id, task_id, peer_id, expires_at in expired:
+            # Emit lease expired event
+            if self.event_emitter:
+                try:
+                    await self.event_emitter.emit(
+                        "lease_expired",
+                        lease_id=lease_id,
+                        task_id=task_id,
+                        peer_id=peer_id,
+                        expired_at=expires_at,
+                        detected_at=detected_at
+                    )
+                except Exception as e:
+                    logger.error(f"Error emitting lease_expired event: {e}")
+
+            # Let the requeue service handle retry logic when configured
             if self.requeue_service:
                 try:
-                    await self.requeue_service.requeue_task(task.task_id)
+                    await self.requeue_service.requeue_task(task_id)
                 except Exception as e:
-                    logger.error(f"Error requeueing task {task.task_id}: {e}")
-            else:
-                # If no requeue service, just update task status
-                task.status = TaskStatus.QUEUED.value
-                self.db_session.commit()
+                    logger.error(f"Error requeueing task {task_id}: {e}")
 
-    async def mark_lease_expired(self, lease_id: int) -> None:
+        return len(expired)
+
+    def _requeue_tasks_bulk(self, task_ids: List[Any]) -> None:
         """
-        Mark a lease as expired by removing it from the database.
+        Requeue tasks whose leases expired (single UPDATE per chunk).
+
+        Only tasks still held by a lease (LEASED/RUNNING) are moved back to
+        QUEUED so completed results are never clobbered.
 
         Args:
-            lease_id: ID of the lease to expire
+            task_ids: Task identifiers to requeue
         """
+        for start in range(0, len(task_ids), self.BULK_CHUNK_SIZE):
+            chunk = task_ids[start:start + self.BULK_CHUNK_SIZE]
+            self.db_session.execute(
+                update(Task)
+                .where(
+                    Task.id.in_(chunk),
+                    Task.status.in_([TaskStatus.LEASED, TaskStatus.RUNNING]),
+                )
+                .values(status=TaskStatus.QUEUED, assigned_peer_id=None)
+                .execution_options(synchronize_session=False)
+            )
+
+    async def process_expired_leases(self, expired_leases: List[TaskLease]) -> None:
+        """
+        Process a batch of expired leases.
+
+        Args:
+            expired_leases: List of expired TaskLease objects
+        """
+        if not expired_leases:
+            return
         try:
-            lease = self.db_session.query(TaskLease).filter(TaskLease.id == lease_id).first()
+            await self.expire_leases([lease.id for lease in expired_leases])
+        except Exception as e:
+            logger.error(
+                f"Error processing {len(expired_leases)} expired leases: {e}",
+                exc_info=True
+            )
+
+    async def handle_expired_lease(self, lease: TaskLease) -> None:
+        """
+        Handle a single expired lease.
 
-            if lease:
-                # Delete the expired lease
-                self.db_session.delete(lease)
-                self.db_session.commit()
+        Args:
+            lease: The expired TaskLease object
+        """
+        logger.info(
+            f"Processing expired lease {lease.id} for task {lease.task_id} "
+            f"(peer: {lease.peer_id})"
+        )
+        await self.expire_leases([lease.id])
 
-                logger.debug(f"Deleted expired lease {lease_id}")
-            else:
-                logger.warning(f"Lease {lease_id} not found")
+    async def mark_lease_expired(self, lease_id: Any) -> None:
+        """
+        Mark a single lease as expired.
 
-        except Exception as e:
-            logger.error(f"Error marking lease {lease_id} as expired: {e}", exc_info=True)
-            self.db_session.rollback()
-            raise
+        Args:
+            lease_id: ID of the lease to expire
+        """
+        await self.expire_leases([lease_id])
 
     def get_expiration_stats(self) -> dict:
         """
@@ -231,39 +503,52 @@ class LeaseExpirationService:
         Returns:
             Dictionary with expiration statistics
         """
+        base = {
+            "scan_interval": self.scan_interval,
+            "grace_period": self.grace_period,
+            "tracked_leases": len(self._deadlines),
+            "heap_size": len(self._heap),
+            "expired_total": self._expired_total,
+            "reconciled_total": self._reconciled_total,
+        }
+
+        horizon = datetime.now(timezone.utc) + timedelta(seconds=self.scan_interval)
+
+        if self._seeded:
+            # The heap mirrors the active lease set; no database round trip needed
+            base["active_leases"] = len(self._deadlines)
+            base["upcoming_expirations"] = sum(
+                1 for deadline in self._deadlines.values() if deadline < horizon
+            )
+            return base
+
         try:
             # Clear any stale transaction state before querying
             self.db_session.expire_all()  # Expire all cached objects
             self.db_session.rollback()    # Clear any pending transaction state
 
-            active_leases = self.db_session.query(TaskLease).count()
-
-            # Count active leases that will expire soon (within next scan interval)
-            now = datetime.now(timezone.utc).replace(tzinfo=None)
-            upcoming_expirations = (
-                self.db_session.query(TaskLease)
-                .filter(TaskLease.expires_at < now + timedelta(seconds=self.scan_interval))
-                .count()
+            active = self.db_session.query(TaskLease).filter(
+                TaskLease.is_expired == 0,
+                TaskLease.is_revoked == 0,
             )
+            base["active_leases"] = active.count()
 
-            return {
-                "active_leases": active_leases,
-                "upcoming_expirations": upcoming_expirations,
-                "scan_interval": self.scan_interval,
-                "grace_period": self.grace_period
-            }
+            # Count active leases that will expire soon (within next scan interval)
+            base["upcoming_expirations"] = active.filter(
+                TaskLease.expires_at < horizon
+            ).count()
+            return base
 
         except Exception as e:
             self.db_session.rollback()  # Ensure rollback on error
             logger.error(f"Error getting expiration stats: {e}", exc_info=True)
             # Return degraded stats instead of empty dict
-            return {
+            base.update({
                 "error": str(e),
                 "active_leases": None,
                 "upcoming_expirations": None,
-                "scan_interval": self.scan_interval,
-                "grace_period": self.grace_period
-            }
+            })
+            return base
 
 # Global service instance
 _lease_expiration_service: Optional[LeaseExpirationService] = None
@@ -272,12 +557,12 @@ _lease_expiration_service: Optional[LeaseExpirationService] = None
 def get_lease_expiration_service() -> LeaseExpirationService:
     """
     Get global lease expiration service instance
-    
+
     Returns:
         LeaseExpirationService instance
     """
     global _lease_expiration_service
-    
+
     if _lease_expiration_service is None:
         from backend.db.base import SessionLocal
         db_session = SessionLocal()
@@ -286,5 +571,18 @@ def get_lease_expiration_service() -> LeaseExpirationService:
             scan_interval=10,
             grace_period=2
         )
-    
+
+    return _lease_expiration_service
+
+
+def get_running_lease_expiration_service() -> Optional[LeaseExpirationService]:
+    """
+    Get the global lease expiration service if it has been created
+
+    Unlike get_lease_expiration_service(), never creates the service or
+    opens a database session.
+
+    Returns:
+        LeaseExpirationService instance or None
+    """
     return _lease_expiration_service
@@ -10,6 +10,9 @@ Features:
 - Audit logging with revocation reasons
 - Optional automatic requeueing
 - Idempotent operations
+- Set-based revocation for multi-peer failures: one UPDATE ... RETURNING
+  for all peers, task requeue in the same transaction, and one batched
+  audit insert
 
 Refs #E6-S2
 """
@@ -19,9 +22,10 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import and_
+from sqlalchemy import and_, case, update
 
-from backend.models.task_queue import Task, TaskLease, TaskStatus
+from backend.models.audit_event import AuditEvent, AuditEventResult, AuditEventType
+from backend.models.task_lease import Task, TaskLease, TaskStatus
 
 
 logger = logging.getLogger(__name__)
@@ -42,15 +46,19 @@ class LeaseRevocationService:
 
     # Configuration constants
     DEFAULT_BATCH_SIZE = 100
+    # Maximum IDs bound into one IN clause for set-based statements
+    MAX_BULK_PARAMETERS = 1000
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, audit_logger: Optional[Any] = None):
         """
         Initialize lease revocation service
 
         Args:
             db: Database session
+            audit_logger: SecurityAuditLogger for persisted audit events (optional)
         """
         self.db = db
+        self.audit_logger = audit_logger
 
     async def revoke_leases_on_crash(
         self,
@@ -196,6 +204,152 @@ class LeaseRevocationService:
             )
             raise
 
+    async def revoke_leases_on_crash_bulk(
+        self,
+        crashed_peer_ids: List[str],
+        reason: str,
+        requeue: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Revoke all active leases for many crashed nodes in one transaction
+
+        Set-based counterpart of revoke_leases_on_crash for failure domains
+        (zone or rack outages). No ORM objects are loaded:
+
+        1. UPDATE task_leases ... WHERE peer_id IN (:peers) AND is_revoked = 0
+           RETURNING task_id, peer_id
+        2. UPDATE tasks for the returned task IDs that are still LEASED or
+           RUNNING: requeue those with retries left (retry_count + 1,
+           QUEUED), expire the rest. Tasks that already completed or failed
+           keep their status
+        3. Commit once
+        4. Emit one audit record per peer as a single batch
+
+        Args:
+            crashed_peer_ids: Peer IDs of crashed nodes
+            reason: Reason for revocation (e.g., "zone_outage")
+            requeue: Whether to requeue tasks with retries left (default: True)
+
+        Returns:
+            Dict with revocation results:
+            {
+                "success": bool,
+                "revoked_count": int,
+                "requeued_count": int,
+                "revoked_by_peer": Dict[str, int],
+                "reason": str,
+                "timestamp": str
+            }
+
+        Raises:
+            ValueError: If any peer_id is empty
+            SQLAlchemyError: If database operation fails
+        """
+        peer_ids = list(dict.fromkeys(crashed_peer_ids))
+        if any(not peer_id or not peer_id.strip() for peer_id in peer_ids):
+            raise ValueError("peer_id cannot be empty")
+
+        now = datetime.now(timezone.utc)
+        revoked_by_peer: Dict[str, int] = {peer_id: 0 for peer_id in peer_ids}
+        task_ids = []
+        requeued_count = 0
+
+        try:
+            for i in range(0, len(peer_ids), self.MAX_BULK_PARAMETERS):
+                chunk = peer_ids[i:i + self.MAX_BULK_PARAMETERS]
+                rows = self.db.execute(
+                    update(TaskLease)
+                    .where(TaskLease.peer_id.in_(chunk), TaskLease.is_revoked == 0)
+                    .values(is_revoked=1, revoked_at=now, updated_at=now)
+                    .returning(TaskLease.task_id, TaskLease.peer_id)
+                    .execution_options(synchronize_session=False)
+                ).all()
+                for task_id, peer_id in rows:
+                    task_ids.append(task_id)
+                    revoked_by_peer[peer_id] += 1
+
+            has_retries = Task.retry_count < Task.max_retries
+            for i in range(0, len(task_ids), self.MAX_BULK_PARAMETERS):
+                values = {
+                    "status": TaskStatus.EXPIRED,
+                    "assigned_peer_id": None,
+                    "updated_at": now,
+                }
+                if requeue:
+                    values["status"] = case(
+                        (has_retries, TaskStatus.QUEUED), else_=TaskStatus.EXPIRED
+                    )
+                    values["retry_count"] = case(
+                        (has_retries, Task.retry_count + 1), else_=Task.retry_count
+                    )
+                statuses = self.db.execute(
+                    update(Task)
+                    .where(
+                        Task.id.in_(task_ids[i:i + self.MAX_BULK_PARAMETERS]),
+                        Task.status.in_([TaskStatus.LEASED, TaskStatus.RUNNING])
+                    )
+                    .values(**values)
+                    .returning(Task.status)
+                    .execution_options(synchronize_session=False)
+                ).scalars().all()
+                requeued_count += sum(1 for status in statuses if status == TaskStatus.QUEUED)
+
+            self.db.commit()
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(
+                f"Database error during bulk lease revocation for {len(peer_ids)} peers",
+                extra={"peer_count": len(peer_ids), "error": str(e)}
+            )
+            raise
+
+        revoked_count = len(task_ids)
+        await self._emit_bulk_revocation_audit_log(
+            revoked_by_peer=revoked_by_peer,
+            reason=reason,
+            timestamp=now
+        )
+
+        logger.info(
+            f"Revoked {revoked_count} lease(s) for {len(peer_ids)} crashed peer(s)",
+            extra={
+                "peer_count": len(peer_ids),
+                "revoked_count": revoked_count,
+                "requeued_count": requeued_count,
+                "reason": reason
+            }
+        )
+
+        return {
+            "success": True,
+            "revoked_count": revoked_count,
+            "requeued_count": requeued_count,
+            "revoked_by_peer": revoked_by_peer,
+            "reason": reason,
+            "timestamp": now.isoformat()
+        }
+
+    async def revoke_leases_for_peers(
+        self,
+        peer_ids: List[str],
+        reason: str = "heartbeat_timeout"
+    ) -> Dict[str, int]:
+        """
+        Revoke and requeue leases for crashed peers (crash detection hook)
+
+        Called by NodeCrashDetectionService for a burst of crashes.
+
+        Args:
+            peer_ids: Crashed peer IDs
+            reason: Revocation reason
+
+        Returns:
+            Dictionary of peer_id -> revoked lease count
+        """
+        result = await self.revoke_leases_on_crash_bulk(peer_ids, reason=reason, requeue=True)
+        return result["revoked_by_peer"]
+
     async def revoke_lease_by_token(
         self,
         lease_token: str,
@@ -410,6 +564,56 @@ class LeaseRevocationService:
         # TODO: Integrate with audit logging system
         # await self.audit_logger.log_event(audit_event)
 
+    async def _emit_bulk_revocation_audit_log(
+        self,
+        revoked_by_peer: Dict[str, int],
+        reason: str,
+        timestamp: datetime
+    ) -> None:
+        """
+        Emit one audit event per peer as a single batch
+
+        Persisted through audit_logger.log_events (one multi-row insert)
+        when an audit logger is configured; always logged as one summary.
+
+        Args:
+            revoked_by_peer: peer_id -> revoked lease count
+            reason: Revocation reason
+            timestamp: Revocation time
+        """
+        logger.info(
+            "Bulk lease revocation audit event",
+            extra={
+                "event_type": "lease_revocation",
+                "peer_count": len(revoked_by_peer),
+                "revoked_count": sum(revoked_by_peer.values()),
+                "reason": reason,
+                "timestamp": timestamp.isoformat()
+            }
+        )
+
+        if self.audit_logger is None or not revoked_by_peer:
+            return
+
+        events = [
+            AuditEvent(
+                timestamp=timestamp,
+                event_type=AuditEventType.LEASE_REVOKED,
+                peer_id=peer_id,
+                action="lease_revocation",
+                resource="task_leases",
+                result=AuditEventResult.SUCCESS,
+                reason=reason,
+                metadata={"revoked_count": count}
+            )
+            for peer_id, count in revoked_by_peer.items()
+        ]
+        try:
+            self.audit_logger.log_events(events)
+        except Exception as e:
+            # Revocation is already committed; audit failure must not undo it
+            logger.error(f"Failed to store bulk revocation audit events: {e}", exc_info=True)
+
     async def get_revocation_stats(self) -> Dict[str, Any]:
         """
         Get statistics about lease revocations
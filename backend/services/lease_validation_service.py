@@ -12,7 +12,7 @@ Refs #33
 
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from uuid import UUID
 
 from backend.schemas.task_schemas import (
@@ -146,6 +146,55 @@ class LeaseValidationService:
         logger.info(f"Lease validation successful for task {task_id}")
         return True
 
+    async def validate_lease_tokens(
+        self,
+        requests: List[Tuple[str, UUID, str]],
+    ) -> List[Optional[LeaseValidationError]]:
+        """
+        Validate many lease tokens in one pass
+
+        Performs the same checks as validate_lease_token against a single
+        lease store lookup pass and one clock reading. A store backed by
+        PostgreSQL implements this as one query
+        (WHERE lease_token = ANY(:tokens)).
+
+        Args:
+            requests: (lease_token, task_id, peer_id) tuples
+
+        Returns:
+            Per request, None if valid or the error validate_lease_token
+            would have raised
+        """
+        now = datetime.now(timezone.utc)
+        leases = {token: self.lease_store.get(token) for token, _, _ in requests}
+
+        errors: List[Optional[LeaseValidationError]] = []
+        for lease_token, task_id, peer_id in requests:
+            lease = leases[lease_token]
+            if lease is None:
+                errors.append(LeaseNotFoundError(f"Lease token not found: {lease_token}"))
+            elif lease.task_id != task_id:
+                errors.append(LeaseValidationError(
+                    f"Task ID mismatch for lease token {lease_token}"
+                ))
+            elif lease.lease_owner_peer_id != peer_id:
+                errors.append(LeaseOwnershipError(
+                    f"Peer {peer_id} does not own lease for task {task_id}. "
+                    f"Owner: {lease.lease_owner_peer_id}"
+                ))
+            elif now >= lease.lease_expires_at:
+                errors.append(LeaseExpiredError(
+                    f"Lease token {lease_token} expired at {lease.lease_expires_at}"
+                ))
+            else:
+                errors.append(None)
+
+        invalid = sum(1 for error in errors if error is not None)
+        logger.info(
+            f"Bulk lease validation: {len(requests) - invalid} valid, {invalid} invalid"
+        )
+        return errors
+
     async def is_lease_expired(self, lease: TaskLease) -> bool:
         """
         Check if lease has expired
@@ -0,0 +1,57 @@
+"""
+Message Cursor Encoding
+
+Opaque keyset cursors for conversation message pagination.
+
+A cursor identifies the last message of a page by its (created_at, id)
+pair. The next page is every message strictly after that pair in
+(created_at, id) order, which the messages table serves from
+ix_messages_conversation_created without scanning skipped rows.
+"""
+
+import base64
+from datetime import datetime
+from typing import Any, Tuple, Union
+
+
+def encode_message_cursor(created_at: Union[datetime, str], message_id: Any) -> str:
+    """
+    Encode a message position as an opaque cursor.
+
+    Args:
+        created_at: Message timestamp (datetime or ISO 8601 string)
+        message_id: Message ID
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    raw = f"{created_at}|{message_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_message_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Decode a cursor produced by encode_message_cursor().
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (ISO 8601 timestamp, message ID string)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, message_id = (
+            base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").split("|", 1)
+        )
+        datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid message cursor: {cursor!r}") from e
+    if not message_id:
+        raise ValueError(f"Invalid message cursor: {cursor!r}")
+    return created_at, message_id
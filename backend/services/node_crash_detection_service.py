@@ -11,6 +11,10 @@ Features:
 - Trigger lease revocation for crashed nodes
 - Start recovery workflows
 - Track crash statistics and history
+- Hierarchical timing wheel of heartbeat deadlines: sweeps touch only
+  peers whose deadline passed, not the whole peer cache
+- Concurrent, bounded crash fan-out with bulk lease revocation for bursts
+  (e.g., a rack going down)
 
 Refs: OpenCLAW P2P Swarm PRD Section 5.2, Backlog E6-S1
 """
@@ -18,14 +22,22 @@ Refs: OpenCLAW P2P Swarm PRD Section 5.2, Backlog E6-S1
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Set
 from collections import deque
 
 from backend.models.heartbeat import PeerState, PeerEvent
+from backend.services.heartbeat_timing_wheel import HeartbeatTimingWheel
 
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_seconds(timestamp: datetime) -> float:
+    """Convert a naive UTC datetime to seconds since the epoch"""
+    return (timestamp - _EPOCH).total_seconds()
+
 
 class NodeCrashDetectionService:
     """
@@ -40,6 +52,17 @@ class NodeCrashDetectionService:
     - Lease revocation integration
     - Recovery workflow triggering
     - Crash statistics and history tracking
+
+    Heartbeat tracking:
+    - Each non-offline peer has one deadline (last_heartbeat + threshold)
+      in a HeartbeatTimingWheel; record_heartbeat() re-arms it in O(1)
+    - apply_heartbeat() is the ingestion path: it updates the peer cache and
+      re-arms the deadline together. start_crash_monitor() also registers
+      record_heartbeat() with a subscriber that exposes on_heartbeat()
+    - A sweep advances the wheel and re-checks only expired peers against
+      the peer cache, re-arming peers whose heartbeat was updated in place
+    - The cache is rescanned only when its membership changes or every
+      crash_threshold_seconds as a safety net
     """
 
     def __init__(
@@ -48,7 +71,9 @@ class NodeCrashDetectionService:
         heartbeat_subscriber: Optional[Any] = None,
         lease_revocation_service: Optional[Any] = None,
         recovery_workflow: Optional[Any] = None,
-        max_history_size: int = 100
+        max_history_size: int = 100,
+        max_concurrent_recoveries: int = 32,
+        wheel_tick_seconds: float = 1.0
     ):
         """
         Initialize node crash detection service.
@@ -59,6 +84,8 @@ class NodeCrashDetectionService:
             lease_revocation_service: Service to revoke leases for crashed nodes
             recovery_workflow: Workflow to start recovery for crashed nodes
             max_history_size: Maximum crash history records to retain
+            max_concurrent_recoveries: Crashed peers processed concurrently
+            wheel_tick_seconds: Heartbeat timing wheel resolution
         """
         self.crash_threshold_seconds = crash_threshold_seconds
         self.heartbeat_subscriber = heartbeat_subscriber
@@ -71,6 +98,92 @@ class NodeCrashDetectionService:
         self._crash_history: deque = deque(maxlen=max_history_size)
         self._lock = asyncio.Lock()
 
+        self.max_concurrent_recoveries = max(1, max_concurrent_recoveries)
+        self.wheel_tick_seconds = wheel_tick_seconds
+        self._wheel: Optional[HeartbeatTimingWheel] = None
+        # Peer cache the wheel mirrors, the peer_ids seen in it, and when to rescan
+        self._tracked_cache: Optional[Dict[str, PeerState]] = None
+        self._known_peers: Set[str] = set()
+        self._next_full_scan = 0.0
+        # Offline peers are not armed; they are re-checked each sweep so a
+        # peer brought back online in place is tracked again
+        self._offline_peers: Set[str] = set()
+
+    def record_heartbeat(self, peer_id: str, last_heartbeat: datetime) -> None:
+        """
+        Re-arm a peer's crash deadline after a heartbeat.
+
+        O(1); heartbeat consumers call this when they update the peer cache.
+
+        Args:
+            peer_id: Peer identifier
+            last_heartbeat: Heartbeat timestamp (naive UTC)
+        """
+        deadline = _to_seconds(last_heartbeat) + self.crash_threshold_seconds
+        self._get_wheel().arm(peer_id, deadline)
+        self._known_peers.add(peer_id)
+
+    def apply_heartbeat(
+        self,
+        peer_cache: Dict[str, PeerState],
+        peer_id: str,
+        last_heartbeat: datetime,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> PeerState:
+        """
+        Apply a received heartbeat to the peer cache and re-arm its deadline.
+
+        A heartbeat from an unknown peer adds it to the cache; one from an
+        offline peer brings it back online.
+
+        Args:
+            peer_cache: Dictionary of peer_id -> PeerState to update
+            peer_id: Peer identifier
+            last_heartbeat: Heartbeat timestamp (naive UTC)
+            metadata: Optional peer metadata to store
+
+        Returns:
+            Updated PeerState
+        """
+        peer_state = peer_cache.get(peer_id)
+        if peer_state is None:
+            peer_state = PeerState(
+                peer_id=peer_id,
+                status="online",
+                last_heartbeat=last_heartbeat,
+                metadata=metadata
+            )
+            peer_cache[peer_id] = peer_state
+        else:
+            peer_state.last_heartbeat = last_heartbeat
+            peer_state.status = "online"
+            if metadata is not None:
+                peer_state.metadata = metadata
+        self._offline_peers.discard(peer_id)
+
+        self.record_heartbeat(peer_id, last_heartbeat)
+        return peer_state
+
+    def forget_peer(self, peer_id: str) -> None:
+        """
+        Stop tracking a peer removed from the cluster.
+
+        Args:
+            peer_id: Peer identifier
+        """
+        if self._wheel is not None:
+            self._wheel.cancel(peer_id)
+        self._known_peers.discard(peer_id)
+        self._offline_peers.discard(peer_id)
+
+    def _get_wheel(self) -> HeartbeatTimingWheel:
+        if self._wheel is None:
+            self._wheel = HeartbeatTimingWheel(
+                tick_seconds=self.wheel_tick_seconds,
+                start_time=_to_seconds(datetime.utcnow())
+            )
+        return self._wheel
+
     async def detect_crashed_nodes(self, peer_cache: Dict[str, PeerState]) -> List[str]:
         """
         Detect crashed nodes based on heartbeat timeout.
@@ -86,29 +199,90 @@ class NodeCrashDetectionService:
             List of peer_ids for crashed nodes
         """
         async with self._lock:
+            now_dt = datetime.utcnow()
+            now = _to_seconds(now_dt)
+            wheel = self._get_wheel()
             crashed_nodes = []
-            now = datetime.utcnow()
 
-            for peer_id, peer_state in peer_cache.items():
-                # Skip if already marked offline
-                if peer_state.status == "offline":
-                    continue
-
-                # Calculate elapsed time since last heartbeat
-                elapsed = (now - peer_state.last_heartbeat).total_seconds()
-
-                # Check if node has crashed (exceeded threshold)
-                if elapsed >= self.crash_threshold_seconds:
-                    # Mark node as offline
-                    peer_state.status = "offline"
-                    crashed_nodes.append(peer_id)
+            # Only peers whose deadline passed (or that were offline) are touched
+            for peer_id in wheel.advance(now):
+                self._check_peer(peer_id, peer_cache.get(peer_id), now, crashed_nodes)
+
+            for peer_id in list(self._offline_peers):
+                peer_state = peer_cache.get(peer_id)
+                if peer_state is None or peer_state.status != "offline":
+                    self._offline_peers.discard(peer_id)
+                    self._check_peer(peer_id, peer_state, now, crashed_nodes)
+
+            # Pick up peers added to (or removed from) the cache without
+            # record_heartbeat/forget_peer
+            if peer_cache is not self._tracked_cache or now >= self._next_full_scan:
+                self._tracked_cache = peer_cache
+                self._next_full_scan = now + self.crash_threshold_seconds
+                self._known_peers = set()
+                candidates = peer_cache.keys()
+            elif len(peer_cache) != len(self._known_peers):
+                for peer_id in self._known_peers - peer_cache.keys():
+                    self.forget_peer(peer_id)
+                candidates = peer_cache.keys() - self._known_peers
+            else:
+                candidates = ()
+
+            for peer_id in candidates:
+                self._known_peers.add(peer_id)
+                self._check_peer(peer_id, peer_cache[peer_id], now, crashed_nodes)
+
+            if crashed_nodes:
+                logger.info(
+                    f"Crash sweep: {len(crashed_nodes)} crashed, "
+                    f"{len(wheel)} peers armed"
+                )
+            return crashed_nodes
 
-                    logger.warning(
-                        f"Node crash detected: {peer_id} "
-                        f"(no heartbeat for {elapsed:.1f}s, threshold={self.crash_threshold_seconds}s)"
-                    )
+    def _check_peer(
+        self,
+        peer_id: str,
+        peer_state: Optional[PeerState],
+        now: float,
+        crashed_nodes: List[str]
+    ) -> None:
+        """
+        Mark a peer crashed if its deadline passed, otherwise (re-)arm it.
 
-            return crashed_nodes
+        Args:
+            peer_id: Peer identifier
+            peer_state: Current state from the peer cache (None if removed)
+            now: Current time in seconds
+            crashed_nodes: Output list of crashed peer_ids
+        """
+        wheel = self._get_wheel()
+
+        # Skip peers removed from the cache or already marked offline
+        if peer_state is None or peer_state.status == "offline":
+            wheel.cancel(peer_id)
+            if peer_state is not None:
+                self._offline_peers.add(peer_id)
+            return
+
+        last_heartbeat = _to_seconds(peer_state.last_heartbeat)
+        deadline = last_heartbeat + self.crash_threshold_seconds
+
+        if now < deadline:
+            if wheel.deadline(peer_id) != deadline:
+                wheel.arm(peer_id, deadline)
+            return
+
+        # Node has crashed (exceeded threshold): mark offline
+        wheel.cancel(peer_id)
+        peer_state.status = "offline"
+        self._offline_peers.add(peer_id)
+        crashed_nodes.append(peer_id)
+
+        logger.warning(
+            f"Node crash detected: {peer_id} "
+            f"(no heartbeat for {now - last_heartbeat:.1f}s, "
+            f"threshold={self.crash_threshold_seconds}s)"
+        )
 
     async def process_crashes(
         self,
@@ -132,40 +306,92 @@ class NodeCrashDetectionService:
             "recovery_workflows_started": 0
         }
 
+        now = datetime.utcnow()
+        crashed = []
         for peer_id in crashed_nodes:
             peer_state = peer_cache.get(peer_id)
             if not peer_state:
                 continue
+            crashed.append((peer_id, peer_state, (now - peer_state.last_heartbeat).total_seconds()))
+
+        if not crashed:
+            return results
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_recoveries)
+
+        async def emit(peer_id: str, peer_state: PeerState, elapsed: float) -> None:
+            async with semaphore:
+                await self._emit_crash_event(peer_id, peer_state, elapsed)
+                results["events_emitted"] += 1
+                self._record_crash(peer_id, elapsed)
+
+        await asyncio.gather(*(emit(*entry) for entry in crashed))
+
+        # Revoke leases for the whole burst before recovery reassigns work
+        if self.lease_revocation_service:
+            revoked = await self._revoke_leases([peer_id for peer_id, _, _ in crashed], semaphore)
+            results["leases_revoked"] = sum(revoked.values())
+
+        if self.recovery_workflow:
+            async def recover(peer_id: str) -> None:
+                async with semaphore:
+                    try:
+                        workflow_id = await self.recovery_workflow.start_recovery(peer_id)
+                        results["recovery_workflows_started"] += 1
+                        logger.info(f"Started recovery workflow {workflow_id} for crashed node: {peer_id}")
+                    except Exception as e:
+                        logger.error(f"Failed to start recovery workflow for {peer_id}: {e}", exc_info=True)
+
+            await asyncio.gather(*(recover(peer_id) for peer_id, _, _ in crashed))
+
+        return results
 
-            # Calculate elapsed time
-            elapsed = (datetime.utcnow() - peer_state.last_heartbeat).total_seconds()
+    async def _revoke_leases(
+        self,
+        peer_ids: List[str],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, int]:
+        """
+        Revoke leases held by crashed peers.
 
-            # Emit crash event
-            await self._emit_crash_event(peer_id, peer_state, elapsed)
-            results["events_emitted"] += 1
+        Uses the revocation service's bulk revoke_leases_for_peers when it
+        provides one (one statement for the whole burst); otherwise revokes
+        per peer with bounded concurrency.
+
+        Args:
+            peer_ids: Crashed peer identifiers
+            semaphore: Concurrency limit for per-peer revocation
 
-            # Track crash in history
-            self._record_crash(peer_id, elapsed)
+        Returns:
+            Dictionary of peer_id -> revoked lease count
+        """
+        service = self.lease_revocation_service
 
-            # Revoke leases if service configured
-            if self.lease_revocation_service:
+        # Checked on the class so mocks without the bulk API use the per-peer path
+        if callable(getattr(type(service), "revoke_leases_for_peers", None)):
+            try:
+                revoked = await service.revoke_leases_for_peers(peer_ids)
+                logger.info(
+                    f"Revoked {sum(revoked.values())} leases for {len(peer_ids)} crashed nodes"
+                )
+                return revoked
+            except Exception as e:
+                logger.error(f"Bulk lease revocation failed for {len(peer_ids)} nodes: {e}", exc_info=True)
+                return {}
+
+        revoked: Dict[str, int] = {}
+
+        async def revoke(peer_id: str) -> None:
+            async with semaphore:
                 try:
-                    revoked_count = await self.lease_revocation_service.revoke_leases_for_peer(peer_id)
-                    results["leases_revoked"] += revoked_count
+                    revoked_count = await service.revoke_leases_for_peer(peer_id)
+                    revoked[peer_id] = revoked_count
                     logger.info(f"Revoked {revoked_count} leases for crashed node: {peer_id}")
                 except Exception as e:
                     logger.error(f"Failed to revoke leases for {peer_id}: {e}", exc_info=True)
 
-            # Start recovery workflow if configured
-            if self.recovery_workflow:
-                try:
-                    workflow_id = await self.recovery_workflow.start_recovery(peer_id)
-                    results["recovery_workflows_started"] += 1
-                    logger.info(f"Started recovery workflow {workflow_id} for crashed node: {peer_id}")
-                except Exception as e:
-                    logger.error(f"Failed to start recovery workflow for {peer_id}: {e}", exc_info=True)
-
-        return results
+        await asyncio.gather(*(revoke(peer_id) for peer_id in peer_ids))
+        return revoked
 
     async def _emit_crash_event(
         self,
@@ -249,6 +475,11 @@ class NodeCrashDetectionService:
             f"threshold={self.crash_threshold_seconds}s)"
         )
 
+        # Re-arm deadlines as the subscriber updates its peer cache
+        on_heartbeat = getattr(self.heartbeat_subscriber, "on_heartbeat", None)
+        if callable(on_heartbeat):
+            on_heartbeat(self.record_heartbeat)
+
         while True:
             try:
                 await asyncio.sleep(interval_seconds)
@@ -287,7 +518,8 @@ class NodeCrashDetectionService:
             "total_crashes_detected": self._crash_count,
             "crash_detection_threshold_seconds": self.crash_threshold_seconds,
             "recent_crashes": len(self._crash_history),
-            "max_history_size": self.max_history_size
+            "max_history_size": self.max_history_size,
+            "tracked_peers": len(self._wheel) if self._wheel is not None else 0
         }
 
     def get_crash_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -196,6 +196,30 @@ class PrometheusMetricsService:
             registry=reg,
         )
 
+        self._zerodb_pool_in_use = Gauge(
+            f"{ns}_zerodb_pool_in_use",
+            "ZeroDB HTTP requests currently in flight on pooled connections",
+            registry=reg,
+        )
+
+        self._zerodb_pool_idle = Gauge(
+            f"{ns}_zerodb_pool_idle",
+            "Idle keep-alive connections in the ZeroDB HTTP pool",
+            registry=reg,
+        )
+
+        self._zerodb_pool_wait_seconds_total = Gauge(
+            f"{ns}_zerodb_pool_wait_seconds_total",
+            "Cumulative time ZeroDB requests waited for a pool slot",
+            registry=reg,
+        )
+
+        self._zerodb_pool_wait_seconds_max = Gauge(
+            f"{ns}_zerodb_pool_wait_seconds_max",
+            "Longest time a ZeroDB request waited for a pool slot",
+            registry=reg,
+        )
+
         # ── Histograms ──
 
         self._recovery_duration_seconds = Histogram(
@@ -269,6 +293,18 @@ class PrometheusMetricsService:
             except Exception as e:
                 logger.warning(f"Failed to collect partition stats: {e}")
 
+        # ZeroDB connection pool stats
+        zerodb_pool = services.get("zerodb_pool")
+        if zerodb_pool:
+            try:
+                stats = zerodb_pool.get_pool_stats()
+                self._zerodb_pool_in_use.set(stats.get("in_use", 0))
+                self._zerodb_pool_idle.set(stats.get("idle", 0))
+                self._zerodb_pool_wait_seconds_total.set(stats.get("wait_seconds_total", 0.0))
+                self._zerodb_pool_wait_seconds_max.set(stats.get("wait_seconds_max", 0.0))
+            except Exception as e:
+                logger.warning(f"Failed to collect ZeroDB pool stats: {e}")
+
     # ── Counter Record Methods (Push Model) ──
 
     def record_task_assignment(self, status: str) -> None:
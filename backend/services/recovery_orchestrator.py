@@ -13,10 +13,11 @@ from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
 from enum import Enum
 from uuid import uuid4, UUID
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
-from backend.models.task_queue import Task, TaskLease, TaskStatus
+from backend.models.task_lease import Task, TaskLease, TaskStatus
 from backend.services.heartbeat_subscriber import HeartbeatSubscriber
 from backend.services.lease_validation_service import LeaseValidationService
 from backend.services.task_requeue_service import TaskRequeueService
@@ -490,28 +491,27 @@ class RecoveryOrchestrator:
         """
         Revoke all active leases for a peer
 
+        Issues a single UPDATE instead of loading and mutating each lease.
+
         Args:
             peer_id: Peer ID
 
         Returns:
             Number of leases revoked
         """
-        leases = self.db.query(TaskLease).filter(
-            TaskLease.peer_id == peer_id,
-            TaskLease.is_revoked == 0
-        ).all()
-
         now = datetime.now(timezone.utc)
 
-        for lease in leases:
-            lease.is_revoked = 1
-            lease.revoked_at = now
-            lease.updated_at = now
+        result = self.db.execute(
+            update(TaskLease)
+            .where(TaskLease.peer_id == peer_id, TaskLease.is_revoked == 0)
+            .values(is_revoked=1, revoked_at=now, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
 
-        if leases:
+        if result.rowcount:
             self.db.commit()
 
-        return len(leases)
+        return result.rowcount
 
     async def classify_failure(
         self,
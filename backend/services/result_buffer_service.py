@@ -4,16 +4,21 @@ Result Buffer Service
 Local SQLite-based buffer for storing task results during DBOS partition scenarios.
 Implements FIFO queue with periodic flush attempts and retry logic.
 
+All SQLite access goes through one WAL-mode connection owned by a dedicated
+thread; concurrent inserts are group-committed.
+
 Refs #E6-S4
 """
 
 import logging
 import asyncio
+import functools
 import sqlite3
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -34,6 +39,28 @@ class BufferMetrics:
     newest_result_age_seconds: Optional[float]
 
 
+@dataclass
+class FlushStats:
+    """Statistics for a single flush pass"""
+    started_at: datetime
+    duration_seconds: float = 0.0
+    pages: int = 0
+    scanned: int = 0
+    flushed: int = 0
+    failed: int = 0
+    deferred: int = 0
+    exhausted: int = 0
+    peak_rows_in_memory: int = 0
+    peak_memory_bytes: int = 0
+
+    @property
+    def throughput_per_second(self) -> float:
+        """Results flushed per second"""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.flushed / self.duration_seconds
+
+
 class ResultBufferService:
     """
     Local SQLite buffer for task results during DBOS partition
@@ -46,14 +73,34 @@ class ResultBufferService:
     - Retry mechanism with exponential backoff
     - Lease token tracking
     - Metadata preservation
+
+    Storage model:
+    - One long-lived connection in WAL mode, owned by a dedicated
+      single-thread executor so blocking SQLite I/O never runs on the
+      event loop
+    - Pending row count kept in memory (no COUNT(*) per insert)
+    - Concurrent buffer_result calls are group-committed: every insert
+      queued while a commit is in flight lands in the next transaction
+    - Flush streams the buffer page by page with a bounded number of
+      sends in flight and bulk removal of delivered results
     """
 
+    # Max rows bound in one "WHERE id IN (...)" statement
+    # (SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds)
+    _MAX_SQL_VARIABLES = 500
+
     def __init__(
         self,
         db_path: str = "/tmp/openclaw_result_buffer.db",
         max_buffer_size: int = 10000,
         flush_interval: int = 30,
-        max_retry_attempts: int = 3
+        max_retry_attempts: int = 3,
+        flush_batch_size: int = 50,
+        max_group_commit_size: int = 500,
+        flush_page_size: int = 500,
+        flush_concurrency: int = 10,
+        retry_backoff_base: float = 1.0,
+        retry_backoff_max: float = 300.0
     ):
         """
         Initialize result buffer service
@@ -63,27 +110,62 @@ class ResultBufferService:
             max_buffer_size: Maximum number of buffered results
             flush_interval: Interval between flush attempts (seconds)
             max_retry_attempts: Maximum retry attempts for failed flushes
+            flush_batch_size: Results per send_result_batch call during flush;
+                clients without send_result_batch (or a size of 1) send
+                results individually via send_result
+            max_group_commit_size: Maximum inserts committed in one transaction
+            flush_page_size: Rows read from the buffer per page during flush
+            flush_concurrency: Maximum sends in flight during flush
+            retry_backoff_base: Base retry delay in seconds, doubled per failed
+                attempt (0 retries on every flush)
+            retry_backoff_max: Upper bound for the retry delay (seconds)
         """
         self.db_path = db_path
         self.max_buffer_size = max_buffer_size
         self.flush_interval = flush_interval
         self.max_retry_attempts = max_retry_attempts
+        self.flush_batch_size = max(1, flush_batch_size)
+        self.max_group_commit_size = max(1, max_group_commit_size)
+        self.flush_page_size = max(1, flush_page_size)
+        self.flush_concurrency = max(1, flush_concurrency)
+        self.retry_backoff_base = retry_backoff_base
+        self.retry_backoff_max = retry_backoff_max
 
         self._flush_task: Optional[asyncio.Task] = None
         self._flush_running = False
 
+        # Flush statistics
+        self._last_flush_stats: Optional[FlushStats] = None
+        self._total_flushed = 0
+
+        # Dedicated database thread and its connection
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="result-buffer-db"
+        )
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # In-memory pending counter (includes inserts awaiting commit)
+        self._pending_count = 0
+
+        # Group commit queue: (insert params, caller future)
+        self._write_queue: List[Tuple[tuple, asyncio.Future]] = []
+        self._commit_task: Optional[asyncio.Task] = None
+
         # Initialize database
-        self._init_database()
+        self._executor.submit(self._init_database).result()
 
         logger.info(
             f"ResultBufferService initialized: "
             f"db={db_path}, capacity={max_buffer_size}, "
-            f"flush_interval={flush_interval}s"
+            f"flush_interval={flush_interval}s, pending={self._pending_count}"
         )
 
     def _init_database(self):
-        """Initialize SQLite database schema"""
+        """Open the connection in WAL mode and initialize schema (database thread)"""
         conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         cursor = conn.cursor()
 
         # Create buffered_results table
@@ -116,9 +198,83 @@ class ResultBufferService:
         """)
 
         conn.commit()
-        conn.close()
 
-        logger.debug(f"Database initialized at {self.db_path}")
+        # Seed the in-memory pending counter once
+        cursor.execute("""
+            SELECT COUNT(*) FROM buffered_results
+            WHERE status = 'pending'
+        """)
+        self._pending_count = cursor.fetchone()[0]
+
+        self._conn = conn
+        logger.debug(f"Database initialized at {self.db_path} (WAL mode)")
+
+    async def _run(self, fn, *args):
+        """Run a blocking database function on the database thread"""
+        if self._executor is None:
+            raise RuntimeError("ResultBufferService is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args))
+
+    def _db_fetch(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """Run a query and return all rows (database thread)"""
+        return self._conn.execute(sql, params).fetchall()
+
+    def _db_insert_batch(self, rows: List[tuple]) -> List[Any]:
+        """
+        Insert rows in a single transaction (database thread)
+
+        A constraint violation only rolls back its own statement, so one
+        duplicate task_id does not fail the rest of the group.
+
+        Returns:
+            Buffer entry ID or exception per row
+        """
+        outcomes: List[Any] = []
+        cursor = self._conn.cursor()
+        try:
+            for row in rows:
+                try:
+                    cursor.execute("""
+                        INSERT INTO buffered_results
+                        (task_id, agent_id, lease_token, result_data, metadata)
+                        VALUES (?, ?, ?, ?, ?)
+                    """, row)
+                    outcomes.append(cursor.lastrowid)
+                except sqlite3.IntegrityError as e:
+                    outcomes.append(e)
+            self._conn.commit()
+        except sqlite3.Error as e:
+            self._conn.rollback()
+            return [e] * len(rows)
+        return outcomes
+
+    def _db_update_ids(self, sql: str, buffer_ids: List[int], params: tuple = ()) -> int:
+        """
+        Run an UPDATE/DELETE for a set of ids in one transaction (database thread)
+
+        Args:
+            sql: Statement containing an "{ids}" placeholder for the IN list
+            buffer_ids: Buffer entry IDs
+            params: Parameters bound before the ids
+
+        Returns:
+            Number of affected rows
+        """
+        affected = 0
+        for start in range(0, len(buffer_ids), self._MAX_SQL_VARIABLES):
+            chunk = buffer_ids[start:start + self._MAX_SQL_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = self._conn.execute(sql.format(ids=placeholders), params + tuple(chunk))
+            affected += cursor.rowcount
+        self._conn.commit()
+        return affected
+
+    def _db_close(self):
+        """Close the connection (database thread)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     async def buffer_result(
         self,
@@ -144,43 +300,61 @@ class ResultBufferService:
         Raises:
             BufferFullError: If buffer is at capacity
         """
-        # Check capacity
-        current_size = await self.get_buffer_size()
+        # Check capacity (counter already includes uncommitted inserts)
+        current_size = self._pending_count
         if current_size >= self.max_buffer_size:
             raise BufferFullError(
                 f"Buffer capacity exceeded (current={current_size}, max={self.max_buffer_size})"
             )
+        self._pending_count += 1
 
         # Serialize data
         result_json = json.dumps(result)
         metadata_json = json.dumps(metadata) if metadata else None
 
-        # Insert into database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Queue for the next group commit
+        future = asyncio.get_running_loop().create_future()
+        self._write_queue.append(
+            ((task_id, agent_id, lease_token, result_json, metadata_json), future)
+        )
+        if self._commit_task is None or self._commit_task.done():
+            self._commit_task = asyncio.create_task(self._commit_pending_writes())
 
         try:
-            cursor.execute("""
-                INSERT INTO buffered_results
-                (task_id, agent_id, lease_token, result_data, metadata)
-                VALUES (?, ?, ?, ?, ?)
-            """, (task_id, agent_id, lease_token, result_json, metadata_json))
-
-            buffer_id = cursor.lastrowid
-            conn.commit()
-
-            logger.info(
-                f"Buffered result: task_id={task_id}, agent_id={agent_id}, "
-                f"buffer_id={buffer_id}, size={current_size + 1}/{self.max_buffer_size}"
-            )
-
-            return buffer_id
-
+            buffer_id = await future
         except sqlite3.IntegrityError as e:
             logger.error(f"Failed to buffer result (duplicate task_id?): {e}")
             raise
-        finally:
-            conn.close()
+
+        logger.info(
+            f"Buffered result: task_id={task_id}, agent_id={agent_id}, "
+            f"buffer_id={buffer_id}, size={self._pending_count}/{self.max_buffer_size}"
+        )
+
+        return buffer_id
+
+    async def _commit_pending_writes(self):
+        """Commit queued inserts, one transaction per drained group"""
+        while self._write_queue:
+            group = self._write_queue[:self.max_group_commit_size]
+            del self._write_queue[:len(group)]
+
+            try:
+                outcomes = await self._run(self._db_insert_batch, [row for row, _ in group])
+            except Exception as e:
+                outcomes = [e] * len(group)
+
+            for (_, future), outcome in zip(group, outcomes):
+                if isinstance(outcome, Exception):
+                    # Release the capacity reserved by buffer_result
+                    self._pending_count -= 1
+                    if not future.done():
+                        future.set_exception(outcome)
+                elif not future.done():
+                    future.set_result(outcome)
+
+            if len(group) > 1:
+                logger.debug(f"Group-committed {len(group)} buffered results")
 
     async def get_buffer_size(self) -> int:
         """
@@ -189,18 +363,7 @@ class ResultBufferService:
         Returns:
             Number of buffered results
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT COUNT(*) FROM buffered_results
-            WHERE status = 'pending'
-        """)
-
-        count = cursor.fetchone()[0]
-        conn.close()
-
-        return count
+        return self._pending_count
 
     async def get_buffered_result(self, buffer_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -212,23 +375,17 @@ class ResultBufferService:
         Returns:
             Buffered result details or None if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        rows = await self._run(self._db_fetch, """
             SELECT id, task_id, agent_id, lease_token, result_data,
                    metadata, created_at, retry_count, last_retry_at, status
             FROM buffered_results
             WHERE id = ?
         """, (buffer_id,))
 
-        row = cursor.fetchone()
-        conn.close()
-
-        if not row:
+        if not rows:
             return None
 
-        return self._row_to_dict(row)
+        return self._row_to_dict(rows[0])
 
     async def get_all_buffered_results(self) -> List[Dict[str, Any]]:
         """
@@ -237,81 +394,233 @@ class ResultBufferService:
         Returns:
             List of buffered results (oldest first)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        rows = await self._run(self._db_fetch, """
             SELECT id, task_id, agent_id, lease_token, result_data,
                    metadata, created_at, retry_count, last_retry_at, status
             FROM buffered_results
             WHERE status = 'pending'
-            ORDER BY created_at ASC
+            ORDER BY created_at ASC, id ASC
         """)
 
-        rows = cursor.fetchall()
-        conn.close()
-
         return [self._row_to_dict(row) for row in rows]
 
     async def flush_buffer(self, dbos_client) -> int:
         """
         Flush buffered results to DBOS
 
+        Streams the buffer in FIFO (created_at, id) order, one page of
+        flush_page_size rows at a time, prefetching the next page while the
+        current one is sent. Up to flush_concurrency sends are kept in
+        flight. When the client exposes send_result_batch(results) and
+        flush_batch_size is above 1, results are sent in chunks of
+        flush_batch_size, one call per chunk; otherwise each result is sent
+        with send_result. If a batch call raises, its chunk falls back to
+        individual send_result calls so one bad result cannot block the rest.
+        Removals, retry increments and failure marks are applied in bulk once
+        per page.
+
+        Results that failed before are only retried once their backoff
+        (retry_backoff_base * 2^(retry_count - 1), capped at
+        retry_backoff_max) has elapsed since last_retry_at.
+
         Args:
             dbos_client: DBOS client for sending results
 
         Returns:
             Number of results successfully flushed
         """
-        buffered = await self.get_all_buffered_results()
+        send_batch = getattr(dbos_client, "send_result_batch", None)
+        use_batch = self.flush_batch_size > 1 and send_batch is not None
+        semaphore = asyncio.Semaphore(self.flush_concurrency)
 
-        if not buffered:
+        stats = FlushStats(started_at=datetime.now(timezone.utc))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        next_page = asyncio.ensure_future(self._fetch_pending_page(None))
+        try:
+            while True:
+                page = await next_page
+                if not page:
+                    break
+
+                # Prefetch the next page while this one is in flight
+                last = page[-1]
+                next_page = asyncio.ensure_future(
+                    self._fetch_pending_page((last["created_at"], last["id"]))
+                )
+
+                stats.pages += 1
+                stats.scanned += len(page)
+                page_bytes = sum(len(entry["result_data"]) for entry in page)
+                stats.peak_rows_in_memory = max(stats.peak_rows_in_memory, len(page))
+                stats.peak_memory_bytes = max(stats.peak_memory_bytes, page_bytes)
+
+                await self._flush_page(page, dbos_client, send_batch if use_batch else None,
+                                       semaphore, stats)
+        finally:
+            if not next_page.done():
+                next_page.cancel()
+
+        stats.duration_seconds = loop.time() - started
+        self._last_flush_stats = stats
+        self._total_flushed += stats.flushed
+
+        if stats.scanned == 0:
             logger.debug("Buffer is empty, nothing to flush")
             return 0
 
-        flushed_count = 0
+        logger.info(
+            f"Flush complete: {stats.flushed}/{stats.scanned} results sent "
+            f"({stats.deferred} deferred, {stats.throughput_per_second:.1f}/s)"
+        )
+
+        return stats.flushed
 
-        for result_entry in buffered:
-            buffer_id = result_entry["id"]
-            task_id = result_entry["task_id"]
+    async def _fetch_pending_page(
+        self,
+        after: Optional[Tuple[str, int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the next page of pending results in FIFO order
+
+        Args:
+            after: (created_at, id) of the last row of the previous page
+
+        Returns:
+            Up to flush_page_size buffered results
+        """
+        columns = """
+            SELECT id, task_id, agent_id, lease_token, result_data,
+                   metadata, created_at, retry_count, last_retry_at, status
+            FROM buffered_results
+        """
+        if after is None:
+            rows = await self._run(self._db_fetch, columns + """
+                WHERE status = 'pending'
+                ORDER BY created_at ASC, id ASC
+                LIMIT ?
+            """, (self.flush_page_size,))
+        else:
+            created_at, buffer_id = after
+            rows = await self._run(self._db_fetch, columns + """
+                WHERE status = 'pending'
+                  AND (created_at > ? OR (created_at = ? AND id > ?))
+                ORDER BY created_at ASC, id ASC
+                LIMIT ?
+            """, (created_at, created_at, buffer_id, self.flush_page_size))
+
+        return [self._row_to_dict(row) for row in rows]
+
+    async def _flush_page(
+        self,
+        page: List[Dict[str, Any]],
+        dbos_client,
+        send_batch,
+        semaphore: asyncio.Semaphore,
+        stats: FlushStats
+    ):
+        """
+        Send one page of results and apply its outcome in bulk
 
+        Args:
+            page: Buffered results in FIFO order
+            dbos_client: DBOS client for individual sends
+            send_batch: Client batch send callable, or None to send individually
+            semaphore: Bounds sends in flight across the flush
+            stats: Flush statistics to update
+        """
+        now = datetime.now(timezone.utc)
+
+        exhausted: List[int] = []
+        sendable: List[Dict[str, Any]] = []
+        for result_entry in page:
             # Check retry limit
             if result_entry["retry_count"] >= self.max_retry_attempts:
                 logger.warning(
-                    f"Max retry attempts exceeded for task {task_id}, "
+                    f"Max retry attempts exceeded for task {result_entry['task_id']}, "
                     f"marking as failed"
                 )
-                await self._mark_as_failed(buffer_id)
-                continue
+                exhausted.append(result_entry["id"])
+            elif self._retry_due(result_entry, now):
+                sendable.append(result_entry)
+            else:
+                stats.deferred += 1
 
-            try:
-                # Prepare result data
-                result_data = {
-                    "task_id": task_id,
-                    "agent_id": result_entry["agent_id"],
-                    "lease_token": result_entry["lease_token"],
-                    "result": json.loads(result_entry["result_data"]),
-                    "metadata": result_entry["metadata"]  # Already parsed in _row_to_dict
-                }
-
-                # Send to DBOS
-                await dbos_client.send_result(result_data)
-
-                # Remove from buffer on success
-                await self._remove_from_buffer(buffer_id)
-                flushed_count += 1
+        succeeded: List[int] = []
+        failed: List[int] = []
 
+        async def send_one(result_entry: Dict[str, Any]):
+            task_id = result_entry["task_id"]
+            try:
+                async with semaphore:
+                    # Send to DBOS
+                    await dbos_client.send_result(self._to_result_data(result_entry))
+                succeeded.append(result_entry["id"])
                 logger.info(f"Flushed result for task {task_id}")
-
             except Exception as e:
                 logger.error(f"Failed to flush result for task {task_id}: {e}")
+                failed.append(result_entry["id"])
 
-                # Increment retry count
-                await self._increment_retry_count(buffer_id)
-
-        logger.info(f"Flush complete: {flushed_count}/{len(buffered)} results sent")
+        async def send_chunk(chunk: List[Dict[str, Any]]):
+            try:
+                async with semaphore:
+                    await send_batch([self._to_result_data(entry) for entry in chunk])
+                succeeded.extend(entry["id"] for entry in chunk)
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Batch send of {len(chunk)} results failed, "
+                    f"falling back to individual sends: {e}"
+                )
+            await asyncio.gather(*[send_one(entry) for entry in chunk])
+
+        if send_batch is not None:
+            await asyncio.gather(*[
+                send_chunk(sendable[start:start + self.flush_batch_size])
+                for start in range(0, len(sendable), self.flush_batch_size)
+            ])
+        else:
+            await asyncio.gather(*[send_one(entry) for entry in sendable])
+
+        if exhausted:
+            await self._mark_as_failed(exhausted)
+        if succeeded:
+            # Remove from buffer on success
+            await self._remove_from_buffer(succeeded)
+        if failed:
+            # Increment retry count
+            await self._increment_retry_count(failed)
+
+        stats.flushed += len(succeeded)
+        stats.failed += len(failed)
+        stats.exhausted += len(exhausted)
+
+    def _retry_due(self, result_entry: Dict[str, Any], now: datetime) -> bool:
+        """Whether a previously failed result has waited out its backoff"""
+        retry_count = result_entry["retry_count"]
+        last_retry_at = result_entry["last_retry_at"]
+        if retry_count == 0 or not last_retry_at or self.retry_backoff_base <= 0:
+            return True
+
+        delay = min(
+            self.retry_backoff_max,
+            self.retry_backoff_base * (2 ** (retry_count - 1))
+        )
+        last = datetime.fromisoformat(last_retry_at.replace('Z', '+00:00'))
+        if last.tzinfo is None:
+            last = last.replace(tzinfo=timezone.utc)
+        return (now - last).total_seconds() >= delay
 
-        return flushed_count
+    def _to_result_data(self, result_entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the DBOS result payload for a buffered entry"""
+        return {
+            "task_id": result_entry["task_id"],
+            "agent_id": result_entry["agent_id"],
+            "lease_token": result_entry["lease_token"],
+            "result": json.loads(result_entry["result_data"]),
+            "metadata": result_entry["metadata"]  # Already parsed in _row_to_dict
+        }
 
     async def start_periodic_flush(self, dbos_client):
         """
@@ -377,20 +686,14 @@ class ResultBufferService:
         Returns:
             List of failed results
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        rows = await self._run(self._db_fetch, """
             SELECT id, task_id, agent_id, lease_token, result_data,
                    metadata, created_at, retry_count, last_retry_at, status
             FROM buffered_results
             WHERE status = 'failed'
-            ORDER BY created_at ASC
+            ORDER BY created_at ASC, id ASC
         """)
 
-        rows = cursor.fetchall()
-        conn.close()
-
         return [self._row_to_dict(row) for row in rows]
 
     async def get_buffer_metrics(self) -> Dict[str, Any]:
@@ -398,20 +701,14 @@ class ResultBufferService:
         Get buffer metrics for monitoring
 
         Returns:
-            Buffer metrics including size, utilization, and age statistics
+            Buffer metrics including size, utilization, age statistics and
+            statistics of the last flush (throughput and peak rows/bytes
+            held in memory)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Get current size
-        cursor.execute("""
-            SELECT COUNT(*) FROM buffered_results
-            WHERE status = 'pending'
-        """)
-        current_size = cursor.fetchone()[0]
+        current_size = self._pending_count
 
         # Get age statistics
-        cursor.execute("""
+        rows = await self._run(self._db_fetch, """
             SELECT
                 MIN(created_at) as oldest,
                 MAX(created_at) as newest
@@ -419,10 +716,7 @@ class ResultBufferService:
             WHERE status = 'pending'
         """)
 
-        row = cursor.fetchone()
-        conn.close()
-
-        oldest_str, newest_str = row
+        oldest_str, newest_str = rows[0]
 
         # Calculate ages
         now = datetime.now(timezone.utc)
@@ -448,52 +742,57 @@ class ResultBufferService:
             "max_capacity": self.max_buffer_size,
             "utilization_percent": round(utilization, 2),
             "oldest_result_age_seconds": oldest_age,
-            "newest_result_age_seconds": newest_age
+            "newest_result_age_seconds": newest_age,
+            "total_flushed": self._total_flushed,
+            "last_flush": self._flush_stats_to_dict(self._last_flush_stats)
         }
 
-    async def _remove_from_buffer(self, buffer_id: int):
-        """Remove result from buffer"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            DELETE FROM buffered_results
-            WHERE id = ?
-        """, (buffer_id,))
+    def _flush_stats_to_dict(self, stats: Optional[FlushStats]) -> Optional[Dict[str, Any]]:
+        """Convert flush statistics to a metrics dictionary"""
+        if stats is None:
+            return None
 
-        conn.commit()
-        conn.close()
+        return {
+            "started_at": stats.started_at.isoformat(),
+            "duration_seconds": round(stats.duration_seconds, 6),
+            "pages": stats.pages,
+            "scanned": stats.scanned,
+            "flushed": stats.flushed,
+            "failed": stats.failed,
+            "deferred": stats.deferred,
+            "exhausted": stats.exhausted,
+            "throughput_per_second": round(stats.throughput_per_second, 2),
+            "peak_rows_in_memory": stats.peak_rows_in_memory,
+            "peak_memory_bytes": stats.peak_memory_bytes
+        }
 
-    async def _increment_retry_count(self, buffer_id: int):
-        """Increment retry count for a buffered result"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    async def _remove_from_buffer(self, buffer_ids: List[int]):
+        """Remove pending results from buffer"""
+        removed = await self._run(self._db_update_ids, """
+            DELETE FROM buffered_results
+            WHERE status = 'pending' AND id IN ({ids})
+        """, buffer_ids)
+        self._pending_count -= removed
 
+    async def _increment_retry_count(self, buffer_ids: List[int]):
+        """Increment retry count for buffered results"""
         now = datetime.now(timezone.utc).isoformat()
 
-        cursor.execute("""
+        await self._run(self._db_update_ids, """
             UPDATE buffered_results
             SET retry_count = retry_count + 1,
                 last_retry_at = ?
-            WHERE id = ?
-        """, (now, buffer_id))
-
-        conn.commit()
-        conn.close()
+            WHERE id IN ({ids})
+        """, buffer_ids, (now,))
 
-    async def _mark_as_failed(self, buffer_id: int):
-        """Mark result as failed after max retries"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+    async def _mark_as_failed(self, buffer_ids: List[int]):
+        """Mark results as failed after max retries"""
+        marked = await self._run(self._db_update_ids, """
             UPDATE buffered_results
             SET status = 'failed'
-            WHERE id = ?
-        """, (buffer_id,))
-
-        conn.commit()
-        conn.close()
+            WHERE status = 'pending' AND id IN ({ids})
+        """, buffer_ids)
+        self._pending_count -= marked
 
     def _row_to_dict(self, row) -> Dict[str, Any]:
         """Convert database row to dictionary"""
@@ -518,12 +817,20 @@ class ResultBufferService:
             if self._flush_task:
                 self._flush_task.cancel()
 
+        # Close connection on its own thread, then stop the thread
+        if self._executor is not None:
+            self._executor.submit(self._db_close).result()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
         logger.info("ResultBufferService closed")
 
     def __del__(self):
         """Cleanup on deletion"""
         if hasattr(self, '_flush_running') and self._flush_running:
             self._flush_running = False
+        if getattr(self, '_executor', None) is not None:
+            self._executor.shutdown(wait=False)
 
 
 # Global service instance
@@ -534,7 +841,12 @@ def get_result_buffer_service(
     db_path: str = "/tmp/openclaw_result_buffer.db",
     max_buffer_size: int = 10000,
     flush_interval: int = 30,
-    max_retry_attempts: int = 3
+    max_retry_attempts: int = 3,
+    flush_batch_size: int = 50,
+    flush_page_size: int = 500,
+    flush_concurrency: int = 10,
+    retry_backoff_base: float = 1.0,
+    retry_backoff_max: float = 300.0
 ) -> ResultBufferService:
     """
     Get global result buffer service instance
@@ -544,6 +856,11 @@ def get_result_buffer_service(
         max_buffer_size: Maximum number of buffered results
         flush_interval: Interval between flush attempts (seconds)
         max_retry_attempts: Maximum retry attempts for failed flushes
+        flush_batch_size: Results per send_result_batch call during flush
+        flush_page_size: Rows read from the buffer per page during flush
+        flush_concurrency: Maximum sends in flight during flush
+        retry_backoff_base: Base retry delay in seconds, doubled per failed attempt
+        retry_backoff_max: Upper bound for the retry delay (seconds)
 
     Returns:
         ResultBufferService instance
@@ -555,7 +872,12 @@ def get_result_buffer_service(
             db_path=db_path,
             max_buffer_size=max_buffer_size,
             flush_interval=flush_interval,
-            max_retry_attempts=max_retry_attempts
+            max_retry_attempts=max_retry_attempts,
+            flush_batch_size=flush_batch_size,
+            flush_page_size=flush_page_size,
+            flush_concurrency=flush_concurrency,
+            retry_backoff_base=retry_backoff_base,
+            retry_backoff_max=retry_backoff_max
         )
 
     return _buffer_service
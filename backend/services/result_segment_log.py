@@ -0,0 +1,256 @@
+"""
+Result Segment Log
+
+Durable, append-only log for task results buffered during a DBOS
+partition, so a node crash or restart does not lose them.
+
+Features:
+- Length-prefixed msgpack records with a CRC32 per record
+- Segment files rolled at a size limit and named by their first sequence
+- Group-commit fsync: records reach the OS on every append (surviving a
+  process crash) and are fsynced every fsync_batch_size records or on
+  sync() (surviving power loss)
+- mmap replay on startup; a torn trailing record is truncated
+- Checkpoint file recording the highest sequence fully processed; replay
+  starts after it and fully checkpointed segments are deleted
+
+Record layout:
+    [length: u32 BE][crc32: u32 BE][msgpack([sequence, record])]
+
+Refs E6-S4 (result buffering), E6-S5 (reconciliation)
+"""
+
+import logging
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import msgpack
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">II")
+_CHECKPOINT = struct.Struct(">Q")
+_SEGMENT_SUFFIX = ".seg"
+_CHECKPOINT_FILE = "checkpoint"
+
+
+class ResultSegmentLog:
+    """
+    Append-only segment log with checkpointed replay
+
+    Not thread-safe; intended to be driven from a single event loop.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = 8 * 1024 * 1024,
+        fsync_batch_size: int = 32,
+    ):
+        """
+        Open (or create) a segment log
+
+        Args:
+            directory: Directory holding segment and checkpoint files
+            segment_max_bytes: Roll to a new segment after this many bytes
+            fsync_batch_size: Records appended between fsyncs (1 = every record)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync_batch_size = max(1, fsync_batch_size)
+
+        self._checkpoint = self._read_checkpoint()
+        self._segments: List[Tuple[int, Path]] = self._list_segments()
+        self._last_sequence = self._checkpoint
+        self._active = None
+        self._active_size = 0
+        self._unsynced = 0
+
+    @property
+    def checkpoint_sequence(self) -> int:
+        """Highest sequence known to be fully processed"""
+        return self._checkpoint
+
+    @property
+    def last_sequence(self) -> int:
+        """Highest sequence appended (or replayed)"""
+        return self._last_sequence
+
+    def replay(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Read records after the checkpoint
+
+        Must be called once before the first append so sequence numbers
+        continue from the existing log.
+
+        Returns:
+            List of (sequence, record) in append order
+        """
+        records = []
+        for first_sequence, path in self._segments:
+            for sequence, record in self._read_segment(path):
+                self._last_sequence = max(self._last_sequence, sequence)
+                if sequence > self._checkpoint:
+                    records.append((sequence, record))
+
+        if records:
+            logger.info(
+                f"Replayed {len(records)} buffered records from {self.directory} "
+                f"(checkpoint={self._checkpoint})"
+            )
+        return records
+
+    def append(self, record: Dict[str, Any]) -> int:
+        """
+        Append a record
+
+        Args:
+            record: msgpack-serializable mapping
+
+        Returns:
+            Sequence number assigned to the record
+        """
+        sequence = self._last_sequence + 1
+        payload = msgpack.packb([sequence, record], use_bin_type=True)
+        frame = _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+        if self._active is None or self._active_size + len(frame) > self.segment_max_bytes:
+            self._roll(sequence)
+
+        self._active.write(frame)
+        self._active.flush()
+        self._active_size += len(frame)
+        self._last_sequence = sequence
+
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_batch_size:
+            self.sync()
+        return sequence
+
+    def sync(self) -> None:
+        """fsync the active segment"""
+        if self._active is not None and self._unsynced:
+            os.fsync(self._active.fileno())
+        self._unsynced = 0
+
+    def checkpoint(self, sequence: int) -> None:
+        """
+        Record that every sequence up to and including `sequence` is processed
+
+        Persists the checkpoint atomically, then deletes segments whose
+        records are all covered by it.
+
+        Args:
+            sequence: Highest fully processed sequence
+        """
+        if sequence <= self._checkpoint:
+            return
+        self._checkpoint = sequence
+
+        path = self.directory / _CHECKPOINT_FILE
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_CHECKPOINT.pack(sequence))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        self._compact()
+
+    def close(self) -> None:
+        """Sync and close the active segment"""
+        self.sync()
+        if self._active is not None:
+            self._active.close()
+            self._active = None
+
+    def _roll(self, first_sequence: int) -> None:
+        """Close the active segment and start a new one"""
+        self.close()
+        path = self.directory / f"{first_sequence:020d}{_SEGMENT_SUFFIX}"
+        self._active = open(path, "ab")
+        self._active_size = self._active.tell()
+        self._segments.append((first_sequence, path))
+
+    def _compact(self) -> None:
+        """Delete segments whose records are all at or below the checkpoint"""
+        keep = []
+        for index, (first_sequence, path) in enumerate(self._segments):
+            is_last = index == len(self._segments) - 1
+            last_in_segment = (
+                self._last_sequence if is_last else self._segments[index + 1][0] - 1
+            )
+            if last_in_segment <= self._checkpoint:
+                if is_last and self._active is not None:
+                    self.close()
+                path.unlink(missing_ok=True)
+            else:
+                keep.append((first_sequence, path))
+        self._segments = keep
+
+    def _read_segment(self, path: Path) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield records from a segment, truncating a torn tail"""
+        size = path.stat().st_size
+        if size == 0:
+            return
+
+        offset = 0
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            while offset + _HEADER.size <= size:
+                length, crc = _HEADER.unpack_from(mm, offset)
+                start = offset + _HEADER.size
+                end = start + length
+                if end > size:
+                    break
+                payload = mm[start:end]
+                if zlib.crc32(payload) != crc:
+                    break
+                sequence, record = msgpack.unpackb(payload, raw=False)
+                yield sequence, record
+                offset = end
+
+        if offset < size:
+            logger.warning(
+                f"Truncating {size - offset} trailing bytes of torn record in {path.name}"
+            )
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+                os.fsync(f.fileno())
+
+    def _list_segments(self) -> List[Tuple[int, Path]]:
+        segments = []
+        for path in self.directory.glob(f"*{_SEGMENT_SUFFIX}"):
+            try:
+                segments.append((int(path.stem), path))
+            except ValueError:
+                logger.warning(f"Ignoring unexpected file in segment log: {path.name}")
+        return sorted(segments)
+
+    def _read_checkpoint(self) -> int:
+        path = self.directory / _CHECKPOINT_FILE
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return 0
+        if len(data) != _CHECKPOINT.size:
+            logger.warning(f"Ignoring malformed checkpoint file {path}")
+            return 0
+        return _CHECKPOINT.unpack(data)[0]
+
+    def get_stats(self) -> Dict[str, Optional[int]]:
+        """
+        Get log statistics
+
+        Returns:
+            Dictionary with segment count, last sequence, and checkpoint
+        """
+        return {
+            "segments": len(self._segments),
+            "last_sequence": self._last_sequence,
+            "checkpoint_sequence": self._checkpoint,
+        }
@@ -19,7 +19,7 @@ from typing import List, Optional
 from logging.handlers import RotatingFileHandler
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, insert, or_
 
 from backend.models.audit_event import (
     AuditEvent,
@@ -51,6 +51,18 @@ class AuditLogStorage(ABC):
         """
         pass
 
+    def store_many(self, events: List[AuditEvent]) -> None:
+        """
+        Store a batch of audit events.
+
+        Backends that support bulk writes should override this.
+
+        Args:
+            events: AuditEvents to store
+        """
+        for event in events:
+            self.store(event)
+
     @abstractmethod
     def query(self, query: AuditQuery) -> List[AuditEvent]:
         """
@@ -232,6 +244,34 @@ class DatabaseAuditLogStorage(AuditLogStorage):
         self.session.add(db_entry)
         self.session.commit()
 
+    def store_many(self, events: List[AuditEvent]) -> None:
+        """
+        Store a batch of audit events with one multi-row insert.
+
+        Args:
+            events: AuditEvents to store
+        """
+        if not events:
+            return
+
+        self.session.execute(
+            insert(AuditLogEntry),
+            [
+                {
+                    "timestamp": event.timestamp,
+                    "event_type": event.event_type.value,
+                    "peer_id": event.peer_id,
+                    "action": event.action,
+                    "resource": event.resource,
+                    "result": event.result.value,
+                    "reason": event.reason,
+                    "event_metadata": event.metadata,
+                }
+                for event in events
+            ],
+        )
+        self.session.commit()
+
     def query(self, query: AuditQuery) -> List[AuditEvent]:
         """
         Query audit events from database.
@@ -371,6 +411,27 @@ class SecurityAuditLogger:
                 logger.error(f"Failed to store audit event: {e}", exc_info=True)
                 raise
 
+    def log_events(self, events: List[AuditEvent]) -> None:
+        """
+        Log a batch of security audit events.
+
+        Stored with a single storage call (one insert for database storage).
+
+        Args:
+            events: AuditEvents to log
+        """
+        if not events:
+            return
+
+        with self._lock:
+            try:
+                self.storage.store_many(events)
+                logger.info(f"Audit: stored {len(events)} events in batch")
+
+            except Exception as e:
+                logger.error(f"Failed to store audit event batch: {e}", exc_info=True)
+                raise
+
     def query_events(self, query: AuditQuery) -> List[AuditEvent]:
         """
         Query audit events based on filter criteria.
@@ -17,9 +17,13 @@ Enhanced with SwarmLoadBalancer integration (Issue #113):
 - Performance-based decision making
 - Adaptive load balancing
 
+Batch mode (assign_tasks_batch) drains a backlog with one task query, one
+global matching pass, and a single transaction for all lease rows.
+
 Refs #35 (E5-S9: Task Assignment Orchestrator), #113 (Load Balancer Migration)
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any, Optional
@@ -460,6 +464,231 @@ class TaskAssignmentOrchestrator:
             logger.error(f"Failed to revoke lease {lease_token}: {e}")
 
 
+    async def assign_tasks_batch(
+        self,
+        task_ids: List[str],
+        available_nodes: List[Dict[str, Any]],
+    ) -> List[AssignmentResult]:
+        """
+        Orchestrate assignment for a batch of queued tasks
+
+        Steps:
+        1. Load all tasks in one query and keep the QUEUED ones
+        2. Match the whole batch at once (SwarmLoadBalancer.assign_tasks_batch)
+        3. Issue leases via DBOS concurrently
+        4. Persist every lease and LEASED status in a single transaction
+        5. Send TaskRequests via libp2p concurrently
+        6. Revoke and requeue undeliverable tasks in a single transaction
+        7. Release the load balancer reservation of every matched task that
+           was not assigned
+
+        Unlike assign_task, failures are reported per task in the results
+        instead of raised, so one unreachable peer cannot abort the batch.
+        Duplicate task IDs are assigned once.
+
+        Args:
+            task_ids: Task identifiers to assign
+            available_nodes: List of available nodes with capabilities
+
+        Returns:
+            AssignmentResult per unique task, in first-seen task_ids order
+        """
+        assignment_timestamp = datetime.now(timezone.utc)
+        # One lease per task: drop repeated IDs before matching
+        unique_ids: Dict[str, str] = {}
+        for task_id in task_ids:
+            unique_ids.setdefault(str(task_id), task_id)
+        task_ids = list(unique_ids.values())
+        logger.info(f"Starting batch assignment for {len(task_ids)} tasks")
+
+        results: Dict[str, AssignmentResult] = {}
+
+        def fail(task_id: str, status: AssignmentStatus, error_message: str):
+            results[str(task_id)] = AssignmentResult(
+                status=status,
+                task_id=str(task_id),
+                error_message=error_message,
+            )
+
+        # Step 1: Load and validate tasks
+        tasks_by_id = {
+            str(task.id): task
+            for task in self.db_session.query(Task).filter(Task.id.in_(task_ids)).all()
+        }
+        queued_tasks = []
+        for task_id in task_ids:
+            task = tasks_by_id.get(str(task_id))
+            if task is None:
+                fail(task_id, AssignmentStatus.FAILED, f"Task {task_id} not found")
+            elif task.status != TaskStatus.QUEUED:
+                fail(
+                    task_id,
+                    AssignmentStatus.FAILED,
+                    f"Task {task_id} is not in QUEUED status (current: {task.status})",
+                )
+            else:
+                queued_tasks.append(task)
+
+        # Step 2: Match the batch
+        await self.load_balancer.initialize_agent_metrics(available_nodes)
+        selections = await self.load_balancer.assign_tasks_batch(queued_tasks, available_nodes)
+
+        matched = []
+        for task, selection in zip(queued_tasks, selections):
+            if selection is None:
+                fail(
+                    str(task.id),
+                    AssignmentStatus.NO_CAPABLE_NODES,
+                    f"No capable/available nodes found for task {task.id} "
+                    f"with requirements: {task.required_capabilities or {}}",
+                )
+            else:
+                matched.append((task, selection.peer_id))
+
+        # Step 3: Issue leases via DBOS
+        lease_responses = await asyncio.gather(
+            *(
+                self.dbos_service.issue_task_lease(
+                    task_id=str(task.id),
+                    peer_id=peer_id,
+                    duration_minutes=self.lease_duration_minutes,
+                )
+                for task, peer_id in matched
+            ),
+            return_exceptions=True,
+        )
+
+        leased = []
+        for (task, peer_id), lease_data in zip(matched, lease_responses):
+            if isinstance(lease_data, Exception):
+                logger.error(f"DBOS lease issuance failed for task {task.id}: {lease_data}")
+                fail(
+                    str(task.id),
+                    AssignmentStatus.LEASE_ISSUANCE_FAILED,
+                    f"Failed to issue lease: {lease_data}",
+                )
+            else:
+                leased.append((task, peer_id, lease_data["token"], lease_data["expires_at"]))
+
+        # Step 4: Persist all leases in one transaction
+        task_leases = {}
+        for task, peer_id, lease_token, expires_at in leased:
+            task_leases[str(task.id)] = TaskLease(
+                task_id=task.id,
+                peer_id=peer_id,
+                lease_token=lease_token,
+                expires_at=expires_at,
+                lease_duration_seconds=self.lease_duration_minutes * 60,
+            )
+            task.status = TaskStatus.LEASED
+            task.assigned_peer_id = peer_id
+
+        try:
+            self.db_session.add_all(task_leases.values())
+            self.db_session.commit()
+        except Exception as e:
+            self.db_session.rollback()
+            logger.error(f"Failed to persist batch leases: {e}")
+            await asyncio.gather(
+                *(
+                    self.dbos_service.revoke_task_lease(
+                        lease_token=lease_token,
+                        reason=f"Batch lease persistence failed: {e}",
+                    )
+                    for _, _, lease_token, _ in leased
+                ),
+                return_exceptions=True,
+            )
+            for task, _, _, _ in leased:
+                fail(
+                    str(task.id),
+                    AssignmentStatus.LEASE_ISSUANCE_FAILED,
+                    f"Failed to persist lease: {e}",
+                )
+            leased = []
+
+        # Step 5: Send TaskRequests via libp2p
+        responses = await asyncio.gather(
+            *(
+                self.libp2p_client.send_task_request(
+                    peer_id=peer_id,
+                    task_id=str(task.id),
+                    lease_token=lease_token,
+                    payload=task.payload,
+                )
+                for task, peer_id, lease_token, _ in leased
+            ),
+            return_exceptions=True,
+        )
+
+        unreachable = []
+        for (task, peer_id, lease_token, _), response in zip(leased, responses):
+            if isinstance(response, Exception):
+                logger.error(f"libp2p task request failed for task {task.id}: {response}")
+                unreachable.append((task, peer_id, lease_token, response))
+                continue
+
+            results[str(task.id)] = AssignmentResult(
+                status=AssignmentStatus.SUCCESS,
+                task_id=str(task.id),
+                assigned_peer_id=peer_id,
+                lease_token=lease_token,
+                assignment_timestamp=assignment_timestamp,
+                libp2p_message_id=response.get("message_id"),
+            )
+
+        # Step 6: Roll back undeliverable tasks together
+        if unreachable:
+            await asyncio.gather(
+                *(
+                    self.dbos_service.revoke_task_lease(
+                        lease_token=lease_token,
+                        reason=f"Peer unreachable: {error}",
+                    )
+                    for _, _, lease_token, error in unreachable
+                ),
+                return_exceptions=True,
+            )
+
+            revoked_at = datetime.now(timezone.utc)
+            for task, peer_id, _, error in unreachable:
+                lease = task_leases[str(task.id)]
+                lease.is_revoked = 1
+                lease.revoked_at = revoked_at
+                task.status = TaskStatus.QUEUED
+                task.assigned_peer_id = None
+                fail(
+                    str(task.id),
+                    AssignmentStatus.PEER_UNREACHABLE,
+                    f"Peer {peer_id} unreachable: {error}",
+                )
+
+            try:
+                self.db_session.commit()
+            except Exception as e:
+                self.db_session.rollback()
+                # DBOS leases are already revoked; the stale rows expire
+                # through normal lease expiry
+                logger.error(
+                    f"Failed to requeue {len(unreachable)} undeliverable tasks: {e}"
+                )
+                for task, peer_id, _, error in unreachable:
+                    fail(
+                        str(task.id),
+                        AssignmentStatus.PEER_UNREACHABLE,
+                        f"Peer {peer_id} unreachable: {error}; requeue failed: {e}",
+                    )
+
+        # Step 7: Free the agent slots reserved for tasks that did not land
+        for task, _ in matched:
+            if not results[str(task.id)].is_successful():
+                self.load_balancer.release_assignment(str(task.id))
+
+        succeeded = sum(1 for result in results.values() if result.is_successful())
+        logger.info(f"Batch assignment complete: {succeeded}/{len(task_ids)} tasks assigned")
+
+        return [results[str(task_id)] for task_id in task_ids]
+
     async def get_assignment_status(self, task_id: str) -> Dict[str, Any]:
         """
         Get current assignment status for a task
@@ -11,7 +11,7 @@ import os
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
-from uuid import UUID
+from uuid import UUID, uuid4
 import jwt
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
@@ -70,15 +70,40 @@ class TaskLeaseIssuanceService:
         "high": 15
     }
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        lease_expiration_service: Optional[Any] = None
+    ):
         """
         Initialize task lease issuance service
 
         Args:
             db: Database session
+            lease_expiration_service: Optional LeaseExpirationService whose
+                deadline heap is updated on issue/revoke. Defaults to the
+                global instance once it has been created.
         """
         self.db = db
         self._secret_key = None
+        self._lease_expiration_service = lease_expiration_service
+
+    def _get_expiration_scheduler(self) -> Optional[Any]:
+        """
+        Resolve the lease expiration scheduler to notify
+
+        Returns:
+            LeaseExpirationService instance or None if none is running
+        """
+        if self._lease_expiration_service is not None:
+            return self._lease_expiration_service
+
+        # Only notify the global scheduler if it already exists; issuing a
+        # lease must never spin up a new database session as a side effect
+        from backend.services.lease_expiration_service import (
+            get_running_lease_expiration_service,
+        )
+        return get_running_lease_expiration_service()
 
     async def issue_lease(
         self,
@@ -124,9 +149,12 @@ class TaskLeaseIssuanceService:
         # 6. Create TaskLease record
         task_lease = TaskLease()
         task_lease.task_id = task.id
-        task_lease.owner_peer_id = lease_request.peer_id
-        task_lease.token = lease_token
+        task_lease.peer_id = lease_request.peer_id
+        task_lease.lease_token = lease_token
         task_lease.expires_at = expires_at
+        task_lease.lease_duration_seconds = int(
+            (expires_at - issued_at).total_seconds()
+        )
 
         # 7. Update task status to LEASED
         task.status = TaskStatus.LEASED
@@ -153,7 +181,12 @@ class TaskLeaseIssuanceService:
             logger.error(f"Failed to create lease: {e}")
             raise LeaseIssuanceError(f"Failed to create lease: {e}")
 
-        # 9. Return lease response
+        # 9. Register the deadline with the expiration scheduler
+        scheduler = self._get_expiration_scheduler()
+        if scheduler is not None:
+            scheduler.schedule_lease(task_lease.id, task.id, expires_at)
+
+        # 10. Return lease response
         return TaskLeaseResponse(
             lease_id=task_lease.id if hasattr(task_lease, 'id') else uuid4(),
             task_id=task.id,
@@ -425,8 +458,11 @@ class TaskLeaseIssuanceService:
         if not lease:
             raise LeaseIssuanceError(f"Lease {lease_id} not found")
 
-        # Mark lease as expired by setting expires_at to now
-        lease.expires_at = datetime.now(timezone.utc)
+        # Mark lease as revoked and expire it immediately
+        revoked_at = datetime.now(timezone.utc)
+        lease.is_revoked = 1
+        lease.revoked_at = revoked_at
+        lease.expires_at = revoked_at
 
         # Update task status back to QUEUED
         task = self.db.query(Task).filter(Task.id == lease.task_id).first()
@@ -435,6 +471,11 @@ class TaskLeaseIssuanceService:
 
         self.db.commit()
 
+        # Revoked leases no longer need an expiry deadline
+        scheduler = self._get_expiration_scheduler()
+        if scheduler is not None:
+            scheduler.cancel_lease(lease.id)
+
         logger.info(
             f"Lease revoked: {lease_id}, reason: {reason}",
             extra={"lease_id": str(lease_id), "reason": reason}
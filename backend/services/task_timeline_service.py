@@ -4,18 +4,27 @@ Task Timeline Service
 In-memory timeline event service for tracking task state transitions,
 lease events, failures, and recoveries across the agent swarm.
 
-Uses a bounded deque for event storage, matching the pattern from
-node_crash_detection_service (crash_history) and
-dbos_partition_detection_service (partition_events).
+Storage:
+- Compact __slots__ records kept in (timestamp, sequence) order, so
+  time-range queries are bisects and results never need sorting
+- Secondary indexes per task, per peer and per event type, maintained
+  incrementally on record
+- Bounded capacity (oldest events evicted first), configurable into the
+  millions
+- Optional spill-to-disk JSONL segments replayed on startup so history
+  survives restarts
 
 Epic E8-S3: Task Execution Timeline
 Refs: #51
 """
 
+import json
 import logging
+import os
+import sys
 import threading
-from collections import deque
-from datetime import datetime, timezone
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -27,6 +36,9 @@ logger = logging.getLogger(__name__)
 _timeline_service_instance: Optional["TaskTimelineService"] = None
 _singleton_lock = threading.Lock()
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
 
 class TimelineEventType(str, Enum):
     """Task timeline event types"""
@@ -67,12 +79,90 @@ class TimelineEvent(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+def _to_micros(timestamp: datetime) -> int:
+    """Convert a datetime to integer microseconds since the epoch (naive = UTC)."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+class _TimelineRecord:
+    """Compact stored form of a timeline event."""
+
+    __slots__ = ("sort_key", "event_type", "task_id", "peer_id", "timestamp", "metadata")
+
+    def __init__(
+        self,
+        sort_key: Tuple[int, int],
+        event_type: TimelineEventType,
+        task_id: Optional[str],
+        peer_id: Optional[str],
+        timestamp: datetime,
+        metadata: Dict[str, Any],
+    ) -> None:
+        self.sort_key = sort_key
+        self.event_type = event_type
+        self.task_id = task_id
+        self.peer_id = peer_id
+        self.timestamp = timestamp
+        self.metadata = metadata
+
+    def to_event(self) -> TimelineEvent:
+        """Materialize the API model (fields are already validated)."""
+        return TimelineEvent.model_construct(
+            event_type=self.event_type,
+            task_id=self.task_id,
+            peer_id=self.peer_id,
+            timestamp=self.timestamp,
+            metadata=self.metadata,
+        )
+
+
+def _sort_key(record: _TimelineRecord) -> Tuple[int, int]:
+    return record.sort_key
+
+
+class _TimeOrderedList:
+    """
+    Records sorted by (timestamp, sequence) with a lazily trimmed prefix.
+
+    Eviction always removes the globally oldest records, so evicted
+    entries of any list form a prefix of it. They are skipped via
+    `start` and physically dropped once they make up half the list.
+    """
+
+    __slots__ = ("records", "start")
+
+    def __init__(self) -> None:
+        self.records: List[_TimelineRecord] = []
+        self.start = 0
+
+    def add(self, record: _TimelineRecord) -> None:
+        records = self.records
+        if not records or records[-1].sort_key <= record.sort_key:
+            records.append(record)
+        else:
+            insort(records, record, lo=self.start, key=_sort_key)
+
+    def trim(self, watermark: Tuple[int, int]) -> None:
+        """Skip entries ordered before the oldest live record."""
+        if self.start < len(self.records) and self.records[self.start].sort_key < watermark:
+            self.start = bisect_left(self.records, watermark, lo=self.start, key=_sort_key)
+        if self.start > 64 and self.start * 2 > len(self.records):
+            del self.records[:self.start]
+            self.start = 0
+
+    def __len__(self) -> int:
+        return len(self.records) - self.start
+
+
 class TaskTimelineService:
     """
     Task Timeline Service
 
-    Records and queries task execution timeline events using an
-    in-memory bounded deque. Thread-safe via threading.Lock.
+    Records and queries task execution timeline events using in-memory
+    time-ordered storage with per-task, per-peer and per-event-type
+    indexes. Thread-safe via threading.Lock.
 
     Usage:
         service = get_timeline_service()
@@ -80,9 +170,36 @@ class TaskTimelineService:
         events, total = service.query_events(task_id="task-1")
     """
 
-    def __init__(self, max_events: int = 10000) -> None:
-        self._events: deque = deque(maxlen=max_events)
+    def __init__(
+        self,
+        max_events: int = 10000,
+        spill_dir: Optional[str] = None,
+        segment_max_events: int = 10000,
+    ) -> None:
+        """
+        Args:
+            max_events: Maximum events kept (oldest evicted first)
+            spill_dir: Directory for JSONL segment files; when set, every
+                event is appended to disk and replayed on startup
+            segment_max_events: Events per segment file before rotating
+        """
+        self.max_events = max_events
         self._lock = threading.Lock()
+        self._seq = 0
+        self._live = 0
+
+        self._all = _TimeOrderedList()
+        self._by_task: Dict[str, _TimeOrderedList] = {}
+        self._by_peer: Dict[str, _TimeOrderedList] = {}
+        self._by_type: Dict[TimelineEventType, _TimeOrderedList] = {}
+
+        self._spill_dir = spill_dir
+        self._segment_max_events = max(1, segment_max_events)
+        self._segment_file = None
+        self._segment_count = 0
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+            self._replay_segments()
 
     def record_event(
         self,
@@ -115,10 +232,67 @@ class TaskTimelineService:
             event.timestamp = timestamp
 
         with self._lock:
-            self._events.append(event)
+            self._insert(event.event_type, event.task_id, event.peer_id,
+                         event.timestamp, event.metadata)
+            if self._spill_dir is not None:
+                self._spill(event)
 
         return event
 
+    def _insert(
+        self,
+        event_type: TimelineEventType,
+        task_id: Optional[str],
+        peer_id: Optional[str],
+        timestamp: datetime,
+        metadata: Dict[str, Any],
+    ) -> None:
+        """Store a record in the time-ordered list and indexes (lock held)."""
+        self._seq += 1
+        record = _TimelineRecord(
+            (_to_micros(timestamp), self._seq),
+            event_type, task_id, peer_id, timestamp, metadata,
+        )
+
+        self._all.add(record)
+        if task_id is not None:
+            self._by_task.setdefault(task_id, _TimeOrderedList()).add(record)
+        if peer_id is not None:
+            self._by_peer.setdefault(peer_id, _TimeOrderedList()).add(record)
+        self._by_type.setdefault(event_type, _TimeOrderedList()).add(record)
+        self._live += 1
+
+        if self._live > self.max_events:
+            self._evict(self._live - self.max_events)
+
+    def _evict(self, count: int) -> None:
+        """Evict the oldest records and trim their index entries (lock held)."""
+        all_list = self._all
+        evicted = all_list.records[all_list.start:all_list.start + count]
+        all_list.start += len(evicted)
+        self._live -= len(evicted)
+        watermark = (
+            all_list.records[all_list.start].sort_key
+            if all_list.start < len(all_list.records)
+            else (sys.maxsize, sys.maxsize)
+        )
+        all_list.trim(watermark)
+
+        for record in evicted:
+            for index, key in (
+                (self._by_task, record.task_id),
+                (self._by_peer, record.peer_id),
+                (self._by_type, record.event_type),
+            ):
+                if key is None:
+                    continue
+                entries = index.get(key)
+                if entries is None:
+                    continue
+                entries.trim(watermark)
+                if not len(entries):
+                    del index[key]
+
     def query_events(
         self,
         task_id: Optional[str] = None,
@@ -132,6 +306,10 @@ class TaskTimelineService:
         """
         Query timeline events with AND-filter logic.
 
+        The smallest matching index is range-limited by bisecting on
+        since/until; with at most one of task_id/peer_id/event_type the
+        total is the range length and only the requested page is touched.
+
         Args:
             task_id: Filter by task ID
             peer_id: Filter by peer ID
@@ -143,48 +321,151 @@ class TaskTimelineService:
 
         Returns:
             Tuple of (paginated_events, total_count) where total_count
-            is the count before limit/offset are applied.
+            is the count before limit/offset are applied. Events are
+            sorted newest-first.
         """
         with self._lock:
-            all_events = list(self._events)
-
-        # Filter
-        filtered = all_events
-        if task_id is not None:
-            filtered = [e for e in filtered if e.task_id == task_id]
-        if peer_id is not None:
-            filtered = [e for e in filtered if e.peer_id == peer_id]
-        if event_type is not None:
-            filtered = [e for e in filtered if e.event_type == event_type]
-        if since is not None:
-            filtered = [e for e in filtered if e.timestamp >= since]
-        if until is not None:
-            filtered = [e for e in filtered if e.timestamp <= until]
-
-        # Sort newest-first
-        filtered.sort(key=lambda e: e.timestamp, reverse=True)
-
-        total_count = len(filtered)
-
-        # Paginate
-        paginated = filtered[offset:offset + limit]
-
-        return paginated, total_count
+            # (index, predicate) per requested filter
+            candidates: List[Tuple[Optional[_TimeOrderedList], Any]] = [(self._all, None)]
+            if task_id is not None:
+                candidates.append((self._by_task.get(task_id), lambda r: r.task_id == task_id))
+            if peer_id is not None:
+                candidates.append((self._by_peer.get(peer_id), lambda r: r.peer_id == peer_id))
+            if event_type is not None:
+                candidates.append((self._by_type.get(event_type), lambda r: r.event_type == event_type))
+            if any(index is None for index, _ in candidates):
+                return [], 0
+
+            source, source_predicate = min(candidates, key=lambda c: len(c[0]))
+            filters = [
+                predicate for _, predicate in candidates
+                if predicate is not None and predicate is not source_predicate
+            ]
+            records = source.records
+
+            lo = source.start
+            hi = len(records)
+            if since is not None:
+                lo = bisect_left(records, (_to_micros(since), -1), lo=lo, hi=hi, key=_sort_key)
+            if until is not None:
+                hi = bisect_right(records, (_to_micros(until), sys.maxsize), lo=lo, hi=hi, key=_sort_key)
+
+            if not filters:
+                # Newest-first page straight from the range
+                total_count = max(0, hi - lo)
+                stop = hi - offset
+                start = max(lo, stop - limit)
+                page = records[start:stop][::-1] if stop > lo else []
+            else:
+                total_count = 0
+                page = []
+                for i in range(hi - 1, lo - 1, -1):
+                    record = records[i]
+                    if all(f(record) for f in filters):
+                        if offset <= total_count < offset + limit:
+                            page.append(record)
+                        total_count += 1
+
+        return [record.to_event() for record in page], total_count
 
     def get_event_count(self) -> int:
         """
         Get current number of events in the timeline.
 
         Returns:
-            Current deque size
+            Number of stored events
         """
         with self._lock:
-            return len(self._events)
+            return self._live
 
     def clear(self) -> None:
         """Clear all events from the timeline (for test isolation)."""
         with self._lock:
-            self._events.clear()
+            self._all = _TimeOrderedList()
+            self._by_task.clear()
+            self._by_peer.clear()
+            self._by_type.clear()
+            self._live = 0
+            if self._spill_dir is not None:
+                self._close_segment()
+                for name in self._segment_names():
+                    os.remove(os.path.join(self._spill_dir, name))
+
+    def close(self) -> None:
+        """Close the open spill segment, if any."""
+        with self._lock:
+            self._close_segment()
+
+    # ── Spill-to-disk segments ──
+
+    def _segment_names(self) -> List[str]:
+        """Segment file names, oldest first."""
+        return sorted(
+            name for name in os.listdir(self._spill_dir)
+            if name.startswith("timeline-") and name.endswith(".jsonl")
+        )
+
+    def _spill(self, event: TimelineEvent) -> None:
+        """Append an event to the current segment (lock held)."""
+        if self._segment_file is None or self._segment_count >= self._segment_max_events:
+            self._rotate_segment()
+
+        line = json.dumps({
+            "event_type": event.event_type.value,
+            "task_id": event.task_id,
+            "peer_id": event.peer_id,
+            "timestamp": event.timestamp.isoformat(),
+            "metadata": event.metadata,
+        }, default=str)
+        self._segment_file.write(line + "\n")
+        self._segment_file.flush()
+        self._segment_count += 1
+
+    def _rotate_segment(self) -> None:
+        """Start a new segment and drop segments beyond capacity (lock held)."""
+        self._close_segment()
+
+        names = self._segment_names()
+        next_index = int(names[-1][len("timeline-"):-len(".jsonl")]) + 1 if names else 0
+
+        # Keep enough closed segments to refill max_events on replay
+        keep = -(-self.max_events // self._segment_max_events)
+        for name in names[:max(0, len(names) - keep)]:
+            os.remove(os.path.join(self._spill_dir, name))
+
+        path = os.path.join(self._spill_dir, f"timeline-{next_index:010d}.jsonl")
+        self._segment_file = open(path, "a", encoding="utf-8")
+        self._segment_count = 0
+
+    def _close_segment(self) -> None:
+        if self._segment_file is not None:
+            self._segment_file.close()
+            self._segment_file = None
+
+    def _replay_segments(self) -> None:
+        """Rebuild the in-memory timeline from segment files."""
+        replayed = 0
+        for name in self._segment_names():
+            path = os.path.join(self._spill_dir, name)
+            with open(path, encoding="utf-8") as segment:
+                for line in segment:
+                    try:
+                        data = json.loads(line)
+                        timestamp = datetime.fromisoformat(data["timestamp"])
+                        self._insert(
+                            TimelineEventType(data["event_type"]),
+                            data.get("task_id"),
+                            data.get("peer_id"),
+                            timestamp,
+                            data.get("metadata") or {},
+                        )
+                        replayed += 1
+                    except (ValueError, KeyError, TypeError) as e:
+                        # Torn last line after a crash
+                        logger.warning(f"Skipping unreadable timeline record in {name}: {e}")
+
+        if replayed:
+            logger.info(f"Replayed {replayed} timeline events from {self._spill_dir}")
 
 
 def get_timeline_service() -> TaskTimelineService:
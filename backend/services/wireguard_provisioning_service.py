@@ -100,7 +100,8 @@ class WireGuardProvisioningService:
         hub_endpoint: str = "hub.example.com:51820",
         hub_ip: str = "10.0.0.1",
         config_path: str = os.getenv("WIREGUARD_CONFIG_PATH", os.path.expanduser("~/.wireguard/wg0.conf")),
-        enable_dbos: bool = False
+        enable_dbos: bool = False,
+        ip_pool_state_dir: Optional[str] = None
     ):
         """
         Initialize provisioning service
@@ -112,11 +113,14 @@ class WireGuardProvisioningService:
             hub_ip: Hub's IP address (reserved)
             config_path: Path to WireGuard config file
             enable_dbos: Enable DBOS persistence (if available)
+            ip_pool_state_dir: Directory for IP pool snapshot/journal, so
+                allocations survive restarts (None = in-memory only)
         """
         # Initialize IP pool (reserve hub IP)
         self.ip_pool = IPPoolManager(
             network=ip_pool_network,
-            reserved_ips=[hub_ip]
+            reserved_ips=[hub_ip],
+            state_dir=ip_pool_state_dir
         )
 
         # Initialize config manager
@@ -205,12 +209,15 @@ class WireGuardProvisioningService:
                     "node_id and wireguard_public_key are required"
                 )
 
-            # 3. Allocate IP address
-            try:
-                assigned_ip = self.ip_pool.allocate_ip(peer_id=node_id)
-            except Exception as e:
-                logger.error(f"Failed to allocate IP for {node_id}: {e}")
-                raise
+            # 3. Allocate IP address (reuse one restored from the pool state)
+            assigned_ip = self.ip_pool.get_allocated_ip(node_id)
+            allocated_now = assigned_ip is None
+            if allocated_now:
+                try:
+                    assigned_ip = self.ip_pool.allocate_ip(peer_id=node_id)
+                except Exception as e:
+                    logger.error(f"Failed to allocate IP for {node_id}: {e}")
+                    raise
 
             # 4. Update hub WireGuard configuration
             try:
@@ -221,7 +228,8 @@ class WireGuardProvisioningService:
                 )
             except Exception as e:
                 # Rollback IP allocation
-                self.ip_pool.deallocate_ip(peer_id=node_id)
+                if allocated_now:
+                    self.ip_pool.deallocate_ip(peer_id=node_id)
                 logger.error(f"Failed to update hub config for {node_id}: {e}")
                 raise ProvisioningError(
                     f"Failed to update hub configuration: {e}"
@@ -7,26 +7,187 @@ Replaces Redis infrastructure with no additional server overhead.
 Features:
 - TTL-based expiration
 - Auto-cleanup of expired entries
-- Atomic counter operations for rate limiting
+- Atomic counter operations for rate limiting (sharded, batched)
 - Cache statistics (hit/miss tracking)
+- Optional in-process L1 tier (LRU, TTL-aware, negative caching)
+- Single-flight remote reads per key
+- Sets written as coalesced upserts (one bulk_upsert per burst)
 
 Architecture:
 - Uses ZeroDB project: 'openclaw-backend'
 - Uses ZeroDB table: 'openclaw_cache'
 - Schema: { key: str, value: str, expires_at: int, created_at: int, counter: int }
 - MongoDB-style queries for efficient filtering
+- L1: bounded OrderedDict in front of the ZeroDB table (L2), written
+  through on set/delete; entries live at most l1_ttl seconds so other
+  processes' writes become visible within that bound
+- Counters: each service instance owns one shard row per counter
+  ({ key: "<counter>#shard:<id>", counter_key, shard_id, counter }).
+  Increments are applied in memory and shard values are written with
+  bulk_upsert; a counter's value is the sum of its shards. Since every
+  shard has a single writer, concurrent increments are never lost.
+  The shard id is unique per instance (ZERODB_CACHE_SHARD_ID, else
+  "<hostname>-<pid>-<random>"), so workers sharing a host never
+  overwrite each other's shard. A row keyed by the counter itself (pre-sharding
+  counters, set(), compacted shards) still counts toward the sum and
+  lends its TTL to new shards
+- Orphaned shards: shards left by exited processes are folded into the
+  counter's base row by compact_counter_shards once they have not been
+  written for longer than the compaction idle time. Live instances drop
+  local counter state after counter_idle_seconds without increments and
+  reload it on next use, so a compacted shard is never rewritten
 """
 
 import asyncio
 import logging
 import os
+import socket
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from backend.integrations.zerodb_client import ZeroDBClient
 
 logger = logging.getLogger(__name__)
 
 
+class L1Cache:
+    """
+    Bounded in-process LRU cache tier.
+
+    Stores values and negative entries (known misses) with a deadline
+    that never outlives the remote entry's expires_at.
+    """
+
+    _NEGATIVE = object()
+
+    def __init__(self, max_size: int, ttl: float, negative_ttl: float):
+        """
+        Initialize L1 tier.
+
+        Args:
+            max_size: Maximum number of entries before LRU eviction
+            ttl: Maximum lifetime of a cached value (seconds)
+            negative_ttl: Lifetime of a cached miss (seconds)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    def get(self, key: str) -> Tuple[bool, Optional[str]]:
+        """
+        Look up a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (found, value) - value is None for a cached miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        value, deadline = entry
+        if deadline <= time.monotonic():
+            del self._entries[key]
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, (None if value is self._NEGATIVE else value)
+
+    def put(self, key: str, value: str, expires_at: Optional[int] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Cached value
+            expires_at: Remote expiration (epoch seconds), caps the L1 lifetime
+        """
+        lifetime = self.ttl
+        if expires_at is not None:
+            lifetime = min(lifetime, expires_at - time.time())
+        if lifetime <= 0:
+            self._entries.pop(key, None)
+            return
+        self._store(key, value, lifetime)
+
+    def put_negative(self, key: str) -> None:
+        """
+        Remember that a key does not exist.
+
+        Args:
+            key: Cache key
+        """
+        if self.negative_ttl <= 0:
+            self._entries.pop(key, None)
+            return
+        self._store(key, self._NEGATIVE, self.negative_ttl)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop a key.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: str, value: Any, lifetime: float) -> None:
+        self._entries[key] = (value, time.monotonic() + lifetime)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+@dataclass
+class CounterState:
+    """Local state of one counter held by this instance."""
+    expires_at: Optional[int] = None
+    own: int = 0
+    others: int = 0
+    others_loaded: bool = False
+    version: int = 0
+    flushed_version: int = 0
+    loaded: Optional[asyncio.Future] = None
+    # time.monotonic() of the last local increment
+    touched_at: float = 0.0
+
+    def apply_totals(self, totals: "CounterTotals") -> None:
+        """Take other instances' total, and the base row's TTL for plain counters"""
+        if not self.others_loaded:
+            # Resume the shard persisted by an earlier run of this instance
+            self.own += totals.own
+        self.others = totals.others
+        self.others_loaded = True
+        if self.expires_at is None:
+            self.expires_at = totals.expires_at
+
+
+@dataclass
+class CounterTotals:
+    """Counter sums read from ZeroDB."""
+    # This instance's persisted shard
+    own: int = 0
+    others: int = 0
+    total: int = 0
+    # TTL of the row keyed by the counter itself, if any
+    expires_at: Optional[int] = None
+
+
 class ZeroDBCacheService:
     """
     Serverless cache service using ZeroDB NoSQL tables.
@@ -38,30 +199,78 @@ class ZeroDBCacheService:
     - atomic increment for rate limiting
     - automatic expiration cleanup
     - cache statistics
+    - optional in-process L1 tier with single-flight remote reads
+    - sharded counters with batched flushes and window helpers
     """
 
     PROJECT_NAME = "openclaw-backend"
     TABLE_NAME = "openclaw_cache"
-
-    def __init__(self, zerodb_client: Optional[ZeroDBClient] = None, project_id: Optional[str] = None):
+    COUNTER_QUERY_PAGE_SIZE = 1000
+
+    def __init__(
+        self,
+        zerodb_client: Optional[ZeroDBClient] = None,
+        project_id: Optional[str] = None,
+        l1_max_size: int = 0,
+        l1_ttl: float = 5.0,
+        l1_negative_ttl: float = 1.0,
+        counter_flush_interval: float = 1.0,
+        shard_id: Optional[str] = None,
+        counter_idle_seconds: float = 300.0
+    ):
         """
         Initialize cache service.
 
         Args:
             zerodb_client: Optional ZeroDB client (creates default if None)
             project_id: Optional ZeroDB project ID (defaults to ZERODB_PROJECT_ID env var)
+            l1_max_size: Maximum entries in the in-process L1 tier (0 disables it)
+            l1_ttl: Maximum time a value is served from L1 (seconds)
+            l1_negative_ttl: Time a miss is served from L1 (seconds)
+            counter_flush_interval: Delay before local counter increments are
+                written to ZeroDB (seconds)
+            shard_id: Counter shard owned by this instance (defaults to the
+                ZERODB_CACHE_SHARD_ID env var, then "<hostname>-<pid>-<random>";
+                an explicit id must be unique per process)
+            counter_idle_seconds: Time after the last increment before local
+                counter state is dropped and reloaded on next use; must stay
+                below the idle time passed to compact_counter_shards
         """
         self.client = zerodb_client or ZeroDBClient()
         self.project_id = project_id or os.getenv("ZERODB_PROJECT_ID")
         self._initialized = False
+        self._l1: Optional[L1Cache] = (
+            L1Cache(l1_max_size, l1_ttl, l1_negative_ttl) if l1_max_size > 0 else None
+        )
+        # In-flight remote reads per key (single-flight)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Counters: this instance only ever writes its own shard row
+        self.shard_id = (
+            shard_id
+            or os.getenv("ZERODB_CACHE_SHARD_ID")
+            or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        )
+        self.counter_flush_interval = counter_flush_interval
+        self.counter_idle_seconds = counter_idle_seconds
+        self._counters: Dict[str, CounterState] = {}
+        self._counter_flush_task: Optional[asyncio.Task] = None
         self._stats = {
             "hits": 0,
             "misses": 0,
             "sets": 0,
             "deletes": 0,
-            "increments": 0
+            "increments": 0,
+            "l1_hits": 0,
+            "l1_misses": 0,
+            "l2_hits": 0,
+            "l2_misses": 0,
+            "coalesced": 0,
+            "counter_flushes": 0
         }
-        logger.info(f"ZeroDBCacheService initialized with table '{self.TABLE_NAME}'")
+        logger.info(
+            f"ZeroDBCacheService initialized with table '{self.TABLE_NAME}' "
+            f"(L1 size={l1_max_size})"
+        )
 
     async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
         """
@@ -86,27 +295,24 @@ class ZeroDBCacheService:
             "counter": 0
         }
 
-        # Upsert: insert or update if key exists
+        # Upsert by key; concurrent sets are coalesced into one bulk_upsert
         try:
-            # First try to update existing row
-            result = await self.client.update_rows(
+            await self.client.upsert_row_batched(
                 table_name=self.TABLE_NAME,
-                filter_query={"key": {"$eq": key}},
-                update_data=row,
+                row=row,
+                unique_key="key",
                 project_id=self.project_id
             )
-
-            # If no rows updated, insert new row
-            if result.get("updated_count", 0) == 0:
-                await self.client.insert_rows(
-                    table_name=self.TABLE_NAME,
-                    rows=[row],
-                    project_id=self.project_id
-                )
         except Exception as e:
             logger.error(f"Error setting cache key '{key}': {e}")
+            self._invalidate_local(key)
             raise
 
+        # Write-through to L1; reads already in flight must not overwrite it
+        self._inflight.pop(key, None)
+        if self._l1 is not None:
+            self._l1.put(key, value, expires_at)
+
         self._stats["sets"] += 1
         logger.debug(f"Set cache key '{key}' with TTL={ttl}s")
 
@@ -114,12 +320,61 @@ class ZeroDBCacheService:
         """
         Get cache value if exists and not expired.
 
+        Served from the L1 tier when enabled; otherwise concurrent misses
+        for the same key share one remote query.
+
         Args:
             key: Cache key
 
         Returns:
             Cached value or None if not found/expired
         """
+        if self._l1 is not None:
+            found, value = self._l1.get(key)
+            if found:
+                self._stats["l1_hits"] += 1
+                self._count_lookup(key, value, tier="L1")
+                return value
+            self._stats["l1_misses"] += 1
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._stats["coalesced"] += 1
+            try:
+                value = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leading read was cancelled, not this caller
+                return await self.get(key)
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            try:
+                value = await self._get_remote(key, future)
+                future.set_result(value)
+            except BaseException:
+                future.cancel()
+                raise
+            finally:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+        self._count_lookup(key, value, tier="L2")
+        return value
+
+    async def _get_remote(self, key: str, future: asyncio.Future) -> Optional[str]:
+        """
+        Read a key from ZeroDB and populate L1.
+
+        Args:
+            key: Cache key
+            future: Single-flight future of this read; L1 is only populated
+                if no set/delete superseded it meanwhile
+
+        Returns:
+            Cached value or None if not found/expired/unavailable
+        """
         now = int(datetime.now(timezone.utc).timestamp())
 
         try:
@@ -134,33 +389,51 @@ class ZeroDBCacheService:
 
             # Result is a dict with 'data' key containing list of rows
             data_list = result.get("data", [])
+        except Exception as e:
+            logger.error(f"Error getting cache key '{key}': {e}")
+            self._stats["l2_misses"] += 1
+            return None
 
-            if data_list:
-                # Extract row_data from response
-                row_data = data_list[0].get("row_data", {})
+        current = self._inflight.get(key) is future
 
-                # Check if expired
-                expires_at = row_data.get("expires_at")
-                if expires_at is not None and expires_at < now:
-                    # Expired - delete it
-                    await self.delete(key)
-                    self._stats["misses"] += 1
-                    logger.debug(f"Cache MISS for key '{key}' (expired)")
-                    return None
-
-                self._stats["hits"] += 1
-                value = row_data.get("value")
-                logger.debug(f"Cache HIT for key '{key}'")
-                return value
-            else:
-                self._stats["misses"] += 1
-                logger.debug(f"Cache MISS for key '{key}'")
+        if data_list:
+            # Extract row_data from response
+            row_data = data_list[0].get("row_data", {})
+
+            # Check if expired
+            expires_at = row_data.get("expires_at")
+            if expires_at is not None and expires_at < now:
+                # Expired - delete it
+                self._stats["l2_misses"] += 1
+                logger.debug(f"Cache key '{key}' expired")
+                await self.delete(key)
                 return None
 
-        except Exception as e:
-            logger.error(f"Error getting cache key '{key}': {e}")
+            self._stats["l2_hits"] += 1
+            value = row_data.get("value")
+            if current and self._l1 is not None:
+                self._l1.put(key, value, expires_at)
+            return value
+
+        self._stats["l2_misses"] += 1
+        if current and self._l1 is not None:
+            self._l1.put_negative(key)
+        return None
+
+    def _count_lookup(self, key: str, value: Optional[str], tier: str) -> None:
+        """Record an overall cache hit or miss."""
+        if value is None:
             self._stats["misses"] += 1
-            return None
+            logger.debug(f"Cache MISS for key '{key}' ({tier})")
+        else:
+            self._stats["hits"] += 1
+            logger.debug(f"Cache HIT for key '{key}' ({tier})")
+
+    def _invalidate_local(self, key: str) -> None:
+        """Drop a key from L1 and detach any in-flight read of it."""
+        self._inflight.pop(key, None)
+        if self._l1 is not None:
+            self._l1.invalidate(key)
 
     async def exists(self, key: str) -> bool:
         """
@@ -185,15 +458,27 @@ class ZeroDBCacheService:
         Returns:
             True if key was deleted
         """
+        self._invalidate_local(key)
+        self._counters.pop(key, None)
+
         try:
             result = await self.client.delete_rows(
                 table_name=self.TABLE_NAME,
-                filter_query={"key": {"$eq": key}},
+                filter_query={
+                    "$or": [
+                        {"key": {"$eq": key}},
+                        {"counter_key": {"$eq": key}}
+                    ]
+                },
                 project_id=self.project_id
             )
 
             deleted_count = result.get("deleted_count", 0)
 
+            # Write-through: the key is now known to be absent
+            if self._l1 is not None:
+                self._l1.put_negative(key)
+
             if deleted_count > 0:
                 self._stats["deletes"] += 1
                 logger.debug(f"Deleted cache key '{key}'")
@@ -210,6 +495,13 @@ class ZeroDBCacheService:
         """
         Atomically increment counter.
 
+        The increment is applied to this instance's shard of the counter in
+        memory and written to ZeroDB by the next counter flush (at most
+        counter_flush_interval seconds later), so it is never lost to a
+        concurrent writer. The returned total includes every local
+        increment plus other instances' shards as last read by this
+        instance (refreshed on each flush and by get_counter).
+
         Args:
             key: Cache key
             amount: Increment amount (default: 1)
@@ -217,54 +509,439 @@ class ZeroDBCacheService:
         Returns:
             New counter value
         """
+        return await self._increment_counter(key, amount, expires_at=None)
+
+    async def get_counter(self, key: str) -> int:
+        """
+        Get the current value of a counter.
+
+        Reads all shards from ZeroDB; this instance's shard is taken from
+        memory so unflushed local increments are included.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Sum of all shards (0 if the counter does not exist)
+        """
+        totals = (await self._query_counter_shards([key])).get(key, CounterTotals())
+
+        state = self._live_counter_state(key)
+        if state is None:
+            return totals.total
+
+        state.apply_totals(totals)
+        return state.own + state.others
+
+    async def increment_fixed_window(
+        self,
+        key: str,
+        window_seconds: int,
+        amount: int = 1
+    ) -> int:
+        """
+        Increment a fixed-window counter (e.g. requests per minute).
+
+        Windows are aligned to multiples of window_seconds since the epoch;
+        each window is a separate counter that expires when it ends.
+
+        Args:
+            key: Counter key (e.g. "rate:ip:1.2.3.4")
+            window_seconds: Window length in seconds
+            amount: Increment amount (default: 1)
+
+        Returns:
+            Count within the current window
+        """
+        bucket = int(time.time() // window_seconds)
+        return await self._increment_counter(
+            self._window_key(key, window_seconds, bucket),
+            amount,
+            expires_at=(bucket + 1) * window_seconds
+        )
+
+    async def increment_sliding_window(
+        self,
+        key: str,
+        window_seconds: int,
+        amount: int = 1
+    ) -> float:
+        """
+        Increment a sliding-window counter.
+
+        Uses the two-bucket sliding window estimate: the current fixed
+        window's count plus the previous window's count weighted by the
+        fraction of it still inside the sliding window. Buckets are kept
+        one extra window so the previous count is available.
+
+        Args:
+            key: Counter key
+            window_seconds: Window length in seconds
+            amount: Increment amount (default: 1)
+
+        Returns:
+            Estimated count within the last window_seconds
+        """
+        now = time.time()
+        bucket = int(now // window_seconds)
+        current = await self._increment_counter(
+            self._window_key(key, window_seconds, bucket),
+            amount,
+            expires_at=(bucket + 2) * window_seconds
+        )
+        previous_key = self._window_key(key, window_seconds, bucket - 1)
+        previous_state = self._live_counter_state(previous_key)
+        if previous_state is not None and previous_state.others_loaded:
+            previous = previous_state.own + previous_state.others
+        else:
+            previous = await self.get_counter(previous_key)
+
+        elapsed_fraction = (now - bucket * window_seconds) / window_seconds
+        return previous * (1 - elapsed_fraction) + current
+
+    async def flush_counters(self) -> int:
+        """
+        Write pending counter shards to ZeroDB.
+
+        Sends every changed shard in one bulk_upsert, then refreshes the
+        other instances' shard totals for those counters with one query.
+        A shard is only written once its persisted value has been loaded,
+        so a restarted instance never overwrites it with a partial count.
+
+        Returns:
+            Number of counter shards written
+        """
+        unloaded = [
+            (key, state) for key, state in self._counters.items()
+            if state.version != state.flushed_version and not state.others_loaded
+        ]
+        if unloaded:
+            await asyncio.gather(*[
+                self._ensure_counter_loaded(key, state) for key, state in unloaded
+            ])
+
+        dirty = [
+            (key, state, state.version)
+            for key, state in self._counters.items()
+            if state.version != state.flushed_version
+        ]
+
         now = int(datetime.now(timezone.utc).timestamp())
 
-        try:
-            # Try to get existing counter
-            result = await self.client.query_rows(
+        if dirty:
+            rows = [
+                {
+                    "key": self._shard_row_key(key),
+                    "value": "",
+                    "counter_key": key,
+                    "shard_id": self.shard_id,
+                    "expires_at": state.expires_at,
+                    "created_at": now,
+                    "counter": state.own
+                }
+                for key, state, _ in dirty
+            ]
+
+            await self.client.bulk_upsert(
                 table_name=self.TABLE_NAME,
-                filter_query={"key": {"$eq": key}},
+                rows=rows,
+                unique_key="key",
                 project_id=self.project_id
             )
 
-            # Result is a dict with 'data' key containing list of rows
-            data_list = result.get("data", [])
+            for _, state, version in dirty:
+                state.flushed_version = version
+            self._stats["counter_flushes"] += 1
+
+            totals = await self._query_counter_shards([key for key, _, _ in dirty])
+            for key, state, _ in dirty:
+                if key in totals and self._counters.get(key) is state:
+                    state.apply_totals(totals[key])
+
+            logger.debug(f"Flushed {len(dirty)} counter shards")
+
+        # Drop local state of expired windows once written
+        for key in [
+            key for key, state in self._counters.items()
+            if state.expires_at is not None and state.expires_at < now
+            and state.version == state.flushed_version
+        ]:
+            del self._counters[key]
+
+        return len(dirty)
+
+    async def _increment_counter(
+        self,
+        key: str,
+        amount: int,
+        expires_at: Optional[int]
+    ) -> int:
+        """
+        Apply an increment to the local shard and schedule a flush.
 
-            if data_list:
-                # Increment existing counter
-                row_data = data_list[0].get("row_data", {})
-                current_value = row_data.get("counter", 0)
-                new_value = current_value + amount
-
-                await self.client.update_rows(
-                    table_name=self.TABLE_NAME,
-                    filter_query={"key": {"$eq": key}},
-                    update_data={"counter": new_value},
-                    project_id=self.project_id
-                )
-            else:
-                # Create new counter
-                new_value = amount
-                await self.client.insert_rows(
-                    table_name=self.TABLE_NAME,
-                    rows=[{
-                        "key": key,
-                        "value": "",
-                        "expires_at": None,
-                        "created_at": now,
-                        "counter": new_value
-                    }],
-                    project_id=self.project_id
-                )
+        Args:
+            key: Counter key
+            amount: Increment amount
+            expires_at: Counter expiration (epoch seconds) or None
 
-            self._stats["increments"] += 1
-            logger.debug(f"Incremented counter '{key}' to {new_value}")
-            return new_value
+        Returns:
+            New counter value
+        """
+        state = self._live_counter_state(key)
+        if state is None:
+            state = CounterState(expires_at=expires_at)
+            self._counters[key] = state
+
+        # Applied synchronously: concurrent increments cannot interleave
+        state.own += amount
+        state.version += 1
+        state.touched_at = time.monotonic()
+        own = state.own
+        self._stats["increments"] += 1
+        self._schedule_counter_flush()
 
+        try:
+            await self._ensure_counter_loaded(key, state)
         except Exception as e:
             logger.error(f"Error incrementing counter '{key}': {e}")
             raise
 
+        new_value = own + state.others
+        logger.debug(f"Incremented counter '{key}' to {new_value}")
+        return new_value
+
+    def _live_counter_state(self, key: str) -> Optional[CounterState]:
+        """
+        Get local counter state, dropping it if it has gone idle.
+
+        Flushed state untouched for counter_idle_seconds is discarded so the
+        next use reloads the shard from ZeroDB; by then compaction may have
+        folded the shard into the base row, and the stale local value must
+        not be written back.
+
+        Args:
+            key: Counter key
+
+        Returns:
+            CounterState, or None if there is no live local state
+        """
+        state = self._counters.get(key)
+        if state is None:
+            return None
+        idle = time.monotonic() - state.touched_at
+        if state.version == state.flushed_version and idle > self.counter_idle_seconds:
+            del self._counters[key]
+            return None
+        return state
+
+    async def compact_counter_shards(self, idle_seconds: int = 3600) -> int:
+        """
+        Fold orphaned counter shards into their counter's base row.
+
+        A shard not written for idle_seconds belongs to a process that has
+        exited (or to an idle counter whose owner dropped its local state),
+        so its value is added to the row keyed by the counter and the shard
+        row is deleted. Each shard is deleted with a condition on its last
+        write time before being folded, so a shard rewritten in the
+        meantime is left alone. Expired shards are simply deleted.
+
+        Run from a single maintenance job (alongside cleanup_expired);
+        idle_seconds must exceed every instance's counter_idle_seconds.
+
+        Args:
+            idle_seconds: Minimum time since a shard's last write (seconds)
+
+        Returns:
+            Number of shard rows compacted
+        """
+        now = int(datetime.now(timezone.utc).timestamp())
+        cutoff = now - idle_seconds
+        orphans: List[Dict[str, Any]] = []
+        skip = 0
+
+        while True:
+            result = await self.client.query_rows(
+                table_name=self.TABLE_NAME,
+                filter_query={
+                    "shard_id": {"$exists": True},
+                    "created_at": {"$lt": cutoff}
+                },
+                project_id=self.project_id,
+                limit=self.COUNTER_QUERY_PAGE_SIZE,
+                skip=skip
+            )
+            data_list = result.get("data", [])
+            orphans.extend(item.get("row_data", {}) for item in data_list)
+            if len(data_list) < self.COUNTER_QUERY_PAGE_SIZE:
+                break
+            skip += self.COUNTER_QUERY_PAGE_SIZE
+
+        folded: Dict[str, Tuple[int, Optional[int]]] = {}
+        compacted = 0
+        for row in orphans:
+            if row.get("shard_id") == self.shard_id:
+                continue
+            deleted = await self.client.delete_rows(
+                table_name=self.TABLE_NAME,
+                filter_query={
+                    "key": {"$eq": row["key"]},
+                    "created_at": {"$lt": cutoff}
+                },
+                project_id=self.project_id
+            )
+            if not deleted.get("deleted_count"):
+                continue
+            compacted += 1
+            expires_at = row.get("expires_at")
+            if expires_at is not None and expires_at < now:
+                continue
+            total, _ = folded.get(row["counter_key"], (0, None))
+            folded[row["counter_key"]] = (total + (row.get("counter", 0) or 0), expires_at)
+
+        if folded:
+            base_rows = await self._query_base_counter_rows(list(folded))
+            await self.client.bulk_upsert(
+                table_name=self.TABLE_NAME,
+                rows=[
+                    {
+                        "key": key,
+                        "value": base_rows.get(key, {}).get("value", ""),
+                        "expires_at": base_rows.get(key, {}).get("expires_at", expires_at),
+                        "created_at": now,
+                        "counter": (base_rows.get(key, {}).get("counter", 0) or 0) + value
+                    }
+                    for key, (value, expires_at) in folded.items()
+                ],
+                unique_key="key",
+                project_id=self.project_id
+            )
+            for key in folded:
+                self._invalidate_local(key)
+
+        if compacted:
+            logger.info(f"Compacted {compacted} orphaned counter shards")
+        return compacted
+
+    async def _query_base_counter_rows(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Read the rows keyed by the counters themselves."""
+        result = await self.client.query_rows(
+            table_name=self.TABLE_NAME,
+            filter_query={"key": {"$in": keys}},
+            project_id=self.project_id,
+            limit=len(keys)
+        )
+        return {
+            item.get("row_data", {}).get("key"): item.get("row_data", {})
+            for item in result.get("data", [])
+        }
+
+    async def _ensure_counter_loaded(self, key: str, state: CounterState) -> None:
+        """
+        Load shard totals once per counter.
+
+        Concurrent first increments of a key share one query.
+
+        Args:
+            key: Counter key
+            state: Local counter state
+        """
+        if state.loaded is None:
+            state.loaded = asyncio.ensure_future(self._query_counter_shards([key]))
+
+        loaded = state.loaded
+        try:
+            totals = await asyncio.shield(loaded)
+        except Exception:
+            if state.loaded is loaded:
+                state.loaded = None
+            raise
+
+        if not state.others_loaded:
+            state.apply_totals(totals.get(key, CounterTotals()))
+
+    async def _query_counter_shards(self, keys: List[str]) -> Dict[str, CounterTotals]:
+        """
+        Sum counter shards for a set of counters.
+
+        A row keyed by the counter itself (written by the former
+        read-modify-write increment, or by set()) is folded into the sum
+        as if it were another instance's shard, and its TTL is reported so
+        new shards inherit it. Expired rows are not counted.
+
+        Args:
+            keys: Counter keys
+
+        Returns:
+            Mapping of key to CounterTotals
+        """
+        totals: Dict[str, CounterTotals] = {}
+        now = int(datetime.now(timezone.utc).timestamp())
+        skip = 0
+
+        while True:
+            result = await self.client.query_rows(
+                table_name=self.TABLE_NAME,
+                filter_query={
+                    "$or": [
+                        {"counter_key": {"$in": keys}},
+                        {"key": {"$in": keys}}
+                    ]
+                },
+                project_id=self.project_id,
+                limit=self.COUNTER_QUERY_PAGE_SIZE,
+                skip=skip
+            )
+            data_list = result.get("data", [])
+
+            for item in data_list:
+                row_data = item.get("row_data", {})
+                expires_at = row_data.get("expires_at")
+                if expires_at is not None and expires_at < now:
+                    continue
+
+                key = row_data.get("counter_key") or row_data.get("key")
+                value = row_data.get("counter", 0) or 0
+                entry = totals.setdefault(key, CounterTotals())
+                if row_data.get("shard_id") == self.shard_id:
+                    entry.own += value
+                else:
+                    entry.others += value
+                entry.total += value
+                if expires_at is not None and row_data.get("key") == key:
+                    entry.expires_at = expires_at
+
+            if len(data_list) < self.COUNTER_QUERY_PAGE_SIZE:
+                break
+            skip += self.COUNTER_QUERY_PAGE_SIZE
+
+        return totals
+
+    def _schedule_counter_flush(self) -> None:
+        """Start a delayed counter flush unless one is already pending."""
+        if self._counter_flush_task is None or self._counter_flush_task.done():
+            self._counter_flush_task = asyncio.create_task(self._delayed_counter_flush())
+
+    async def _delayed_counter_flush(self) -> None:
+        """Flush counters after counter_flush_interval, retrying on failure."""
+        while True:
+            await asyncio.sleep(self.counter_flush_interval)
+            try:
+                await self.flush_counters()
+            except Exception as e:
+                logger.error(f"Error flushing counters: {e}")
+                continue
+            if all(s.version == s.flushed_version for s in self._counters.values()):
+                return
+
+    def _shard_row_key(self, key: str) -> str:
+        """Row key of this instance's shard of a counter."""
+        return f"{key}#shard:{self.shard_id}"
+
+    @staticmethod
+    def _window_key(key: str, window_seconds: int, bucket: int) -> str:
+        """Counter key of one window bucket."""
+        return f"{key}:w{window_seconds}:{bucket}"
+
     async def cleanup_expired(self) -> int:
         """
         Remove all expired cache entries.
@@ -298,6 +975,23 @@ class ZeroDBCacheService:
             logger.error(f"Error cleaning up expired entries: {e}")
             return 0
 
+    async def close(self) -> None:
+        """
+        Stop the pending counter flush and write remaining increments.
+        """
+        if self._counter_flush_task is not None and not self._counter_flush_task.done():
+            self._counter_flush_task.cancel()
+            try:
+                await self._counter_flush_task
+            except asyncio.CancelledError:
+                pass
+        self._counter_flush_task = None
+
+        try:
+            await self.flush_counters()
+        except Exception as e:
+            logger.error(f"Error flushing counters on close: {e}")
+
     async def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
@@ -328,7 +1022,8 @@ class ZeroDBCacheService:
                 "hit_rate": round(hit_rate, 2),
                 "sets": self._stats["sets"],
                 "deletes": self._stats["deletes"],
-                "increments": self._stats["increments"]
+                "increments": self._stats["increments"],
+                **self._tier_stats()
             }
 
         except Exception as e:
@@ -340,9 +1035,39 @@ class ZeroDBCacheService:
                 "hit_rate": 0.0,
                 "sets": self._stats["sets"],
                 "deletes": self._stats["deletes"],
-                "increments": self._stats["increments"]
+                "increments": self._stats["increments"],
+                **self._tier_stats()
             }
 
+    def _tier_stats(self) -> Dict[str, Any]:
+        """
+        Get per-tier statistics.
+
+        Returns:
+            L1/L2 hit counts and hit ratios (percent), L1 size and evictions
+        """
+        def ratio(hits: int, misses: int) -> float:
+            total = hits + misses
+            return round(hits / total * 100, 2) if total > 0 else 0.0
+
+        return {
+            "l1_enabled": self._l1 is not None,
+            "l1_size": len(self._l1) if self._l1 is not None else 0,
+            "l1_evictions": self._l1.evictions if self._l1 is not None else 0,
+            "l1_hits": self._stats["l1_hits"],
+            "l1_misses": self._stats["l1_misses"],
+            "l1_hit_rate": ratio(self._stats["l1_hits"], self._stats["l1_misses"]),
+            "l2_hits": self._stats["l2_hits"],
+            "l2_misses": self._stats["l2_misses"],
+            "l2_hit_rate": ratio(self._stats["l2_hits"], self._stats["l2_misses"]),
+            "coalesced_reads": self._stats["coalesced"],
+            "counter_flushes": self._stats["counter_flushes"],
+            "pending_counters": sum(
+                1 for state in self._counters.values()
+                if state.version != state.flushed_version
+            )
+        }
+
 
 # Global service instance
 _cache_service: Optional[ZeroDBCacheService] = None
@@ -358,6 +1083,10 @@ def get_cache_service() -> ZeroDBCacheService:
     global _cache_service
 
     if _cache_service is None:
-        _cache_service = ZeroDBCacheService()
+        _cache_service = ZeroDBCacheService(
+            l1_max_size=int(os.getenv("ZERODB_CACHE_L1_MAX_SIZE", "0")),
+            l1_ttl=float(os.getenv("ZERODB_CACHE_L1_TTL", "5")),
+            l1_negative_ttl=float(os.getenv("ZERODB_CACHE_L1_NEGATIVE_TTL", "1"))
+        )
 
     return _cache_service
@@ -3,10 +3,21 @@ Log Sanitization Utility
 
 Automatically redacts sensitive information from log messages to prevent credential leakage.
 Supports both string-based and structured logging with configurable redaction patterns.
+
+Performance:
+- All enabled patterns are combined into one precompiled alternation, so a
+  message is scanned once rather than once per pattern
+- A substring pre-check skips messages containing no trigger keyword
+- Short messages (typically format strings) are memoized, and a record
+  passing through several handlers is sanitized only once
+
+See scripts/benchmark_log_sanitization.py for a comparison against the
+previous per-pattern implementation.
 """
 
 import re
-from typing import Any, Dict, List, Pattern
+from functools import lru_cache
+from typing import Any, Dict, List, Pattern, Tuple
 from enum import Enum
 
 
@@ -88,6 +99,185 @@ _SENSITIVE_PATTERNS: Dict[SensitivePattern, Pattern] = {
 # Redaction placeholder
 REDACTED = "***REDACTED***"
 
+# Lowercase substrings that must occur for a pattern to match (pre-check)
+_TRIGGERS: Dict[SensitivePattern, str] = {
+    SensitivePattern.PASSWORD: "password",
+    SensitivePattern.API_KEY: "api",
+    SensitivePattern.TOKEN: "token",
+    SensitivePattern.SECRET: "secret",
+    SensitivePattern.BEARER: "bearer",
+    SensitivePattern.AUTHORIZATION: "authorization",
+    SensitivePattern.JWT: "eyj",
+    SensitivePattern.SSH_KEY: "-----begin",
+    SensitivePattern.PRIVATE_KEY: "private",
+}
+
+# Credit card numbers have no keyword; require two adjacent digit quads instead
+_CREDIT_CARD_TRIGGER = re.compile(r'[0-9]{4}[\s\-]?[0-9]{4}')
+
+# Messages up to this length are memoized
+_MEMO_MAX_LENGTH = 1024
+
+# Sensitive key names for structured data (case-insensitive)
+_SENSITIVE_KEYS = frozenset({
+    'password', 'passwd', 'pwd',
+    'api_key', 'apikey', 'api-key',
+    'token', 'access_token', 'refresh_token',
+    'secret', 'secret_key', 'client_secret',
+    'authorization', 'auth',
+    'jwt', 'bearer',
+    'private_key', 'private-key', 'privatekey',
+    'credit_card', 'creditcard', 'card_number',
+    'ssn', 'social_security',
+})
+
+
+def _inline_flags(pattern: Pattern) -> str:
+    """Render a compiled pattern's flags as a scoped inline-flag prefix"""
+    flags = ""
+    if pattern.flags & re.IGNORECASE:
+        flags += "i"
+    if pattern.flags & re.DOTALL:
+        flags += "s"
+    return flags
+
+
+class _CombinedSanitizer:
+    """
+    Single-pass redaction engine for a fixed set of patterns.
+
+    All patterns are compiled into one alternation of named groups (each
+    keeping its own flags), so a message is scanned once instead of once
+    per pattern. Scanning resumes at the start of each redacted value, so a
+    match nested in another pattern's value (e.g. a bearer token inside an
+    Authorization header) is still found; the redacted spans are the union
+    of every pattern's matches on the original message.
+    """
+
+    def __init__(self, patterns: Tuple[SensitivePattern, ...]):
+        """
+        Compile the combined pattern.
+
+        Args:
+            patterns: Patterns to apply (earlier ones win ties at the same position)
+        """
+        alternatives = []
+        # Maps each alternative's group name to the group holding its redacted value
+        self._value_groups: Dict[str, int] = {}
+        group_index = 1
+        for pattern_type in patterns:
+            pattern = _SENSITIVE_PATTERNS.get(pattern_type)
+            if pattern is None:
+                continue
+            name = pattern_type.name.lower()
+            flags = _inline_flags(pattern)
+            body = f"(?{flags}:{pattern.pattern})" if flags else pattern.pattern
+            alternatives.append(f"(?P<{name}>{body})")
+            if pattern.groups >= 2:
+                # Keep the prefix (group 1) and any suffix, redact the value (group 2)
+                self._value_groups[name] = group_index + 2
+            else:
+                self._value_groups[name] = group_index
+            group_index += 1 + pattern.groups
+
+        self.regex = re.compile("|".join(alternatives)) if alternatives else None
+
+    def scan(self, message: str) -> str:
+        """
+        Redact all sensitive values in one scan.
+
+        Args:
+            message: Log message
+
+        Returns:
+            Sanitized message
+        """
+        if self.regex is None:
+            return message
+
+        spans: List[List[int]] = []
+        search = self.regex.search
+        value_groups = self._value_groups
+        pos = 0
+        length = len(message)
+        while pos <= length:
+            match = search(message, pos)
+            if match is None:
+                break
+            value_start, value_end = match.span(value_groups[match.lastgroup])
+
+            if spans and value_start < spans[-1][1]:
+                if value_end > spans[-1][1]:
+                    spans[-1][1] = value_end
+            else:
+                spans.append([value_start, value_end])
+            # Re-scan from the redacted value so nested matches are found
+            pos = max(value_start, match.start() + 1)
+
+        if not spans:
+            return message
+
+        parts = []
+        last = 0
+        for start, end in spans:
+            parts.append(message[last:start])
+            parts.append(REDACTED)
+            last = end
+        parts.append(message[last:])
+        return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _get_sanitizer(patterns: Tuple[SensitivePattern, ...]) -> _CombinedSanitizer:
+    """Get the compiled sanitizer for a pattern set"""
+    return _CombinedSanitizer(patterns)
+
+
+_ALL_PATTERNS: Tuple[SensitivePattern, ...] = tuple(SensitivePattern)
+
+
+def _candidate_patterns(
+    message: str,
+    patterns: Tuple[SensitivePattern, ...]
+) -> Tuple[SensitivePattern, ...]:
+    """
+    Pre-check: select the patterns whose trigger occurs in the message.
+
+    Args:
+        message: Log message
+        patterns: Enabled patterns
+
+    Returns:
+        Patterns that can possibly match (empty for most clean messages)
+    """
+    lowered = message.lower()
+    candidates = []
+    for pattern_type in patterns:
+        trigger = _TRIGGERS.get(pattern_type)
+        if trigger is not None:
+            if trigger in lowered:
+                candidates.append(pattern_type)
+        elif pattern_type is SensitivePattern.CREDIT_CARD:
+            if _CREDIT_CARD_TRIGGER.search(message):
+                candidates.append(pattern_type)
+        else:
+            candidates.append(pattern_type)
+    return tuple(candidates)
+
+
+def _sanitize(message: str, patterns: Tuple[SensitivePattern, ...]) -> str:
+    """Sanitize with only the patterns that pass the pre-check"""
+    candidates = _candidate_patterns(message, patterns)
+    if not candidates:
+        return message
+    return _get_sanitizer(candidates).scan(message)
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_memoized(message: str, patterns: Tuple[SensitivePattern, ...]) -> str:
+    """Memoized sanitize for short, frequently repeated messages (format strings)"""
+    return _sanitize(message, patterns)
+
 
 def sanitize_message(message: str, enabled_patterns: List[SensitivePattern] = None) -> str:
     """
@@ -103,34 +293,11 @@ def sanitize_message(message: str, enabled_patterns: List[SensitivePattern] = No
     if not message:
         return message
 
-    if enabled_patterns is None:
-        enabled_patterns = list(SensitivePattern)
-
-    sanitized = message
-
-    for pattern_type in enabled_patterns:
-        pattern = _SENSITIVE_PATTERNS.get(pattern_type)
-        if pattern is None:
-            continue
-
-        # Handle multi-group patterns (preserve prefix, redact value)
-        if pattern_type in (SensitivePattern.SSH_KEY,):
-            # For SSH keys, redact the entire key block
-            sanitized = pattern.sub(
-                r'\1' + REDACTED + r'\3',
-                sanitized
-            )
-        elif pattern.groups >= 2:
-            # For patterns with prefix and value groups, preserve prefix
-            sanitized = pattern.sub(
-                r'\1' + REDACTED,
-                sanitized
-            )
-        else:
-            # For patterns with single capture group, replace entire match
-            sanitized = pattern.sub(REDACTED, sanitized)
+    patterns = _ALL_PATTERNS if enabled_patterns is None else tuple(enabled_patterns)
 
-    return sanitized
+    if len(message) <= _MEMO_MAX_LENGTH:
+        return _sanitize_memoized(message, patterns)
+    return _sanitize(message, patterns)
 
 
 def sanitize_dict(data: Dict[str, Any], enabled_patterns: List[SensitivePattern] = None) -> Dict[str, Any]:
@@ -150,29 +317,13 @@ def sanitize_dict(data: Dict[str, Any], enabled_patterns: List[SensitivePattern]
     if not isinstance(data, dict):
         return data
 
-    if enabled_patterns is None:
-        enabled_patterns = list(SensitivePattern)
-
     sanitized = {}
 
-    # Sensitive key names (case-insensitive)
-    sensitive_keys = {
-        'password', 'passwd', 'pwd',
-        'api_key', 'apikey', 'api-key',
-        'token', 'access_token', 'refresh_token',
-        'secret', 'secret_key', 'client_secret',
-        'authorization', 'auth',
-        'jwt', 'bearer',
-        'private_key', 'private-key', 'privatekey',
-        'credit_card', 'creditcard', 'card_number',
-        'ssn', 'social_security',
-    }
-
     for key, value in data.items():
         key_lower = key.lower()
 
         # Check if key is in sensitive list
-        if key_lower in sensitive_keys:
+        if key_lower in _SENSITIVE_KEYS:
             sanitized[key] = REDACTED
         # Recursively sanitize nested dictionaries
         elif isinstance(value, dict):
@@ -215,17 +366,24 @@ class SanitizingFilter:
             enabled_patterns: List of patterns to check (defaults to all patterns)
         """
         self.enabled_patterns = enabled_patterns
+        self._patterns = _ALL_PATTERNS if enabled_patterns is None else tuple(enabled_patterns)
 
     def filter(self, record):
         """
         Filter and sanitize a log record
 
+        A record reaching several handlers (root and uvicorn) is sanitized
+        once; later filters with the same patterns skip it.
+
         Args:
             record: LogRecord to sanitize
 
         Returns:
             True (always allows record through after sanitization)
         """
+        if getattr(record, '_sanitized_patterns', None) == self._patterns:
+            return True
+
         # Sanitize the main message
         if hasattr(record, 'msg') and isinstance(record.msg, str):
             record.msg = sanitize_message(record.msg, self.enabled_patterns)
@@ -242,4 +400,5 @@ class SanitizingFilter:
                     for arg in record.args
                 )
 
+        record._sanitized_patterns = self._patterns
         return True
@@ -93,15 +93,22 @@ class OpenClawBridge:
             self._connected = False
             print("OpenClaw connection closed")
 
-    async def _request(self, method: str, params: Any = None, expect_final: bool = False) -> Any:
+    async def _request(
+        self,
+        method: str,
+        params: Any = None,
+        expect_final: bool = False,
+        request_id: Optional[str] = None
+    ) -> Any:
         """Send RPC request and wait for response
 
         Args:
             method: RPC method name
             params: Method parameters
             expect_final: If True, ignore intermediate "accepted" status and wait for final result
+            request_id: Frame ID the gateway echoes in its response (default: new UUID)
         """
-        request_id = str(uuid.uuid4())
+        request_id = request_id or str(uuid.uuid4())
         frame = {
             "type": "req",
             "id": request_id,
@@ -119,13 +126,20 @@ class OpenClawBridge:
         """Register event handler"""
         self.handlers[event] = handler
 
-    async def send_to_agent(self, session_key: str, message: str, timeout_seconds: int = 600) -> Dict[str, Any]:
+    async def send_to_agent(
+        self,
+        session_key: str,
+        message: str,
+        timeout_seconds: int = 600,
+        request_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Send message to specific agent session and wait for response
 
         Args:
             session_key: Agent session key (e.g., "agent:main:main")
             message: Message to send to agent
             timeout_seconds: Timeout for agent response (default 600s / 10 minutes)
+            request_id: Gateway request frame ID (default: new UUID)
 
         Returns:
             dict with 'result' containing payloads and meta, or error information
@@ -136,7 +150,7 @@ class OpenClawBridge:
             "message": message,
             "idempotencyKey": idempotency_key,
             "timeout": timeout_seconds
-        }, expect_final=True)
+        }, expect_final=True, request_id=request_id)
 
     async def delegate_task(self, agent_profile: str, task: str) -> str:
         """
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Data Migration Script: Backfill ZeroDB Message Rows
+
+Copies conversation messages written through the legacy ZeroDB table API
+(/projects/{project_id}/tables/messages) into the public database API
+table that ConversationService now writes and reads. Run once after
+deploying; re-running is safe because messages are upserted by id.
+
+Usage:
+    python scripts/backfill_zerodb_messages.py [--workspace-id UUID] [--batch-size N]
+
+Options:
+    --workspace-id   Only backfill this workspace (default: every workspace
+                     with a ZeroDB project)
+    --batch-size     Legacy rows copied per request (default: 100)
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from uuid import UUID
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+
+from backend.db.base import AsyncSessionLocal
+from backend.integrations.zerodb_client import ZeroDBClient
+from backend.models.workspace import Workspace
+from backend.services.conversation_service import ConversationService
+
+
+async def backfill_messages(workspace_id: UUID = None, batch_size: int = 100) -> dict:
+    """
+    Backfill legacy message rows for every workspace ZeroDB project.
+
+    Args:
+        workspace_id: Only backfill this workspace (None = all workspaces)
+        batch_size: Legacy rows copied per request
+
+    Returns:
+        Dictionary with migration statistics
+    """
+    async with AsyncSessionLocal() as db:
+        stmt = select(Workspace).where(Workspace.zerodb_project_id.isnot(None))
+        if workspace_id:
+            stmt = stmt.where(Workspace.id == workspace_id)
+        workspaces = (await db.execute(stmt)).scalars().all()
+
+        stats = {"workspaces": len(workspaces), "scanned": 0, "copied": 0}
+        async with ZeroDBClient() as zerodb:
+            service = ConversationService(db=db, zerodb_client=zerodb)
+            for workspace in workspaces:
+                result = await service.backfill_legacy_messages(
+                    workspace.zerodb_project_id, batch_size=batch_size
+                )
+                print(
+                    f"{workspace.name} ({workspace.zerodb_project_id}): "
+                    f"copied {result['copied']} of {result['scanned']} legacy rows"
+                )
+                stats["scanned"] += result["scanned"]
+                stats["copied"] += result["copied"]
+
+    return stats
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Copy legacy ZeroDB message rows into the public database API table"
+    )
+    parser.add_argument("--workspace-id", type=UUID, help="Only backfill this workspace")
+    parser.add_argument("--batch-size", type=int, default=100, help="Legacy rows per request")
+    args = parser.parse_args()
+
+    stats = asyncio.run(backfill_messages(args.workspace_id, args.batch_size))
+    print(
+        f"\nBackfilled {stats['copied']} messages "
+        f"({stats['scanned']} legacy rows) across {stats['workspaces']} workspaces"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ Tests cover:
 - Coverage >= 90%
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch, call
 from uuid import uuid4
@@ -20,6 +21,15 @@ from backend.agents.orchestration.production_openclaw_bridge import ProductionOp
 from backend.services.conversation_service import ConversationService
 from backend.models.conversation import Conversation
 from backend.integrations.zerodb_client import ZeroDBClient, ZeroDBAPIError
+from backend.services.conversation_cache import get_conversation_metadata_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_conversation_cache():
+    """Isolate the shared conversation metadata cache between tests"""
+    get_conversation_metadata_cache().clear()
+    yield
+    get_conversation_metadata_cache().clear()
 
 
 @pytest.fixture
@@ -155,7 +165,8 @@ class TestSendToAgentBackwardCompatibility:
             assert result["status"] == "sent"
             mock_base_bridge.send_to_agent.assert_called_once_with(
                 session_key="whatsapp:dm:test123",
-                message="Hello agent"
+                message="Hello agent",
+                request_id=result["request_id"]
             )
 
     @pytest.mark.asyncio
@@ -243,6 +254,7 @@ class TestSendToAgentWithPersistence:
                 user_id=user_id,
                 workspace_id=workspace_id
             )
+            await bridge.flush()
 
             # Verify conversation created
             mock_conversation_service.create_conversation.assert_called_once_with(
@@ -311,6 +323,7 @@ class TestSendToAgentWithPersistence:
                 user_id=user_id,
                 workspace_id=workspace_id
             )
+            await bridge.flush()
 
             # Verify conversation NOT created (uses existing)
             mock_conversation_service.create_conversation.assert_not_called()
@@ -514,6 +527,7 @@ class TestAssistantResponsePersistence:
                 user_id=sample_conversation.user_id,
                 workspace_id=sample_conversation.workspace_id
             )
+            await bridge.flush()
 
             # Verify assistant message call includes metadata
             assistant_call = mock_conversation_service.add_message.call_args_list[1]
@@ -556,6 +570,7 @@ class TestAssistantResponsePersistence:
                 user_id=sample_conversation.user_id,
                 workspace_id=sample_conversation.workspace_id
             )
+            await bridge.flush()
 
             # Verify only user message stored (no assistant message)
             assert mock_conversation_service.add_message.call_count == 1
@@ -597,6 +612,7 @@ class TestAssistantResponsePersistence:
                 user_id=sample_conversation.user_id,
                 workspace_id=sample_conversation.workspace_id
             )
+            await bridge.flush()
 
             # Verify only user message stored
             assert mock_conversation_service.add_message.call_count == 1
@@ -982,14 +998,19 @@ class TestConversationMetadataTracking:
             )
             bridge._conversation_service = mock_conversation_service
 
-            # Execute
-            result = await bridge.send_to_agent(
-                session_key=sample_conversation.openclaw_session_key,
-                message="Test message",
-                agent_id=sample_conversation.agent_id,
-                user_id=sample_conversation.user_id,
-                workspace_id=sample_conversation.workspace_id
-            )
+            async def send():
+                return await bridge.send_to_agent(
+                    session_key=sample_conversation.openclaw_session_key,
+                    message="Test message",
+                    agent_id=sample_conversation.agent_id,
+                    user_id=sample_conversation.user_id,
+                    workspace_id=sample_conversation.workspace_id
+                )
+
+            # Execute once the session's conversation has been resolved
+            await send()
+            await bridge.flush()
+            result = await send()
 
             # Verify conversation_id in response metadata
             assert "conversation_id" in result
@@ -1050,16 +1071,280 @@ class TestConversationMetadataTracking:
             )
             bridge._conversation_service = mock_conversation_service
 
-            # Execute with custom metadata
-            result = await bridge.send_to_agent(
-                session_key=sample_conversation.openclaw_session_key,
-                message="Test",
-                agent_id=sample_conversation.agent_id,
-                user_id=sample_conversation.user_id,
-                workspace_id=sample_conversation.workspace_id,
-                metadata=custom_metadata
-            )
+            async def send():
+                return await bridge.send_to_agent(
+                    session_key=sample_conversation.openclaw_session_key,
+                    message="Test",
+                    agent_id=sample_conversation.agent_id,
+                    user_id=sample_conversation.user_id,
+                    workspace_id=sample_conversation.workspace_id,
+                    metadata=custom_metadata
+                )
+
+            # Execute with custom metadata once the conversation is resolved
+            await send()
+            await bridge.flush()
+            result = await send()
 
             # Verify both conversation_id and custom metadata present
             assert result["conversation_id"] == str(sample_conversation.id)
             assert result["metadata"]["custom_field"] == "custom_value"
+
+
+class TestPipelinedSends:
+    """Test pipelined sends and write-behind persistence"""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_window_bounds_concurrent_sends(self, mock_base_bridge):
+        """Test concurrent sends to one session overlap up to the window size"""
+        in_flight = 0
+        peak = 0
+
+        async def slow_send(session_key, message, request_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"id": f"gw_{message}"}
+
+        mock_base_bridge.send_to_agent.side_effect = slow_send
+
+        with patch('backend.agents.orchestration.production_openclaw_bridge.BaseOpenClawBridge', return_value=mock_base_bridge):
+            bridge = ProductionOpenClawBridge(
+                url="ws://localhost:18789",
+                token="test-token",
+                max_in_flight_per_session=3
+            )
+
+            results = await asyncio.gather(*[
+                bridge.send_to_agent(session_key="whatsapp:dm:pipe", message=str(i))
+                for i in range(9)
+            ])
+
+            assert peak == 3
+            assert len({r["request_id"] for r in results}) == 9
+            stats = bridge.get_pipeline_stats()
+            assert stats["sent"] == 9
+            assert stats["in_flight"] == 0
+            assert stats["active_sessions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_persistence_does_not_delay_send(
+        self,
+        mock_base_bridge,
+        mock_conversation_service,
+        sample_conversation
+    ):
+        """Test message writes happen write-behind, in order, after the send returns"""
+        mock_conversation_service.get_conversation_by_session_key.return_value = sample_conversation
+        stored = []
+
+        async def slow_add_message(conversation_id, role, content, **kwargs):
+            await asyncio.sleep(0.05)
+            stored.append((role, content))
+
+        mock_conversation_service.add_message.side_effect = slow_add_message
+        mock_base_bridge.send_to_agent.side_effect = lambda session_key, message, request_id: {
+            "id": "gw", "result": {"response": f"re:{message}"}
+        }
+
+        with patch('backend.agents.orchestration.production_openclaw_bridge.BaseOpenClawBridge', return_value=mock_base_bridge):
+            bridge = ProductionOpenClawBridge(
+                url="ws://localhost:18789",
+                token="test-token"
+            )
+            bridge._conversation_service = mock_conversation_service
+
+            for text in ("one", "two"):
+                result = await asyncio.wait_for(
+                    bridge.send_to_agent(
+                        session_key=sample_conversation.openclaw_session_key,
+                        message=text,
+                        agent_id=sample_conversation.agent_id,
+                        user_id=sample_conversation.user_id,
+                        workspace_id=sample_conversation.workspace_id
+                    ),
+                    timeout=0.04
+                )
+                assert result["status"] == "sent"
+
+            await bridge.flush()
+
+            assert stored == [
+                ("user", "one"), ("assistant", "re:one"),
+                ("user", "two"), ("assistant", "re:two"),
+            ]
+            # Conversation lookup is cached per session key
+            mock_conversation_service.get_conversation_by_session_key.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidated_conversation_is_looked_up_again(
+        self,
+        mock_base_bridge,
+        mock_conversation_service,
+        sample_conversation
+    ):
+        """Test the session lookup goes through the shared metadata cache"""
+        mock_conversation_service.get_conversation_by_session_key.return_value = sample_conversation
+        mock_base_bridge.send_to_agent.return_value = {"id": "gw", "result": {}}
+
+        with patch('backend.agents.orchestration.production_openclaw_bridge.BaseOpenClawBridge', return_value=mock_base_bridge):
+            bridge = ProductionOpenClawBridge(
+                url="ws://localhost:18789",
+                token="test-token"
+            )
+            bridge._conversation_service = mock_conversation_service
+
+            async def send():
+                return await bridge.send_to_agent(
+                    session_key=sample_conversation.openclaw_session_key,
+                    message="Hello",
+                    agent_id=sample_conversation.agent_id,
+                    user_id=sample_conversation.user_id,
+                    workspace_id=sample_conversation.workspace_id
+                )
+
+            await send()
+            await bridge.flush()
+            cache = get_conversation_metadata_cache()
+            assert cache.get_by_session_key(sample_conversation.openclaw_session_key).id == sample_conversation.id
+
+            # Archiving invalidates the shared entry, so the bridge re-resolves
+            cache.invalidate(sample_conversation.id)
+            await send()
+            await bridge.flush()
+
+            assert mock_conversation_service.get_conversation_by_session_key.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_request_id_is_gateway_frame_id(self, mock_base_bridge):
+        """Test the returned request_id is the ID sent to the gateway"""
+        mock_base_bridge.send_to_agent.return_value = {"id": "gw", "result": {}}
+
+        with patch('backend.agents.orchestration.production_openclaw_bridge.BaseOpenClawBridge', return_value=mock_base_bridge):
+            bridge = ProductionOpenClawBridge(
+                url="ws://localhost:18789",
+                token="test-token"
+            )
+
+            result = await bridge.send_to_agent(
+                session_key="whatsapp:dm:test123",
+                message="Hello"
+            )
+
+            sent_id = mock_base_bridge.send_to_agent.call_args.kwargs["request_id"]
+            assert result["request_id"] == sent_id
+
+    @pytest.mark.asyncio
+    async def test_each_retry_uses_fresh_request_id(self, mock_base_bridge):
+        """Test retries send new frame IDs and the successful one is returned"""
+        mock_base_bridge.send_to_agent.side_effect = [
+            Exception("Timeout"),
+            {"id": "gw", "result": {}}
+        ]
+
+        with patch('backend.agents.orchestration.production_openclaw_bridge.BaseOpenClawBridge', return_value=mock_base_bridge):
+            bridge = ProductionOpenClawBridge(
+                url="ws://localhost:18789",
+                token="test-token",
+                initial_delay=0.01
+            )
+
+            result = await bridge.send_to_agent(
+                session_key="whatsapp:dm:test123",
+                message="Hello"
+            )
+
+            sent_ids = [
+                call.kwargs["request_id"]
+                for call in mock_base_bridge.send_to_agent.call_args_list
+            ]
+            assert len(set(sent_ids)) == 2
+            assert result["request_id"] == sent_ids[-1]
+
+    @pytest.mark.asyncio
+    async def test_send_returns_when_persistence_queue_full(
+        self,
+        mock_base_bridge,
+        mock_conversation_service
+    ):
+        """Test a dropped conversation lookup resolves to None instead of blocking the send"""
+        release = asyncio.Event()
+        mock_base_bridge.send_to_agent.return_value = {
+            "id": "gw", "result": {"response": "hi"}
+        }
+
+        with patch('backend.agents.orchestration.production_openclaw_bridge.BaseOpenClawBridge', return_value=mock_base_bridge):
+            bridge = ProductionOpenClawBridge(
+                url="ws://localhost:18789",
+                token="test-token",
+                persistence_queue_size=1
+            )
+            bridge._conversation_service = mock_conversation_service
+
+            # Worker blocks on the first operation, the second fills the queue
+            assert bridge._enqueue_write(release.wait) is True
+            await asyncio.sleep(0)
+            assert bridge._enqueue_write(release.wait) is True
+
+            result = await asyncio.wait_for(
+                bridge.send_to_agent(
+                    session_key="whatsapp:dm:full",
+                    message="Hello",
+                    agent_id=uuid4(),
+                    user_id=uuid4(),
+                    workspace_id=uuid4()
+                ),
+                timeout=1.0
+            )
+
+            assert result["status"] == "sent"
+            assert "conversation_id" not in result
+            assert "whatsapp:dm:full" not in bridge._conversation_futures
+            assert bridge.get_pipeline_stats()["writes_failed"] >= 1
+
+            release.set()
+            await asyncio.wait_for(bridge.flush(), timeout=1.0)
+            mock_conversation_service.add_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_does_not_wait_for_pending_conversation_lookup(
+        self,
+        mock_base_bridge,
+        mock_conversation_service,
+        sample_conversation
+    ):
+        """Test a pending conversation lookup does not hold the response"""
+        release = asyncio.Event()
+
+        async def slow_lookup(session_key):
+            await release.wait()
+            return sample_conversation
+
+        mock_conversation_service.get_conversation_by_session_key.side_effect = slow_lookup
+        mock_base_bridge.send_to_agent.return_value = {"id": "gw"}
+
+        with patch('backend.agents.orchestration.production_openclaw_bridge.BaseOpenClawBridge', return_value=mock_base_bridge):
+            bridge = ProductionOpenClawBridge(
+                url="ws://localhost:18789",
+                token="test-token"
+            )
+            bridge._conversation_service = mock_conversation_service
+
+            result = await asyncio.wait_for(
+                bridge.send_to_agent(
+                    session_key=sample_conversation.openclaw_session_key,
+                    message="Hello",
+                    agent_id=sample_conversation.agent_id,
+                    user_id=sample_conversation.user_id,
+                    workspace_id=sample_conversation.workspace_id
+                ),
+                timeout=0.1
+            )
+            assert "conversation_id" not in result
+
+            # The lookup still completes and the user message is persisted
+            release.set()
+            await asyncio.wait_for(bridge.flush(), timeout=1.0)
+            mock_conversation_service.add_message.assert_called_once()
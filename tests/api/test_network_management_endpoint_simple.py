@@ -139,3 +139,23 @@ class TestNetworkManagementEndpoints:
             assert len(response.nodes) == 2  # hub + 1 peer
             assert response.nodes[0].type == 'hub'
 
+    def test_provisioning_service_shared_with_wireguard_router(self):
+        """Test both routers resolve the same provisioning service dependency"""
+        from backend.api.v1.endpoints import network_management, wireguard_provisioning
+
+        assert network_management.get_provisioning_service is wireguard_provisioning.get_provisioning_service
+
+    def test_shared_provisioning_service_keeps_default_pool(self, monkeypatch):
+        """Test the shared getter defaults to the 10.8.0.0/24 pool and 10.8.0.1 hub"""
+        from backend.api.v1.endpoints import wireguard_provisioning
+
+        monkeypatch.delenv("WIREGUARD_IP_POOL", raising=False)
+        monkeypatch.delenv("WIREGUARD_HUB_IP", raising=False)
+        monkeypatch.setattr(wireguard_provisioning, "_provisioning_service", None)
+
+        with patch.object(wireguard_provisioning, "WireGuardProvisioningService") as service_cls:
+            wireguard_provisioning.get_provisioning_service()
+
+        kwargs = service_cls.call_args.kwargs
+        assert kwargs["ip_pool_network"] == "10.8.0.0/24"
+        assert kwargs["hub_ip"] == "10.8.0.1"
@@ -18,6 +18,8 @@ from unittest.mock import Mock, AsyncMock
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from backend.security.principal_cache import UserSnapshot
+
 # We'll create a minimal test app to avoid import errors from the full app
 test_app = FastAPI()
 
@@ -29,13 +31,37 @@ def db_session():
 
 
 @pytest.fixture
-def mock_conversation_service():
+def current_user():
+    """Authenticated user returned by the overridden auth dependencies."""
+    return UserSnapshot(
+        id=uuid4(),
+        email="user@example.com",
+        workspace_id=uuid4(),
+        is_active=True
+    )
+
+
+@pytest.fixture
+def owned_conversation(current_user):
+    """Conversation in the current user's workspace and owned by them."""
+    conv = Mock()
+    conv.id = uuid4()
+    conv.workspace_id = current_user.workspace_id
+    conv.user_id = current_user.id
+    conv.message_count = 0
+    return conv
+
+
+@pytest.fixture
+def mock_conversation_service(owned_conversation):
     """Create a mocked ConversationService."""
     service = Mock()
     # Make async methods return AsyncMock
     service.list_conversations = AsyncMock()
-    service.get_conversation = AsyncMock()
+    service.get_conversation = AsyncMock(return_value=owned_conversation)
+    service.get_message_count = AsyncMock(return_value=0)
     service.get_messages = AsyncMock()
+    service.get_messages_page = AsyncMock(return_value=([], None))
     service.search_conversation_semantic = AsyncMock()
     service.create_conversation = AsyncMock()
     service.add_message = AsyncMock()
@@ -46,10 +72,11 @@ def mock_conversation_service():
 
 
 @pytest.fixture(scope="function")
-def client(db_session, mock_conversation_service):
-    """Create FastAPI test client with mocked service."""
+def client(db_session, mock_conversation_service, current_user):
+    """Create FastAPI test client with mocked service and an authenticated user."""
     from backend.api.v1.endpoints.conversations import router, get_conversation_service
     from backend.db.base import get_async_db
+    from backend.security.auth_dependencies import get_current_active_user, get_current_user
 
     # Include the conversations router in our test app
     test_app.include_router(router, prefix="/api/v1")
@@ -62,6 +89,8 @@ def client(db_session, mock_conversation_service):
 
     test_app.dependency_overrides[get_async_db] = override_get_async_db
     test_app.dependency_overrides[get_conversation_service] = override_get_conversation_service
+    test_app.dependency_overrides[get_current_user] = lambda: current_user
+    test_app.dependency_overrides[get_current_active_user] = lambda: current_user
 
     yield TestClient(test_app)
 
@@ -311,12 +340,10 @@ class TestGetConversationMessages:
                     "metadata": {}
                 }
             ]
-        mock_conversation_service.get_messages.return_value = mock_messages
+        mock_conversation_service.get_messages_page.return_value = (mock_messages, "next_page")
 
-        # Mock get_conversation to provide total message count
-        mock_conv = Mock()
-        mock_conv.message_count = 2
-        mock_conversation_service.get_conversation.return_value = mock_conv
+        # Total comes from the service's message count
+        mock_conversation_service.get_message_count.return_value = 2
 
         response = client.get(f"/api/v1/conversations/{conversation_id}/messages")
 
@@ -326,23 +353,22 @@ class TestGetConversationMessages:
         assert len(data["messages"]) == 2
         assert data["messages"][0]["role"] == "user"
         assert data["messages"][1]["role"] == "assistant"
+        assert data["next_cursor"] == "next_page"
 
-        # Verify service was called with correct parameters
-        mock_conversation_service.get_messages.assert_called_once()
-        call_kwargs = mock_conversation_service.get_messages.call_args.kwargs
+        # First page uses keyset pagination
+        mock_conversation_service.get_messages_page.assert_called_once()
+        call_kwargs = mock_conversation_service.get_messages_page.call_args.kwargs
         assert str(call_kwargs["conversation_id"]) == str(conversation_id)
         assert call_kwargs["limit"] == 50
-        assert call_kwargs["offset"] == 0
+        assert call_kwargs["cursor"] is None
 
     def test_get_messages_with_pagination(self, client, mock_conversation_service):
         """Test retrieving messages with custom pagination."""
         conversation_id = uuid4()
         mock_conversation_service.get_messages.return_value = []
 
-        # Mock get_conversation to provide total message count
-        mock_conv = Mock()
-        mock_conv.message_count = 100
-        mock_conversation_service.get_conversation.return_value = mock_conv
+        # Total comes from the service's message count
+        mock_conversation_service.get_message_count.return_value = 100
 
         response = client.get(f"/api/v1/conversations/{conversation_id}/messages?limit=20&offset=40")
 
@@ -395,10 +421,8 @@ class TestGetConversationMessages:
         conversation_id = uuid4()
         mock_conversation_service.get_messages.return_value = []
 
-        # Mock get_conversation to provide total message count
-        mock_conv = Mock()
-        mock_conv.message_count = 0
-        mock_conversation_service.get_conversation.return_value = mock_conv
+        # Total comes from the service's message count
+        mock_conversation_service.get_message_count.return_value = 0
 
         response = client.get(f"/api/v1/conversations/{conversation_id}/messages")
 
@@ -479,6 +503,33 @@ class TestSearchConversation:
         call_kwargs = mock_conversation_service.search_conversation_semantic.call_args.kwargs
         assert call_kwargs["limit"] == 20
 
+    def test_search_conversation_forwards_offset(self, client, mock_conversation_service):
+        """Test search offset is forwarded to the service (defaults to 0)."""
+        conversation_id = uuid4()
+        mock_conversation_service.search_conversation_semantic.return_value = {"results": {}}
+
+        response = client.post(
+            f"/api/v1/conversations/{conversation_id}/search",
+            json={"query": "test", "limit": 5, "offset": 10}
+        )
+        assert response.status_code == 200
+        call_kwargs = mock_conversation_service.search_conversation_semantic.call_args.kwargs
+        assert call_kwargs["offset"] == 10
+
+        response = client.post(
+            f"/api/v1/conversations/{conversation_id}/search",
+            json={"query": "test"}
+        )
+        assert response.status_code == 200
+        call_kwargs = mock_conversation_service.search_conversation_semantic.call_args.kwargs
+        assert call_kwargs["offset"] == 0
+
+        response = client.post(
+            f"/api/v1/conversations/{conversation_id}/search",
+            json={"query": "test", "offset": -1}
+        )
+        assert response.status_code == 422
+
     def test_search_conversation_limit_validation(self, client, mock_conversation_service):
         """Test search limit validation (1-50)."""
         conversation_id = uuid4()
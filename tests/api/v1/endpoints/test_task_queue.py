@@ -11,6 +11,9 @@ Tests all endpoints for task queue management:
 Refs: Issue #86
 """
 
+import os
+import tempfile
+
 import pytest
 from datetime import datetime, timezone, timedelta
 from uuid import uuid4
@@ -21,15 +24,15 @@ from sqlalchemy.orm import sessionmaker
 from backend.main import app
 from backend.db.base import get_db
 from backend.db.base_class import Base
-from backend.models.task_queue import Task, TaskLease, TaskStatus, TaskPriority
+from backend.models.task_lease import Task, TaskLease, TaskStatus, TaskPriority
 from backend.services.task_timeline_service import (
     get_timeline_service,
     TimelineEventType,
 )
 
 
-# Test database setup
-TEST_DATABASE_URL = "sqlite:///./test_task_queue.db"
+# Test database setup (kept out of the working tree)
+TEST_DATABASE_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test_task_queue.db')}"
 test_engine = create_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False},
@@ -599,6 +602,20 @@ class TestQueueStats:
         assert "completed" in bucket
         assert "failed" in bucket
 
+    def test_stats_time_series_bucket_counts(self, sample_tasks):
+        """Should aggregate created/completed/failed counts into aligned buckets"""
+        response = client.get("/api/v1/tasks/stats")
+        assert response.status_code == 200
+        buckets = response.json()["time_series"]["hourly"]
+
+        assert len(buckets) == 24
+        assert sum(b["created"] for b in buckets) == 5
+        assert sum(b["completed"] for b in buckets) == 1
+        assert sum(b["failed"] for b in buckets) == 1
+        for bucket in buckets:
+            timestamp = datetime.fromisoformat(bucket["timestamp"])
+            assert timestamp.minute == 0 and timestamp.second == 0
+
     def test_stats_time_series_custom_interval(self, sample_tasks):
         """Should support custom time series interval"""
         response = client.get("/api/v1/tasks/stats?interval=daily")
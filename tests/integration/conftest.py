@@ -181,7 +181,7 @@ def zerodb_client_mock() -> MagicMock:
             "created_at": datetime.now(timezone.utc).isoformat()
         }
 
-    mock.create_table_row = AsyncMock(side_effect=create_row_side_effect)
+    mock.create_table_row_batched = AsyncMock(side_effect=create_row_side_effect)
 
     # Mock memory creation
     memory_counter = {"count": 0}
@@ -612,7 +612,7 @@ def zerodb_client_with_failures():
                     raise ZeroDBConnectionError(f"Connection failed (attempt {attempt_counter['table_row']})")
                 return create_row_normal(project_id, table_name, row_data)
 
-            mock.create_table_row = AsyncMock(side_effect=create_row_with_failures)
+            mock.create_table_row_batched = AsyncMock(side_effect=create_row_with_failures)
 
         elif operation == "memory":
             def create_memory_with_failures(title, content, type, tags, metadata):
@@ -625,11 +625,11 @@ def zerodb_client_with_failures():
 
     def partial_failure_mode():
         """Table write succeeds, memory write fails"""
-        mock.create_table_row = AsyncMock(side_effect=create_row_normal)
+        mock.create_table_row_batched = AsyncMock(side_effect=create_row_normal)
         mock.create_memory = AsyncMock(side_effect=ZeroDBAPIError("Memory write failed"))
 
     # Setup default behavior
-    mock.create_table_row = AsyncMock(side_effect=create_row_normal)
+    mock.create_table_row_batched = AsyncMock(side_effect=create_row_normal)
     mock.create_memory = AsyncMock(side_effect=create_memory_normal)
     mock.query_table = AsyncMock(return_value=[])
     mock.search_memories = AsyncMock(return_value={"results": [], "total": 0})
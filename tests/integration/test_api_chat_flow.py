@@ -15,6 +15,11 @@ from datetime import datetime, timezone
 from fastapi import status
 
 
+def _rows_response(rows):
+    """Wrap message documents in the ZeroDB query_rows response shape"""
+    return {"data": [{"row_data": row} for row in rows], "total": len(rows)}
+
+
 @pytest.mark.asyncio
 class TestConversationAPIIntegration:
     """Test conversation API endpoints with full stack"""
@@ -130,9 +135,9 @@ class TestConversationAPIIntegration:
             )
             all_messages.append(msg)
 
-        # Mock query_table to return paginated results
-        def query_table_paginated(project_id, table_name, limit=10, skip=0):
-            return [
+        # Mock query_rows to return paginated results
+        def query_rows_paginated(table_name, filter_query, project_id=None, limit=100, skip=0):
+            return _rows_response([
                 {
                     "id": f"msg_{j:03d}",
                     "role": "user" if j % 2 == 0 else "assistant",
@@ -140,9 +145,9 @@ class TestConversationAPIIntegration:
                     "timestamp": datetime.now(timezone.utc).isoformat()
                 }
                 for j in range(skip, min(skip + limit, 100))
-            ]
+            ])
 
-        zerodb_client_mock.query_table = AsyncMock(side_effect=query_table_paginated)
+        zerodb_client_mock.query_rows = AsyncMock(side_effect=query_rows_paginated)
 
         # Override dependencies
         async def override_get_db():
@@ -590,14 +595,14 @@ class TestLifecycleIntegration:
         assert conversation.message_count == 1
 
         # Verify message can be retrieved
-        zerodb_client_mock.query_table = AsyncMock(return_value=[
+        zerodb_client_mock.query_rows = AsyncMock(return_value=_rows_response([
             {
                 "id": "msg_heartbeat_001",
                 "role": "system",
                 "content": "Heartbeat execution: All checks passed",
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
-        ])
+        ]))
 
         messages = await service.get_messages(conversation.id, limit=10)
         assert len(messages) == 1
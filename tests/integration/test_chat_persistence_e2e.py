@@ -46,6 +46,11 @@ from backend.models.workspace import Workspace
 from backend.integrations.zerodb_client import ZeroDBConnectionError, ZeroDBAPIError
 
 
+def _rows_response(rows):
+    """Wrap message documents in the ZeroDB query_rows response shape"""
+    return {"data": [{"row_data": row} for row in rows], "total": len(rows)}
+
+
 @pytest.mark.asyncio
 class TestFullMessageFlow:
     """Test complete message flow from WhatsApp to ZeroDB"""
@@ -128,8 +133,8 @@ class TestFullMessageFlow:
             assert conversation.openclaw_session_key == whatsapp_session
 
             # Verify user message persisted to ZeroDB table
-            assert zerodb_client_mock.create_table_row.call_count >= 1
-            user_msg_call = zerodb_client_mock.create_table_row.call_args_list[0]
+            assert zerodb_client_mock.create_table_row_batched.call_count >= 1
+            user_msg_call = zerodb_client_mock.create_table_row_batched.call_args_list[0]
             assert user_msg_call[1]["row_data"]["role"] == "user"
             assert user_msg_call[1]["row_data"]["content"] == "Hello from WhatsApp!"
             assert user_msg_call[1]["row_data"]["conversation_id"] == str(conversation.id)
@@ -143,8 +148,8 @@ class TestFullMessageFlow:
             assert str(conversation.id) in user_memory_call[1]["tags"]
 
             # Step 5-6: Verify assistant response stored
-            assert zerodb_client_mock.create_table_row.call_count >= 2
-            assistant_msg_call = zerodb_client_mock.create_table_row.call_args_list[1]
+            assert zerodb_client_mock.create_table_row_batched.call_count >= 2
+            assistant_msg_call = zerodb_client_mock.create_table_row_batched.call_args_list[1]
             assert assistant_msg_call[1]["row_data"]["role"] == "assistant"
             assert assistant_msg_call[1]["row_data"]["content"] == "Hello! I received your WhatsApp message."
             assert assistant_msg_call[1]["row_data"]["metadata"]["model"] == "claude-3-5-sonnet-20241022"
@@ -155,7 +160,7 @@ class TestFullMessageFlow:
             assert conversation.last_message_at is not None
 
             # Step 8: Verify messages retrievable
-            zerodb_client_mock.query_table = AsyncMock(return_value=[
+            zerodb_client_mock.query_rows = AsyncMock(return_value=_rows_response([
                 {
                     "id": "msg_001",
                     "role": "user",
@@ -169,7 +174,7 @@ class TestFullMessageFlow:
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                     "metadata": {"model": "claude-3-5-sonnet-20241022"}
                 }
-            ])
+            ]))
 
             messages = await service.get_messages(conversation.id, limit=50, offset=0)
             assert len(messages) == 2
@@ -248,13 +253,13 @@ class TestFullMessageFlow:
             await db.refresh(conversation)
             assert conversation.message_count == 10
 
-            # Verify create_table_row called 10 times
-            assert zerodb_client_mock.create_table_row.call_count == 10
+            # Verify create_table_row_batched called 10 times
+            assert zerodb_client_mock.create_table_row_batched.call_count == 10
 
             # Verify message order
             user_messages = [
                 call[1]["row_data"]["content"]
-                for call in zerodb_client_mock.create_table_row.call_args_list
+                for call in zerodb_client_mock.create_table_row_batched.call_args_list
                 if call[1]["row_data"]["role"] == "user"
             ]
             assert user_messages == messages
@@ -362,7 +367,7 @@ class TestConversationLifecycle:
         assert sample_conversation.message_count == 20
 
         # Verify all messages linked to same conversation
-        table_calls = zerodb_client_mock.create_table_row.call_args_list
+        table_calls = zerodb_client_mock.create_table_row_batched.call_args_list
         conversation_ids = [
             call[1]["row_data"]["conversation_id"]
             for call in table_calls
@@ -403,14 +408,14 @@ class TestConversationLifecycle:
         assert sample_conversation.status == ConversationStatus.ARCHIVED
 
         # Verify messages still retrievable
-        zerodb_client_mock.query_table = AsyncMock(return_value=[
+        zerodb_client_mock.query_rows = AsyncMock(return_value=_rows_response([
             {
                 "id": "msg_archived_001",
                 "role": "user",
                 "content": "Message before archival",
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
-        ])
+        ]))
 
         messages = await service.get_messages(sample_conversation.id, limit=10)
         assert len(messages) == 1
@@ -447,7 +452,7 @@ class TestAgentContextLoading:
             )
 
         # Mock query to return last 10 messages
-        zerodb_client_mock.query_table = AsyncMock(return_value=[
+        zerodb_client_mock.query_rows = AsyncMock(return_value=_rows_response([
             {
                 "id": f"msg_{i:03d}",
                 "role": "user" if i % 2 == 0 else "assistant",
@@ -455,7 +460,7 @@ class TestAgentContextLoading:
                 "timestamp": (datetime.now(timezone.utc) + timedelta(seconds=i)).isoformat()
             }
             for i in range(5, 15)  # Messages 5-14 (last 10)
-        ])
+        ]))
 
         # Agent loads context
         messages = await service.get_messages(
@@ -509,7 +514,7 @@ class TestAgentContextLoading:
         )
 
         # Mock query with metadata
-        zerodb_client_mock.query_table = AsyncMock(return_value=[
+        zerodb_client_mock.query_rows = AsyncMock(return_value=_rows_response([
             {
                 "id": "msg_meta_001",
                 "role": "user",
@@ -530,7 +535,7 @@ class TestAgentContextLoading:
                     "tokens_used": 85
                 }
             }
-        ])
+        ]))
 
         # Agent loads context
         messages = await service.get_messages(sample_conversation.id, limit=10)
@@ -635,14 +640,14 @@ class TestMultiUserIsolation:
             # Verify messages isolated
             user1_messages = [
                 call[1]["row_data"]["content"]
-                for call in zerodb_client_mock.create_table_row.call_args_list
+                for call in zerodb_client_mock.create_table_row_batched.call_args_list
                 if call[1]["row_data"]["conversation_id"] == str(conv1.id)
                 and call[1]["row_data"]["role"] == "user"
             ]
 
             user2_messages = [
                 call[1]["row_data"]["content"]
-                for call in zerodb_client_mock.create_table_row.call_args_list
+                for call in zerodb_client_mock.create_table_row_batched.call_args_list
                 if call[1]["row_data"]["conversation_id"] == str(conv2.id)
                 and call[1]["row_data"]["role"] == "user"
             ]
@@ -750,7 +755,7 @@ class TestMultiUserIsolation:
             )
 
             # Verify messages sent to different ZeroDB projects
-            table_calls = zerodb_client_mock.create_table_row.call_args_list
+            table_calls = zerodb_client_mock.create_table_row_batched.call_args_list
             projects_used = set()
 
             for call in table_calls:
@@ -902,7 +907,7 @@ class TestErrorRecovery:
             }
 
         mock_zerodb = MagicMock()
-        mock_zerodb.create_table_row = AsyncMock(side_effect=create_table_row_with_retry)
+        mock_zerodb.create_table_row_batched = AsyncMock(side_effect=create_table_row_with_retry)
         mock_zerodb.create_memory = AsyncMock(return_value={"id": "mem_retry"})
 
         with patch('integrations.openclaw_bridge.OpenClawBridge') as MockBaseOpenClawBridge:
@@ -939,7 +944,7 @@ class TestErrorRecovery:
             assert response["status"] == "sent"
 
             # Verify retry attempted multiple times
-            assert mock_zerodb.create_table_row.call_count >= 2
+            assert mock_zerodb.create_table_row_batched.call_count >= 2
 
     async def test_partial_failure_recovery(
         self,
@@ -960,7 +965,7 @@ class TestErrorRecovery:
         service = ConversationService(db=db, zerodb_client=zerodb_client_mock)
 
         # Mock: table write succeeds, memory write fails
-        zerodb_client_mock.create_table_row = AsyncMock(return_value={"id": "msg_partial"})
+        zerodb_client_mock.create_table_row_batched = AsyncMock(return_value={"id": "msg_partial"})
         zerodb_client_mock.create_memory = AsyncMock(side_effect=ZeroDBAPIError("Memory write failed"))
 
         # Add message (should succeed despite memory failure)
@@ -1157,8 +1162,8 @@ class TestAPIIntegration:
         service = ConversationService(db=db, zerodb_client=zerodb_client_mock)
 
         # Mock query to return paginated messages instantly
-        def query_table_paginated(project_id, table_name, limit=10, skip=0):
-            return [
+        def query_rows_paginated(table_name, filter_query, project_id=None, limit=100, skip=0):
+            return _rows_response([
                 {
                     "id": f"msg_{i:04d}",
                     "role": "user" if i % 2 == 0 else "assistant",
@@ -1166,9 +1171,9 @@ class TestAPIIntegration:
                     "timestamp": datetime.now(timezone.utc).isoformat()
                 }
                 for i in range(skip, min(skip + limit, 1000))
-            ]
+            ])
 
-        zerodb_client_mock.query_table = AsyncMock(side_effect=query_table_paginated)
+        zerodb_client_mock.query_rows = AsyncMock(side_effect=query_rows_paginated)
 
         # Override dependencies
         async def override_get_db():
@@ -1231,7 +1236,7 @@ class TestZeroDBConsistency:
         )
 
         # Verify table storage
-        table_call = zerodb_client_mock.create_table_row.call_args
+        table_call = zerodb_client_mock.create_table_row_batched.call_args
         assert table_call[1]["row_data"]["content"] == content
         assert table_call[1]["row_data"]["conversation_id"] == str(sample_conversation.id)
 
@@ -1416,8 +1421,8 @@ class TestPerformanceMetrics:
         service = ConversationService(db=db, zerodb_client=zerodb_client_mock)
 
         # Mock large conversation
-        def query_large_conversation(project_id, table_name, limit=10, skip=0):
-            return [
+        def query_large_conversation(table_name, filter_query, project_id=None, limit=100, skip=0):
+            return _rows_response([
                 {
                     "id": f"msg_{i:05d}",
                     "role": "user" if i % 2 == 0 else "assistant",
@@ -1425,9 +1430,9 @@ class TestPerformanceMetrics:
                     "timestamp": datetime.now(timezone.utc).isoformat()
                 }
                 for i in range(skip, min(skip + limit, 10000))
-            ]
+            ])
 
-        zerodb_client_mock.query_table = AsyncMock(side_effect=query_large_conversation)
+        zerodb_client_mock.query_rows = AsyncMock(side_effect=query_large_conversation)
 
         start = datetime.now(timezone.utc)
 
@@ -21,6 +21,11 @@ from backend.models.conversation import Conversation
 from backend.integrations.zerodb_client import ZeroDBConnectionError, ZeroDBAPIError
 
 
+def _rows_response(rows):
+    """Wrap message documents in the ZeroDB query_rows response shape"""
+    return {"data": [{"row_data": row} for row in rows], "total": len(rows)}
+
+
 @pytest.mark.asyncio
 class TestFullChatPersistenceFlow:
     """Test complete chat persistence flow end-to-end"""
@@ -107,8 +112,8 @@ class TestFullChatPersistenceFlow:
             assert conversation.user_id == sample_user.id
 
             # Step 7: Verify user message stored (both table + memory)
-            assert zerodb_client_mock.create_table_row.call_count >= 1
-            user_message_call = zerodb_client_mock.create_table_row.call_args_list[0]
+            assert zerodb_client_mock.create_table_row_batched.call_count >= 1
+            user_message_call = zerodb_client_mock.create_table_row_batched.call_args_list[0]
             assert user_message_call[1]["row_data"]["role"] == "user"
             assert user_message_call[1]["row_data"]["content"] == "Hello, assistant!"
             assert user_message_call[1]["row_data"]["conversation_id"] == str(conversation.id)
@@ -121,16 +126,16 @@ class TestFullChatPersistenceFlow:
             assert str(conversation.id) in memory_call[1]["tags"]
 
             # Step 8: Verify assistant response stored
-            assert zerodb_client_mock.create_table_row.call_count >= 2
-            assistant_message_call = zerodb_client_mock.create_table_row.call_args_list[1]
+            assert zerodb_client_mock.create_table_row_batched.call_count >= 2
+            assistant_message_call = zerodb_client_mock.create_table_row_batched.call_args_list[1]
             assert assistant_message_call[1]["row_data"]["role"] == "assistant"
             assert assistant_message_call[1]["row_data"]["content"] == "Hello! How can I help you?"
             assert assistant_message_call[1]["row_data"]["metadata"]["model"] == "claude-3-5-sonnet-20241022"
             assert assistant_message_call[1]["row_data"]["metadata"]["tokens_used"] == 150
 
             # Step 9: Retrieve messages via ConversationService
-            # Mock query_table to return stored messages
-            zerodb_client_mock.query_table = AsyncMock(return_value=[
+            # Mock query_rows to return stored messages
+            zerodb_client_mock.query_rows = AsyncMock(return_value=_rows_response([
                 {
                     "id": "msg_001",
                     "role": "user",
@@ -144,7 +149,7 @@ class TestFullChatPersistenceFlow:
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                     "metadata": {"model": "claude-3-5-sonnet-20241022", "tokens_used": 150}
                 }
-            ])
+            ]))
 
             messages = await service.get_messages(conversation.id, limit=50, offset=0)
             assert len(messages) == 2
@@ -165,7 +170,7 @@ class TestFullChatPersistenceFlow:
         """
         Test: Messages stored in BOTH ZeroDB Table AND Memory API
 
-        - Verify create_table_row called for messages
+        - Verify create_table_row_batched called for messages
         - Verify create_memory called for semantic search
         - Verify both have same content
         """
@@ -181,8 +186,8 @@ class TestFullChatPersistenceFlow:
         )
 
         # Verify table storage
-        assert zerodb_client_mock.create_table_row.called
-        table_call = zerodb_client_mock.create_table_row.call_args
+        assert zerodb_client_mock.create_table_row_batched.called
+        table_call = zerodb_client_mock.create_table_row_batched.call_args
         assert table_call[1]["row_data"]["content"] == message_content
         assert table_call[1]["row_data"]["role"] == "user"
         assert table_call[1]["table_name"] == "messages"
@@ -296,11 +301,11 @@ class TestFullChatPersistenceFlow:
             for i in range(100)
         ]
 
-        # Mock query_table to return paginated results
-        def query_table_paginated(project_id, table_name, limit=10, skip=0):
-            return all_messages[skip:skip + limit]
+        # Mock query_rows to return paginated results
+        def query_rows_paginated(table_name, filter_query, project_id=None, limit=100, skip=0):
+            return _rows_response(all_messages[skip:skip + limit])
 
-        zerodb_client_mock.query_table = AsyncMock(side_effect=query_table_paginated)
+        zerodb_client_mock.query_rows = AsyncMock(side_effect=query_rows_paginated)
 
         # Retrieve first page (limit=50, offset=0)
         first_page = await service.get_messages(
@@ -367,8 +372,8 @@ class TestFullChatPersistenceFlow:
         await db.refresh(sample_conversation)
         assert sample_conversation.message_count == 10
 
-        # Verify all create_table_row calls succeeded
-        assert zerodb_client_mock.create_table_row.call_count == 10
+        # Verify all create_table_row_batched calls succeeded
+        assert zerodb_client_mock.create_table_row_batched.call_count == 10
 
 
 @pytest.mark.asyncio
@@ -1173,3 +1173,202 @@ async def test_metrics_collection(reconciliation_service):
     assert "degraded_duration_seconds" in metrics
     assert metrics["state"] == ReconciliationState.DEGRADED.value
     assert metrics["buffered_results_count"] == 3
+
+
+def _task_result(lease: TaskLease, index: int) -> TaskResult:
+    return TaskResult(
+        task_id=lease.task_id,
+        peer_id=lease.lease_owner_peer_id,
+        lease_token=lease.lease_token,
+        status=TaskStatus.COMPLETED,
+        output_payload={"result": f"Task {index} completed"},
+        execution_metadata={"duration_seconds": index},
+        submitted_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_durable_buffer_survives_restart(
+    tmp_path,
+    lease_validation_service,
+    valid_task_lease,
+):
+    """
+    Given results buffered to a durable log
+    When the service restarts and flushes
+    Then buffered results are restored, submitted once, and not replayed again
+
+    BDD Scenario: Durable Result Buffer
+    """
+    # Given: Three results buffered before a crash
+    service = DBOSReconciliationService(
+        dbos_gateway_url="http://localhost:8080",
+        lease_validator=lease_validation_service,
+        buffer_dir=str(tmp_path),
+    )
+    for i in range(3):
+        assert await service.buffer_result(_task_result(valid_task_lease, i))
+    service.segment_log.close()
+
+    # When: A new process starts on the same directory
+    restarted = DBOSReconciliationService(
+        dbos_gateway_url="http://localhost:8080",
+        lease_validator=lease_validation_service,
+        buffer_dir=str(tmp_path),
+    )
+    lease_validation_service.lease_store[valid_task_lease.lease_token] = valid_task_lease
+
+    # Then: Results are restored in order
+    assert [r.output_payload["result"] for r in restarted.result_buffer] == [
+        "Task 0 completed", "Task 1 completed", "Task 2 completed"
+    ]
+
+    submit_mock = AsyncMock(return_value={"success": True})
+    with patch.object(restarted, "_submit_result_to_dbos", submit_mock):
+        summary = await restarted.flush_buffered_results()
+    await restarted.close()
+
+    assert summary["submitted"] == 3
+    # And: The checkpoint covers the flush, so nothing is replayed again
+    again = DBOSReconciliationService(
+        dbos_gateway_url="http://localhost:8080",
+        lease_validator=lease_validation_service,
+        buffer_dir=str(tmp_path),
+    )
+    assert again.result_buffer == []
+    await again.close()
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_restart_mid_flush_resumes_after_checkpoint(
+    tmp_path,
+    lease_validation_service,
+    valid_task_lease,
+):
+    """
+    Given a flush checkpointed after the first result
+    When the process restarts before finishing
+    Then only the unprocessed results are restored
+
+    BDD Scenario: Checkpointed Flush Resume
+    """
+    service = DBOSReconciliationService(
+        dbos_gateway_url="http://localhost:8080",
+        lease_validator=lease_validation_service,
+        buffer_dir=str(tmp_path),
+    )
+    for i in range(3):
+        await service.buffer_result(_task_result(valid_task_lease, i))
+    first_sequence = service.result_buffer[0].sequence
+    service.segment_log.checkpoint(first_sequence)
+    await service.close()
+
+    restarted = DBOSReconciliationService(
+        dbos_gateway_url="http://localhost:8080",
+        lease_validator=lease_validation_service,
+        buffer_dir=str(tmp_path),
+    )
+
+    assert [r.output_payload["result"] for r in restarted.result_buffer] == [
+        "Task 1 completed", "Task 2 completed"
+    ]
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_validates_in_bulk_with_bounded_concurrency(
+    lease_validation_service,
+    buffered_results,
+    valid_task_lease,
+):
+    """
+    Given many buffered results sharing leases
+    When flushing with a concurrency limit
+    Then leases are validated in one bulk call and submissions never exceed the limit
+
+    BDD Scenario: Pipelined Flush
+    """
+    service = DBOSReconciliationService(
+        dbos_gateway_url="http://localhost:8080",
+        lease_validator=lease_validation_service,
+        max_concurrent_submissions=3,
+    )
+    service.result_buffer = buffered_results.copy()
+    lease_validation_service.lease_store[valid_task_lease.lease_token] = valid_task_lease
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_submit(result):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"success": True}
+
+    bulk_spy = AsyncMock(wraps=lease_validation_service.validate_lease_tokens)
+    with patch.object(service, "_submit_result_to_dbos", side_effect=slow_submit), \
+            patch.object(lease_validation_service, "validate_lease_tokens", bulk_spy):
+        summary = await service.flush_buffered_results()
+    await service.close()
+
+    assert summary["submitted"] == 8
+    assert summary["discarded"] == 2
+    assert bulk_spy.await_count == 1
+    # 10 results share 2 distinct (token, task, peer) triples
+    assert len(bulk_spy.await_args.args[0]) == 2
+    assert 1 < peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_failed_submissions_stay_buffered_and_unchecked(
+    tmp_path,
+    lease_validation_service,
+    valid_task_lease,
+):
+    """
+    Given three durable buffered results
+    When the second submission fails and the third raises
+    Then both stay buffered and are restored after a restart, while the
+         submitted result is not replayed
+
+    BDD Scenario: Failed Submission Retention
+    """
+    service = DBOSReconciliationService(
+        dbos_gateway_url="http://localhost:8080",
+        lease_validator=lease_validation_service,
+        buffer_dir=str(tmp_path),
+    )
+    for i in range(3):
+        assert await service.buffer_result(_task_result(valid_task_lease, i))
+    lease_validation_service.lease_store[valid_task_lease.lease_token] = valid_task_lease
+
+    async def flaky_submit(result):
+        outcome = result.output_payload["result"]
+        if outcome == "Task 1 completed":
+            return {"success": False, "error": "Network error"}
+        if outcome == "Task 2 completed":
+            raise Exception("Unexpected error")
+        return {"success": True}
+
+    with patch.object(service, "_submit_result_to_dbos", side_effect=flaky_submit):
+        summary = await service.flush_buffered_results()
+
+    assert summary["submitted"] == 1
+    assert summary["failed"] == 2
+    assert [r.output_payload["result"] for r in service.result_buffer] == [
+        "Task 1 completed", "Task 2 completed"
+    ]
+    await service.close()
+
+    restarted = DBOSReconciliationService(
+        dbos_gateway_url="http://localhost:8080",
+        lease_validator=lease_validation_service,
+        buffer_dir=str(tmp_path),
+    )
+    assert [r.output_payload["result"] for r in restarted.result_buffer] == [
+        "Task 1 completed", "Task 2 completed"
+    ]
+    await restarted.close()
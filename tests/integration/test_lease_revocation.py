@@ -13,7 +13,7 @@ from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 from sqlalchemy.orm import Session
 
-from backend.models.task_queue import Task, TaskLease, TaskStatus, TaskPriority
+from backend.models.task_lease import Task, TaskLease, TaskStatus, TaskPriority
 from backend.services.lease_revocation_service import LeaseRevocationService
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
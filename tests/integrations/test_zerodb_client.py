@@ -5,6 +5,7 @@ Following TDD methodology - tests written before implementation.
 Coverage target: 100%
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from typing import List, Dict, Any
@@ -552,6 +553,34 @@ class TestSearchMemories:
         assert result["total"] == 0
         assert result["results"] == []
 
+    @pytest.mark.asyncio
+    async def test_search_memories_sends_filters_and_offset(self, zerodb_client, mock_httpx_client):
+        """Test memory search pushes filters and pagination into the request."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"results": [], "total": 0, "query": "test"}
+        mock_httpx_client.post.return_value = mock_response
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            await zerodb_client.search_memories(
+                query="test",
+                limit=5,
+                type="conversation",
+                offset=10,
+                tags=["conv_1"],
+                metadata_filter={"conversation_id": "conv_1"}
+            )
+
+        payload = mock_httpx_client.post.call_args.kwargs["json"]
+        assert payload == {
+            "query": "test",
+            "limit": 5,
+            "type": "conversation",
+            "offset": 10,
+            "tags": ["conv_1"],
+            "metadata_filter": {"conversation_id": "conv_1"}
+        }
+
     @pytest.mark.asyncio
     async def test_search_memories_api_error(self, zerodb_client, mock_httpx_client):
         """Test memory search with API error."""
@@ -918,7 +947,100 @@ class TestConnectionPooling:
         assert "timeout" in str(exc_info.value).lower()
 
 
-class TestQueryBuilder:
+    @pytest.mark.asyncio
+    async def test_shared_client_reused_across_methods(self, zerodb_client, mock_httpx_client):
+        """Test that different API methods share one lazily created client."""
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {"rows": [], "id": "proj_1"}
+        mock_httpx_client.post.return_value = mock_response
+        mock_httpx_client.get.return_value = mock_response
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client) as client_cls:
+            await zerodb_client.create_project("Test", "Desc")
+            await zerodb_client.query_table("proj_1", "users", limit=10, skip=0)
+            await zerodb_client.query_rows("users", filter_query={}, project_id="proj_1")
+
+        assert client_cls.call_count == 1
+        limits = client_cls.call_args.kwargs["limits"]
+        assert limits.max_connections == zerodb_client.pool_max_connections
+        assert limits.max_keepalive_connections == zerodb_client.pool_max_keepalive_connections
+
+        stats = zerodb_client.get_pool_stats()
+        assert stats["requests_total"] == 3
+        assert stats["in_use"] == 0
+        assert stats["clients_created"] == 1
+
+    @pytest.mark.asyncio
+    async def test_aclose_is_graceful_and_client_recreated(self, zerodb_client, mock_httpx_client):
+        """Test that aclose closes the pool and later calls recreate it."""
+        mock_httpx_client.post.return_value = Mock(
+            status_code=201,
+            json=lambda: {"id": "proj_1"}
+        )
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client) as client_cls:
+            await zerodb_client.create_project("Test", "Desc")
+            await zerodb_client.aclose()
+            await zerodb_client.aclose()
+            await zerodb_client.create_project("Test", "Desc")
+
+        assert mock_httpx_client.aclose.call_count == 1
+        assert client_cls.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_bounded_by_pool(self, mock_httpx_client):
+        """Test that in-flight requests are bounded and wait time is recorded."""
+        from backend.integrations.zerodb_client import ZeroDBClient, ZeroDBPoolMonitor
+
+        client = ZeroDBClient(api_key="test-key", max_concurrent_requests=2)
+        peak = 0
+
+        async def slow_post(*args, **kwargs):
+            nonlocal peak
+            peak = max(peak, client.get_pool_stats()["in_use"])
+            await asyncio.sleep(0.01)
+            return Mock(status_code=201, json=lambda: {"id": "proj_1"})
+
+        mock_httpx_client.post.side_effect = slow_post
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            await asyncio.gather(*[
+                client.create_project(f"Test {i}", "Desc") for i in range(6)
+            ])
+
+        stats = client.get_pool_stats()
+        assert peak == 2
+        assert stats["requests_total"] == 6
+        assert stats["wait_seconds_max"] > 0
+        assert ZeroDBPoolMonitor().get_pool_stats()["requests_total"] >= 6
+
+    def test_client_and_slots_recreated_per_event_loop(self):
+        """Test that an instance reused from a new event loop gets a fresh client and semaphore."""
+        from backend.integrations.zerodb_client import ZeroDBClient
+
+        client = ZeroDBClient(api_key="test-key")
+        http_clients = []
+        slots = []
+
+        def make_http_client(*args, **kwargs):
+            http_client = AsyncMock()
+            http_client.is_closed = False
+            http_client.post.return_value = Mock(status_code=201, json=lambda: {"id": "proj_1"})
+            http_clients.append(http_client)
+            return http_client
+
+        async def use_client():
+            await client.create_project("Test", "Desc")
+            slots.append(client._request_slots)
+
+        with patch('httpx.AsyncClient', side_effect=make_http_client):
+            asyncio.run(use_client())
+            asyncio.run(use_client())
+
+        assert len(http_clients) == 2
+        assert slots[0] is not slots[1]
+        assert client.get_pool_stats()["clients_created"] == 2
+
     """Test query builder helpers for complex filters."""
 
     def test_eq_filter_builder(self, zerodb_client):
@@ -1417,3 +1539,159 @@ class TestWorkspaceAndConversationSupport:
 
         assert result["inserted_count"] == 1
         assert len(result["inserted_ids"]) == 1
+
+
+class TestWriteCoalescing:
+    """Test auto-batching of single-row writes."""
+
+    @pytest.fixture
+    def batching_client(self):
+        """ZeroDBClient with a short coalescing window."""
+        from backend.integrations.zerodb_client import ZeroDBClient
+
+        return ZeroDBClient(
+            api_key="test-key",
+            write_coalesce_window=0.01,
+            write_coalesce_max_rows=100
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_row_writes_sent_as_one_insert(self, batching_client):
+        """Test that a burst of row writes becomes one insert_rows call."""
+        batching_client.insert_rows = AsyncMock(return_value={
+            "inserted_count": 5,
+            "inserted_ids": [f"row_{i}" for i in range(5)]
+        })
+
+        results = await asyncio.gather(*[
+            batching_client.create_table_row_batched(
+                project_id="proj_1",
+                table_name="messages",
+                row_data={"content": f"msg {i}"}
+            )
+            for i in range(5)
+        ])
+
+        batching_client.insert_rows.assert_awaited_once()
+        sent_rows = batching_client.insert_rows.call_args.kwargs["rows"]
+        assert [row["content"] for row in sent_rows] == [f"msg {i}" for i in range(5)]
+        assert [r["id"] for r in results] == [f"row_{i}" for i in range(5)]
+        assert results[3]["data"] == {"content": "msg 3"}
+
+        stats = batching_client.get_write_stats()
+        assert stats["batches"] == 1
+        assert stats["requests_saved"] == 4
+
+    @pytest.mark.asyncio
+    async def test_batches_split_by_table_and_max_rows(self, batching_client):
+        """Test that batches are keyed per table and capped at max_rows."""
+        batching_client.write_coalesce_max_rows = 3
+        batching_client.insert_rows = AsyncMock(
+            side_effect=lambda table_name, rows, project_id: {
+                "inserted_ids": [f"{table_name}_{i}" for i in range(len(rows))]
+            }
+        )
+
+        await asyncio.gather(
+            *[batching_client.create_table_row_batched("proj_1", "a", {"n": i}) for i in range(4)],
+            batching_client.create_table_row_batched("proj_1", "b", {"n": 0}),
+        )
+
+        batch_sizes = sorted(
+            len(call.kwargs["rows"]) for call in batching_client.insert_rows.call_args_list
+        )
+        assert batch_sizes == [1, 1, 3]
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_every_caller(self, batching_client):
+        """Test that each caller in a failed batch sees the error."""
+        from backend.integrations.zerodb_client import ZeroDBConnectionError
+
+        batching_client.insert_rows = AsyncMock(side_effect=ZeroDBConnectionError("down"))
+
+        results = await asyncio.gather(
+            *[batching_client.create_table_row_batched("proj_1", "messages", {"n": i}) for i in range(3)],
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, ZeroDBConnectionError) for r in results)
+        assert batching_client.get_write_stats()["failed_batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_upserts_deduplicated_last_write_wins(self, batching_client):
+        """Test that coalesced upserts keep the last row per unique key."""
+        batching_client.bulk_upsert = AsyncMock(return_value={"upserted_count": 2})
+
+        await asyncio.gather(
+            batching_client.upsert_row_batched("cache", {"key": "a", "value": "1"}, "key"),
+            batching_client.upsert_row_batched("cache", {"key": "b", "value": "1"}, "key"),
+            batching_client.upsert_row_batched("cache", {"key": "a", "value": "2"}, "key"),
+        )
+
+        batching_client.bulk_upsert.assert_awaited_once()
+        rows = batching_client.bulk_upsert.call_args.kwargs["rows"]
+        assert {row["key"]: row["value"] for row in rows} == {"a": "2", "b": "1"}
+
+    @pytest.mark.asyncio
+    async def test_aclose_flushes_pending_writes(self, batching_client):
+        """Test that closing the client sends writes still in the window."""
+        batching_client.write_coalesce_window = 60.0
+        batching_client.insert_rows = AsyncMock(return_value={"inserted_ids": ["row_0"]})
+
+        pending = asyncio.ensure_future(
+            batching_client.create_table_row_batched("proj_1", "messages", {"n": 0})
+        )
+        await asyncio.sleep(0)
+        await batching_client.aclose()
+
+        assert (await pending)["id"] == "row_0"
+
+    @pytest.mark.asyncio
+    async def test_batched_rows_written_where_query_rows_reads(self, mock_httpx_client):
+        """Test that batched message rows hit the same table API query_rows reads."""
+        from backend.integrations.zerodb_client import ZeroDBClient
+
+        mock_httpx_client.post.return_value = Mock(
+            status_code=200,
+            json=lambda: {"inserted_ids": ["row_0", "row_1"], "data": []},
+            raise_for_status=Mock()
+        )
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            async with ZeroDBClient(
+                api_url="https://api.ainative.studio",
+                api_key="test-key",
+                write_coalesce_window=0.01
+            ) as client:
+                await asyncio.gather(
+                    client.create_table_row_batched("proj_1", "messages", {"n": 0}),
+                    client.create_table_row_batched("proj_1", "messages", {"n": 1}),
+                )
+                await client.query_rows(
+                    table_name="messages",
+                    filter_query={"conversation_id": {"$eq": "c1"}},
+                    project_id="proj_1"
+                )
+
+        write_call, query_call = mock_httpx_client.post.call_args_list
+        table_url = "https://api.ainative.studio/v1/public/proj_1/database/tables/messages"
+        assert write_call.args[0] == f"{table_url}/rows"
+        assert write_call.kwargs["json"] == {"rows": [{"n": 0}, {"n": 1}]}
+        assert query_call.args[0] == f"{table_url}/query"
+
+    @pytest.mark.asyncio
+    async def test_query_rows_sends_sort_only_when_given(self, zerodb_client, mock_httpx_client):
+        """Test that a sort spec is forwarded in the query body and omitted otherwise."""
+        mock_httpx_client.post.return_value = Mock(
+            status_code=200, json=lambda: {"data": []}, raise_for_status=Mock()
+        )
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            await zerodb_client.query_rows("messages", filter_query={}, project_id="proj_1")
+            await zerodb_client.query_rows(
+                "messages", filter_query={}, project_id="proj_1", sort={"timestamp": 1, "id": 1}
+            )
+
+        unsorted_call, sorted_call = mock_httpx_client.post.call_args_list
+        assert "sort" not in unsorted_call.kwargs["json"]
+        assert sorted_call.kwargs["json"]["sort"] == {"timestamp": 1, "id": 1}
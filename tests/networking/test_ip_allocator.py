@@ -0,0 +1,165 @@
+"""
+Bitmap IP Allocator Tests
+
+Tests the shared allocation engine used by IPPoolManager and
+IPAddressAllocator: free-list reuse, next-fit scanning, reverse lookups,
+bulk operations and snapshot/journal persistence.
+"""
+
+import pytest
+from ipaddress import IPv4Address
+from unittest.mock import patch
+
+from backend.networking.ip_allocator import AddressPoolExhaustedError, BitmapIPAllocator
+from backend.services.ip_pool_manager import IPPoolManager
+
+
+class TestBitmapAllocation:
+    """Test core bitmap allocation behaviour"""
+
+    def test_allocates_sequentially_skipping_reserved(self):
+        """
+        GIVEN a /29 network with the gateway reserved
+        WHEN allocating every free address
+        THEN addresses are handed out in order and the pool then reports exhaustion
+        """
+        allocator = BitmapIPAllocator("10.0.0.0/29", reserved=["10.0.0.1"])
+
+        ips = [allocator.allocate() for _ in range(5)]
+
+        assert ips == [IPv4Address(f"10.0.0.{i}") for i in range(2, 7)]
+        assert allocator.available_count() == 0
+        with pytest.raises(AddressPoolExhaustedError):
+            allocator.allocate()
+
+    def test_released_address_is_reused_and_cursor_continues(self):
+        """
+        GIVEN a partially allocated pool
+        WHEN an address is released
+        THEN it is reused first and later allocations continue from the cursor
+        """
+        allocator = BitmapIPAllocator("10.0.0.0/24")
+        first, second, third = (allocator.allocate() for _ in range(3))
+
+        allocator.release(second)
+
+        assert allocator.allocate() == second
+        assert allocator.allocate() == IPv4Address("10.0.0.4")
+
+    def test_owner_reverse_lookup(self):
+        """
+        GIVEN addresses allocated to named owners
+        WHEN looking up by owner and by address
+        THEN both directions resolve and are cleared on release
+        """
+        allocator = BitmapIPAllocator("10.0.0.0/24")
+        ip = allocator.allocate(owner="peer-1")
+
+        assert allocator.owner_of(ip) == "peer-1"
+        assert allocator.address_of("peer-1") == ip
+
+        allocator.release_owner("peer-1")
+
+        assert allocator.owner_of(ip) is None
+        assert allocator.address_of("peer-1") is None
+
+
+class TestBulkOperations:
+    """Test bulk allocate and release"""
+
+    def test_bulk_allocation_is_all_or_nothing(self):
+        """
+        GIVEN a pool with fewer free addresses than requested
+        WHEN allocating in bulk
+        THEN nothing is allocated and the shortfall is reported
+        """
+        pool = IPPoolManager(network="10.0.0.0/29", reserved_ips=["10.0.0.1"])
+        pool.allocate_ip(peer_id="existing")
+
+        from backend.services.wireguard_provisioning_service import IPPoolExhaustedError
+        with pytest.raises(IPPoolExhaustedError):
+            pool.allocate_bulk([f"peer-{i}" for i in range(5)])
+
+        assert pool.get_pool_stats()["allocated_addresses"] == 1
+
+    def test_bulk_allocate_and_release(self):
+        """
+        GIVEN a /24 pool
+        WHEN allocating and then releasing many peers in bulk
+        THEN every peer gets a unique address and all are returned
+        """
+        pool = IPPoolManager(network="10.0.0.0/24", reserved_ips=["10.0.0.1"])
+        peers = [f"peer-{i}" for i in range(100)]
+
+        allocations = pool.allocate_bulk(peers)
+
+        assert len(set(allocations.values())) == 100
+        assert pool.get_peer_for_ip(allocations["peer-42"]) == "peer-42"
+        assert dict(pool.allocated) == allocations
+
+        assert pool.deallocate_bulk(peers + ["unknown"]) == 100
+        assert pool.available_count() == 253
+
+
+class TestPersistence:
+    """Test snapshot and journal recovery"""
+
+    def test_state_restored_from_snapshot_and_journal(self, tmp_path):
+        """
+        GIVEN a persisted pool with a snapshot followed by journaled changes
+        WHEN a new pool is created from the same state directory
+        THEN allocations and owners are restored exactly
+        """
+        pool = IPPoolManager(
+            network="10.0.0.0/24", reserved_ips=["10.0.0.1"], state_dir=str(tmp_path)
+        )
+        pool.allocate_bulk(["peer-a", "peer-b", "peer-c"])
+        pool.snapshot()
+        pool.deallocate_ip("peer-b")
+        pool.allocate_ip("peer-d")
+
+        restored = IPPoolManager(
+            network="10.0.0.0/24", reserved_ips=["10.0.0.1"], state_dir=str(tmp_path)
+        )
+
+        assert dict(restored.allocated) == dict(pool.allocated)
+        assert restored.get_pool_stats() == pool.get_pool_stats()
+        assert restored.allocate_ip("peer-e") not in pool.allocated.values()
+
+    def test_state_for_different_network_is_rejected(self, tmp_path):
+        """
+        GIVEN state persisted for one network
+        WHEN loading it for a different network
+        THEN initialization fails instead of corrupting allocations
+        """
+        allocator = BitmapIPAllocator("10.0.0.0/24", state_dir=str(tmp_path))
+        allocator.allocate()
+        allocator.close()
+
+        with pytest.raises(ValueError, match="10.0.0.0/24"):
+            BitmapIPAllocator("10.1.0.0/24", state_dir=str(tmp_path))
+
+    def test_journal_appends_hold_the_state_lock(self, tmp_path):
+        """
+        GIVEN a persisted allocator
+        WHEN an allocation is journaled
+        THEN the write happens between an exclusive flock and its release
+        """
+        import fcntl
+
+        allocator = BitmapIPAllocator("10.0.0.0/24", state_dir=str(tmp_path))
+        calls = []
+        real_write = allocator._journal.write
+
+        def record_write(data):
+            calls.append("write")
+            return real_write(data)
+
+        allocator._journal.write = record_write
+        with patch("backend.networking.ip_allocator.fcntl.flock",
+                   side_effect=lambda fd, op: calls.append(op)):
+            allocator.allocate("peer-a")
+
+        assert calls == [fcntl.LOCK_EX, "write", fcntl.LOCK_UN]
+        assert (tmp_path / BitmapIPAllocator.LOCK_FILE).exists()
+        allocator.close()
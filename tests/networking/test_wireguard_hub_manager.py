@@ -90,10 +90,11 @@ class TestAddPeerToConfig:
         assert peer_id in hub_manager.peers
         assert hub_manager.peers[peer_id] == sample_peer_config
 
-        # Then: wg syncconf should be called
-        mock_wg.assert_called_once()
-        call_args = mock_wg.call_args[0]
-        assert 'syncconf' in call_args
+        # Then: live state is read, and with no interface dump available
+        # the batch falls back to a single wg syncconf
+        commands = [call.args for call in mock_wg.call_args_list]
+        assert commands[0] == ("show", "wg0", "dump")
+        assert [c for c in commands if 'syncconf' in c] == [commands[-1]]
 
     @pytest.mark.asyncio
     async def test_add_peer_writes_config_file(self, hub_manager, sample_peer_config):
@@ -335,9 +336,11 @@ class TestConfigReloadNoDowntime:
         peer_id = "peer-013"
 
         with patch.object(hub_manager, '_execute_wg_command', new_callable=AsyncMock) as mock_wg:
-            # First call succeeds (adding initial peer)
+            # First batch succeeds (adding initial peer)
             mock_wg.side_effect = [
+                (0, "", ""),  # show dump (no live state)
                 (0, "", ""),  # Initial peer add succeeds
+                (0, "", ""),  # show dump (no live state)
                 (1, "", "Failed to reload configuration"),  # Reload fails
             ]
 
@@ -588,3 +591,186 @@ class TestWireGuardHubManagerIntegration:
         assert len(all_peers) == len(peer_ids)
         for peer_id in peer_ids:
             assert peer_id in all_peers
+
+
+def _dump(*peers: str) -> str:
+    """Build 'wg show dump' output with an interface line and peer lines."""
+    interface = "privkey\thubpubkey\t51820\toff"
+    return "\n".join([interface, *peers])
+
+
+def _dump_peer(public_key: str, allowed_ips: str, keepalive: str = "25") -> str:
+    """Build a single peer line of 'wg show dump' output."""
+    return f"{public_key}\t(none)\t(none)\t{allowed_ips}\t0\t0\t0\t{keepalive}"
+
+
+class TestBatchedReconciliation:
+    """Tests for the batched incremental reconciliation engine."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_mutations_coalesced_into_one_wg_set(self, hub_manager):
+        """
+        Given 50 peers added concurrently
+        When the debounce window elapses
+        Then the interface is updated with one dump and one wg set
+        """
+        # Given: empty live interface
+        configs = {
+            f"node-{i}": PeerConfig(
+                public_key=f"key{i:03d}=",
+                allowed_ips=[f"10.0.1.{i}/32"],
+                persistent_keepalive=25,
+            )
+            for i in range(50)
+        }
+
+        with patch.object(hub_manager, '_execute_wg_command', new_callable=AsyncMock) as mock_wg:
+            mock_wg.return_value = (0, _dump(), "")
+
+            # When: adding all peers concurrently
+            results = await asyncio.gather(*[
+                hub_manager.add_peer(peer_id, config) for peer_id, config in configs.items()
+            ])
+
+        # Then: one batch, applied incrementally
+        assert all(results)
+        commands = [call.args for call in mock_wg.call_args_list]
+        assert [c[0] for c in commands] == ["show", "set"]
+        assert commands[1].count("peer") == 50
+
+        stats = hub_manager.get_reconcile_stats()
+        assert stats["batches"] == 1
+        assert stats["mutations"] == 50
+        assert stats["wg_set_batches"] == 1
+        assert stats["syncconf_fallbacks"] == 0
+        assert stats["last_batch"]["peers_changed"] == 50
+        assert stats["last_batch"]["peers_per_second"] > 0
+
+    @pytest.mark.asyncio
+    async def test_only_delta_is_applied(self, hub_manager):
+        """
+        Given a live interface with an unchanged peer, a stale peer and a
+              peer with outdated allowed IPs
+        When reconciling
+        Then only the stale and outdated peers are touched
+        """
+        # Given: desired state
+        hub_manager.peers = {
+            "same": PeerConfig(public_key="same=", allowed_ips=["10.0.0.2/32"]),
+            "changed": PeerConfig(public_key="changed=", allowed_ips=["10.0.0.3/32", "10.0.0.4/32"]),
+        }
+        live = _dump(
+            _dump_peer("same=", "10.0.0.2/32"),
+            _dump_peer("changed=", "10.0.0.3/32"),
+            _dump_peer("stale=", "10.0.0.9/32"),
+        )
+
+        with patch.object(hub_manager, '_execute_wg_command', new_callable=AsyncMock) as mock_wg:
+            mock_wg.return_value = (0, live, "")
+
+            # When: reconciling
+            stats = await hub_manager.reconcile()
+
+        # Then: one wg set with exactly the delta
+        set_command = mock_wg.call_args_list[1].args
+        assert set_command[:2] == ("set", "wg0")
+        assert ("peer", "stale=", "remove") == set_command[2:5]
+        assert "changed=" in set_command
+        assert "same=" not in set_command
+        assert stats.method == "wg_set"
+        assert stats.peers_changed == 2
+
+    @pytest.mark.asyncio
+    async def test_no_delta_skips_apply(self, hub_manager):
+        """
+        Given live state already matching desired state
+        When reconciling
+        Then no wg set or syncconf is issued
+        """
+        hub_manager.peers = {
+            "same": PeerConfig(public_key="same=", allowed_ips=["10.0.0.2/32"]),
+        }
+
+        with patch.object(hub_manager, '_execute_wg_command', new_callable=AsyncMock) as mock_wg:
+            mock_wg.return_value = (0, _dump(_dump_peer("same=", "10.0.0.2/32")), "")
+            stats = await hub_manager.reconcile()
+
+        assert mock_wg.call_count == 1
+        assert stats.method == "noop"
+
+    @pytest.mark.asyncio
+    async def test_failed_delta_falls_back_to_syncconf(self, hub_manager, sample_peer_config):
+        """
+        Given a wg set that fails
+        When applying a batch
+        Then the engine falls back to wg syncconf
+        """
+        with patch.object(hub_manager, '_execute_wg_command', new_callable=AsyncMock) as mock_wg:
+            mock_wg.side_effect = [
+                (0, _dump(), ""),           # show dump
+                (1, "", "Invalid peer"),    # wg set fails
+                (0, "", ""),                # syncconf succeeds
+            ]
+            await hub_manager.add_peer("peer-fallback", sample_peer_config)
+
+        assert mock_wg.call_args_list[2].args[0] == "syncconf"
+        assert hub_manager.get_reconcile_stats()["syncconf_fallbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_wg_set_chunked_by_max_peers(self, hub_manager):
+        """
+        Given more peer changes than max_peers_per_command
+        When reconciling
+        Then the delta is split across several wg set invocations
+        """
+        hub_manager.max_peers_per_command = 2
+        hub_manager.peers = {
+            f"n{i}": PeerConfig(public_key=f"k{i}=", allowed_ips=[f"10.0.2.{i}/32"])
+            for i in range(5)
+        }
+
+        with patch.object(hub_manager, '_execute_wg_command', new_callable=AsyncMock) as mock_wg:
+            mock_wg.return_value = (0, _dump(), "")
+            await hub_manager.reconcile()
+
+        set_calls = [c.args for c in mock_wg.call_args_list if c.args[0] == "set"]
+        assert len(set_calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_unexpected_keepalive_value_does_not_break_dump(self, hub_manager):
+        """
+        Given a dump whose keepalive field is neither "off" nor an integer
+        When reconciling
+        Then the dump is still used and the peer's keepalive is re-applied
+        """
+        hub_manager.peers = {
+            "odd": PeerConfig(public_key="odd=", allowed_ips=["10.0.0.5/32"], persistent_keepalive=25),
+        }
+        live = _dump(_dump_peer("odd=", "10.0.0.5/32", keepalive="25s"))
+
+        with patch.object(hub_manager, '_execute_wg_command', new_callable=AsyncMock) as mock_wg:
+            mock_wg.return_value = (0, live, "")
+            stats = await hub_manager.reconcile()
+
+        assert stats.method == "wg_set"
+        assert mock_wg.call_args_list[1].args[0] == "set"
+
+    @pytest.mark.asyncio
+    async def test_peer_mutations_wait_for_config_lock(self, hub_manager, sample_peer_config):
+        """
+        Given a reconciliation holding the configuration lock
+        When a peer is added
+        Then the desired peer set is not changed until the lock is released
+        """
+        with patch.object(hub_manager, '_execute_wg_command', new_callable=AsyncMock) as mock_wg:
+            mock_wg.return_value = (0, _dump(), "")
+
+            await hub_manager._config_lock.acquire()
+            add = asyncio.create_task(hub_manager.add_peer("peer-locked", sample_peer_config))
+            await asyncio.sleep(0)
+            assert "peer-locked" not in hub_manager.peers
+
+            hub_manager._config_lock.release()
+            await add
+
+        assert "peer-locked" in hub_manager.peers
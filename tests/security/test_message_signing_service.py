@@ -510,3 +510,65 @@ class TestMessageSigningServiceExtended:
 
         # Then
         assert is_valid is False
+
+
+class TestBatchSignatureVerification:
+    """Test batch verification and canonical hash caching"""
+
+    @pytest.fixture
+    def identity(self):
+        """Create a test identity with Ed25519 keypair"""
+        identity = LibP2PIdentity()
+        identity.generate()
+        return identity
+
+    def test_verify_signatures_batch_matches_single_verification(self, identity):
+        """
+        Given valid, tampered and malformed envelopes,
+        when verifying them as a batch,
+        then results should match verify_signature_with_public_key
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Given
+        service = MessageSigningService(identity)
+        payloads = [{"type": "task_progress", "progress": i} for i in range(10)]
+        items = [(service.sign_message(p), p, identity.public_key) for p in payloads]
+        items[2] = (items[2][0], {"type": "task_progress", "progress": 99}, identity.public_key)
+        bad_signature = items[5][0].model_copy(update={"signature": "not-base64!!"})
+        items[5] = (bad_signature, payloads[5], identity.public_key)
+
+        expected = [
+            service.verify_signature_with_public_key(envelope, payload, key)
+            for envelope, payload, key in items
+        ]
+
+        # When
+        inline = service.verify_signatures_batch(items)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pooled = service.verify_signatures_batch(items, executor=executor, chunk_size=3)
+
+        # Then
+        assert expected == [True, True, False, True, True, False, True, True, True, True]
+        assert inline == expected
+        assert pooled == expected
+
+    def test_canonical_hash_cache_reuses_payload_hash(self, identity):
+        """
+        Given hash caching enabled,
+        when the same payload object is signed and verified,
+        then its canonical JSON should be hashed once
+        """
+        # Given
+        service = MessageSigningService(identity, hash_cache_size=16)
+        payload = {"type": "task_result", "data": {"ok": True}}
+
+        # When
+        envelope = service.sign_message(payload)
+        assert service.verify_signature(envelope, payload) is True
+        assert service.verify_signature(envelope, dict(payload)) is True
+
+        # Then
+        stats = service.get_hash_cache_stats()
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 2
@@ -733,3 +733,99 @@ class TestSecurityFeatures:
         # Assert
         failures = verification_service.get_failure_count(peer_id)
         assert failures == 12
+
+
+class TestBatchVerificationPipeline:
+    """Test micro-batched verification on the pool."""
+
+    def test_verify_messages_batch(self, peer_key_store, sender_keypair):
+        """
+        Given valid, tampered, expired and unknown-sender messages
+        When verifying them as one batch
+        Then should return per-message results without raising
+        """
+        from backend.security.message_verification_service import VerificationRequest
+
+        # Arrange
+        private_key, public_key = sender_keypair
+        peer_id = "12D3KooWBatchSender"
+        peer_key_store.store_public_key(peer_id, public_key)
+        service = MessageVerificationService(peer_key_store, max_batch_size=8)
+        now = int(time.time())
+
+        requests = [
+            VerificationRequest(peer_id, f"msg {i}".encode(), private_key.sign(f"msg {i}".encode()), now)
+            for i in range(20)
+        ]
+        requests[3] = VerificationRequest(peer_id, b"tampered", requests[3].signature, now)
+        requests[7] = VerificationRequest(peer_id, b"old", private_key.sign(b"old"), now - 600)
+        requests[11] = VerificationRequest("12D3KooWUnknown", b"x", private_key.sign(b"x"), now)
+
+        # Act
+        results = service.verify_messages(requests)
+
+        # Assert
+        expected = [True] * 20
+        expected[3] = expected[7] = expected[11] = False
+        assert results == expected
+        assert service.get_failure_count(peer_id) == 0  # reset by later successes
+        stats = service.get_pipeline_stats()
+        assert stats["messages_processed"] == 20
+        assert stats["messages_verified"] == 17
+        assert stats["message_latency"]["count"] == 20
+
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_async_verification_is_micro_batched(self, peer_key_store, sender_keypair):
+        """
+        Given 100 concurrent async verifications
+        When they complete
+        Then results should match and be verified in batches of at most
+        max_batch_size
+        """
+        import asyncio
+
+        # Arrange
+        private_key, public_key = sender_keypair
+        peer_id = "12D3KooWAsyncSender"
+        peer_key_store.store_public_key(peer_id, public_key)
+        service = MessageVerificationService(peer_key_store, max_batch_size=32)
+        now = int(time.time())
+
+        messages = []
+        for i in range(100):
+            payload = f"progress {i}".encode()
+            signature = private_key.sign(payload) if i % 10 else b"\x00" * 64
+            messages.append((payload, signature))
+
+        # Act
+        results = await asyncio.gather(*[
+            service.verify_message_async(peer_id, payload, signature, now)
+            for payload, signature in messages
+        ])
+
+        # Assert
+        assert results == [i % 10 != 0 for i in range(100)]
+        stats = service.get_pipeline_stats()
+        assert stats["messages_processed"] == 100
+        assert stats["messages_verified"] == 90
+        assert stats["batches"] == 4
+        await asyncio.sleep(0)
+        assert not service._batch_tasks  # finished batch tasks are released
+        assert stats["throughput_per_second"] > 0
+        assert stats["message_latency"]["p99_ms"] is not None
+
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_async_verification_rejects_unknown_sender(self, verification_service):
+        """
+        Given an unknown sender
+        When verifying asynchronously
+        Then should raise ValueError like verify_message
+        """
+        with pytest.raises(ValueError, match="Unknown peer"):
+            await verification_service.verify_message_async(
+                "12D3KooWNobody", b"payload", b"\x00" * 64, int(time.time())
+            )
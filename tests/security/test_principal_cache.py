@@ -0,0 +1,161 @@
+"""
+Tests for the Authenticated Principal Cache
+
+Covers cached token resolution in get_current_user, expiry bounds,
+invalidation on user deactivation, and token revocation.
+"""
+
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import jwt
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.user import User
+from backend.security.auth_dependencies import (
+    AuthenticationError,
+    create_access_token,
+    get_current_user,
+)
+from backend.security.principal_cache import (
+    PrincipalCache,
+    UserSnapshot,
+    get_principal_cache,
+)
+
+
+@pytest.fixture
+def user():
+    """Detached user as loaded from the database"""
+    return User(
+        id=uuid4(),
+        email="alice@example.com",
+        full_name="Alice",
+        workspace_id=uuid4(),
+        is_active=True,
+    )
+
+
+@pytest.fixture
+def mock_db(user):
+    """Async session whose users query returns the fixture user"""
+    db = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    result.scalars.return_value.first.return_value = user
+    db.execute.return_value = result
+    return db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    get_principal_cache("auth_dependencies").clear()
+    yield
+    get_principal_cache("auth_dependencies").clear()
+
+
+def _credentials(user, **kwargs):
+    token = create_access_token(str(user.id), user.email, str(user.workspace_id), **kwargs)
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestCachedResolution:
+    """Test get_current_user through the cache"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_requests_skip_database(self, user, mock_db):
+        """
+        GIVEN a valid access token
+        WHEN it authenticates several requests
+        THEN the users table is queried once and a snapshot is returned
+        """
+        credentials = _credentials(user)
+
+        first = await get_current_user(credentials=credentials, db=mock_db)
+        second = await get_current_user(credentials=credentials, db=mock_db)
+
+        assert mock_db.execute.await_count == 1
+        assert isinstance(first, UserSnapshot)
+        assert first == second
+        assert first.id == user.id and first.workspace_id == user.workspace_id
+
+    @pytest.mark.asyncio
+    async def test_deactivation_invalidates_cached_principal(self, user, mock_db):
+        """
+        GIVEN a cached principal
+        WHEN the user is deactivated in this process
+        THEN the next request reloads the user and sees the inactive flag
+        """
+        credentials = _credentials(user)
+        await get_current_user(credentials=credentials, db=mock_db)
+
+        user.is_active = False
+        snapshot = await get_current_user(credentials=credentials, db=mock_db)
+
+        assert mock_db.execute.await_count == 2
+        assert snapshot.is_active is False
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_rejected(self, user, mock_db):
+        """
+        GIVEN a cached principal
+        WHEN its token is revoked
+        THEN further requests with the token fail authentication
+        """
+        credentials = _credentials(user)
+        await get_current_user(credentials=credentials, db=mock_db)
+
+        get_principal_cache("auth_dependencies").revoke(token=credentials.credentials)
+
+        with pytest.raises(AuthenticationError):
+            await get_current_user(credentials=credentials, db=mock_db)
+
+
+class TestPrincipalCacheBounds:
+    """Test entry lifetime and eviction"""
+
+    def test_entry_never_outlives_token(self):
+        """
+        GIVEN a token that expires before the cache max TTL
+        WHEN the token's exp passes
+        THEN the cached entry is gone
+        """
+        cache = PrincipalCache(max_ttl_seconds=3600)
+        snapshot = UserSnapshot(id=uuid4(), email="a@b.c", workspace_id=None, is_active=True)
+        cache.put("tok", {"sub": str(snapshot.id), "exp": time.time() - 1}, snapshot)
+
+        assert cache.get("tok") is None
+
+    def test_lru_eviction_and_user_index(self):
+        """
+        GIVEN a cache bounded to two entries
+        WHEN a third token is cached
+        THEN the least recently used token is evicted and user invalidation
+             only affects remaining entries
+        """
+        cache = PrincipalCache(max_entries=2)
+        snapshot = UserSnapshot(id=uuid4(), email="a@b.c", workspace_id=None, is_active=True)
+        for token in ("t1", "t2", "t3"):
+            cache.put(token, {"sub": str(snapshot.id)}, snapshot)
+
+        assert cache.get("t1") is None
+        assert cache.invalidate_user(snapshot.id) == 2
+        assert cache.get_stats()["size"] == 0
+
+    def test_create_access_token_respects_custom_expiry(self):
+        """
+        GIVEN a token issued with a short lifetime
+        WHEN it is cached
+        THEN the entry expires with the token rather than at max TTL
+        """
+        cache = PrincipalCache(max_ttl_seconds=3600)
+        snapshot = UserSnapshot(id=uuid4(), email="a@b.c", workspace_id=None, is_active=True)
+        token = create_access_token(str(snapshot.id), "a@b.c", "", expires_delta=timedelta(seconds=30))
+        claims = jwt.decode(token, options={"verify_signature": False})
+
+        principal = cache.put(token, claims, snapshot)
+
+        assert principal.expires_at <= time.time() + 30
@@ -326,3 +326,83 @@ def test_get_token_claims():
     assert claims["peer_id"] == "12D3KooWEyopopk1234567890"
     assert "can_execute:llama-2-7b" in claims["capabilities"]
     assert claims["limits"]["max_gpu_minutes"] == 1000
+
+
+def test_repeated_checks_verify_signature_once():
+    """
+    Given a verified token, when checking capabilities and data access repeatedly,
+    then the signature is verified once and claims are frozensets
+    """
+    from unittest.mock import patch
+    from backend.security.token_service import TokenService
+    from backend.models.capability_token import CapabilityToken, TokenLimits
+
+    service = TokenService(secret_key="test-secret-key-12345")
+
+    expires_at = int((datetime.utcnow() + timedelta(hours=1)).timestamp())
+
+    token_model = CapabilityToken(
+        peer_id="12D3KooWEyopopk1234567890",
+        capabilities=["can_execute:llama-2-7b", "can_execute:gpt-3.5-turbo"],
+        limits=TokenLimits(max_gpu_minutes=1000, max_concurrent_tasks=3),
+        data_scope=["project-alpha"],
+        expires_at=expires_at
+    )
+
+    encoded_token = service.encode_token(token_model)
+
+    with patch.object(service, "_verify_and_build", wraps=service._verify_and_build) as verify:
+        assert service.check_capability(encoded_token, "can_execute:llama-2-7b") is True
+        assert service.check_data_access(encoded_token, "project-alpha") is True
+        assert service.check_capabilities(
+            encoded_token, ["can_execute:llama-2-7b", "can_execute:mistral-7b"]
+        ) == {"can_execute:llama-2-7b": True, "can_execute:mistral-7b": False}
+        assert service.get_token_claims(encoded_token)["peer_id"] == "12D3KooWEyopopk1234567890"
+
+    assert verify.call_count == 1
+    claims = service.verify(encoded_token)
+    assert isinstance(claims.capabilities, frozenset)
+    assert service.get_cache_stats()["hits"] >= 3
+
+
+def test_revoked_token_rejected_after_caching():
+    """
+    Given a cached verified token, when its jti is revoked,
+    then subsequent checks raise TokenRevokedError
+    """
+    from backend.security.token_service import (
+        TokenService,
+        InvalidTokenError,
+        TokenRevokedError,
+    )
+    from backend.models.capability_token import CapabilityToken, TokenLimits
+
+    revoked_jtis = set()
+    service = TokenService(
+        secret_key="test-secret-key-12345",
+        revocation_checker=revoked_jtis.__contains__
+    )
+
+    expires_at = int((datetime.utcnow() + timedelta(hours=1)).timestamp())
+
+    token_model = CapabilityToken(
+        peer_id="12D3KooWEyopopk1234567890",
+        capabilities=["can_execute:llama-2-7b"],
+        limits=TokenLimits(max_gpu_minutes=1000, max_concurrent_tasks=3),
+        expires_at=expires_at
+    )
+
+    encoded_token = service.encode_token(token_model)
+    assert service.check_capability(encoded_token, "can_execute:llama-2-7b") is True
+
+    # Revocation recorded by an external list is seen on the cached path
+    revoked_jtis.add(token_model.jti)
+    with pytest.raises(TokenRevokedError):
+        service.check_capability(encoded_token, "can_execute:llama-2-7b")
+
+    # Local revocation also drops the cache entry
+    revoked_jtis.clear()
+    service.revoke(token_model.jti, expires_at=expires_at)
+    assert service.get_cache_stats()["size"] == 0
+    with pytest.raises(InvalidTokenError):
+        service.check_data_access(encoded_token, "project-alpha")
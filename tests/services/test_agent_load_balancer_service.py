@@ -804,3 +804,280 @@ class TestEdgeCases:
         score = balancer._calculate_capability_match(task_no_reqs, available_nodes[0])
 
         assert score == 1.0  # Perfect match when no requirements
+
+
+class TestCandidateIndex:
+    """Test indexed candidate selection used by assign_task"""
+
+    @staticmethod
+    def _random_nodes(rng, count):
+        nodes = []
+        for i in range(count):
+            capabilities = {
+                "cpu_cores": rng.choice([2, 4, 8, 16]),
+                "memory_mb": rng.choice([4096, 8192, 16384]),
+                "gpu_available": rng.random() < 0.3,
+                "models": rng.sample(["llama-2-7b", "claude", "mistral"], rng.randint(0, 3))
+            }
+            if rng.random() < 0.1:
+                capabilities = {}
+            nodes.append({"peer_id": f"node-{rng.randint(0, 10 ** 6):07d}-{i}", "capabilities": capabilities})
+        return nodes
+
+    @staticmethod
+    def _randomize_metrics(rng, balancer, nodes):
+        for node in nodes:
+            metrics = balancer.agent_metrics[node["peer_id"]]
+            metrics.current_tasks = rng.randint(0, 12)
+            metrics.average_response_time = rng.choice([0.0, 1.0, 2.5, 40.0])
+            metrics.error_rate = rng.choice([0.0, 0.05, 0.2])
+            metrics.queue_length = rng.randint(0, 5)
+            if rng.random() < 0.1:
+                metrics.last_heartbeat = datetime.now(timezone.utc) - timedelta(minutes=10)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy_name", [
+        "ROUND_ROBIN", "LEAST_CONNECTIONS", "LEAST_RESPONSE_TIME", "WEIGHTED_ROUND_ROBIN",
+        "CAPABILITY_BASED", "PERFORMANCE_BASED", "ADAPTIVE"
+    ])
+    async def test_indexed_selection_matches_list_scan(self, mock_db_session, strategy_name):
+        """
+        GIVEN randomized nodes, metrics and task requirements
+        WHEN assigning tasks through the candidate index
+        THEN should select the same agents as the list-based strategies
+        """
+        import random
+        from backend.services.agent_load_balancer_service import (
+            SwarmLoadBalancer,
+            LoadBalancingStrategy
+        )
+
+        rng = random.Random(strategy_name)
+        strategy = LoadBalancingStrategy[strategy_name]
+        nodes = self._random_nodes(rng, 60)
+
+        indexed = SwarmLoadBalancer(db_session=mock_db_session, strategy=strategy)
+        reference = SwarmLoadBalancer(db_session=mock_db_session, strategy=strategy)
+        await indexed.initialize_agent_metrics(nodes)
+        await reference.initialize_agent_metrics(nodes)
+
+        requirement_sets = [
+            {},
+            {"cpu_cores": 4},
+            {"gpu_available": True},
+            {"models": ["llama-2-7b"]},
+            {"cpu_cores": 8, "memory_mb": 8192},
+            {"models": ["nonexistent"]},
+        ]
+
+        for round_number in range(40):
+            if round_number % 10 == 0:
+                self._randomize_metrics(rng, indexed, nodes)
+                for node in nodes:
+                    peer_id = node["peer_id"]
+                    source = indexed.agent_metrics[peer_id]
+                    target = reference.agent_metrics[peer_id]
+                    target.current_tasks = source.current_tasks
+                    target.average_response_time = source.average_response_time
+                    target.error_rate = source.error_rate
+                    target.queue_length = source.queue_length
+                    target.last_heartbeat = source.last_heartbeat
+                    await indexed.update_agent_metrics(peer_id)
+                    await reference.update_agent_metrics(peer_id)
+
+            task = Task(
+                id=uuid4(),
+                task_type="test",
+                payload={},
+                priority=TaskPriority.NORMAL,
+                status=TaskStatus.QUEUED,
+                required_capabilities=rng.choice(requirement_sets)
+            )
+
+            expected_agents = await reference._get_available_agents(task, nodes)
+            expected = await reference._select_agent(task, expected_agents, nodes)
+            if expected is not None:
+                reference.agent_metrics[expected].current_tasks += 1
+
+            result = await indexed.assign_task(task, nodes)
+
+            assert (result.peer_id if result else None) == expected
+
+    @pytest.mark.asyncio
+    async def test_task_completed_reorders_candidates(self, mock_db_session, sample_task, available_nodes):
+        """
+        GIVEN least-connections strategy and assigned tasks
+        WHEN a task completes on a busy agent
+        THEN the index should pick up the reduced load incrementally
+        """
+        from backend.services.agent_load_balancer_service import (
+            SwarmLoadBalancer,
+            LoadBalancingStrategy
+        )
+
+        balancer = SwarmLoadBalancer(
+            db_session=mock_db_session,
+            strategy=LoadBalancingStrategy.LEAST_CONNECTIONS
+        )
+        await balancer.initialize_agent_metrics(available_nodes)
+        await balancer.update_agent_metrics("node1", current_tasks=0)
+        await balancer.update_agent_metrics("node2", current_tasks=3)
+        await balancer.update_agent_metrics("node3", current_tasks=3)
+        await balancer.update_agent_metrics("node4", current_tasks=3)
+
+        first = await balancer.assign_task(sample_task, available_nodes)
+        assert first.peer_id == "node1"
+
+        await balancer.update_agent_metrics("node1", current_tasks=5)
+        second_task = Task(
+            id=uuid4(),
+            task_type="code_generation",
+            payload={},
+            priority=TaskPriority.NORMAL,
+            status=TaskStatus.QUEUED,
+            required_capabilities={"cpu_cores": 2}
+        )
+        second = await balancer.assign_task(second_task, available_nodes)
+        assert second.peer_id == "node2"
+
+        await balancer.task_completed(str(second_task.id), success=True, completion_time=1.0)
+        assert balancer.agent_metrics["node2"].current_tasks == 3
+
+    @pytest.mark.asyncio
+    async def test_sync_drops_removed_nodes(self, mock_db_session, gpu_task, available_nodes):
+        """
+        GIVEN an index synced with all nodes
+        WHEN a later node list no longer contains a GPU node
+        THEN the removed node should never be selected
+        """
+        from backend.services.agent_load_balancer_service import SwarmLoadBalancer
+
+        balancer = SwarmLoadBalancer(db_session=mock_db_session)
+        await balancer.initialize_agent_metrics(available_nodes)
+        await balancer.assign_task(gpu_task, available_nodes)
+
+        remaining = [node for node in available_nodes if node["peer_id"] != "node2"]
+        result = await balancer.assign_task(gpu_task, remaining)
+
+        assert result.peer_id == "node4"
+        assert "node2" not in balancer.candidate_index
+
+
+class TestBatchAssignment:
+    """Test batch assignment with global matching"""
+
+    @staticmethod
+    def _task(required_capabilities=None, priority=TaskPriority.NORMAL):
+        return Task(
+            id=uuid4(),
+            task_type="batch_task",
+            payload={},
+            priority=priority,
+            status=TaskStatus.QUEUED,
+            required_capabilities=required_capabilities or {}
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_spreads_load_across_agents(self, mock_db_session):
+        """
+        GIVEN equally capable idle agents
+        WHEN assigning a batch of tasks
+        THEN should spread tasks evenly instead of piling onto one agent
+        """
+        from backend.services.agent_load_balancer_service import SwarmLoadBalancer
+
+        nodes = [{"peer_id": f"node{i}", "capabilities": {"cpu_cores": 8}} for i in range(4)]
+        balancer = SwarmLoadBalancer(db_session=mock_db_session)
+        await balancer.initialize_agent_metrics(nodes)
+
+        tasks = [self._task({"cpu_cores": 2}) for _ in range(20)]
+        results = await balancer.assign_tasks_batch(tasks, nodes)
+
+        assert all(result is not None for result in results)
+        for node in nodes:
+            assert balancer.agent_metrics[node["peer_id"]].current_tasks == 5
+        assert balancer.total_tasks_assigned == 20
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_agent_capacity(self, mock_db_session):
+        """
+        GIVEN more tasks than agent headroom
+        WHEN assigning a batch
+        THEN should never overload an agent and leave the rest unassigned
+        """
+        from backend.services.agent_load_balancer_service import SwarmLoadBalancer, AgentMetrics
+
+        nodes = [{"peer_id": "node1", "capabilities": {}}, {"peer_id": "node2", "capabilities": {}}]
+        balancer = SwarmLoadBalancer(db_session=mock_db_session)
+        await balancer.initialize_agent_metrics(nodes)
+        await balancer.update_agent_metrics("node2", current_tasks=8)
+
+        tasks = [self._task() for _ in range(30)]
+        results = await balancer.assign_tasks_batch(tasks, nodes)
+
+        headroom = (AgentMetrics.MAX_CURRENT_TASKS + 1) * 2 - 8
+        assert sum(1 for result in results if result is not None) == headroom
+        assert balancer.agent_metrics["node1"].current_tasks == AgentMetrics.MAX_CURRENT_TASKS + 1
+        assert balancer.agent_metrics["node2"].current_tasks == AgentMetrics.MAX_CURRENT_TASKS + 1
+
+    @pytest.mark.asyncio
+    async def test_batch_places_constrained_tasks_first(self, mock_db_session):
+        """
+        GIVEN one GPU agent with limited headroom and unconstrained tasks listed first
+        WHEN assigning a batch
+        THEN GPU tasks should get the GPU agent and others go elsewhere
+        """
+        from backend.services.agent_load_balancer_service import SwarmLoadBalancer
+
+        nodes = [
+            {"peer_id": "gpu-node", "capabilities": {"gpu_available": True}},
+            {"peer_id": "cpu-node", "capabilities": {"gpu_available": False}},
+        ]
+        balancer = SwarmLoadBalancer(db_session=mock_db_session)
+        await balancer.initialize_agent_metrics(nodes)
+        await balancer.update_agent_metrics("gpu-node", current_tasks=9)
+        await balancer.update_agent_metrics("cpu-node", current_tasks=5)
+
+        plain_tasks = [self._task() for _ in range(2)]
+        gpu_tasks = [self._task({"gpu_available": True}) for _ in range(2)]
+        results = await balancer.assign_tasks_batch(plain_tasks + gpu_tasks, nodes)
+
+        assert [result.peer_id for result in results] == ["cpu-node", "cpu-node", "gpu-node", "gpu-node"]
+
+    @pytest.mark.asyncio
+    async def test_batch_prioritizes_high_priority_tasks(self, mock_db_session):
+        """
+        GIVEN a single agent slot and tasks of mixed priority
+        WHEN assigning a batch
+        THEN the highest priority task should win the slot
+        """
+        from backend.services.agent_load_balancer_service import SwarmLoadBalancer
+
+        nodes = [{"peer_id": "node1", "capabilities": {}}]
+        balancer = SwarmLoadBalancer(db_session=mock_db_session)
+        await balancer.initialize_agent_metrics(nodes)
+        await balancer.update_agent_metrics("node1", current_tasks=10)
+
+        tasks = [
+            self._task(priority=TaskPriority.LOW),
+            self._task(priority=TaskPriority.CRITICAL),
+            self._task(priority=TaskPriority.NORMAL),
+        ]
+        results = await balancer.assign_tasks_batch(tasks, nodes)
+
+        assert results[0] is None
+        assert results[1].peer_id == "node1"
+        assert results[2] is None
+
+    @pytest.mark.asyncio
+    async def test_batch_empty(self, mock_db_session, available_nodes):
+        """
+        GIVEN an empty batch
+        WHEN assigning
+        THEN should return an empty result list
+        """
+        from backend.services.agent_load_balancer_service import SwarmLoadBalancer
+
+        balancer = SwarmLoadBalancer(db_session=mock_db_session)
+
+        assert await balancer.assign_tasks_batch([], available_nodes) == []
@@ -0,0 +1,195 @@
+"""
+Tests for Bulk Lease Revocation
+
+Covers set-based revocation across many crashed peers: lease revocation,
+requeue in the same transaction with retry limits, per-peer counts for
+crash detection, and the batched audit insert.
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.models.audit_event import (
+    AuditEventType,
+    AuditLogEntry,
+    AuditQuery,
+    Base as AuditBase,
+)
+from backend.models.task_lease import Task, TaskLease, TaskPriority, TaskStatus
+from backend.services.lease_revocation_service import LeaseRevocationService
+from backend.services.security_audit_logger import (
+    DatabaseAuditLogStorage,
+    SecurityAuditLogger,
+)
+
+
+@pytest.fixture
+def db_session():
+    """In-memory SQLite session with only the task, lease and audit tables"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Task.__table__.create(engine)
+    TaskLease.__table__.create(engine)
+    AuditBase.metadata.create_all(engine, tables=[AuditLogEntry.__table__])
+
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def audit_logger(db_session):
+    return SecurityAuditLogger(DatabaseAuditLogStorage(db_session))
+
+
+@pytest.fixture
+def service(db_session, audit_logger):
+    return LeaseRevocationService(db=db_session, audit_logger=audit_logger)
+
+
+@pytest.fixture
+def create_leased_task(db_session):
+    """Factory for a LEASED task with an active lease held by a peer"""
+    def _create(peer_id, retry_count=0, max_retries=3, is_revoked=0):
+        task = Task(
+            id=uuid4(),
+            task_type="test_task",
+            payload={},
+            priority=TaskPriority.NORMAL,
+            status=TaskStatus.LEASED,
+            retry_count=retry_count,
+            max_retries=max_retries,
+            assigned_peer_id=peer_id,
+        )
+        lease = TaskLease(
+            id=uuid4(),
+            task_id=task.id,
+            peer_id=peer_id,
+            lease_token=f"token-{uuid4()}",
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+            is_expired=0,
+            is_revoked=is_revoked,
+            lease_duration_seconds=300,
+        )
+        db_session.add_all([task, lease])
+        db_session.commit()
+        return task
+
+    return _create
+
+
+class TestBulkRevocation:
+    """Test revoke_leases_on_crash_bulk"""
+
+    @pytest.mark.asyncio
+    async def test_revokes_and_requeues_across_peers(self, service, create_leased_task, db_session):
+        """
+        GIVEN three crashed peers holding leases and a healthy peer
+        WHEN revoking in bulk
+        THEN only the crashed peers' leases are revoked and their tasks are
+             requeued with retry_count incremented
+        """
+        crashed = ["peer-a", "peer-b", "peer-c"]
+        for i, peer_id in enumerate(crashed):
+            for _ in range(i + 1):
+                create_leased_task(peer_id)
+        healthy_task = create_leased_task("peer-healthy")
+
+        result = await service.revoke_leases_on_crash_bulk(crashed, reason="zone_outage")
+
+        assert result["success"] is True
+        assert result["revoked_count"] == 6
+        assert result["requeued_count"] == 6
+        assert result["revoked_by_peer"] == {"peer-a": 1, "peer-b": 2, "peer-c": 3}
+
+        db_session.expire_all()
+        assert db_session.query(TaskLease).filter(TaskLease.is_revoked == 1).count() == 6
+        requeued = db_session.query(Task).filter(Task.status == TaskStatus.QUEUED).all()
+        assert len(requeued) == 6
+        assert all(t.retry_count == 1 and t.assigned_peer_id is None for t in requeued)
+        assert db_session.get(Task, healthy_task.id).status == TaskStatus.LEASED
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_expire_and_revoked_leases_skipped(
+        self, service, create_leased_task, db_session
+    ):
+        """
+        GIVEN a task with no retries left and an already revoked lease
+        WHEN revoking in bulk
+        THEN the exhausted task is expired and the revoked lease is not counted
+        """
+        exhausted = create_leased_task("peer-a", retry_count=3, max_retries=3)
+        create_leased_task("peer-a", is_revoked=1)
+
+        result = await service.revoke_leases_on_crash_bulk(["peer-a"], reason="node_crash")
+
+        assert result["revoked_count"] == 1
+        assert result["requeued_count"] == 0
+        db_session.expire_all()
+        task = db_session.get(Task, exhausted.id)
+        assert task.status == TaskStatus.EXPIRED
+        assert task.retry_count == 3
+
+    @pytest.mark.asyncio
+    async def test_finished_tasks_keep_their_status(self, service, create_leased_task, db_session):
+        """
+        GIVEN a crashed peer whose active lease belongs to a task that already completed
+        WHEN revoking in bulk
+        THEN the lease is revoked but the completed task is not requeued
+        """
+        completed = create_leased_task("peer-a")
+        completed.status = TaskStatus.COMPLETED
+        db_session.commit()
+        running = create_leased_task("peer-a")
+        running.status = TaskStatus.RUNNING
+        db_session.commit()
+
+        result = await service.revoke_leases_on_crash_bulk(["peer-a"], reason="node_crash")
+
+        assert result["revoked_count"] == 2
+        assert result["requeued_count"] == 1
+        db_session.expire_all()
+        assert db_session.get(Task, completed.id).status == TaskStatus.COMPLETED
+        assert db_session.get(Task, completed.id).retry_count == 0
+        assert db_session.get(Task, running.id).status == TaskStatus.QUEUED
+
+    @pytest.mark.asyncio
+    async def test_batched_audit_events_and_crash_detection_hook(
+        self, service, create_leased_task, audit_logger
+    ):
+        """
+        GIVEN two crashed peers
+        WHEN revoking through revoke_leases_for_peers
+        THEN per-peer counts are returned and one LEASE_REVOKED audit event
+             per peer is stored
+        """
+        create_leased_task("peer-a")
+        create_leased_task("peer-b")
+        create_leased_task("peer-b")
+
+        counts = await service.revoke_leases_for_peers(["peer-a", "peer-b", "peer-idle"])
+
+        assert counts == {"peer-a": 1, "peer-b": 2, "peer-idle": 0}
+        events = audit_logger.query_events(AuditQuery(event_type=AuditEventType.LEASE_REVOKED))
+        assert {e.peer_id: e.metadata["revoked_count"] for e in events} == counts
+
+    @pytest.mark.asyncio
+    async def test_empty_peer_id_rejected(self, service):
+        """
+        GIVEN a peer list containing an empty ID
+        WHEN revoking in bulk
+        THEN ValueError is raised
+        """
+        with pytest.raises(ValueError):
+            await service.revoke_leases_on_crash_bulk(["peer-a", ""], reason="node_crash")
@@ -780,3 +780,48 @@ class TestCombinedValidation:
         assert len(result.missing_capabilities) > 0
         assert len(result.resource_violations) > 0
         assert len(result.scope_violations) > 0
+
+
+class TestBatchValidation:
+    """Test validating many tasks against one token"""
+
+    def test_validate_batch_matches_individual_results(self):
+        """
+        GIVEN several tasks and one node token
+        WHEN validating them as a batch
+        THEN each result matches validating the task on its own
+        """
+        validation_service = CapabilityValidationService()
+        token = CapabilityToken(
+            peer_id="QmBatchPeer",
+            capabilities=["can_execute:llama-2-7b"],
+            limits={"max_concurrent_tasks": 5},
+            data_scopes=["project-alpha"]
+        )
+        tasks = [
+            TaskRequirements(
+                task_id=f"task-{model}-{project}",
+                model_name=model,
+                capabilities=[
+                    CapabilityRequirement(capability_id=f"can_execute:{model}", required=True)
+                ],
+                data_scope=DataScope(project_id=project, data_classification="internal"),
+                estimated_duration_minutes=10
+            )
+            for model, project in [
+                ("llama-2-7b", "project-alpha"),
+                ("mistral-7b", "project-alpha"),
+                ("llama-2-7b", "project-beta"),
+            ]
+        ]
+        node_usage = {"concurrent_tasks": 1}
+
+        results = validation_service.validate_batch(tasks, token, node_usage)
+
+        assert [r.is_valid for r in results] == [True, False, False]
+        assert [r.error_code for r in results] == [
+            None, "CAPABILITY_MISSING", "DATA_SCOPE_VIOLATION"
+        ]
+        assert results == [
+            validation_service.validate(task, token, node_usage) for task in tasks
+        ]
@@ -0,0 +1,270 @@
+"""
+Tests for the conversation metadata cache and message stats buffer
+
+Covers cache hits on the ConversationService hot path, TTL/LRU bounds,
+invalidation on archive/attach-agent, and batched counter flushes.
+"""
+
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.integrations.zerodb_client import ZeroDBClient
+from backend.services.conversation_cache import (
+    ConversationMetadata,
+    ConversationMetadataCache,
+    MessageStatsBuffer,
+    start_message_stats_flusher,
+    stop_message_stats_flusher,
+)
+from backend.services.conversation_service import ConversationService
+from backend.services.conversation_service_pg import ConversationServicePG
+
+
+@pytest.fixture
+def mock_db_session():
+    """Create a mocked async database session"""
+    session = AsyncMock(spec=AsyncSession)
+    session.add = MagicMock()
+    return session
+
+
+@pytest.fixture
+def mock_zerodb_client():
+    """Create a mocked ZeroDBClient"""
+    client = AsyncMock(spec=ZeroDBClient)
+    client.create_table_row_batched = AsyncMock(return_value={"id": "row_1"})
+    client.create_memory = AsyncMock(return_value={"id": "mem_1"})
+    client.query_rows = AsyncMock(return_value={"rows": []})
+    return client
+
+
+@pytest.fixture
+def conversation():
+    """Create a conversation stand-in with a loaded workspace"""
+    conv = MagicMock()
+    conv.id = uuid4()
+    conv.workspace_id = uuid4()
+    conv.workspace.zerodb_project_id = "proj_123"
+    conv.openclaw_session_key = f"whatsapp:dm:{uuid4().hex[:8]}"
+    conv.status = "active"
+    return conv
+
+
+def _scalar_result(value):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = value
+    return result
+
+
+def _metadata(**overrides):
+    fields = dict(id=uuid4(), workspace_id=uuid4(), status="active", session_key=None)
+    fields.update(overrides)
+    return ConversationMetadata(**fields)
+
+
+class TestConversationMetadataCache:
+    """Test cache bounds and indexes"""
+
+    def test_lookup_by_id_and_session_key(self):
+        """
+        GIVEN cached metadata with a session key
+        WHEN looking it up by ID and by session key
+        THEN both resolve to the same entry until invalidated
+        """
+        cache = ConversationMetadataCache()
+        metadata = _metadata(session_key="whatsapp:dm:1")
+        cache.put(metadata)
+
+        assert cache.get(metadata.id) is metadata
+        assert cache.get_by_session_key("whatsapp:dm:1") is metadata
+
+        cache.invalidate(metadata.id)
+
+        assert cache.get(metadata.id) is None
+        assert cache.get_by_session_key("whatsapp:dm:1") is None
+
+    def test_ttl_and_lru_bounds(self, monkeypatch):
+        """
+        GIVEN a cache limited to two entries with a 10 second TTL
+        WHEN a third entry is added and time passes the TTL
+        THEN the least recently used entry is evicted and the rest expire
+        """
+        clock = [1000.0]
+        monkeypatch.setattr("backend.services.conversation_cache.time.monotonic", lambda: clock[0])
+        cache = ConversationMetadataCache(max_entries=2, ttl_seconds=10)
+        first, second, third = _metadata(), _metadata(), _metadata()
+
+        cache.put(first)
+        cache.put(second)
+        cache.get(first.id)  # first becomes most recently used
+        cache.put(third)
+
+        assert cache.get(second.id) is None
+        assert cache.get(first.id) is first
+
+        clock[0] += 11
+        assert cache.get(first.id) is None
+        assert cache.get_stats()["size"] == 1
+
+
+class TestConversationServiceHotPath:
+    """Test cached metadata on the ConversationService message path"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_messages_load_conversation_once(
+        self, mock_db_session, mock_zerodb_client, conversation
+    ):
+        """
+        GIVEN a conversation not yet cached
+        WHEN adding messages and reading them back
+        THEN select(Conversation) runs once and counters are buffered, not committed
+        """
+        mock_db_session.execute.return_value = _scalar_result(conversation)
+        service = ConversationService(
+            db=mock_db_session,
+            zerodb_client=mock_zerodb_client,
+            metadata_cache=ConversationMetadataCache(),
+            stats_buffer=MessageStatsBuffer(flush_interval=3600, max_pending=100)
+        )
+
+        await service.add_message(conversation.id, "user", "one")
+        await service.add_message(conversation.id, "assistant", "two")
+        await service.get_messages(conversation.id)
+
+        assert mock_db_session.execute.await_count == 1
+        mock_db_session.commit.assert_not_awaited()
+        assert service.stats_buffer.pending_count(conversation.id) == 2
+        assert mock_zerodb_client.query_rows.call_args.kwargs["project_id"] == "proj_123"
+
+    @pytest.mark.asyncio
+    async def test_session_key_lookup_uses_primary_key_on_hit(
+        self, mock_db_session, mock_zerodb_client, conversation
+    ):
+        """
+        GIVEN a session key already present in the cache
+        WHEN resolving it
+        THEN the conversation is fetched by primary key instead of a session-key query
+        """
+        cache = ConversationMetadataCache()
+        cache.put(ConversationMetadata.from_conversation(conversation))
+        mock_db_session.get.return_value = conversation
+        service = ConversationService(
+            db=mock_db_session, zerodb_client=mock_zerodb_client, metadata_cache=cache
+        )
+
+        result = await service.get_conversation_by_session_key(conversation.openclaw_session_key)
+
+        assert result is conversation
+        mock_db_session.execute.assert_not_awaited()
+        mock_db_session.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_archive_invalidates_cache(
+        self, mock_db_session, mock_zerodb_client, conversation
+    ):
+        """
+        GIVEN a cached conversation
+        WHEN it is archived
+        THEN its cache entry is dropped
+        """
+        cache = ConversationMetadataCache()
+        cache.put(ConversationMetadata.from_conversation(conversation))
+        mock_db_session.execute.return_value = _scalar_result(conversation)
+        service = ConversationService(
+            db=mock_db_session, zerodb_client=mock_zerodb_client, metadata_cache=cache
+        )
+
+        await service.archive_conversation(conversation.id)
+
+        assert cache.get(conversation.id) is None
+
+    @pytest.mark.asyncio
+    async def test_attach_agent_invalidates_cache(self, mock_db_session, conversation):
+        """
+        GIVEN a cached conversation
+        WHEN an agent is attached through ConversationServicePG
+        THEN its cache entry is dropped
+        """
+        cache = ConversationMetadataCache()
+        cache.put(ConversationMetadata.from_conversation(conversation))
+        mock_db_session.execute.return_value = _scalar_result(conversation)
+        service = ConversationServicePG(db=mock_db_session, metadata_cache=cache)
+
+        await service.attach_agent(conversation.id, uuid4())
+
+        assert cache.get(conversation.id) is None
+
+
+class TestMessageStatsBuffer:
+    """Test batched counter flushes"""
+
+    @pytest.mark.asyncio
+    async def test_flush_issues_one_update_per_conversation(self, mock_db_session):
+        """
+        GIVEN five messages recorded across two conversations
+        WHEN the buffer is flushed
+        THEN one UPDATE per conversation is executed in a single commit
+        """
+        buffer = MessageStatsBuffer()
+        first, second = uuid4(), uuid4()
+        for conversation_id in (first, first, first, second, second):
+            buffer.record(conversation_id, datetime.now(timezone.utc))
+
+        assert await buffer.flush(mock_db_session) == 2
+
+        assert mock_db_session.execute.await_count == 2
+        mock_db_session.commit.assert_awaited_once()
+        assert buffer.get_stats()["pending_messages"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_increments(self, mock_db_session):
+        """
+        GIVEN pending increments and a database error during flush
+        WHEN maybe_flush runs
+        THEN the error is contained and increments remain pending for retry
+        """
+        buffer = MessageStatsBuffer(max_pending=1)
+        conversation_id = uuid4()
+        buffer.record(conversation_id, datetime.now(timezone.utc))
+        mock_db_session.execute.side_effect = Exception("db down")
+
+        await buffer.maybe_flush(mock_db_session)
+
+        assert buffer.pending_count(conversation_id) == 1
+        mock_db_session.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_background_flusher_writes_idle_conversations(self, mock_db_session):
+        """
+        GIVEN a pending increment and no further messages
+        WHEN the background flusher runs past the flush interval
+        THEN the increment is written without another add_message
+        """
+        buffer = MessageStatsBuffer(flush_interval=0.01)
+        conversation_id = uuid4()
+        buffer.record(conversation_id, datetime.now(timezone.utc))
+
+        @asynccontextmanager
+        async def session_factory():
+            yield mock_db_session
+
+        with patch(
+            "backend.services.conversation_cache.get_message_stats_buffer",
+            return_value=buffer
+        ):
+            start_message_stats_flusher(session_factory, interval=0.01)
+            try:
+                for _ in range(50):
+                    if buffer.pending_count(conversation_id) == 0:
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                await stop_message_stats_flusher()
+
+        assert buffer.pending_count(conversation_id) == 0
+        mock_db_session.commit.assert_awaited()
@@ -0,0 +1,331 @@
+"""
+Tests for keyset message pagination and transcript streaming
+
+Covers (created_at, id) cursor pages in ConversationServicePG against a
+real SQLite messages table, cursor filters pushed to ZeroDB by
+ConversationService (including the legacy-table fallback for histories
+not yet backfilled), and cursor validation.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.integrations.zerodb_client import ZeroDBClient
+from backend.models.message import Message
+from backend.services.conversation_cache import (
+    ConversationMetadata,
+    ConversationMetadataCache,
+    MessageStatsBuffer,
+)
+from backend.services.conversation_service import ConversationService
+from backend.services.conversation_service_pg import ConversationServicePG
+from backend.services.message_cursor import decode_message_cursor, encode_message_cursor
+
+
+@pytest.fixture
+async def db_session():
+    """Async SQLite session with only the messages table created"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Message.__table__.create(sync_conn))
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def seeded_conversation(db_session):
+    """
+    Conversation with five messages; the middle three share a timestamp so
+    ordering depends on the id tie-breaker.
+    """
+    conversation_id = uuid4()
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    timestamps = [base, base + timedelta(seconds=1), base + timedelta(seconds=1),
+                  base + timedelta(seconds=1), base + timedelta(seconds=2)]
+    for i, created_at in enumerate(timestamps):
+        db_session.add(Message(
+            id=UUID(f"aaaaaaaa-0000-0000-0000-00000000000{9 - i}"),
+            conversation_id=conversation_id,
+            role="user",
+            content=f"message {i}",
+            created_at=created_at,
+            message_metadata={},
+        ))
+    # Another conversation's message must never appear
+    db_session.add(Message(
+        id=uuid4(), conversation_id=uuid4(), role="user", content="other",
+        created_at=base, message_metadata={},
+    ))
+    await db_session.commit()
+    return conversation_id
+
+
+class TestKeysetPaginationPG:
+    """Test cursor pages over the messages table"""
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_every_message_once_in_order(self, db_session, seeded_conversation):
+        """
+        GIVEN five messages, three sharing a timestamp
+        WHEN walking pages of two with next_cursor
+        THEN each message appears exactly once in (created_at, id) order
+        """
+        service = ConversationServicePG(db=db_session)
+        contents, cursor, pages = [], None, 0
+        while True:
+            messages, cursor = await service.get_messages_page(
+                seeded_conversation, limit=2, cursor=cursor
+            )
+            contents.extend(m.content for m in messages)
+            pages += 1
+            if cursor is None:
+                break
+
+        # Ties at +1s are broken by id ascending (ids decrease with i)
+        assert contents == ["message 0", "message 3", "message 2", "message 1", "message 4"]
+        assert pages == 3
+
+    @pytest.mark.asyncio
+    async def test_iter_messages_streams_full_transcript(self, db_session, seeded_conversation):
+        """
+        GIVEN a conversation longer than one batch
+        WHEN iterating its messages
+        THEN all messages are yielded in the same order as paging
+        """
+        service = ConversationServicePG(db=db_session)
+
+        streamed = [m.content async for m in service.iter_messages(seeded_conversation, batch_size=2)]
+        first_page, _ = await service.get_messages_page(seeded_conversation, limit=10)
+
+        assert streamed == [m.content for m in first_page]
+        assert len(streamed) == 5
+
+
+def _zerodb_service(conversation_id, zerodb):
+    """ConversationService over a mocked ZeroDB client with cached conversation metadata"""
+    metadata_cache = ConversationMetadataCache()
+    metadata_cache.put(ConversationMetadata(
+        id=conversation_id, workspace_id=uuid4(), status="active", zerodb_project_id="proj_1"
+    ))
+    return ConversationService(
+        db=MagicMock(spec=AsyncSession),
+        zerodb_client=zerodb,
+        metadata_cache=metadata_cache,
+        stats_buffer=MessageStatsBuffer(),
+    )
+
+
+class TestKeysetPaginationZeroDB:
+    """Test cursor filters sent to ZeroDB"""
+
+    @pytest.mark.asyncio
+    async def test_cursor_pushed_into_filter(self):
+        """
+        GIVEN a cursor from a previous page
+        WHEN requesting the next page
+        THEN ZeroDB is queried for this conversation's rows after the cursor only
+        """
+        conversation_id = uuid4()
+        metadata_cache = ConversationMetadataCache()
+        metadata_cache.put(ConversationMetadata(
+            id=conversation_id, workspace_id=uuid4(), status="active", zerodb_project_id="proj_1"
+        ))
+        zerodb = AsyncMock(spec=ZeroDBClient)
+        zerodb.query_rows = AsyncMock(return_value={"data": [
+            {"row_data": {"id": "row_9", "timestamp": "2024-01-01T10:00:09+00:00"}},
+            {"row_data": {"id": "row_8", "timestamp": "2024-01-01T10:00:08+00:00"}},
+        ]})
+        service = ConversationService(
+            db=MagicMock(spec=AsyncSession),
+            zerodb_client=zerodb,
+            metadata_cache=metadata_cache,
+            stats_buffer=MessageStatsBuffer(),
+        )
+        cursor = encode_message_cursor("2024-01-01T10:00:05+00:00", "row_5")
+
+        rows, next_cursor = await service.get_messages_page(conversation_id, limit=2, cursor=cursor)
+
+        filter_query = zerodb.query_rows.call_args.kwargs["filter_query"]
+        assert filter_query["$and"][0] == {"conversation_id": {"$eq": str(conversation_id)}}
+        assert {"timestamp": {"$gt": "2024-01-01T10:00:05+00:00"}} in filter_query["$and"][1]["$or"]
+        assert [row["id"] for row in rows] == ["row_8", "row_9"]
+        assert decode_message_cursor(next_cursor) == ("2024-01-01T10:00:09+00:00", "row_9")
+
+    @pytest.mark.asyncio
+    async def test_pages_sorted_server_side_lose_no_rows(self):
+        """
+        GIVEN ZeroDB rows stored out of (timestamp, id) order, two sharing a timestamp
+        WHEN walking pages of two with next_cursor
+        THEN every row appears exactly once, in order, because the sort is
+             applied before the limit
+        """
+        conversation_id = uuid4()
+        metadata_cache = ConversationMetadataCache()
+        metadata_cache.put(ConversationMetadata(
+            id=conversation_id, workspace_id=uuid4(), status="active", zerodb_project_id="proj_1"
+        ))
+        stored = [
+            {"id": "row_5", "timestamp": "2024-01-01T10:00:05+00:00"},
+            {"id": "row_1", "timestamp": "2024-01-01T10:00:01+00:00"},
+            {"id": "row_4", "timestamp": "2024-01-01T10:00:03+00:00"},
+            {"id": "row_2", "timestamp": "2024-01-01T10:00:02+00:00"},
+            {"id": "row_3", "timestamp": "2024-01-01T10:00:03+00:00"},
+        ]
+
+        def matches(row, query):
+            for key, condition in query.items():
+                if key == "$and":
+                    if not all(matches(row, q) for q in condition):
+                        return False
+                elif key == "$or":
+                    if not any(matches(row, q) for q in condition):
+                        return False
+                elif key == "conversation_id":
+                    continue
+                elif "$eq" in condition and not row[key] == condition["$eq"]:
+                    return False
+                elif "$gt" in condition and not row[key] > condition["$gt"]:
+                    return False
+            return True
+
+        async def query_rows(table_name, filter_query, project_id=None, limit=100, skip=0, sort=None):
+            rows = [row for row in stored if matches(row, filter_query)]
+            if sort:
+                rows.sort(key=lambda row: tuple(row[key] for key in sort))
+            return {"data": [{"row_data": row} for row in rows[skip:skip + limit]]}
+
+        zerodb = AsyncMock(spec=ZeroDBClient)
+        zerodb.query_rows = AsyncMock(side_effect=query_rows)
+        service = ConversationService(
+            db=MagicMock(spec=AsyncSession),
+            zerodb_client=zerodb,
+            metadata_cache=metadata_cache,
+            stats_buffer=MessageStatsBuffer(),
+        )
+
+        ids, cursor = [], None
+        while True:
+            rows, cursor = await service.get_messages_page(conversation_id, limit=2, cursor=cursor)
+            ids.extend(row["id"] for row in rows)
+            if cursor is None:
+                break
+
+        assert ids == ["row_1", "row_2", "row_3", "row_4", "row_5"]
+        assert zerodb.query_rows.call_args.kwargs["sort"] == {"timestamp": 1, "id": 1}
+
+    @pytest.mark.asyncio
+    async def test_add_message_returns_row_id_and_message_id(self):
+        """
+        GIVEN a message added through the ZeroDB service
+        WHEN reading the add_message result and the stored row
+        THEN "id" is the ZeroDB row id and "message_id" the stored keyset id
+        """
+        conversation_id = uuid4()
+        zerodb = AsyncMock(spec=ZeroDBClient)
+        zerodb.create_table_row_batched = AsyncMock(return_value={"id": "row_123"})
+        zerodb.create_memory = AsyncMock(return_value={"id": "mem_123"})
+        service = _zerodb_service(conversation_id, zerodb)
+
+        result = await service.add_message(conversation_id, role="user", content="Hello")
+
+        stored = zerodb.create_table_row_batched.call_args.kwargs["row_data"]
+        assert result["id"] == "row_123"
+        assert result["message_id"] == stored["id"]
+        assert result["message_id"] != "row_123"
+
+    def test_malformed_cursor_rejected(self):
+        """
+        GIVEN a cursor that was not produced by the service
+        WHEN decoding it
+        THEN ValueError is raised
+        """
+        with pytest.raises(ValueError, match="Invalid message cursor"):
+            decode_message_cursor("not-a-cursor")
+
+
+class TestLegacyMessageFallback:
+    """Test reads of histories not yet copied from the legacy table API"""
+
+    @pytest.fixture
+    def conversation_id(self):
+        return uuid4()
+
+    @pytest.fixture
+    def zerodb(self, conversation_id):
+        """Empty new table; legacy table holds this and another conversation's rows"""
+        legacy_rows = [
+            {"id": f"row_{i}", "data": {
+                "conversation_id": str(conversation_id), "role": "user",
+                "content": f"message {i}", "timestamp": f"2024-01-01T10:00:0{i}+00:00"
+            }}
+            for i in (3, 1, 5, 2, 4)
+        ]
+        legacy_rows.insert(2, {"id": "row_x", "data": {
+            "conversation_id": str(uuid4()), "role": "user",
+            "content": "other", "timestamp": "2024-01-01T10:00:00+00:00"
+        }})
+
+        async def query_table(project_id, table_name, limit=10, skip=0):
+            return legacy_rows[skip:skip + limit]
+
+        zerodb = AsyncMock(spec=ZeroDBClient)
+        zerodb.query_rows = AsyncMock(return_value={"data": []})
+        zerodb.query_table = AsyncMock(side_effect=query_table)
+        return zerodb
+
+    @pytest.mark.asyncio
+    async def test_get_messages_reads_legacy_table(self, conversation_id, zerodb):
+        """
+        GIVEN a conversation whose messages only exist in the legacy table
+        WHEN reading messages with an offset
+        THEN only that conversation's messages are returned, in order
+        """
+        service = _zerodb_service(conversation_id, zerodb)
+
+        messages = await service.get_messages(conversation_id, limit=2, offset=1)
+
+        assert [m["id"] for m in messages] == ["row_2", "row_3"]
+        assert zerodb.query_table.call_args.kwargs["project_id"] == "proj_1"
+
+    @pytest.mark.asyncio
+    async def test_pages_walk_legacy_history(self, conversation_id, zerodb):
+        """
+        GIVEN a conversation whose messages only exist in the legacy table
+        WHEN walking pages of two with next_cursor
+        THEN every legacy message of the conversation appears once, in order
+        """
+        service = _zerodb_service(conversation_id, zerodb)
+
+        ids, cursor = [], None
+        while True:
+            rows, cursor = await service.get_messages_page(conversation_id, limit=2, cursor=cursor)
+            ids.extend(row["id"] for row in rows)
+            if cursor is None:
+                break
+
+        assert ids == ["row_1", "row_2", "row_3", "row_4", "row_5"]
+
+    @pytest.mark.asyncio
+    async def test_migrated_conversation_never_reads_legacy_table(self, conversation_id, zerodb):
+        """
+        GIVEN a conversation with rows in the new table
+        WHEN reading past its last row by offset and by cursor
+        THEN empty pages are returned without reading the legacy table
+        """
+        async def query_rows(table_name, filter_query, project_id=None, limit=100, skip=0, sort=None):
+            if skip or "$and" in filter_query:
+                return {"data": []}
+            return {"data": [{"row_data": {"id": "msg_1", "timestamp": "2024-01-01T10:00:00+00:00"}}]}
+
+        zerodb.query_rows = AsyncMock(side_effect=query_rows)
+        service = _zerodb_service(conversation_id, zerodb)
+        cursor = encode_message_cursor("2024-01-01T10:00:00+00:00", "msg_1")
+
+        assert await service.get_messages(conversation_id, limit=10, offset=10) == []
+        assert await service.get_messages_page(conversation_id, limit=10, cursor=cursor) == ([], None)
+        zerodb.query_table.assert_not_called()
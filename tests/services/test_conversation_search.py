@@ -0,0 +1,171 @@
+"""
+Tests for conversation semantic search caching and local fallback
+
+Covers server-side filter/pagination pass-through, per-conversation result
+caching with invalidation on new messages, and the BM25 fallback used when
+ZeroDB is unavailable.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.integrations.zerodb_client import ZeroDBClient, ZeroDBConnectionError
+from backend.services.conversation_cache import (
+    ConversationMetadata,
+    ConversationMetadataCache,
+    MessageStatsBuffer,
+)
+from backend.services.conversation_search import LocalMessageIndex, SearchResultCache
+from backend.services.conversation_service import ConversationService
+
+
+@pytest.fixture
+def conversation_id():
+    return uuid4()
+
+
+@pytest.fixture
+def mock_zerodb_client():
+    """Create a mocked ZeroDBClient"""
+    client = AsyncMock(spec=ZeroDBClient)
+    client.create_table_row_batched = AsyncMock(return_value={"id": "row_1"})
+    client.create_memory = AsyncMock(return_value={"id": "mem_1"})
+    client.search_memories = AsyncMock(return_value={"results": [], "total": 0})
+    return client
+
+
+@pytest.fixture
+def service(mock_zerodb_client, conversation_id):
+    """ConversationService with isolated caches and a primed conversation"""
+    metadata_cache = ConversationMetadataCache()
+    metadata_cache.put(ConversationMetadata(
+        id=conversation_id,
+        workspace_id=uuid4(),
+        status="active",
+        zerodb_project_id="proj_123",
+    ))
+    session = AsyncMock(spec=AsyncSession)
+    session.add = MagicMock()
+    return ConversationService(
+        db=session,
+        zerodb_client=mock_zerodb_client,
+        metadata_cache=metadata_cache,
+        stats_buffer=MessageStatsBuffer(flush_interval=3600),
+        search_cache=SearchResultCache(),
+        local_index=LocalMessageIndex(),
+    )
+
+
+class TestSemanticSearchCaching:
+    """Test filter pass-through and result caching"""
+
+    @pytest.mark.asyncio
+    async def test_filter_and_page_sent_to_zerodb(self, service, mock_zerodb_client, conversation_id):
+        """
+        GIVEN a conversation with cached metadata
+        WHEN searching the second page
+        THEN ZeroDB receives the conversation filter and offset
+        """
+        result = await service.search_conversation_semantic(
+            conversation_id, "deploy", limit=5, offset=5
+        )
+
+        mock_zerodb_client.search_memories.assert_awaited_once_with(
+            query="deploy",
+            limit=5,
+            type="conversation",
+            offset=5,
+            metadata_filter={"conversation_id": str(conversation_id)}
+        )
+        assert result["offset"] == 5
+        assert result["source"] == "zerodb"
+
+    @pytest.mark.asyncio
+    async def test_repeat_query_served_from_cache_until_new_message(
+        self, service, mock_zerodb_client, conversation_id
+    ):
+        """
+        GIVEN a query that has already been searched
+        WHEN it is repeated (with different spacing/case) and then a message is added
+        THEN the repeat is served from cache and the next search hits ZeroDB again
+        """
+        await service.search_conversation_semantic(conversation_id, "Deploy steps")
+        await service.search_conversation_semantic(conversation_id, "  deploy   STEPS ")
+
+        assert mock_zerodb_client.search_memories.await_count == 1
+
+        await service.add_message(conversation_id, role="user", content="new info")
+        await service.search_conversation_semantic(conversation_id, "deploy steps")
+
+        assert mock_zerodb_client.search_memories.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_page_is_returned_as_a_copy(self, service, conversation_id):
+        """
+        GIVEN a search result that a caller mutates
+        WHEN the same query is repeated
+        THEN the cached page is unaffected
+        """
+        first = await service.search_conversation_semantic(conversation_id, "deploy")
+        first["results"].append({"content": "injected"})
+        first["total"] = 99
+
+        second = await service.search_conversation_semantic(conversation_id, "deploy")
+
+        assert second["total"] != 99
+        assert {"content": "injected"} not in second["results"]
+
+
+class TestLocalFallback:
+    """Test BM25 fallback when ZeroDB is unavailable"""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_index(self, service, mock_zerodb_client, conversation_id):
+        """
+        GIVEN messages added through the service and ZeroDB search failing
+        WHEN searching
+        THEN the most relevant recent messages are ranked locally
+        """
+        await service.add_message(conversation_id, role="user", content="How do I deploy to staging?")
+        await service.add_message(conversation_id, role="assistant", content="Run the tests first.")
+        await service.add_message(
+            conversation_id, role="assistant", content="Deploy staging with make deploy-staging."
+        )
+        mock_zerodb_client.search_memories.side_effect = ZeroDBConnectionError("down")
+
+        result = await service.search_conversation_semantic(conversation_id, "deploy staging")
+
+        assert result["source"] == "local"
+        assert [r["content"] for r in result["results"]] == [
+            "Deploy staging with make deploy-staging.",
+            "How do I deploy to staging?",
+        ]
+        assert result["results"][0]["metadata"]["conversation_id"] == str(conversation_id)
+
+    @pytest.mark.asyncio
+    async def test_error_raised_without_local_history(self, service, mock_zerodb_client, conversation_id):
+        """
+        GIVEN no locally indexed messages for the conversation
+        WHEN ZeroDB search fails
+        THEN the ZeroDB error propagates
+        """
+        mock_zerodb_client.search_memories.side_effect = ZeroDBConnectionError("down")
+
+        with pytest.raises(ZeroDBConnectionError):
+            await service.search_conversation_semantic(conversation_id, "deploy")
+
+    def test_index_keeps_only_recent_messages(self, conversation_id):
+        """
+        GIVEN an index bounded to two messages per conversation
+        WHEN three matching messages are added
+        THEN only the two most recent are searchable
+        """
+        index = LocalMessageIndex(max_messages_per_conversation=2)
+        for i in range(3):
+            index.add(conversation_id, content=f"deploy {i}", role="user", timestamp=str(i))
+
+        results = index.search(conversation_id, "deploy", limit=10)
+
+        assert sorted(r["content"] for r in results) == ["deploy 1", "deploy 2"]
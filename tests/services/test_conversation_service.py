@@ -27,8 +27,9 @@ from backend.models.agent_swarm_lifecycle import AgentSwarmInstance
 def mock_zerodb_client():
     """Create a mocked ZeroDBClient"""
     client = AsyncMock(spec=ZeroDBClient)
-    client.create_table_row = AsyncMock()
+    client.create_table_row_batched = AsyncMock()
     client.query_table = AsyncMock()
+    client.query_rows = AsyncMock()
     client.create_memory = AsyncMock()
     client.search_memories = AsyncMock()
     return client
@@ -267,7 +268,7 @@ class TestAddMessage:
         mock_db_session.execute.return_value = mock_result
 
         # Mock ZeroDB responses
-        mock_zerodb_client.create_table_row.return_value = {
+        mock_zerodb_client.create_table_row_batched.return_value = {
             "id": "row_123",
             "data": {
                 "conversation_id": str(sample_conversation.id),
@@ -290,11 +291,11 @@ class TestAddMessage:
         )
 
         # Verify dual storage calls
-        mock_zerodb_client.create_table_row.assert_called_once()
+        mock_zerodb_client.create_table_row_batched.assert_called_once()
         mock_zerodb_client.create_memory.assert_called_once()
 
         # Verify table row call details
-        table_call = mock_zerodb_client.create_table_row.call_args
+        table_call = mock_zerodb_client.create_table_row_batched.call_args
         assert table_call.kwargs["project_id"] == sample_conversation.workspace.zerodb_project_id
         assert table_call.kwargs["table_name"] == "messages"
         assert table_call.kwargs["row_data"]["role"] == "user"
@@ -307,13 +308,13 @@ class TestAddMessage:
         assert memory_call.kwargs["type"] == "conversation"
         assert str(sample_conversation.id) in memory_call.kwargs["tags"]
 
-        # Verify conversation metadata updated
-        assert sample_conversation.message_count == 1
-        assert sample_conversation.last_message_at is not None
-        mock_db_session.commit.assert_called()
+        # Verify conversation metadata update buffered for batch flush
+        assert conversation_service.stats_buffer.pending_count(sample_conversation.id) == 1
 
-        # Verify result structure
+        # Verify result structure: id is the table row id, message_id the
+        # message id stored in the row
         assert result["id"] == "row_123"
+        assert result["message_id"] == table_call.kwargs["row_data"]["id"]
         assert result["memory_id"] == "mem_123"
 
     @pytest.mark.asyncio
@@ -351,7 +352,7 @@ class TestAddMessage:
         mock_db_session.execute.return_value = mock_result
 
         # Mock ZeroDB table failure
-        mock_zerodb_client.create_table_row.side_effect = ZeroDBAPIError(
+        mock_zerodb_client.create_table_row_batched.side_effect = ZeroDBAPIError(
             "Table creation failed", status_code=500
         )
 
@@ -381,7 +382,7 @@ class TestAddMessage:
         mock_db_session.execute.return_value = mock_result
 
         # Mock successful table creation but failed memory
-        mock_zerodb_client.create_table_row.return_value = {
+        mock_zerodb_client.create_table_row_batched.return_value = {
             "id": "row_123",
             "data": {"content": "Test"}
         }
@@ -400,9 +401,8 @@ class TestAddMessage:
         assert result["id"] == "row_123"
         assert result["memory_id"] is None
 
-        # Verify conversation was still updated
-        assert sample_conversation.message_count == 1
-        mock_db_session.commit.assert_called()
+        # Verify conversation update was still buffered
+        assert conversation_service.stats_buffer.pending_count(sample_conversation.id) == 1
 
 
 class TestGetMessages:
@@ -423,20 +423,28 @@ class TestGetMessages:
         mock_db_session.execute.return_value = mock_result
 
         # Mock ZeroDB response
-        mock_zerodb_client.query_table.return_value = [
-            {
-                "id": "row_1",
-                "role": "user",
-                "content": "Hello",
-                "timestamp": "2024-01-01T10:00:00Z"
-            },
-            {
-                "id": "row_2",
-                "role": "assistant",
-                "content": "Hi there",
-                "timestamp": "2024-01-01T10:00:05Z"
-            }
-        ]
+        mock_zerodb_client.query_rows.return_value = {
+            "data": [
+                {
+                    "row_id": "row_1",
+                    "row_data": {
+                        "id": "msg_1",
+                        "role": "user",
+                        "content": "Hello",
+                        "timestamp": "2024-01-01T10:00:00Z"
+                    }
+                },
+                {
+                    "row_id": "row_2",
+                    "row_data": {
+                        "id": "msg_2",
+                        "role": "assistant",
+                        "content": "Hi there",
+                        "timestamp": "2024-01-01T10:00:05Z"
+                    }
+                }
+            ]
+        }
 
         # Execute
         result = await conversation_service.get_messages(
@@ -447,13 +455,15 @@ class TestGetMessages:
 
         # Verify
         assert len(result) == 2
+        assert result[0]["id"] == "msg_1"
         assert result[0]["role"] == "user"
         assert result[1]["role"] == "assistant"
 
         # Verify ZeroDB query call
-        mock_zerodb_client.query_table.assert_called_once_with(
-            project_id=sample_conversation.workspace.zerodb_project_id,
+        mock_zerodb_client.query_rows.assert_called_once_with(
             table_name="messages",
+            filter_query={"conversation_id": {"$eq": str(sample_conversation.id)}},
+            project_id=sample_conversation.workspace.zerodb_project_id,
             limit=50,
             skip=0
         )
@@ -471,7 +481,9 @@ class TestGetMessages:
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = sample_conversation
         mock_db_session.execute.return_value = mock_result
-        mock_zerodb_client.query_table.return_value = []
+        mock_zerodb_client.query_rows.return_value = {
+            "data": [{"row_data": {"id": "msg_21", "role": "user", "content": "Hi"}}]
+        }
 
         # Execute with custom pagination
         await conversation_service.get_messages(
@@ -481,13 +493,64 @@ class TestGetMessages:
         )
 
         # Verify pagination parameters
-        mock_zerodb_client.query_table.assert_called_once_with(
-            project_id=sample_conversation.workspace.zerodb_project_id,
+        mock_zerodb_client.query_rows.assert_called_once_with(
             table_name="messages",
+            filter_query={"conversation_id": {"$eq": str(sample_conversation.id)}},
+            project_id=sample_conversation.workspace.zerodb_project_id,
             limit=10,
             skip=20
         )
 
+    @pytest.mark.asyncio
+    async def test_get_messages_falls_back_to_legacy_table(
+        self,
+        conversation_service,
+        mock_db_session,
+        mock_zerodb_client,
+        sample_conversation
+    ):
+        """Test history not yet backfilled is read from the legacy table API"""
+        # Setup mocks
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = sample_conversation
+        mock_db_session.execute.return_value = mock_result
+        mock_zerodb_client.query_rows.return_value = {"data": []}
+        conversation_id = str(sample_conversation.id)
+        mock_zerodb_client.query_table.return_value = [
+            {
+                "id": "row_2",
+                "data": {"conversation_id": conversation_id, "role": "assistant",
+                         "content": "Hi there", "timestamp": "2024-01-01T10:00:05+00:00"}
+            },
+            {
+                "id": "row_9",
+                "data": {"conversation_id": str(uuid4()), "role": "user",
+                         "content": "Other", "timestamp": "2024-01-01T09:00:00+00:00"}
+            },
+            {
+                "id": "row_1",
+                "data": {"conversation_id": conversation_id, "role": "user",
+                         "content": "Hello", "timestamp": "2024-01-01T10:00:00+00:00"}
+            }
+        ]
+
+        # Execute
+        result = await conversation_service.get_messages(
+            conversation_id=sample_conversation.id,
+            limit=50,
+            offset=0
+        )
+
+        # Verify only this conversation's legacy rows, in order
+        assert [message["id"] for message in result] == ["row_1", "row_2"]
+        assert [message["content"] for message in result] == ["Hello", "Hi there"]
+        mock_zerodb_client.query_table.assert_called_once_with(
+            project_id=sample_conversation.workspace.zerodb_project_id,
+            table_name="messages",
+            limit=100,
+            skip=0
+        )
+
     @pytest.mark.asyncio
     async def test_get_messages_conversation_not_found(
         self,
@@ -505,6 +568,70 @@ class TestGetMessages:
             await conversation_service.get_messages(conversation_id=uuid4())
 
 
+class TestBackfillLegacyMessages:
+    """Test suite for backfill_legacy_messages method"""
+
+    @pytest.mark.asyncio
+    async def test_backfill_copies_legacy_rows_by_id(
+        self,
+        conversation_service,
+        mock_zerodb_client
+    ):
+        """Test legacy rows are paged and upserted into the new table keyed on id"""
+        conversation_id = str(uuid4())
+        legacy_rows = [
+            {
+                "id": "row_1",
+                "data": {"conversation_id": conversation_id, "role": "user", "content": "Hi"},
+                "created_at": "2024-01-01T10:00:00+00:00"
+            },
+            {
+                "id": "row_2",
+                "conversation_id": conversation_id,
+                "role": "assistant",
+                "content": "Hello",
+                "timestamp": "2024-01-01T10:00:05+00:00"
+            },
+            {"id": "row_3", "data": {"unrelated": True}}
+        ]
+
+        def query_table(project_id, table_name, limit=10, skip=0):
+            return legacy_rows[skip:skip + limit]
+
+        mock_zerodb_client.query_table = AsyncMock(side_effect=query_table)
+        mock_zerodb_client.bulk_upsert = AsyncMock(return_value={})
+
+        result = await conversation_service.backfill_legacy_messages("proj_test123", batch_size=2)
+
+        assert result == {"scanned": 3, "copied": 2}
+        assert mock_zerodb_client.query_table.call_count == 2
+        upserted = [
+            row
+            for call in mock_zerodb_client.bulk_upsert.call_args_list
+            for row in call.kwargs["rows"]
+        ]
+        assert upserted == [
+            {
+                "id": "row_1",
+                "conversation_id": conversation_id,
+                "role": "user",
+                "content": "Hi",
+                "timestamp": "2024-01-01T10:00:00+00:00"
+            },
+            {
+                "id": "row_2",
+                "conversation_id": conversation_id,
+                "role": "assistant",
+                "content": "Hello",
+                "timestamp": "2024-01-01T10:00:05+00:00"
+            }
+        ]
+        for call in mock_zerodb_client.bulk_upsert.call_args_list:
+            assert call.kwargs["table_name"] == "messages"
+            assert call.kwargs["unique_key"] == "id"
+            assert call.kwargs["project_id"] == "proj_test123"
+
+
 class TestSearchConversationSemantic:
     """Test suite for search_conversation_semantic method"""
 
@@ -558,7 +685,9 @@ class TestSearchConversationSemantic:
         mock_zerodb_client.search_memories.assert_called_once_with(
             query="deployment",
             limit=5,
-            type="conversation"
+            type="conversation",
+            offset=0,
+            metadata_filter={"conversation_id": str(sample_conversation.id)}
         )
 
     @pytest.mark.asyncio
@@ -914,7 +1043,7 @@ class TestErrorHandling:
         mock_db_session.execute.return_value = mock_result
 
         # Mock ZeroDB connection error
-        mock_zerodb_client.create_table_row.side_effect = ZeroDBConnectionError(
+        mock_zerodb_client.create_table_row_batched.side_effect = ZeroDBConnectionError(
             "Failed to connect to ZeroDB"
         )
 
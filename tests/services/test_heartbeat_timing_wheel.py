@@ -0,0 +1,71 @@
+"""
+Heartbeat Timing Wheel Tests (E6-S1)
+
+Tests for deadline tracking across wheel levels, re-arming, and
+cancellation.
+
+Refs: OpenCLAW P2P Swarm PRD Section 5.2, Backlog E6-S1
+"""
+
+import random
+
+import pytest
+
+from backend.services.heartbeat_timing_wheel import HeartbeatTimingWheel
+
+
+class TestHeartbeatTimingWheel:
+    """Test timing wheel expiry semantics"""
+
+    def test_rearm_postpones_expiry(self):
+        """
+        GIVEN a peer armed to expire at t=10
+        WHEN it is re-armed to t=20 before expiring
+        THEN it is not reported at t=10 but is at t=20
+        """
+        wheel = HeartbeatTimingWheel(tick_seconds=1.0, wheel_size=8, levels=2)
+        wheel.arm("peer1", 10.0)
+        wheel.arm("peer1", 20.0)
+
+        assert wheel.advance(10.0) == []
+        assert wheel.advance(20.0) == ["peer1"]
+        assert "peer1" not in wheel
+
+    def test_cancelled_peer_never_expires(self):
+        """
+        GIVEN an armed peer
+        WHEN it is cancelled
+        THEN advancing past its deadline reports nothing
+        """
+        wheel = HeartbeatTimingWheel(tick_seconds=1.0, wheel_size=8, levels=2)
+        wheel.arm("peer1", 5.0)
+
+        assert wheel.cancel("peer1") is True
+        assert wheel.advance(100.0) == []
+        assert len(wheel) == 0
+
+    @pytest.mark.parametrize("wheel_size, levels", [(2, 1), (4, 2), (8, 3)])
+    def test_matches_reference_across_levels(self, wheel_size, levels):
+        """
+        GIVEN random deadlines spanning every level and the overflow set
+        WHEN advancing in uneven steps
+        THEN each peer is reported once, never early and at most one tick late
+        """
+        rng = random.Random(wheel_size * 10 + levels)
+        wheel = HeartbeatTimingWheel(tick_seconds=1.0, wheel_size=wheel_size, levels=levels)
+        horizon = 2 * wheel_size ** levels
+        deadlines = {f"p{i}": rng.uniform(1, horizon) for i in range(200)}
+        for peer_id, deadline in deadlines.items():
+            wheel.arm(peer_id, deadline)
+
+        reported = {}
+        now = 0.0
+        while now < horizon + 2:
+            now += rng.choice([0.4, 1.0, 3.0])
+            for peer_id in wheel.advance(now):
+                assert peer_id not in reported
+                reported[peer_id] = now
+
+        assert reported.keys() == deadlines.keys()
+        for peer_id, reported_at in reported.items():
+            assert deadlines[peer_id] <= reported_at < deadlines[peer_id] + 1.0 + 3.0
@@ -0,0 +1,233 @@
+"""
+Test suite for the deadline-heap lease expiration scheduler.
+
+Uses an in-memory SQLite database with the canonical Task/TaskLease models.
+Tests follow BDD-style naming (Given/When/Then) as per project standards.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.base_class import Base
+from backend.models.task_lease import Task, TaskLease, TaskStatus
+from backend.services import lease_expiration_service as lease_expiration_module
+from backend.services.lease_expiration_service import LeaseExpirationService
+from backend.services.task_lease_issuance_service import TaskLeaseIssuanceService
+
+
+@pytest.fixture
+def db_session():
+    """Create an in-memory database with the task and lease tables."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Task.__table__, TaskLease.__table__])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _lease(db_session, expires_in: float, **lease_kwargs) -> TaskLease:
+    """Create a leased task and its lease expiring in `expires_in` seconds."""
+    task = Task(task_type="compute", payload={}, status=TaskStatus.LEASED)
+    db_session.add(task)
+    db_session.flush()
+    lease = TaskLease(
+        task_id=task.id,
+        peer_id="peer-abc",
+        lease_token=f"token-{uuid4()}",
+        expires_at=datetime.now(timezone.utc) + timedelta(seconds=expires_in),
+        lease_duration_seconds=600,
+        **lease_kwargs
+    )
+    db_session.add(lease)
+    db_session.commit()
+    return lease
+
+
+class TestDeadlineHeap:
+    """Tests for in-memory deadline tracking."""
+
+    def test_pop_due_leases_respects_grace_period_and_cancellation(self):
+        """
+        GIVEN leases scheduled at different deadlines, one of them cancelled
+        WHEN popping due leases
+        THEN only uncancelled leases past deadline + grace period are returned
+        """
+        service = LeaseExpirationService(db_session=MagicMock(), grace_period=2)
+        now = datetime.now(timezone.utc)
+        service.schedule_lease("a", "t1", now - timedelta(seconds=10))
+        service.schedule_lease("b", "t2", now - timedelta(seconds=1))
+        service.schedule_lease("c", "t3", now - timedelta(seconds=20))
+        service.cancel_lease("c")
+
+        assert service.pop_due_leases(now) == ["a"]
+        assert service.next_deadline() == now - timedelta(seconds=1)
+
+    def test_reschedule_replaces_previous_deadline(self):
+        """
+        GIVEN a lease that was rescheduled to a later deadline
+        WHEN popping due leases at the original deadline
+        THEN the stale heap entry is discarded
+        """
+        service = LeaseExpirationService(db_session=MagicMock(), grace_period=0)
+        now = datetime.now(timezone.utc)
+        service.schedule_lease("a", "t1", now - timedelta(seconds=5))
+        service.schedule_lease("a", "t1", now + timedelta(seconds=60))
+
+        assert service.pop_due_leases(now) == []
+        assert service.next_deadline() == now + timedelta(seconds=60)
+
+
+class TestBulkExpiry:
+    """Tests for bulk expiry and requeue against the database."""
+
+    @pytest.mark.asyncio
+    async def test_expire_leases_flags_and_requeues_in_bulk(self, db_session):
+        """
+        GIVEN two expired leases and one already revoked lease
+        WHEN expiring all three
+        THEN only the active leases are flagged and their tasks requeued
+        """
+        emitter = MagicMock()
+        emitter.emit = AsyncMock()
+        service = LeaseExpirationService(
+            db_session=db_session, grace_period=0, event_emitter=emitter
+        )
+        first = _lease(db_session, -10)
+        second = _lease(db_session, -5)
+        revoked = _lease(db_session, -5, is_revoked=1)
+
+        count = await service.expire_leases([first.id, str(second.id), revoked.id])
+
+        assert count == 2
+        db_session.expire_all()
+        assert first.is_expired == 1 and second.is_expired == 1
+        assert revoked.is_expired == 0
+        assert first.task.status == TaskStatus.QUEUED
+        assert second.task.status == TaskStatus.QUEUED
+        assert revoked.task.status == TaskStatus.LEASED
+        assert emitter.emit.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expire_leases_skips_renewed_lease(self, db_session):
+        """
+        GIVEN a lease whose deadline was extended after it was queued for expiry
+        WHEN expiring it
+        THEN the lease stays active and its task is not requeued
+        """
+        service = LeaseExpirationService(db_session=db_session, grace_period=0)
+        renewed = _lease(db_session, 300)
+
+        count = await service.expire_leases([renewed.id])
+
+        assert count == 0
+        db_session.expire_all()
+        assert renewed.is_expired == 0
+        assert renewed.task.status == TaskStatus.LEASED
+
+    @pytest.mark.asyncio
+    async def test_scan_ignores_expired_and_revoked_leases(self, db_session):
+        """
+        GIVEN leases that are already expired or revoked
+        WHEN scanning for expired leases
+        THEN only active leases past the grace period are returned
+        """
+        service = LeaseExpirationService(db_session=db_session, grace_period=2)
+        active = _lease(db_session, -10)
+        _lease(db_session, -10, is_expired=1)
+        _lease(db_session, -10, is_revoked=1)
+        _lease(db_session, -1)
+
+        leases = await service.scan_expired_leases()
+
+        assert [lease.id for lease in leases] == [active.id]
+
+    @pytest.mark.asyncio
+    async def test_seed_and_reconcile(self, db_session):
+        """
+        GIVEN active leases in the database before the scheduler starts
+        WHEN seeding the heap and running a reconciliation sweep
+        THEN active leases are tracked and missed expiries are caught
+        """
+        service = LeaseExpirationService(db_session=db_session, grace_period=0)
+        missed = _lease(db_session, -30)
+        future = _lease(db_session, 300)
+
+        assert service.seed_from_db() == 2
+        assert service.get_expiration_stats()["active_leases"] == 2
+
+        # Simulate the heap losing track of the expired lease
+        service.cancel_lease(missed.id)
+        assert await service.reconcile() == 1
+
+        db_session.expire_all()
+        assert missed.is_expired == 1
+        assert future.is_expired == 0
+        assert service.get_expiration_stats()["reconciled_total"] == 1
+
+
+class TestScheduler:
+    """Tests for the deadline-driven scheduler loop."""
+
+    @pytest.mark.asyncio
+    async def test_scheduler_expires_lease_near_deadline(self, db_session):
+        """
+        GIVEN a running scheduler with a long reconciliation interval
+        WHEN a lease is scheduled to expire shortly
+        THEN it is expired close to its deadline without waiting for a sweep
+        """
+        service = LeaseExpirationService(
+            db_session=db_session, scan_interval=3600, grace_period=0
+        )
+        runner = asyncio.create_task(service.start())
+        await asyncio.sleep(0.01)
+
+        lease = _lease(db_session, 0.05)
+        service.schedule_lease(lease.id, lease.task_id, lease.expires_at)
+        await asyncio.sleep(0.3)
+
+        service.stop()
+        await asyncio.wait_for(runner, timeout=1)
+
+        db_session.expire_all()
+        assert lease.is_expired == 1
+        assert lease.task.status == TaskStatus.QUEUED
+
+    @pytest.mark.asyncio
+    async def test_revoke_lease_cancels_deadline(self, db_session, monkeypatch):
+        """
+        GIVEN a lease tracked by the scheduler
+        WHEN the issuance service revokes it
+        THEN the lease is flagged revoked and no longer tracked
+        """
+        monkeypatch.setenv("SECRET_KEY", "test-secret")
+        scheduler = LeaseExpirationService(db_session=db_session)
+        issuance = TaskLeaseIssuanceService(
+            db=db_session, lease_expiration_service=scheduler
+        )
+        lease = _lease(db_session, 300)
+        scheduler.schedule_lease(lease.id, lease.task_id, lease.expires_at)
+
+        await issuance.revoke_lease(lease.id, reason="peer left")
+
+        assert lease.is_revoked == 1
+        assert scheduler.next_deadline() is None
+        assert scheduler.get_expiration_stats()["tracked_leases"] == 0
+
+    def test_issuance_does_not_create_global_scheduler(self, db_session, monkeypatch):
+        """
+        GIVEN an issuance service without an explicit scheduler
+        WHEN no global scheduler has been created
+        THEN it resolves no scheduler and does not create one
+        """
+        monkeypatch.setenv("SECRET_KEY", "test-secret")
+        monkeypatch.setattr(lease_expiration_module, "_lease_expiration_service", None)
+        issuance = TaskLeaseIssuanceService(db=db_session)
+
+        assert issuance._get_expiration_scheduler() is None
+        assert lease_expiration_module.get_running_lease_expiration_service() is None
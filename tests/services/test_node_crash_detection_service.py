@@ -603,3 +603,166 @@ class TestCrashMetrics:
             assert "peer_id" in record
             assert "timestamp" in record
             assert "elapsed_seconds" in record
+
+
+class TestTimingWheelSweep:
+    """Test wheel-driven sweeps and burst crash handling"""
+
+    @pytest.mark.asyncio
+    async def test_record_heartbeat_rearms_peer(self):
+        """
+        GIVEN a tracked peer whose heartbeat is recorded after going stale
+        WHEN sweeping
+        THEN the peer is not reported as crashed
+        """
+        from backend.services.node_crash_detection_service import NodeCrashDetectionService
+
+        service = NodeCrashDetectionService(crash_threshold_seconds=60)
+        now = datetime.utcnow()
+        peer_cache = {
+            "peer1": PeerState(peer_id="peer1", status="online", last_heartbeat=now - timedelta(seconds=30))
+        }
+        assert await service.detect_crashed_nodes(peer_cache) == []
+
+        # Heartbeat arrives: cache updated in place and deadline re-armed
+        peer_cache["peer1"].last_heartbeat = now
+        service.record_heartbeat("peer1", now)
+
+        assert await service.detect_crashed_nodes(peer_cache) == []
+        assert service.get_crash_statistics()["tracked_peers"] == 1
+
+    @pytest.mark.asyncio
+    async def test_apply_heartbeat_updates_cache_and_rearms(self):
+        """
+        GIVEN a peer marked offline and a heartbeat from a new peer
+        WHEN heartbeats are applied through apply_heartbeat
+        THEN the cache is updated, both peers are armed, and the next sweep
+             reads no peer state
+        """
+        from backend.services.node_crash_detection_service import NodeCrashDetectionService
+
+        service = NodeCrashDetectionService(crash_threshold_seconds=60)
+        stale = datetime.utcnow() - timedelta(seconds=120)
+        peer_cache = {
+            "peer1": PeerState(peer_id="peer1", status="online", last_heartbeat=stale)
+        }
+        assert await service.detect_crashed_nodes(peer_cache) == ["peer1"]
+
+        now = datetime.utcnow()
+        service.apply_heartbeat(peer_cache, "peer1", now)
+        service.apply_heartbeat(peer_cache, "peer2", now, metadata={"zone": "a"})
+
+        assert peer_cache["peer1"].status == "online"
+        assert peer_cache["peer1"].last_heartbeat == now
+        assert peer_cache["peer2"].metadata == {"zone": "a"}
+        assert service.get_crash_statistics()["tracked_peers"] == 2
+
+        with patch.object(service, "_check_peer") as check_peer:
+            assert await service.detect_crashed_nodes(peer_cache) == []
+        check_peer.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_monitor_registers_heartbeat_handler(self):
+        """
+        GIVEN a heartbeat subscriber exposing on_heartbeat
+        WHEN the crash monitor starts
+        THEN record_heartbeat is registered and re-arms peers the subscriber updates
+        """
+        from backend.services.node_crash_detection_service import NodeCrashDetectionService
+
+        handlers = []
+        subscriber = Mock()
+        subscriber.peer_cache = {}
+        subscriber.on_heartbeat = Mock(side_effect=handlers.append)
+        service = NodeCrashDetectionService(
+            crash_threshold_seconds=60,
+            heartbeat_subscriber=subscriber
+        )
+
+        task = asyncio.create_task(service.start_crash_monitor(interval_seconds=10))
+        await asyncio.sleep(0)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        assert len(handlers) == 1
+        now = datetime.utcnow()
+        subscriber.peer_cache["peer1"] = PeerState(peer_id="peer1", status="online", last_heartbeat=now)
+        handlers[0]("peer1", now)
+        assert service.get_crash_statistics()["tracked_peers"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sweep_only_checks_expired_peers(self):
+        """
+        GIVEN many healthy tracked peers and a stable peer cache
+        WHEN sweeping again before any deadline
+        THEN no peer state is read
+        """
+        from backend.services.node_crash_detection_service import NodeCrashDetectionService
+
+        service = NodeCrashDetectionService(crash_threshold_seconds=60)
+        now = datetime.utcnow()
+        peer_cache = {
+            f"peer{i}": PeerState(peer_id=f"peer{i}", status="online", last_heartbeat=now)
+            for i in range(1000)
+        }
+        await service.detect_crashed_nodes(peer_cache)
+
+        with patch.object(service, "_check_peer") as check_peer:
+            assert await service.detect_crashed_nodes(peer_cache) == []
+
+        check_peer.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_burst_uses_bulk_revocation_and_bounded_fanout(self):
+        """
+        GIVEN a rack of peers crashing together
+        WHEN processing the crashes
+        THEN leases are revoked in one bulk call and recovery concurrency is bounded
+        """
+        from backend.services.node_crash_detection_service import NodeCrashDetectionService
+
+        class BulkRevoker:
+            def __init__(self):
+                self.calls = []
+
+            async def revoke_leases_for_peers(self, peer_ids):
+                self.calls.append(list(peer_ids))
+                return {peer_id: 1 for peer_id in peer_ids}
+
+        in_flight = 0
+        peak = 0
+
+        async def start_recovery(peer_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"wf-{peer_id}"
+
+        revoker = BulkRevoker()
+        workflow = AsyncMock()
+        workflow.start_recovery = AsyncMock(side_effect=start_recovery)
+        service = NodeCrashDetectionService(
+            crash_threshold_seconds=60,
+            lease_revocation_service=revoker,
+            recovery_workflow=workflow,
+            max_concurrent_recoveries=4
+        )
+        stale = datetime.utcnow() - timedelta(seconds=120)
+        peer_cache = {
+            f"rack-{i}": PeerState(peer_id=f"rack-{i}", status="online", last_heartbeat=stale)
+            for i in range(20)
+        }
+
+        crashed_nodes = await service.detect_crashed_nodes(peer_cache)
+        results = await service.process_crashes(crashed_nodes, peer_cache)
+
+        assert len(crashed_nodes) == 20
+        assert len(revoker.calls) == 1 and sorted(revoker.calls[0]) == sorted(crashed_nodes)
+        assert results["leases_revoked"] == 20
+        assert results["recovery_workflows_started"] == 20
+        assert 1 < peak <= 4
@@ -540,7 +540,32 @@ class TestGaugeMetrics:
         assert "openclaw_partition_degraded 0.0" in output
 
 
-class TestHistogramMetrics:
+    def test_collect_service_stats_with_zerodb_pool(self, metrics_service):
+        """
+        GIVEN a ZeroDB pool monitor registered
+        WHEN collecting service stats
+        THEN should update the ZeroDB pool gauges
+        """
+        # Given
+        mock_pool_monitor = Mock()
+        mock_pool_monitor.get_pool_stats.return_value = {
+            "in_use": 3,
+            "idle": 7,
+            "wait_seconds_total": 1.5,
+            "wait_seconds_max": 0.25,
+        }
+        metrics_service.register_service("zerodb_pool", mock_pool_monitor)
+
+        # When
+        metrics_service.collect_service_stats()
+
+        # Then
+        output = metrics_service.generate_metrics()
+        assert "openclaw_zerodb_pool_in_use 3.0" in output
+        assert "openclaw_zerodb_pool_idle 7.0" in output
+        assert "openclaw_zerodb_pool_wait_seconds_total 1.5" in output
+        assert "openclaw_zerodb_pool_wait_seconds_max 0.25" in output
+
     """Test histogram observation methods"""
 
     @pytest.fixture
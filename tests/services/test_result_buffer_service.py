@@ -32,6 +32,7 @@ def mock_dbos_client():
     """Mock DBOS client for testing flush operations"""
     client = AsyncMock()
     client.send_result = AsyncMock(return_value={"status": "success"})
+    client.send_result_batch = None  # client without batch support
     client.is_connected = AsyncMock(return_value=True)
     return client
 
@@ -508,6 +509,7 @@ class TestFlushBufferOnReconnect:
 
         # Mock client that fails on specific task
         mock_client = AsyncMock()
+        mock_client.send_result_batch = None
         call_count = 0
 
         async def mock_send(result_data):
@@ -640,6 +642,7 @@ class TestPeriodicFlushAttempts:
 
         # Mock client that becomes available after delay
         mock_client = AsyncMock()
+        mock_client.send_result_batch = None
         connection_available = False
 
         async def mock_is_connected():
@@ -823,6 +826,7 @@ class TestRetryMechanism:
 
         # Mock failing client
         mock_client = AsyncMock()
+        mock_client.send_result_batch = None
         mock_client.send_result = AsyncMock(
             side_effect=Exception("Connection failed")
         )
@@ -847,9 +851,11 @@ class TestRetryMechanism:
         from backend.services.result_buffer_service import ResultBufferService
 
         # Arrange
+        # No backoff, so every flush retries immediately
         service = ResultBufferService(
             db_path=temp_db_path,
-            max_retry_attempts=3
+            max_retry_attempts=3,
+            retry_backoff_base=0.0
         )
 
         # Buffer result
@@ -863,6 +869,7 @@ class TestRetryMechanism:
 
         # Mock failing client
         mock_client = AsyncMock()
+        mock_client.send_result_batch = None
         mock_client.send_result = AsyncMock(
             side_effect=Exception("Connection failed")
         )
@@ -996,3 +1003,400 @@ class TestBufferMetrics:
         assert metrics["utilization_percent"] == 50.0
 
         service.close()
+
+
+class TestConnectionPoolingAndBatching:
+    """Test WAL-mode connection, group commit and batched flush"""
+
+    def test_database_uses_wal_mode(self, temp_db_path):
+        """
+        GIVEN a new result buffer service
+        WHEN inspecting the SQLite journal mode
+        THEN should be WAL
+        """
+        from backend.services.result_buffer_service import ResultBufferService
+
+        # Arrange
+        service = ResultBufferService(db_path=temp_db_path)
+
+        # Act
+        conn = sqlite3.connect(temp_db_path)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+
+        # Assert
+        assert mode.lower() == "wal"
+
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_buffer_results_group_committed(self, temp_db_path):
+        """
+        GIVEN many concurrent buffer_result calls
+        WHEN they complete
+        THEN all should be stored with distinct IDs and a duplicate should
+        fail alone without affecting the rest of its group
+        """
+        from backend.services.result_buffer_service import ResultBufferService
+
+        # Arrange
+        service = ResultBufferService(db_path=temp_db_path, max_buffer_size=100)
+
+        # Act
+        outcomes = await asyncio.gather(
+            *[
+                service.buffer_result(
+                    task_id=f"task-{i % 50}",
+                    agent_id="agent-1",
+                    lease_token=f"lease-{i}",
+                    result={"index": i}
+                )
+                for i in range(51)
+            ],
+            return_exceptions=True
+        )
+
+        # Assert
+        ids = [o for o in outcomes if isinstance(o, int)]
+        errors = [o for o in outcomes if isinstance(o, Exception)]
+        assert len(set(ids)) == 50
+        assert len(errors) == 1
+        assert isinstance(errors[0], sqlite3.IntegrityError)
+        assert await service.get_buffer_size() == 50
+        assert len(await service.get_all_buffered_results()) == 50
+
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_pending_count_survives_restart(self, temp_db_path):
+        """
+        GIVEN results buffered by a previous service instance
+        WHEN a new instance opens the same database
+        THEN its in-memory size should match the stored pending rows
+        """
+        from backend.services.result_buffer_service import ResultBufferService
+
+        # Arrange
+        service1 = ResultBufferService(db_path=temp_db_path, max_buffer_size=3)
+        for i in range(3):
+            await service1.buffer_result(
+                task_id=f"task-{i}",
+                agent_id="agent-1",
+                lease_token=f"lease-{i}",
+                result={"index": i}
+            )
+        service1.close()
+
+        # Act
+        service2 = ResultBufferService(db_path=temp_db_path, max_buffer_size=3)
+
+        # Assert
+        assert await service2.get_buffer_size() == 3
+        from backend.services.result_buffer_service import BufferFullError
+        with pytest.raises(BufferFullError):
+            await service2.buffer_result(
+                task_id="task-overflow",
+                agent_id="agent-1",
+                lease_token="lease-overflow",
+                result={}
+            )
+
+        service2.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_batches(self, temp_db_path):
+        """
+        GIVEN a client with send_result_batch and flush_batch_size=4
+        WHEN flushing 10 buffered results
+        THEN should send 3 batches in FIFO order and empty the buffer
+        """
+        from backend.services.result_buffer_service import ResultBufferService
+
+        # Arrange
+        service = ResultBufferService(db_path=temp_db_path, flush_batch_size=4)
+        for i in range(10):
+            await service.buffer_result(
+                task_id=f"task-{i}",
+                agent_id="agent-1",
+                lease_token=f"lease-{i}",
+                result={"index": i}
+            )
+        client = AsyncMock()
+
+        # Act
+        flushed = await service.flush_buffer(client)
+
+        # Assert
+        assert flushed == 10
+        assert client.send_result_batch.call_count == 3
+        sent = [
+            r["task_id"]
+            for call in client.send_result_batch.call_args_list
+            for r in call.args[0]
+        ]
+        assert sent == [f"task-{i}" for i in range(10)]
+        client.send_result.assert_not_called()
+        assert await service.get_buffer_size() == 0
+
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_individual_sends(self, temp_db_path):
+        """
+        GIVEN a batch send that fails and one result the client rejects
+        WHEN flushing
+        THEN should resend individually and keep only the rejected result
+        """
+        from backend.services.result_buffer_service import ResultBufferService
+
+        # Arrange
+        service = ResultBufferService(db_path=temp_db_path, flush_batch_size=5)
+        for i in range(5):
+            await service.buffer_result(
+                task_id=f"task-{i}",
+                agent_id="agent-1",
+                lease_token=f"lease-{i}",
+                result={"index": i}
+            )
+
+        async def send_result(result):
+            if result["task_id"] == "task-2":
+                raise Exception("rejected")
+            return True
+
+        client = AsyncMock()
+        client.send_result_batch.side_effect = Exception("batch rejected")
+        client.send_result.side_effect = send_result
+
+        # Act
+        flushed = await service.flush_buffer(client)
+
+        # Assert
+        assert flushed == 4
+        remaining = await service.get_all_buffered_results()
+        assert [r["task_id"] for r in remaining] == ["task-2"]
+        assert remaining[0]["retry_count"] == 1
+
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_client_without_batch_support_sends_individually(self, temp_db_path):
+        """
+        GIVEN the default flush_batch_size and a client without send_result_batch
+        WHEN flushing buffered results
+        THEN should send each result with send_result in FIFO order
+        """
+        from backend.services.result_buffer_service import ResultBufferService
+
+        # Arrange
+        service = ResultBufferService(db_path=temp_db_path)
+        assert service.flush_batch_size > 1
+        for i in range(5):
+            await service.buffer_result(
+                task_id=f"task-{i}",
+                agent_id="agent-1",
+                lease_token=f"lease-{i}",
+                result={"index": i}
+            )
+
+        class PerResultClient:
+            def __init__(self):
+                self.sent = []
+
+            async def send_result(self, result):
+                self.sent.append(result["task_id"])
+                return True
+
+        client = PerResultClient()
+
+        # Act
+        flushed = await service.flush_buffer(client)
+
+        # Assert
+        assert flushed == 5
+        assert client.sent == [f"task-{i}" for i in range(5)]
+        assert await service.get_buffer_size() == 0
+
+        service.close()
+
+
+class TestStreamingFlush:
+    """Test paged flush with bounded concurrency and retry backoff"""
+
+    @pytest.mark.asyncio
+    async def test_flush_pages_in_fifo_order(self, temp_db_path):
+        """
+        GIVEN more buffered results than one flush page
+        WHEN flushing
+        THEN should send every result in FIFO order and report the pages
+        """
+        from backend.services.result_buffer_service import ResultBufferService
+
+        # Arrange
+        service = ResultBufferService(
+            db_path=temp_db_path,
+            flush_page_size=4,
+            flush_concurrency=2
+        )
+        for i in range(10):
+            await service.buffer_result(
+                task_id=f"task-{i}",
+                agent_id="agent-1",
+                lease_token=f"lease-{i}",
+                result={"index": i}
+            )
+        client = AsyncMock()
+        client.send_result_batch = None
+
+        # Act
+        flushed = await service.flush_buffer(client)
+
+        # Assert
+        assert flushed == 10
+        sent = [call.args[0]["task_id"] for call in client.send_result.call_args_list]
+        assert sent == [f"task-{i}" for i in range(10)]
+        assert await service.get_buffer_size() == 0
+
+        metrics = await service.get_buffer_metrics()
+        assert metrics["total_flushed"] == 10
+        assert metrics["last_flush"]["pages"] == 3
+        assert metrics["last_flush"]["peak_rows_in_memory"] == 4
+        assert metrics["last_flush"]["peak_memory_bytes"] > 0
+
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_bounds_sends_in_flight(self, temp_db_path):
+        """
+        GIVEN flush_concurrency=3 and a slow client
+        WHEN flushing 12 results
+        THEN should never have more than 3 sends in flight
+        """
+        from backend.services.result_buffer_service import ResultBufferService
+
+        # Arrange
+        service = ResultBufferService(db_path=temp_db_path, flush_concurrency=3)
+        for i in range(12):
+            await service.buffer_result(
+                task_id=f"task-{i}",
+                agent_id="agent-1",
+                lease_token=f"lease-{i}",
+                result={"index": i}
+            )
+
+        in_flight = 0
+        peak = 0
+
+        async def send_result(result):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        client = AsyncMock()
+        client.send_result_batch = None
+        client.send_result.side_effect = send_result
+
+        # Act
+        flushed = await service.flush_buffer(client)
+
+        # Assert
+        assert flushed == 12
+        assert peak == 3
+
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_retry_backoff_defers_recent_failures(self, temp_db_path):
+        """
+        GIVEN a result that just failed with retry backoff enabled
+        WHEN flushing again before the backoff elapses
+        THEN should not resend it until last_retry_at is old enough
+        """
+        from backend.services.result_buffer_service import ResultBufferService
+
+        # Arrange
+        service = ResultBufferService(
+            db_path=temp_db_path,
+            retry_backoff_base=60.0
+        )
+        buffer_id = await service.buffer_result(
+            task_id="task-1",
+            agent_id="agent-1",
+            lease_token="lease-1",
+            result={"status": "completed"}
+        )
+        client = AsyncMock()
+        client.send_result_batch = None
+        client.send_result.side_effect = Exception("Connection failed")
+        await service.flush_buffer(client)
+
+        # Act - Immediate retry is deferred
+        client.send_result.side_effect = None
+        flushed = await service.flush_buffer(client)
+
+        # Assert
+        assert flushed == 0
+        assert client.send_result.call_count == 1
+        metrics = await service.get_buffer_metrics()
+        assert metrics["last_flush"]["deferred"] == 1
+
+        # Act - Backoff elapsed
+        past = (datetime.now(timezone.utc) - timedelta(seconds=61)).isoformat()
+        conn = sqlite3.connect(temp_db_path)
+        conn.execute(
+            "UPDATE buffered_results SET last_retry_at = ? WHERE id = ?",
+            (past, buffer_id)
+        )
+        conn.commit()
+        conn.close()
+        flushed = await service.flush_buffer(client)
+
+        # Assert
+        assert flushed == 1
+        assert await service.get_buffer_size() == 0
+
+        service.close()
+
+    def test_global_service_enables_backoff_and_forwards_tuning(self, temp_db_path):
+        """
+        GIVEN the production singleton getter
+        WHEN it creates the service
+        THEN retry backoff is on by default and flush tuning is forwarded
+        """
+        import backend.services.result_buffer_service as module
+
+        # Arrange
+        module._buffer_service = None
+
+        # Act
+        service = module.get_result_buffer_service(
+            db_path=temp_db_path,
+            flush_page_size=50,
+            flush_concurrency=4
+        )
+
+        # Assert
+        try:
+            assert service.retry_backoff_base == 1.0
+            assert service.flush_page_size == 50
+            assert service.flush_concurrency == 4
+        finally:
+            service.close()
+            module._buffer_service = None
+
+    def test_constructor_and_getter_share_backoff_default(self, temp_db_path):
+        """
+        GIVEN a service built directly with default arguments
+        WHEN comparing it to the singleton getter's default
+        THEN both use the same retry backoff base
+        """
+        from backend.services.result_buffer_service import ResultBufferService
+
+        service = ResultBufferService(db_path=temp_db_path)
+        try:
+            assert service.retry_backoff_base == 1.0
+        finally:
+            service.close()
@@ -0,0 +1,221 @@
+"""
+Task Assignment Orchestrator Batch Tests
+
+Tests batch assignment flow:
+- Single task query and global matching
+- Concurrent lease issuance persisted in one transaction
+- Per-task failure reporting (missing, unreachable, lease failures)
+"""
+
+import pytest
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from backend.models.task_lease import Task, TaskLease, TaskStatus, TaskPriority
+from backend.services.task_assignment_orchestrator import (
+    TaskAssignmentOrchestrator,
+    AssignmentStatus,
+)
+
+
+def _task(status=TaskStatus.QUEUED):
+    return Task(
+        id=uuid4(),
+        task_type="code_generation",
+        payload={"prompt": "test"},
+        priority=TaskPriority.NORMAL,
+        status=status,
+        required_capabilities={"cpu_cores": 2},
+    )
+
+
+@pytest.fixture
+def tasks():
+    return [_task() for _ in range(4)]
+
+
+@pytest.fixture
+def db_session(tasks):
+    session = MagicMock()
+    session.query.return_value.filter.return_value.all.return_value = tasks
+    return session
+
+
+@pytest.fixture
+def mock_dbos_service():
+    service = AsyncMock()
+
+    async def issue_task_lease(task_id, peer_id, duration_minutes):
+        return {
+            "token": f"lease-{task_id}",
+            "expires_at": datetime.now(timezone.utc) + timedelta(minutes=duration_minutes),
+        }
+
+    service.issue_task_lease = AsyncMock(side_effect=issue_task_lease)
+    service.revoke_task_lease = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def mock_libp2p_client():
+    client = AsyncMock()
+    client.send_task_request = AsyncMock(return_value={"message_id": "msg-1"})
+    return client
+
+
+@pytest.fixture
+def available_nodes():
+    return [
+        {"peer_id": "peer-a", "capabilities": {"cpu_cores": 8}},
+        {"peer_id": "peer-b", "capabilities": {"cpu_cores": 4}},
+    ]
+
+
+@pytest.fixture
+def orchestrator(db_session, mock_libp2p_client, mock_dbos_service):
+    return TaskAssignmentOrchestrator(
+        db_session=db_session,
+        libp2p_client=mock_libp2p_client,
+        dbos_service=mock_dbos_service,
+    )
+
+
+class TestAssignTasksBatch:
+    """Test TaskAssignmentOrchestrator.assign_tasks_batch"""
+
+    @pytest.mark.asyncio
+    async def test_batch_assigns_all_tasks_in_one_commit(
+        self, orchestrator, db_session, tasks, available_nodes
+    ):
+        """
+        GIVEN queued tasks and capable nodes
+        WHEN assigning as a batch
+        THEN every task is leased and all leases are committed together
+        """
+        task_ids = [str(task.id) for task in tasks]
+
+        results = await orchestrator.assign_tasks_batch(task_ids, available_nodes)
+
+        assert [result.task_id for result in results] == task_ids
+        assert all(result.status == AssignmentStatus.SUCCESS for result in results)
+        assert {result.assigned_peer_id for result in results} == {"peer-a", "peer-b"}
+        assert all(task.status == TaskStatus.LEASED for task in tasks)
+
+        db_session.add_all.assert_called_once()
+        leases = list(db_session.add_all.call_args[0][0])
+        assert len(leases) == len(tasks)
+        assert all(isinstance(lease, TaskLease) for lease in leases)
+        assert db_session.commit.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_missing_and_non_queued_tasks(
+        self, orchestrator, tasks, available_nodes
+    ):
+        """
+        GIVEN a batch containing an unknown and a leased task
+        WHEN assigning as a batch
+        THEN those tasks fail individually while others succeed
+        """
+        tasks[0].status = TaskStatus.LEASED
+        task_ids = [str(task.id) for task in tasks] + ["missing-task"]
+
+        results = await orchestrator.assign_tasks_batch(task_ids, available_nodes)
+
+        assert results[0].status == AssignmentStatus.FAILED
+        assert results[-1].status == AssignmentStatus.FAILED
+        assert all(result.status == AssignmentStatus.SUCCESS for result in results[1:-1])
+
+    @pytest.mark.asyncio
+    async def test_batch_requeues_unreachable_peers(
+        self, orchestrator, tasks, available_nodes, mock_libp2p_client, mock_dbos_service
+    ):
+        """
+        GIVEN one peer that cannot be reached
+        WHEN assigning as a batch
+        THEN its tasks are revoked and requeued while the rest succeed
+        """
+        async def send_task_request(peer_id, task_id, lease_token, payload):
+            if peer_id == "peer-b":
+                raise ConnectionError("unreachable")
+            return {"message_id": f"msg-{task_id}"}
+
+        mock_libp2p_client.send_task_request.side_effect = send_task_request
+
+        results = await orchestrator.assign_tasks_batch(
+            [str(task.id) for task in tasks], available_nodes
+        )
+
+        unreachable = [r for r in results if r.status == AssignmentStatus.PEER_UNREACHABLE]
+        succeeded = [r for r in results if r.status == AssignmentStatus.SUCCESS]
+        assert unreachable and succeeded
+        assert mock_dbos_service.revoke_task_lease.await_count == len(unreachable)
+        for task, result in zip(tasks, results):
+            expected = TaskStatus.QUEUED if result in unreachable else TaskStatus.LEASED
+            assert task.status == expected
+
+        # Only delivered tasks keep their load balancer reservation
+        load_balancer = orchestrator.load_balancer
+        assert set(load_balancer.task_assignments) == {r.task_id for r in succeeded}
+        assert load_balancer.agent_metrics["peer-b"].current_tasks == 0
+        assert load_balancer.agent_metrics["peer-a"].current_tasks == len(succeeded)
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_lease_issuance_failures(
+        self, orchestrator, tasks, available_nodes, mock_dbos_service
+    ):
+        """
+        GIVEN DBOS failing to issue leases
+        WHEN assigning as a batch
+        THEN tasks are reported as lease failures and stay queued
+        """
+        mock_dbos_service.issue_task_lease.side_effect = RuntimeError("DBOS down")
+
+        results = await orchestrator.assign_tasks_batch(
+            [str(task.id) for task in tasks], available_nodes
+        )
+
+        assert all(r.status == AssignmentStatus.LEASE_ISSUANCE_FAILED for r in results)
+        assert all(task.status == TaskStatus.QUEUED for task in tasks)
+        assert orchestrator.load_balancer.task_assignments == {}
+        assert all(
+            metrics.current_tasks == 0
+            for metrics in orchestrator.load_balancer.agent_metrics.values()
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_deduplicates_task_ids(
+        self, orchestrator, db_session, tasks, available_nodes, mock_dbos_service
+    ):
+        """
+        GIVEN a batch listing the same task twice
+        WHEN assigning as a batch
+        THEN the task gets exactly one lease and one result
+        """
+        task_ids = [str(tasks[0].id), str(tasks[1].id), str(tasks[0].id)]
+
+        results = await orchestrator.assign_tasks_batch(task_ids, available_nodes)
+
+        assert [result.task_id for result in results] == task_ids[:2]
+        assert mock_dbos_service.issue_task_lease.await_count == 2
+        assert len(list(db_session.add_all.call_args[0][0])) == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_rolls_back_failed_requeue_commit(
+        self, orchestrator, db_session, tasks, available_nodes, mock_libp2p_client
+    ):
+        """
+        GIVEN every peer unreachable and the requeue commit failing
+        WHEN assigning as a batch
+        THEN the session is rolled back and tasks are reported unreachable
+        """
+        mock_libp2p_client.send_task_request.side_effect = ConnectionError("unreachable")
+        db_session.commit.side_effect = [None, RuntimeError("db down")]
+
+        results = await orchestrator.assign_tasks_batch(
+            [str(task.id) for task in tasks], available_nodes
+        )
+
+        db_session.rollback.assert_called_once()
+        assert all(r.status == AssignmentStatus.PEER_UNREACHABLE for r in results)
+        assert all("requeue failed" in r.error_message for r in results)
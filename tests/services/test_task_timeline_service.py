@@ -225,7 +225,7 @@ class TestBoundedStorage:
         service = TaskTimelineService()
 
         # Then - internal check
-        assert service._events.maxlen == 10000
+        assert service.max_events == 10000
 
 
 class TestQueryEvents:
@@ -554,3 +554,91 @@ class TestSingletonFactory:
 
         # Cleanup
         mod._timeline_service_instance = None
+
+
+class TestIndexedStorage:
+    """Test indexed, time-ordered storage against a brute-force reference"""
+
+    def test_indexed_queries_match_full_scan(self):
+        """
+        GIVEN events recorded with out-of-order timestamps beyond capacity
+        WHEN querying with every filter combination and page
+        THEN results should equal filtering and sorting the retained events
+        """
+        import random
+
+        rng = random.Random(7)
+        service = TaskTimelineService(max_events=300)
+        base_time = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        recorded = []
+
+        for seq in range(1000):
+            ts = base_time + timedelta(seconds=seq + rng.randint(-30, 30))
+            fields = dict(
+                event_type=rng.choice(list(TimelineEventType)),
+                task_id=rng.choice([None, "task-1", "task-2", "task-3"]),
+                peer_id=rng.choice([None, "peer-a", "peer-b"]),
+            )
+            service.record_event(timestamp=ts, **fields)
+            recorded.append((ts, seq, fields))
+
+        # Oldest timestamps are evicted first
+        retained = sorted(recorded, key=lambda r: (r[0], r[1]))[-300:]
+        assert service.get_event_count() == 300
+
+        since = base_time + timedelta(seconds=750)
+        until = base_time + timedelta(seconds=900)
+        for task_id in (None, "task-2"):
+            for peer_id in (None, "peer-a"):
+                for event_type in (None, TimelineEventType.TASK_FAILED):
+                    for window in ((None, None), (since, until)):
+                        expected = [
+                            r for r in reversed(retained)
+                            if (task_id is None or r[2]["task_id"] == task_id)
+                            and (peer_id is None or r[2]["peer_id"] == peer_id)
+                            and (event_type is None or r[2]["event_type"] == event_type)
+                            and (window[0] is None or r[0] >= window[0])
+                            and (window[1] is None or r[0] <= window[1])
+                        ]
+                        for offset in (0, 7):
+                            events, total = service.query_events(
+                                task_id=task_id, peer_id=peer_id, event_type=event_type,
+                                since=window[0], until=window[1], limit=10, offset=offset,
+                            )
+                            assert total == len(expected)
+                            assert [e.timestamp for e in events] == [
+                                r[0] for r in expected[offset:offset + 10]
+                            ]
+
+    def test_spill_segments_survive_restart(self, tmp_path):
+        """
+        GIVEN a timeline spilling to disk segments
+        WHEN a new service opens the same directory
+        THEN it should replay the newest max_events events
+        """
+        base_time = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        service = TaskTimelineService(
+            max_events=5, spill_dir=str(tmp_path), segment_max_events=2
+        )
+        for i in range(9):
+            service.record_event(
+                event_type=TimelineEventType.TASK_PROGRESS,
+                task_id=f"task-{i}",
+                timestamp=base_time + timedelta(seconds=i),
+                metadata={"progress": i},
+            )
+        service.close()
+
+        # Old segments beyond capacity are removed
+        assert len(list(tmp_path.iterdir())) <= 4
+
+        restarted = TaskTimelineService(
+            max_events=5, spill_dir=str(tmp_path), segment_max_events=2
+        )
+        events, total = restarted.query_events()
+
+        assert total == 5
+        assert [e.task_id for e in events] == [f"task-{i}" for i in range(8, 3, -1)]
+        assert events[0].metadata == {"progress": 8}
+        assert events[0].timestamp == base_time + timedelta(seconds=8)
+        restarted.close()
@@ -14,6 +14,7 @@ Issue #123: Implement ZeroDB Cache Service with Auto-Cleanup
 
 import pytest
 import asyncio
+import time
 from datetime import datetime, timedelta, timezone
 
 
@@ -131,3 +132,442 @@ class TestZeroDBCacheService:
         assert "hit_rate" in stats
         assert stats["hits"] >= 1
         assert stats["misses"] >= 1
+
+
+class FakeZeroDBTable:
+    """In-memory stand-in for the ZeroDB cache table"""
+
+    def __init__(self, delay: float = 0.0):
+        self.rows = {}
+        self.delay = delay
+        self.query_calls = 0
+        self.upsert_calls = 0
+
+    def _matches(self, row, filter_query):
+        if "$or" in filter_query:
+            return any(self._matches(row, f) for f in filter_query["$or"])
+        for field, condition in filter_query.items():
+            if "$eq" in condition and row.get(field) != condition["$eq"]:
+                return False
+            if "$in" in condition and row.get(field) not in condition["$in"]:
+                return False
+            if "$exists" in condition and (field in row) != condition["$exists"]:
+                return False
+            if "$lt" in condition and not (
+                row.get(field) is not None and row[field] < condition["$lt"]
+            ):
+                return False
+        return True
+
+    async def query_rows(self, table_name, filter_query, project_id=None, limit=100, skip=0):
+        self.query_calls += 1
+        await asyncio.sleep(self.delay)
+        matches = [r for r in self.rows.values() if self._matches(r, filter_query)]
+        return {"data": [{"row_data": dict(r)} for r in matches[skip:skip + limit]]}
+
+    async def update_rows(self, table_name, filter_query, update_data, project_id=None):
+        key = filter_query["key"]["$eq"]
+        if key not in self.rows:
+            return {"updated_count": 0}
+        self.rows[key].update(update_data)
+        return {"updated_count": 1}
+
+    async def insert_rows(self, table_name, rows, project_id=None):
+        for row in rows:
+            self.rows[row["key"]] = dict(row)
+        return {"inserted_count": len(rows)}
+
+    async def bulk_upsert(self, table_name, rows, unique_key, project_id=None):
+        self.upsert_calls += 1
+        for row in rows:
+            self.rows[row[unique_key]] = dict(row)
+        return {"upserted_count": len(rows)}
+
+    async def upsert_row_batched(self, table_name, row, unique_key, project_id=None):
+        result = await self.bulk_upsert(table_name, [row], unique_key, project_id)
+        return {"data": row, "result": result}
+
+    async def delete_rows(self, table_name, filter_query, project_id=None):
+        keys = [k for k, r in self.rows.items() if self._matches(r, filter_query)]
+        for k in keys:
+            del self.rows[k]
+        return {"deleted_count": len(keys)}
+
+
+class TestTwoTierCache:
+    """Test in-process L1 tier in front of ZeroDB"""
+
+    @pytest.mark.asyncio
+    async def test_l1_serves_hot_keys_without_remote_query(self):
+        """
+        GIVEN a cache with L1 enabled and a key that was just set
+        WHEN reading it repeatedly
+        THEN should not query ZeroDB and report L1 hits in stats
+        """
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        cache = ZeroDBCacheService(zerodb_client=table, project_id="p", l1_max_size=10)
+
+        await cache.set("session", "data", ttl=60)
+        for _ in range(5):
+            assert await cache.get("session") == "data"
+
+        assert table.query_calls == 0
+        stats = await cache.get_stats()
+        assert stats["l1_hits"] == 5
+        assert stats["l1_hit_rate"] == 100.0
+        assert stats["hits"] == 5
+
+    @pytest.mark.asyncio
+    async def test_negative_caching_and_delete_write_through(self):
+        """
+        GIVEN a cache with L1 enabled
+        WHEN reading a missing key twice and deleting a cached key
+        THEN the second miss should not query ZeroDB and the deleted key
+        should read as missing without a query
+        """
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        cache = ZeroDBCacheService(zerodb_client=table, project_id="p", l1_max_size=10)
+
+        assert await cache.get("missing") is None
+        assert await cache.get("missing") is None
+        assert table.query_calls == 1
+
+        await cache.set("k", "v")
+        await cache.delete("k")
+        assert await cache.get("k") is None
+        assert table.query_calls == 1
+
+        stats = await cache.get_stats()
+        assert stats["l2_misses"] == 1
+        assert stats["misses"] == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_single_flight(self):
+        """
+        GIVEN a value only present in ZeroDB
+        WHEN ten readers miss L1 concurrently
+        THEN should make one remote query and return the value to all
+        """
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable(delay=0.01)
+        table.rows["hot"] = {"key": "hot", "value": "v", "expires_at": None, "counter": 0}
+        cache = ZeroDBCacheService(zerodb_client=table, project_id="p", l1_max_size=10)
+
+        values = await asyncio.gather(*[cache.get("hot") for _ in range(10)])
+
+        assert values == ["v"] * 10
+        assert table.query_calls == 1
+        stats = await cache.get_stats()
+        assert stats["coalesced_reads"] == 9
+        assert stats["l2_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_l1_lru_eviction_and_remote_expiry(self):
+        """
+        GIVEN an L1 tier of size 2
+        WHEN caching three keys and one whose remote TTL has passed
+        THEN should evict the least recently used key and not serve the
+        expired value from L1
+        """
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        cache = ZeroDBCacheService(zerodb_client=table, project_id="p", l1_max_size=2)
+
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        await cache.get("a")
+        await cache.set("c", "3")
+
+        stats = await cache.get_stats()
+        assert stats["l1_size"] == 2
+        assert stats["l1_evictions"] == 1
+
+        # "b" was evicted, so reading it goes to ZeroDB
+        queries_before = table.query_calls
+        assert await cache.get("b") == "2"
+        assert table.query_calls == queries_before + 1
+
+        await cache.set("short", "x", ttl=-1)
+        assert await cache.get("short") is None
+
+
+class TestShardedCounters:
+    """Test batched, sharded counter increments"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_increments_batched_into_one_upsert(self):
+        """
+        GIVEN 100 concurrent increments of one counter
+        WHEN flushing counters
+        THEN no increment should be lost and one bulk_upsert should be made
+        """
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        cache = ZeroDBCacheService(
+            zerodb_client=table, project_id="p", counter_flush_interval=3600
+        )
+
+        values = await asyncio.gather(*[cache.increment("hits") for _ in range(100)])
+        written = await cache.flush_counters()
+
+        assert sorted(values) == list(range(1, 101))
+        assert written == 1
+        assert table.upsert_calls == 1
+        assert await cache.get_counter("hits") == 100
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_instances_write_separate_shards(self):
+        """
+        GIVEN two service instances sharing a table
+        WHEN both increment the same counter concurrently
+        THEN the total should include every increment from both
+        """
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        a = ZeroDBCacheService(zerodb_client=table, project_id="p", counter_flush_interval=3600)
+        b = ZeroDBCacheService(zerodb_client=table, project_id="p", counter_flush_interval=3600)
+        assert a.shard_id != b.shard_id
+
+        await asyncio.gather(
+            *[a.increment("shared") for _ in range(30)],
+            *[b.increment("shared", 2) for _ in range(20)]
+        )
+        await a.flush_counters()
+        await b.flush_counters()
+
+        assert await a.get_counter("shared") == 70
+        assert await b.get_counter("shared") == 70
+        assert await a.increment("shared") == 71
+
+        await a.close()
+        await b.close()
+
+    @pytest.mark.asyncio
+    async def test_restarted_instance_resumes_its_shard(self):
+        """
+        GIVEN an instance that flushed a counter and was shut down
+        WHEN a new instance with the same shard id increments it
+        THEN it continues from the persisted shard instead of adding a new one
+        """
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        first = ZeroDBCacheService(
+            zerodb_client=table, project_id="p", counter_flush_interval=3600, shard_id="node-1"
+        )
+        await first.increment("restarts", 5)
+        await first.close()
+
+        second = ZeroDBCacheService(
+            zerodb_client=table, project_id="p", counter_flush_interval=3600, shard_id="node-1"
+        )
+        await second.increment("restarts")
+        await second.flush_counters()
+
+        shard_rows = [row for row in table.rows.values() if row.get("counter_key") == "restarts"]
+        assert len(shard_rows) == 1
+        assert shard_rows[0]["counter"] == 6
+        assert await second.get_counter("restarts") == 6
+
+        await second.close()
+
+    def test_default_shard_id_is_unique_per_process(self, monkeypatch):
+        """
+        GIVEN no explicit shard id
+        WHEN creating instances
+        THEN the shard id comes from ZERODB_CACHE_SHARD_ID, else hostname, pid
+             and a random suffix
+        """
+        import os
+        import socket
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        monkeypatch.delenv("ZERODB_CACHE_SHARD_ID", raising=False)
+        shard_id = ZeroDBCacheService(zerodb_client=table, project_id="p").shard_id
+        assert shard_id.startswith(f"{socket.gethostname()}-{os.getpid()}-")
+
+        monkeypatch.setenv("ZERODB_CACHE_SHARD_ID", "worker-3")
+        assert ZeroDBCacheService(zerodb_client=table, project_id="p").shard_id == "worker-3"
+
+    @pytest.mark.asyncio
+    async def test_orphaned_shards_folded_into_base_row(self):
+        """
+        GIVEN shards left behind by exited processes and a live instance's shard
+        WHEN compacting idle shards
+        THEN orphan values move into the base row, the live shard is untouched
+             and the counter total is unchanged
+        """
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        now = int(datetime.now(timezone.utc).timestamp())
+        for shard_id, value in (("dead-1", 4), ("dead-2", 6)):
+            table.rows[f"hits#shard:{shard_id}"] = {
+                "key": f"hits#shard:{shard_id}", "value": "", "counter_key": "hits",
+                "shard_id": shard_id, "expires_at": None, "created_at": now - 7200,
+                "counter": value
+            }
+        live = ZeroDBCacheService(zerodb_client=table, project_id="p", counter_flush_interval=3600)
+        await live.increment("hits", 5)
+        await live.flush_counters()
+
+        compacted = await live.compact_counter_shards(idle_seconds=3600)
+
+        assert compacted == 2
+        assert table.rows["hits"]["counter"] == 10
+        assert f"hits#shard:{live.shard_id}" in table.rows
+        assert not any(key.startswith("hits#shard:dead") for key in table.rows)
+        assert await live.get_counter("hits") == 15
+
+        await live.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_counter_state_reloaded_after_compaction(self):
+        """
+        GIVEN an instance whose counter went idle and was compacted by another
+        WHEN the instance increments the counter again
+        THEN it reloads from ZeroDB instead of rewriting its old shard value
+        """
+        from unittest.mock import patch
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        idle = ZeroDBCacheService(
+            zerodb_client=table, project_id="p", counter_flush_interval=3600,
+            counter_idle_seconds=60
+        )
+        await idle.increment("hits", 3)
+        await idle.flush_counters()
+        table.rows[f"hits#shard:{idle.shard_id}"]["created_at"] -= 7200
+
+        compactor = ZeroDBCacheService(zerodb_client=table, project_id="p")
+        assert await compactor.compact_counter_shards(idle_seconds=3600) == 1
+
+        later = time.monotonic() + 120
+        with patch("backend.services.zerodb_cache_service.time.monotonic", return_value=later):
+            assert await idle.increment("hits") == 4
+            await idle.flush_counters()
+            assert await idle.get_counter("hits") == 4
+
+        await idle.close()
+
+    @pytest.mark.asyncio
+    async def test_delete_resets_counter(self):
+        """
+        GIVEN a flushed counter
+        WHEN deleting its key and incrementing again
+        THEN the counter should restart from the increment amount
+        """
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        cache = ZeroDBCacheService(zerodb_client=table, project_id="p", counter_flush_interval=3600)
+
+        await cache.increment("counter_key", 5)
+        await cache.flush_counters()
+        await cache.delete("counter_key")
+
+        assert await cache.increment("counter_key") == 1
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_fixed_window_resets_each_window(self):
+        """
+        GIVEN a fixed 60 second window
+        WHEN incrementing in two consecutive windows
+        THEN each window should count independently
+        """
+        from unittest.mock import patch
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        cache = ZeroDBCacheService(zerodb_client=table, project_id="p", counter_flush_interval=3600)
+
+        with patch("backend.services.zerodb_cache_service.time.time", return_value=6000.0):
+            assert await cache.increment_fixed_window("rate:ip", 60) == 1
+            assert await cache.increment_fixed_window("rate:ip", 60) == 2
+        with patch("backend.services.zerodb_cache_service.time.time", return_value=6061.0):
+            assert await cache.increment_fixed_window("rate:ip", 60) == 1
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_sliding_window_weights_previous_window(self):
+        """
+        GIVEN 10 hits in the previous 60 second window
+        WHEN incrementing 15 seconds into the next window
+        THEN the estimate should be 10 * 0.75 + 1
+        """
+        from unittest.mock import patch
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        cache = ZeroDBCacheService(zerodb_client=table, project_id="p", counter_flush_interval=3600)
+
+        with patch("backend.services.zerodb_cache_service.time.time", return_value=6030.0):
+            for _ in range(10):
+                await cache.increment_sliding_window("rate:user", 60)
+        with patch("backend.services.zerodb_cache_service.time.time", return_value=6075.0):
+            estimate = await cache.increment_sliding_window("rate:user", 60)
+
+        assert estimate == pytest.approx(10 * 0.75 + 1)
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_legacy_counter_row_counts_and_keeps_ttl(self):
+        """
+        GIVEN a counter row written before sharding, with a TTL
+        WHEN incrementing and flushing
+        THEN the legacy value is included and the new shard keeps its TTL
+        """
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        expires_at = int(datetime.now(timezone.utc).timestamp()) + 60
+        table.rows["rate:legacy"] = {
+            "key": "rate:legacy", "value": "", "expires_at": expires_at, "counter": 7
+        }
+        cache = ZeroDBCacheService(zerodb_client=table, project_id="p", counter_flush_interval=3600)
+
+        assert await cache.get_counter("rate:legacy") == 7
+        assert await cache.increment("rate:legacy") == 8
+        await cache.flush_counters()
+
+        shard = table.rows[f"rate:legacy#shard:{cache.shard_id}"]
+        assert shard["expires_at"] == expires_at
+        assert await cache.get_counter("rate:legacy") == 8
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_legacy_counter_row_ignored(self):
+        """
+        GIVEN a pre-sharding counter row whose TTL has passed
+        WHEN incrementing
+        THEN counting restarts from the increment amount
+        """
+        from backend.services.zerodb_cache_service import ZeroDBCacheService
+
+        table = FakeZeroDBTable()
+        expired = int(datetime.now(timezone.utc).timestamp()) - 1
+        table.rows["rate:old"] = {
+            "key": "rate:old", "value": "", "expires_at": expired, "counter": 50
+        }
+        cache = ZeroDBCacheService(zerodb_client=table, project_id="p", counter_flush_interval=3600)
+
+        assert await cache.increment("rate:old") == 1
+
+        await cache.close()
@@ -221,3 +221,35 @@ class TestWireGuardProvisioningService:
 
         # No errors
         assert len(errors) == 0
+
+    def test_ip_allocations_survive_restart(self, tmp_path):
+        """
+        Given a service persisting its IP pool state
+        When the service restarts and the node provisions again
+        Then the node gets its previous IP and no other node can take it
+        """
+        def make_service():
+            return WireGuardProvisioningService(
+                ip_pool_network="10.0.0.0/28",
+                hub_public_key="hub_test_key==",
+                hub_endpoint="hub.test.com:51820",
+                hub_ip="10.0.0.1",
+                config_path=str(tmp_path / "wg0.conf"),
+                enable_dbos=False,
+                ip_pool_state_dir=str(tmp_path / "ip_pool")
+            )
+
+        first = make_service().provision_peer(
+            node_id="node-a", public_key="pk_a", wireguard_public_key="wg_a", capabilities={}
+        )
+
+        restarted = make_service()
+        other = restarted.provision_peer(
+            node_id="node-b", public_key="pk_b", wireguard_public_key="wg_b", capabilities={}
+        )
+        again = restarted.provision_peer(
+            node_id="node-a", public_key="pk_a", wireguard_public_key="wg_a2", capabilities={}
+        )
+
+        assert again["assigned_ip"] == first["assigned_ip"]
+        assert other["assigned_ip"] != first["assigned_ip"]
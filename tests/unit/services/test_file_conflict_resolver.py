@@ -615,3 +615,112 @@ class TestFileConflictResolverIntegration:
 
         assert len(locks) == 3
         assert all(lock.holder_task_id == "task_1" for lock in locks)
+
+
+class TestWaitQueues:
+    """Test event-driven wait queues and timer-driven expiry"""
+
+    @pytest.mark.asyncio
+    async def test_waiter_woken_on_release(self):
+        """Test a blocked request is granted as soon as the lock is released"""
+        resolver = FileConflictResolver()
+        lock1 = await resolver.acquire_lock(
+            FileAccessRequest("task_1", "agent_1", "file.py", "write")
+        )
+
+        waiter = asyncio.create_task(resolver.acquire_lock(
+            FileAccessRequest("task_2", "agent_2", "file.py", "write"), timeout=5
+        ))
+        await asyncio.sleep(0)
+        assert resolver.get_statistics()["waiting_requests"] == 1
+
+        await resolver.release_lock(lock1)
+        lock2 = await asyncio.wait_for(waiter, timeout=0.05)
+        assert lock2.holder_task_id == "task_2"
+
+    @pytest.mark.asyncio
+    async def test_waiters_granted_by_priority_then_fifo(self):
+        """Test queued requests are granted highest priority first, FIFO within a priority"""
+        resolver = FileConflictResolver()
+        await resolver.acquire_lock(FileAccessRequest("holder", "agent_0", "file.py", "write"))
+
+        order = []
+
+        async def acquire(task_id, priority):
+            lock = await resolver.acquire_lock(
+                FileAccessRequest(task_id, "agent", "file.py", "write", priority=priority),
+                timeout=5
+            )
+            order.append(task_id)
+            await resolver.release_lock(lock)
+
+        waiters = [
+            asyncio.create_task(acquire("low", 1)),
+            asyncio.create_task(acquire("high_a", 9)),
+            asyncio.create_task(acquire("high_b", 9)),
+        ]
+        await asyncio.sleep(0)
+
+        await resolver.release_locks_by_task("holder")
+        await asyncio.gather(*waiters)
+        assert order == ["high_a", "high_b", "low"]
+
+    @pytest.mark.asyncio
+    async def test_expiry_timer_wakes_waiter(self):
+        """Test an expired lock is reclaimed by the timer without polling"""
+        resolver = FileConflictResolver(max_lock_duration=0.05)
+        await resolver.acquire_lock(FileAccessRequest("task_1", "agent_1", "file.py", "write"))
+
+        lock2 = await resolver.acquire_lock(
+            FileAccessRequest("task_2", "agent_2", "file.py", "write"), timeout=1
+        )
+
+        assert lock2.holder_task_id == "task_2"
+        assert resolver.get_statistics()["expired_locks"] == 1
+
+
+class TestAtomicBulkLocks:
+    """Test all-or-nothing bulk lock acquisition"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_acquire_holds_no_partial_locks(self):
+        """Test bulk acquisition waits without holding any path while one is busy"""
+        resolver = FileConflictResolver()
+        busy = await resolver.acquire_lock(FileAccessRequest("task_1", "agent_1", "b.py", "write"))
+
+        with pytest.raises(LockAcquisitionError):
+            await resolver.acquire_locks_bulk(
+                task_id="task_2", agent_id="agent_2",
+                file_paths=["c.py", "a.py", "b.py"], timeout=0.05
+            )
+        assert [lock.holder_task_id for lock in resolver.get_active_locks()] == ["task_1"]
+
+        bulk = asyncio.create_task(resolver.acquire_locks_bulk(
+            task_id="task_2", agent_id="agent_2",
+            file_paths=["c.py", "a.py", "b.py", "a.py"], timeout=5
+        ))
+        await asyncio.sleep(0)
+        await resolver.release_lock(busy)
+        locks = await asyncio.wait_for(bulk, timeout=0.05)
+
+        assert [lock.file_path for lock in locks] == ["a.py", "b.py", "c.py"]
+
+    @pytest.mark.asyncio
+    async def test_opposite_order_bulk_requests_do_not_deadlock(self):
+        """Test bulk requests over the same paths in opposite orders both complete"""
+        resolver = FileConflictResolver()
+
+        async def run(task_id, paths):
+            locks = await resolver.acquire_locks_bulk(
+                task_id=task_id, agent_id=task_id, file_paths=paths, timeout=1
+            )
+            await asyncio.sleep(0.01)
+            await resolver.release_locks_by_task(task_id)
+            return locks
+
+        first, second = await asyncio.gather(
+            run("task_1", ["x.py", "y.py"]),
+            run("task_2", ["y.py", "x.py"]),
+        )
+        assert len(first) == len(second) == 2
+        assert resolver.get_active_locks() == []